@@ -0,0 +1,97 @@
+"""add price rollups table
+
+Revision ID: a3d6e8f0b2c4
+Revises: f5a1b9c3d7e2
+Create Date: 2026-10-18 20:11:37.204518
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a3d6e8f0b2c4"
+down_revision: str | Sequence[str] | None = "f5a1b9c3d7e2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Creates `price_rollups` (hourly and daily aggregates per ticker, kept current by the
+    snapshot writer) and backfills both resolutions from `price_snapshots`.
+    """
+    op.create_table(
+        "price_rollups",
+        sa.Column("ticker", sa.String(), nullable=False),
+        sa.Column("resolution", sa.String(length=8), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("first_snapshot_time", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("snapshot_time", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("sample_count", sa.Integer(), nullable=False),
+        sa.Column("open_mid", sa.Float(), nullable=False),
+        sa.Column("high_mid", sa.Float(), nullable=False),
+        sa.Column("low_mid", sa.Float(), nullable=False),
+        sa.Column("close_mid", sa.Float(), nullable=False),
+        sa.Column("open_volume", sa.Integer(), nullable=False),
+        sa.Column("yes_bid", sa.Integer(), nullable=False),
+        sa.Column("yes_ask", sa.Integer(), nullable=False),
+        sa.Column("no_bid", sa.Integer(), nullable=False),
+        sa.Column("no_ask", sa.Integer(), nullable=False),
+        sa.Column("last_price", sa.Integer(), nullable=True),
+        sa.Column("volume", sa.Integer(), nullable=False),
+        sa.Column("volume_24h", sa.Integer(), nullable=False),
+        sa.Column("open_interest", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["ticker"], ["markets.ticker"]),
+        sa.PrimaryKeyConstraint("ticker", "resolution", "bucket_start"),
+    )
+    op.create_index(
+        "idx_price_rollups_resolution_bucket", "price_rollups", ["resolution", "bucket_start"]
+    )
+
+    for resolution, bucket_format in (
+        ("1h", "%Y-%m-%d %H:00:00.000000"),
+        ("1d", "%Y-%m-%d 00:00:00.000000"),
+    ):
+        op.execute(
+            f"""
+            INSERT INTO price_rollups (
+                ticker, resolution, bucket_start, first_snapshot_time, snapshot_time,
+                sample_count, open_mid, high_mid, low_mid, close_mid, open_volume,
+                yes_bid, yes_ask, no_bid, no_ask, last_price, volume, volume_24h, open_interest
+            )
+            SELECT
+                ticker, '{resolution}', bucket_start, first_snapshot_time, snapshot_time,
+                sample_count, open_mid, high_mid, low_mid, mid, open_volume,
+                yes_bid, yes_ask, no_bid, no_ask, last_price, volume, volume_24h, open_interest
+            FROM (
+                SELECT
+                    *,
+                    ROW_NUMBER() OVER (bucket ORDER BY snapshot_time DESC) AS rn,
+                    FIRST_VALUE(mid) OVER (bucket ORDER BY snapshot_time) AS open_mid,
+                    FIRST_VALUE(volume) OVER (bucket ORDER BY snapshot_time) AS open_volume,
+                    MIN(snapshot_time) OVER bucket AS first_snapshot_time,
+                    MAX(mid) OVER bucket AS high_mid,
+                    MIN(mid) OVER bucket AS low_mid,
+                    COUNT(*) OVER bucket AS sample_count
+                FROM (
+                    SELECT
+                        *,
+                        strftime('{bucket_format}', snapshot_time) AS bucket_start,
+                        (yes_bid + yes_ask) / 2.0 AS mid
+                    FROM price_snapshots
+                )
+                WINDOW bucket AS (PARTITION BY ticker, bucket_start)
+            )
+            WHERE rn = 1
+            """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_price_rollups_resolution_bucket", table_name="price_rollups")
+    op.drop_table("price_rollups")
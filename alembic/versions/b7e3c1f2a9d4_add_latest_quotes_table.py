@@ -0,0 +1,62 @@
+"""add latest quotes table
+
+Revision ID: b7e3c1f2a9d4
+Revises: cbbf8e286441
+Create Date: 2026-10-18 10:12:44.318205
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e3c1f2a9d4"
+down_revision: str | Sequence[str] | None = "cbbf8e286441"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Creates the `latest_quotes` table (one row per ticker, kept current by the snapshot
+    collector) and backfills it from the newest row per ticker in `price_snapshots`.
+    """
+    op.create_table(
+        "latest_quotes",
+        sa.Column("ticker", sa.String(length=100), nullable=False),
+        sa.Column("snapshot_time", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("yes_bid", sa.Integer(), nullable=False),
+        sa.Column("yes_ask", sa.Integer(), nullable=False),
+        sa.Column("no_bid", sa.Integer(), nullable=False),
+        sa.Column("no_ask", sa.Integer(), nullable=False),
+        sa.Column("last_price", sa.Integer(), nullable=True),
+        sa.Column("volume", sa.Integer(), nullable=False),
+        sa.Column("volume_24h", sa.Integer(), nullable=False),
+        sa.Column("open_interest", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["ticker"], ["markets.ticker"]),
+        sa.PrimaryKeyConstraint("ticker"),
+    )
+    op.create_index("idx_latest_quotes_snapshot_time", "latest_quotes", ["snapshot_time"])
+
+    op.execute(
+        """
+        INSERT OR REPLACE INTO latest_quotes (
+            ticker, snapshot_time, yes_bid, yes_ask, no_bid, no_ask,
+            last_price, volume, volume_24h, open_interest
+        )
+        SELECT
+            ticker, MAX(snapshot_time), yes_bid, yes_ask, no_bid, no_ask,
+            last_price, volume, volume_24h, open_interest
+        FROM price_snapshots
+        GROUP BY ticker
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_latest_quotes_snapshot_time", table_name="latest_quotes")
+    op.drop_table("latest_quotes")
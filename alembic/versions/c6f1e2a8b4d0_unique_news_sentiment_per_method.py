@@ -0,0 +1,44 @@
+"""unique news sentiment per article and method
+
+Revision ID: c6f1e2a8b4d0
+Revises: a3d6e8f0b2c4
+Create Date: 2026-10-18 21:02:45.118304
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c6f1e2a8b4d0"
+down_revision: str | Sequence[str] | None = "a3d6e8f0b2c4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Keeps one `news_sentiments` row per (article, method), the newest, so re-scoring can upsert
+    results under a method version.
+    """
+    op.execute(
+        """
+        DELETE FROM news_sentiments
+        WHERE id NOT IN (
+            SELECT MAX(id) FROM news_sentiments GROUP BY article_id, method
+        )
+        """
+    )
+    op.create_index(
+        "uq_news_sentiments_article_method",
+        "news_sentiments",
+        ["article_id", "method"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("uq_news_sentiments_article_method", table_name="news_sentiments")
@@ -0,0 +1,67 @@
+"""add news sentiment daily table
+
+Revision ID: d8a4f0c3e6b1
+Revises: c6f1e2a8b4d0
+Create Date: 2026-10-18 21:47:09.531862
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d8a4f0c3e6b1"
+down_revision: str | Sequence[str] | None = "c6f1e2a8b4d0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Creates `news_sentiment_daily` (per market, sentiment method and collection day; kept
+    current by news collection and re-scoring) and backfills it from `news_sentiments`.
+    """
+    op.create_table(
+        "news_sentiment_daily",
+        sa.Column("ticker", sa.String(length=100), nullable=False),
+        sa.Column("method", sa.String(length=50), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("article_count", sa.Integer(), nullable=False),
+        sa.Column("score_sum", sa.Float(), nullable=False),
+        sa.Column("score_sq_sum", sa.Float(), nullable=False),
+        sa.Column("positive_count", sa.Integer(), nullable=False),
+        sa.Column("negative_count", sa.Integer(), nullable=False),
+        sa.Column("neutral_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["ticker"], ["markets.ticker"]),
+        sa.PrimaryKeyConstraint("ticker", "method", "bucket_start"),
+    )
+    op.execute(
+        """
+        INSERT INTO news_sentiment_daily (
+            ticker, method, bucket_start, article_count, score_sum, score_sq_sum,
+            positive_count, negative_count, neutral_count
+        )
+        SELECT
+            m.ticker,
+            s.method,
+            strftime('%Y-%m-%d 00:00:00.000000', a.collected_at),
+            COUNT(*),
+            SUM(s.score),
+            SUM(s.score * s.score),
+            SUM(s.label = 'positive'),
+            SUM(s.label = 'negative'),
+            SUM(s.label = 'neutral')
+        FROM news_sentiments s
+        JOIN news_articles a ON a.id = s.article_id
+        JOIN news_article_markets m ON m.article_id = a.id
+        GROUP BY 1, 2, 3
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("news_sentiment_daily")
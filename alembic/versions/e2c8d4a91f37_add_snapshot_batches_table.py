@@ -0,0 +1,47 @@
+"""add snapshot batches table
+
+Revision ID: e2c8d4a91f37
+Revises: b7e3c1f2a9d4
+Create Date: 2026-10-18 16:05:21.417092
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2c8d4a91f37"
+down_revision: str | Sequence[str] | None = "b7e3c1f2a9d4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Creates `snapshot_batches` (one row per `take_snapshot` run). Snapshots taken before this
+    migration have no batch rows; batch-aware readers only see runs recorded from now on.
+    """
+    op.create_table(
+        "snapshot_batches",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("snapshot_time", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("market_count", sa.Integer(), nullable=False),
+        sa.Column("skipped_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("snapshot_time"),
+    )
+    op.create_index(
+        "idx_snapshot_batches_status_time", "snapshot_batches", ["status", "snapshot_time"]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_snapshot_batches_status_time", table_name="snapshot_batches")
+    op.drop_table("snapshot_batches")
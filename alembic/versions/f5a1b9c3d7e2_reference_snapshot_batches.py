@@ -0,0 +1,76 @@
+"""reference snapshot batches from price snapshots
+
+Revision ID: f5a1b9c3d7e2
+Revises: e2c8d4a91f37
+Create Date: 2026-10-18 18:42:09.553210
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f5a1b9c3d7e2"
+down_revision: str | Sequence[str] | None = "e2c8d4a91f37"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Adds `price_snapshots.batch_id` plus the batch `status_filter` / `truncated` columns, then
+    backfills: every legacy `snapshot_time` without a batch row becomes a "complete" batch (its
+    status filter is unknown), and every snapshot row is pointed at its batch.
+    """
+    with op.batch_alter_table("snapshot_batches", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("status_filter", sa.String(), nullable=True))
+        batch_op.add_column(
+            sa.Column("truncated", sa.Boolean(), nullable=False, server_default=sa.false())
+        )
+
+    with op.batch_alter_table("price_snapshots", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("batch_id", sa.Integer(), nullable=True))
+        batch_op.create_foreign_key(
+            "fk_price_snapshots_batch_id", "snapshot_batches", ["batch_id"], ["id"]
+        )
+        batch_op.create_index("idx_snapshots_batch_ticker", ["batch_id", "ticker"])
+
+    op.execute(
+        """
+        INSERT INTO snapshot_batches (
+            snapshot_time, status, started_at, finished_at, market_count, skipped_count, truncated
+        )
+        SELECT snapshot_time, 'complete', snapshot_time, snapshot_time, COUNT(*), 0, 0
+        FROM price_snapshots
+        WHERE snapshot_time NOT IN (SELECT snapshot_time FROM snapshot_batches)
+        GROUP BY snapshot_time
+        """
+    )
+    op.execute(
+        """
+        UPDATE price_snapshots
+        SET batch_id = (
+            SELECT b.id FROM snapshot_batches AS b
+            WHERE b.snapshot_time = price_snapshots.snapshot_time
+        )
+        WHERE batch_id IS NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema.
+
+    Backfilled batch rows are kept; they are indistinguishable from recorded runs.
+    """
+    with op.batch_alter_table("price_snapshots", schema=None) as batch_op:
+        batch_op.drop_index("idx_snapshots_batch_ticker")
+        batch_op.drop_constraint("fk_price_snapshots_batch_id", type_="foreignkey")
+        batch_op.drop_column("batch_id")
+
+    with op.batch_alter_table("snapshot_batches", schema=None) as batch_op:
+        batch_op.drop_column("truncated")
+        batch_op.drop_column("status_filter")
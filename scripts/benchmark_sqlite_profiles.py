@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Benchmark SQLite performance profiles on the collector's write workloads.
+
+Runs two synthetic workloads against a fresh temporary database per profile:
+- sync: upsert markets (and placeholder events) one API page per transaction
+- snapshot: insert price snapshots for every market, one API page per transaction
+
+Both mirror how `DataFetcher` writes, using the real repositories and `DatabaseManager`, so the
+numbers reflect the pragmas and pool settings each profile applies. The interesting column is
+the commit-heavy snapshot workload: with `synchronous=FULL` every commit waits for an fsync.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from kalshi_research.data import SQLITE_PROFILES, DatabaseManager
+from kalshi_research.data.models import Event, Market, PriceSnapshot
+from kalshi_research.data.repositories import EventRepository, MarketRepository, PriceRepository
+
+PAGE_SIZE = 200
+
+
+def _market(i: int, now: datetime) -> Market:
+    return Market(
+        ticker=f"BENCH-{i:06d}",
+        event_ticker=f"BENCH-EVT-{i // 10:05d}",
+        series_ticker="BENCH",
+        title=f"Benchmark market {i}",
+        subtitle=None,
+        status="active",
+        result=None,
+        open_time=now - timedelta(days=1),
+        close_time=now + timedelta(days=30),
+        expiration_time=now + timedelta(days=31),
+        category=None,
+        subcategory=None,
+    )
+
+
+async def _sync_workload(db: DatabaseManager, markets: int) -> float:
+    now = datetime.now(UTC)
+    started = time.perf_counter()
+    for page_start in range(0, markets, PAGE_SIZE):
+        async with db.session_factory() as session, session.begin():
+            event_repo = EventRepository(session)
+            market_repo = MarketRepository(session)
+            for i in range(page_start, min(page_start + PAGE_SIZE, markets)):
+                market = _market(i, now)
+                await event_repo.insert_ignore(
+                    Event(
+                        ticker=market.event_ticker,
+                        series_ticker="BENCH",
+                        title=market.event_ticker,
+                        mutually_exclusive=False,
+                    )
+                )
+                await market_repo.upsert(market)
+    return time.perf_counter() - started
+
+
+async def _snapshot_workload(db: DatabaseManager, markets: int, cycles: int) -> float:
+    started = time.perf_counter()
+    for cycle in range(cycles):
+        snapshot_time = datetime.now(UTC) + timedelta(minutes=15 * cycle)
+        for page_start in range(0, markets, PAGE_SIZE):
+            async with db.session_factory() as session, session.begin():
+                price_repo = PriceRepository(session)
+                snapshots = [
+                    PriceSnapshot(
+                        ticker=f"BENCH-{i:06d}",
+                        snapshot_time=snapshot_time,
+                        yes_bid=45,
+                        yes_ask=47,
+                        no_bid=53,
+                        no_ask=55,
+                        last_price=46,
+                        volume=1000 + cycle,
+                        volume_24h=100,
+                        open_interest=500,
+                    )
+                    for i in range(page_start, min(page_start + PAGE_SIZE, markets))
+                ]
+                await price_repo.add_many(snapshots, flush=False)
+    return time.perf_counter() - started
+
+
+async def _run_profile(profile: str, markets: int, cycles: int, workdir: Path) -> tuple[float, ...]:
+    db_path = workdir / f"bench-{profile}.db"
+    async with DatabaseManager(db_path, profile=profile) as db:
+        await db.create_tables()
+        sync_seconds = await _sync_workload(db, markets)
+        snapshot_seconds = await _snapshot_workload(db, markets, cycles)
+    return (sync_seconds, snapshot_seconds)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark SQLite performance profiles.")
+    parser.add_argument("--markets", type=int, default=5000, help="Markets per sweep.")
+    parser.add_argument("--cycles", type=int, default=5, help="Snapshot cycles to write.")
+    parser.add_argument(
+        "--profiles",
+        default="default,collector,bulk-load",
+        help="Comma-separated profile names (default: default,collector,bulk-load).",
+    )
+    parser.add_argument(
+        "--dir",
+        default=None,
+        help="Directory for temporary databases (use a real disk, not tmpfs, to see fsync cost).",
+    )
+    args = parser.parse_args(argv)
+
+    profiles = [p.strip() for p in args.profiles.split(",") if p.strip()]
+    unknown = [p for p in profiles if p not in SQLITE_PROFILES]
+    if unknown:
+        print(f"ERROR: Unknown profiles: {', '.join(unknown)}")
+        return 2
+
+    print(f"markets={args.markets} cycles={args.cycles} page_size={PAGE_SIZE}")
+    print(f"{'profile':<12} {'sync (s)':>10} {'snapshot (s)':>13} {'rows/s':>10}")
+    with tempfile.TemporaryDirectory(prefix="kalshi-bench-", dir=args.dir) as tmp:
+        for profile in profiles:
+            sync_s, snapshot_s = asyncio.run(
+                _run_profile(profile, args.markets, args.cycles, Path(tmp))
+            )
+            rows_per_s = args.markets * args.cycles / snapshot_s if snapshot_s else 0.0
+            print(f"{profile:<12} {sync_s:>10.2f} {snapshot_s:>13.2f} {rows_per_s:>10.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,15 @@
 """Research agent system for cost-bounded, reproducible research automation."""
 
+from kalshi_research.agent.batch import BatchAgentRunner
 from kalshi_research.agent.orchestrator import AgentKernel
 from kalshi_research.agent.research_agent import ResearchAgent
 from kalshi_research.agent.schemas import (
     AgentRunResult,
     AnalysisFactor,
     AnalysisResult,
+    BatchMarketResult,
+    BatchMarketStatus,
+    BatchRunResult,
     Factor,
     MarketInfo,
     MarketPriceSnapshot,
@@ -22,6 +26,10 @@ __all__ = [
     "AgentRunResult",
     "AnalysisFactor",
     "AnalysisResult",
+    "BatchAgentRunner",
+    "BatchMarketResult",
+    "BatchMarketStatus",
+    "BatchRunResult",
     "Factor",
     "MarketInfo",
     "MarketPriceSnapshot",
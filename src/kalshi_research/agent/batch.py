@@ -0,0 +1,318 @@
+"""Batch agent runs: the `AgentKernel` workflow across many markets at once.
+
+Running `AgentKernel.analyze` once per ticker repeats work that a watchlist refresh can share:
+
+- Markets are fetched with batched `tickers=` lookups, and price snapshots come from the
+  fetched markets' top-of-book fields instead of one orderbook request per ticker.
+- Research runs once per event; every market in the event is synthesized from that summary.
+- Research and LLM synthesis run concurrently, up to a fixed number of calls in flight.
+- Exa and LLM spend are bounded for the whole batch, not only per call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+import structlog
+
+from kalshi_research.constants import (
+    DEFAULT_AGENT_BATCH_CONCURRENCY,
+    DEFAULT_AGENT_BATCH_MAX_EXA_USD,
+    DEFAULT_AGENT_BATCH_MAX_LLM_USD,
+    DEFAULT_AGENT_MAX_EXA_USD,
+    DEFAULT_AGENT_MAX_LLM_USD,
+)
+from kalshi_research.exa.exceptions import ExaError
+from kalshi_research.exa.policy import ExaBudget, ExaMode
+
+from .providers.kalshi import market_info_from_market, price_snapshot_from_market
+from .providers.llm import SynthesisInput
+from .schemas import (
+    AgentRunResult,
+    BatchMarketResult,
+    BatchMarketStatus,
+    BatchRunResult,
+    ResearchSummary,
+)
+from .verify import verify_analysis
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from kalshi_research.analysis.scanner import ScanResult
+    from kalshi_research.api.client import KalshiPublicClient
+    from kalshi_research.api.models.market import Market
+
+    from .providers.llm import StructuredSynthesizer
+    from .research_agent import ResearchAgent
+
+logger = structlog.get_logger()
+
+
+class BatchAgentRunner:
+    """Runs the agent workflow (fetch → research → synthesize → verify) for many markets.
+
+    Budgets work by reservation, like `ResearchAgent` steps: each event's research reserves
+    `per_event_exa_usd` and each synthesis reserves `per_market_llm_usd` against the batch
+    totals before starting, then settles with its actual cost (a failed synthesis settles at the
+    full reservation, since its cost is unknown). The LLM reservation is the synthesizer's
+    per-call cap (`ClaudeSynthesizer` sizes `max_tokens` from its model pricing to stay under it),
+    so concurrent calls cannot overspend the batch together. Work that does not fit the remaining
+    budget is skipped rather than started.
+
+    A failure in one market (or one event's research) is recorded in its result; the rest of the
+    batch carries on.
+    """
+
+    def __init__(
+        self,
+        *,
+        kalshi_client: KalshiPublicClient,
+        research_agent: ResearchAgent | None = None,
+        synthesizer: StructuredSynthesizer,
+        max_exa_usd: float = DEFAULT_AGENT_BATCH_MAX_EXA_USD,
+        max_llm_usd: float = DEFAULT_AGENT_BATCH_MAX_LLM_USD,
+        per_event_exa_usd: float = DEFAULT_AGENT_MAX_EXA_USD,
+        per_market_llm_usd: float = DEFAULT_AGENT_MAX_LLM_USD,
+        max_concurrency: int = DEFAULT_AGENT_BATCH_CONCURRENCY,
+    ):
+        """Initialize batch runner.
+
+        Args:
+            kalshi_client: Kalshi public client for market data
+            research_agent: Optional research agent (if None, skips research)
+            synthesizer: LLM synthesizer, shared by all markets
+            max_exa_usd: Maximum Exa spend for the whole batch
+            max_llm_usd: Maximum LLM spend for the whole batch
+            per_event_exa_usd: Research budget for each event
+            per_market_llm_usd: Budget for each market's synthesis (the synthesizer's cap)
+            max_concurrency: Research runs and syntheses in flight at once
+        """
+        if max_exa_usd <= 0 or max_llm_usd <= 0:
+            raise ValueError("Batch budgets must be positive")
+        if per_event_exa_usd <= 0 or per_market_llm_usd <= 0:
+            raise ValueError("Per-event and per-market budgets must be positive")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.kalshi_client = kalshi_client
+        self.research_agent = research_agent
+        self.synthesizer = synthesizer
+        self.max_exa_usd = max_exa_usd
+        self.max_llm_usd = max_llm_usd
+        self.per_event_exa_usd = per_event_exa_usd
+        self.per_market_llm_usd = per_market_llm_usd
+        self.max_concurrency = max_concurrency
+
+    async def run(
+        self,
+        markets: Iterable[str | ScanResult],
+        *,
+        research_mode: ExaMode = ExaMode.STANDARD,
+    ) -> BatchRunResult:
+        """Analyze markets given as tickers or scan results.
+
+        Args:
+            markets: Market tickers or `ScanResult`s (duplicates are analyzed once)
+            research_mode: Research mode (fast, standard, deep)
+
+        Returns:
+            BatchRunResult with one entry per requested ticker, in request order.
+
+        Raises:
+            KalshiAPIError: If the batched market lookup fails
+        """
+        started_at = datetime.now(UTC)
+        tickers = list(
+            dict.fromkeys(item if isinstance(item, str) else item.ticker for item in markets)
+        )
+        fetched = {m.ticker: m for m in await self.kalshi_client.get_markets_by_tickers(tickers)}
+
+        results: dict[str, BatchMarketResult] = {}
+        events: dict[str, list[Market]] = {}
+        for ticker in tickers:
+            market = fetched.get(ticker)
+            if market is None:
+                results[ticker] = _outcome(ticker, BatchMarketStatus.SKIPPED, reason="not_found")
+            else:
+                events.setdefault(market.event_ticker, []).append(market)
+
+        run = _BatchState(
+            exa_budget=ExaBudget(limit_usd=self.max_exa_usd),
+            llm_budget=ExaBudget(limit_usd=self.max_llm_usd),
+            semaphore=asyncio.Semaphore(self.max_concurrency),
+        )
+        logger.info("Batch agent run started", markets=len(tickers), events=len(events))
+        for outcomes in await asyncio.gather(
+            *(self._run_event(group, research_mode, run) for group in events.values())
+        ):
+            results.update((outcome.ticker, outcome) for outcome in outcomes)
+
+        result = BatchRunResult(
+            research_mode=research_mode.value,
+            markets=[results[ticker] for ticker in tickers],
+            events_researched=run.events_researched,
+            exa_cost_usd=run.exa_budget.spent_usd,
+            llm_cost_usd=run.llm_budget.spent_usd,
+            max_exa_usd=self.max_exa_usd,
+            max_llm_usd=self.max_llm_usd,
+            started_at=started_at,
+            finished_at=datetime.now(UTC),
+        )
+        logger.info(
+            "Batch agent run finished",
+            completed=result.count(BatchMarketStatus.COMPLETED),
+            failed=result.count(BatchMarketStatus.FAILED),
+            skipped=result.count(BatchMarketStatus.SKIPPED),
+            exa_cost_usd=result.exa_cost_usd,
+            llm_cost_usd=result.llm_cost_usd,
+        )
+        return result
+
+    async def _run_event(
+        self, markets: list[Market], mode: ExaMode, run: _BatchState
+    ) -> list[BatchMarketResult]:
+        """Research an event once, then synthesize each of its markets."""
+        research: ResearchSummary | None = None
+        if self.research_agent is not None:
+            try:
+                research = await self._research_event(self.research_agent, markets[0], mode, run)
+            except Exception as exc:
+                # Not only ExaError: ResearchAgent re-raises anything else (e.g. a malformed
+                # payload), and one event must not abort the batch.
+                logger.warning(
+                    "Batch event research failed",
+                    event_ticker=markets[0].event_ticker,
+                    error=str(exc),
+                    exc_info=not isinstance(exc, ExaError),
+                )
+                return [
+                    _outcome(m.ticker, BatchMarketStatus.FAILED, m, reason=f"research: {exc}")
+                    for m in markets
+                ]
+            if research is None:
+                return [
+                    _outcome(m.ticker, BatchMarketStatus.SKIPPED, m, reason="exa_budget_exhausted")
+                    for m in markets
+                ]
+
+        # Markets in the event share the research cost, so per-market totals add up.
+        research_share = research.total_cost_usd / len(markets) if research is not None else 0.0
+        return list(
+            await asyncio.gather(
+                *(self._analyze_market(m, research, research_share, run) for m in markets)
+            )
+        )
+
+    async def _research_event(
+        self, agent: ResearchAgent, market: Market, mode: ExaMode, run: _BatchState
+    ) -> ResearchSummary | None:
+        """Research `market` for its whole event; None if the Exa budget cannot cover it."""
+        async with run.semaphore:
+            if not run.exa_budget.reserve(self.per_event_exa_usd):
+                logger.warning(
+                    "Batch Exa budget exhausted; skipping event",
+                    event_ticker=market.event_ticker,
+                    remaining=run.exa_budget.remaining_usd,
+                )
+                return None
+            # Failed research may have paid for some steps; like a failed synthesis, count it at
+            # the reservation.
+            actual_cost = self.per_event_exa_usd
+            try:
+                summary = await agent.research(market, mode=mode, budget_usd=self.per_event_exa_usd)
+                actual_cost = summary.total_cost_usd
+            finally:
+                run.exa_budget.settle(self.per_event_exa_usd, actual_cost)
+        run.events_researched += 1
+        return summary
+
+    async def _analyze_market(
+        self,
+        market: Market,
+        research: ResearchSummary | None,
+        research_cost_usd: float,
+        run: _BatchState,
+    ) -> BatchMarketResult:
+        """Synthesize and verify one market's estimate."""
+        async with run.semaphore:
+            if not run.llm_budget.reserve(self.per_market_llm_usd):
+                return _outcome(
+                    market.ticker, BatchMarketStatus.SKIPPED, market, reason="llm_budget_exhausted"
+                )
+            # A failed call may still have been billed (e.g. a response without a usable tool
+            # call), and the shared synthesizer's last-call cost may belong to another market:
+            # count it at the reserved cap unless the call succeeds.
+            llm_cost = self.per_market_llm_usd
+            try:
+                synthesis_input = SynthesisInput(
+                    market=market_info_from_market(market),
+                    snapshot=price_snapshot_from_market(market),
+                    research=research,
+                )
+                analysis = await self.synthesizer.synthesize(input=synthesis_input)
+                # Read before the next await: the synthesizer is shared, and its last-call
+                # cost is only this market's until another synthesis finishes.
+                llm_cost = self.synthesizer.get_last_call_cost_usd()
+            except Exception as exc:
+                logger.warning(
+                    "Batch market synthesis failed",
+                    ticker=market.ticker,
+                    error=str(exc),
+                    exc_info=True,
+                )
+                return _outcome(
+                    market.ticker, BatchMarketStatus.FAILED, market, reason=f"synthesis: {exc}"
+                )
+            finally:
+                run.llm_budget.settle(self.per_market_llm_usd, llm_cost)
+
+        verification = verify_analysis(analysis)
+        if verification.suggested_escalation:
+            logger.info(
+                "Escalation suggested (deferred)",
+                ticker=market.ticker,
+                issues=verification.issues,
+            )
+        return _outcome(
+            market.ticker,
+            BatchMarketStatus.COMPLETED,
+            market,
+            result=AgentRunResult(
+                analysis=analysis,
+                verification=verification,
+                research=research,
+                escalated=False,
+                total_cost_usd=research_cost_usd + llm_cost,
+            ),
+        )
+
+
+@dataclass
+class _BatchState:
+    """Budgets and concurrency limit shared by every task of one batch run."""
+
+    exa_budget: ExaBudget
+    llm_budget: ExaBudget
+    semaphore: asyncio.Semaphore
+    events_researched: int = 0
+
+
+def _outcome(
+    ticker: str,
+    status: BatchMarketStatus,
+    market: Market | None = None,
+    *,
+    result: AgentRunResult | None = None,
+    reason: str | None = None,
+) -> BatchMarketResult:
+    return BatchMarketResult(
+        ticker=ticker,
+        event_ticker=market.event_ticker if market is not None else None,
+        status=status,
+        result=result,
+        reason=reason,
+    )
@@ -27,7 +27,11 @@ async def fetch_market_info(client: KalshiPublicClient, ticker: str) -> MarketIn
         httpx.HTTPStatusError: If ticker not found or API error
     """
     market: Market = await client.get_market(ticker=ticker)
+    return market_info_from_market(market)
 
+
+def market_info_from_market(market: Market) -> MarketInfo:
+    """Build MarketInfo from an already fetched market."""
     return MarketInfo(
         ticker=market.ticker,
         event_ticker=market.event_ticker,
@@ -88,3 +92,29 @@ async def fetch_price_snapshot(client: KalshiPublicClient, ticker: str) -> Marke
         spread_cents=spread_cents,
         captured_at=datetime.now(UTC),
     )
+
+
+def price_snapshot_from_market(market: Market) -> MarketPriceSnapshot:
+    """Derive a price snapshot from a market's top-of-book fields.
+
+    Unlike `fetch_price_snapshot`, this needs no orderbook request, so markets fetched in bulk
+    (`get_markets_by_tickers`) can be snapshotted without one request per ticker. Missing
+    quotes are treated like an empty orderbook side.
+    """
+    yes_bid = market.yes_bid_cents or 0
+    no_bid = market.no_bid_cents or 0
+    yes_ask = market.yes_ask_cents if market.yes_ask_cents is not None else 100 - no_bid
+    no_ask = market.no_ask_cents if market.no_ask_cents is not None else 100 - yes_bid
+
+    return MarketPriceSnapshot(
+        yes_bid_cents=yes_bid,
+        yes_ask_cents=yes_ask,
+        no_bid_cents=no_bid,
+        no_ask_cents=no_ask,
+        last_price_cents=market.last_price_cents,
+        volume_24h=market.volume_24h or 0,
+        open_interest=market.open_interest or 0,
+        midpoint_prob=(yes_bid + yes_ask) / 200.0,
+        spread_cents=yes_ask - yes_bid,
+        captured_at=datetime.now(UTC),
+    )
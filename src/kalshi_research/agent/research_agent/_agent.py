@@ -5,6 +5,7 @@ This module contains the ResearchAgent class that orchestrates research workflow
 
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING
 
 import structlog
@@ -14,16 +15,16 @@ from kalshi_research.agent.research_agent._plan_builder import (
     _generate_queries,
     build_research_plan,
 )
+from kalshi_research.agent.research_agent._scheduler import run_plan_steps
 from kalshi_research.agent.schemas import (
     Factor,
     ResearchPlan,
     ResearchStep,
     ResearchStepResult,
-    ResearchStepStatus,
     ResearchSummary,
 )
 from kalshi_research.agent.state import ResearchTaskState
-from kalshi_research.exa.exceptions import ExaError
+from kalshi_research.constants import DEFAULT_AGENT_RESEARCH_CONCURRENCY
 from kalshi_research.exa.policy import ExaBudget, ExaMode, ExaPolicy
 
 if TYPE_CHECKING:
@@ -42,8 +43,18 @@ class ResearchAgent:
         summary = await agent.research(market, mode="standard", budget_usd=0.50)
     """
 
-    def __init__(self, exa: ExaClient) -> None:
+    def __init__(
+        self, exa: ExaClient, *, max_concurrency: int = DEFAULT_AGENT_RESEARCH_CONCURRENCY
+    ) -> None:
+        """
+        Args:
+            exa: Exa client shared by all steps.
+            max_concurrency: Maximum number of plan steps running at once.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
         self._exa = exa
+        self._max_concurrency = max_concurrency
         self._state = ResearchTaskState()
         self._executor = StepExecutor(exa=exa, state=self._state)
 
@@ -91,6 +102,9 @@ class ResearchAgent:
         """
         Execute a research plan with budget enforcement.
 
+        Independent steps run concurrently (see `run_plan_steps`); results are reported in plan
+        order.
+
         Args:
             plan: Research plan to execute
             market: Market metadata
@@ -108,72 +122,26 @@ class ResearchAgent:
             budget_limit=budget.limit_usd,
         )
 
+        run = await run_plan_steps(
+            plan.steps,
+            partial(self._executor.execute_step, market=market),
+            budget=budget,
+            max_concurrency=self._max_concurrency,
+        )
+
+        # Assemble in plan order, however the steps interleaved.
         factors: list[Factor] = []
         queries_used: list[str] = []
         total_sources = 0
-        step_results: list[dict[str, object]] = []
-        budget_exhausted = False
-
         for step in plan.steps:
-            # Check budget before executing step
-            if not budget.can_spend(step.estimated_cost_usd):
-                logger.warning(
-                    "budget_exhausted_skipping_step",
-                    step_id=step.step_id,
-                    remaining=budget.remaining_usd,
-                    estimated=step.estimated_cost_usd,
-                )
-                budget_exhausted = True
-                step_results.append(
-                    {
-                        "step_id": step.step_id,
-                        "status": ResearchStepStatus.SKIPPED.value,
-                        "actual_cost_usd": 0.0,
-                        "reason": "budget_exhausted",
-                    }
-                )
+            result = run.results.get(step.step_id)
+            if result is None:
                 continue
-
-            # Execute step
-            try:
-                result = await self._executor.execute_step(step, market)
-                budget.record_spend(result.actual_cost_usd)
-
-                step_results.append(
-                    {
-                        "step_id": result.step_id,
-                        "status": result.status.value,
-                        "actual_cost_usd": result.actual_cost_usd,
-                        "sources_found": result.sources_found,
-                    }
-                )
-
-                total_sources += result.sources_found
-
-                factors.extend(result.factors)
-
-                # Track queries
-                query = step.params.get("query")
-                if query and isinstance(query, str):
-                    queries_used.append(query)
-
-            except (ExaError, TimeoutError) as exc:
-                logger.error("step_execution_failed", step_id=step.step_id, error=str(exc))
-                step_results.append(
-                    {
-                        "step_id": step.step_id,
-                        "status": ResearchStepStatus.FAILED.value,
-                        "actual_cost_usd": 0.0,
-                        "error": str(exc),
-                    }
-                )
-            except Exception:
-                logger.exception(
-                    "step_execution_crashed",
-                    step_id=step.step_id,
-                    endpoint=step.endpoint,
-                )
-                raise
+            total_sources += result.sources_found
+            factors.extend(result.factors)
+            query = step.params.get("query")
+            if query and isinstance(query, str):
+                queries_used.append(query)
 
         return ResearchSummary(
             ticker=market.ticker,
@@ -184,8 +152,8 @@ class ResearchAgent:
             total_sources_found=total_sources,
             total_cost_usd=budget.spent_usd,
             budget_usd=budget.limit_usd,
-            budget_exhausted=budget_exhausted,
-            steps_executed=step_results,
+            budget_exhausted=run.budget_exhausted,
+            steps_executed=[run.records[step.step_id] for step in plan.steps],
         )
 
     async def research(
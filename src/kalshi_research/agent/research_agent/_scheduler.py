@@ -0,0 +1,161 @@
+"""Concurrent execution of research plan steps.
+
+Steps form a dependency graph through `ResearchStep.depends_on`. Every step whose dependencies
+have completed may run at once, up to a concurrency cap, so a plan takes about as long as its
+longest chain of steps rather than the sum of all of them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from kalshi_research.agent.schemas import ResearchStepStatus
+from kalshi_research.exa.exceptions import ExaError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine, Sequence
+
+    from kalshi_research.agent.schemas import ResearchStep, ResearchStepResult
+    from kalshi_research.exa.policy import ExaBudget
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class PlanRun:
+    """Per-step outcomes of a plan run, keyed by step_id."""
+
+    records: dict[str, dict[str, object]] = field(default_factory=dict)
+    results: dict[str, ResearchStepResult] = field(default_factory=dict)
+    budget_exhausted: bool = False
+
+
+async def run_plan_steps(
+    steps: Sequence[ResearchStep],
+    execute: Callable[[ResearchStep], Coroutine[Any, Any, ResearchStepResult]],
+    *,
+    budget: ExaBudget,
+    max_concurrency: int,
+) -> PlanRun:
+    """Execute plan steps concurrently as their dependencies complete.
+
+    Steps start in plan order. Each reserves its estimated cost on `budget` before starting and
+    settles it with the actual cost when done, so concurrent steps never overspend the limit
+    together. When the next step does not fit, it waits for running steps to settle; once nothing
+    is running it is skipped as over budget. Steps whose dependencies did not complete are
+    skipped. Deep research steps run one at a time, since crash-recovery state is kept per
+    ticker.
+
+    Exa errors and timeouts mark a step failed; any other exception cancels the running steps
+    (deep research task ids are already persisted for recovery) and propagates.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+    run = PlanRun()
+    order = {step.step_id: index for index, step in enumerate(steps)}
+    pending = list(steps)
+    running: dict[asyncio.Task[ResearchStepResult], ResearchStep] = {}
+    try:
+        while pending or running:
+            _start_ready_steps(run, pending, running, execute, budget, max_concurrency)
+            if not running:
+                if pending:
+                    raise RuntimeError("Internal error: research plan steps cannot be scheduled")
+                break
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=lambda t: order[running[t].step_id]):
+                _finish(run, running.pop(task), task, budget)
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+
+    return run
+
+
+def _start_ready_steps(
+    run: PlanRun,
+    pending: list[ResearchStep],
+    running: dict[asyncio.Task[ResearchStepResult], ResearchStep],
+    execute: Callable[[ResearchStep], Coroutine[Any, Any, ResearchStepResult]],
+    budget: ExaBudget,
+    max_concurrency: int,
+) -> None:
+    """Start pending steps in plan order until the cap is hit or the budget must wait."""
+    for step in list(pending):
+        if len(running) >= max_concurrency:
+            return
+        if any(dep not in run.records for dep in step.depends_on):
+            continue
+        if any(dep not in run.results for dep in step.depends_on):
+            _skip(run, pending, step, "dependency_not_completed")
+            continue
+        if step.endpoint == "research" and any(
+            other.endpoint == "research" for other in running.values()
+        ):
+            continue
+        if not budget.reserve(step.estimated_cost_usd):
+            if running:
+                # Settling in-flight steps may free enough budget: keep plan order.
+                return
+            logger.warning(
+                "budget_exhausted_skipping_step",
+                step_id=step.step_id,
+                remaining=budget.remaining_usd,
+                estimated=step.estimated_cost_usd,
+            )
+            run.budget_exhausted = True
+            _skip(run, pending, step, "budget_exhausted")
+            continue
+        pending.remove(step)
+        running[asyncio.create_task(execute(step))] = step
+
+
+def _skip(run: PlanRun, pending: list[ResearchStep], step: ResearchStep, reason: str) -> None:
+    pending.remove(step)
+    run.records[step.step_id] = {
+        "step_id": step.step_id,
+        "status": ResearchStepStatus.SKIPPED.value,
+        "actual_cost_usd": 0.0,
+        "reason": reason,
+    }
+
+
+def _finish(
+    run: PlanRun,
+    step: ResearchStep,
+    task: asyncio.Task[ResearchStepResult],
+    budget: ExaBudget,
+) -> None:
+    try:
+        result = task.result()
+    except (ExaError, TimeoutError) as exc:
+        budget.settle(step.estimated_cost_usd, 0.0)
+        logger.error("step_execution_failed", step_id=step.step_id, error=str(exc))
+        run.records[step.step_id] = {
+            "step_id": step.step_id,
+            "status": ResearchStepStatus.FAILED.value,
+            "actual_cost_usd": 0.0,
+            "error": str(exc),
+        }
+        return
+    except Exception:
+        budget.settle(step.estimated_cost_usd, 0.0)
+        logger.exception("step_execution_crashed", step_id=step.step_id, endpoint=step.endpoint)
+        raise
+
+    budget.settle(step.estimated_cost_usd, result.actual_cost_usd)
+    run.results[step.step_id] = result
+    run.records[step.step_id] = {
+        "step_id": result.step_id,
+        "status": result.status.value,
+        "actual_cost_usd": result.actual_cost_usd,
+        "sources_found": result.sources_found,
+    }
@@ -10,7 +10,7 @@ from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class ResearchStepStatus(str, Enum):
@@ -35,6 +35,10 @@ class ResearchStep(BaseModel):
     description: str = Field(description="Human-readable step description")
     estimated_cost_usd: float = Field(ge=0.0, description="Estimated cost before execution")
     params: dict[str, Any] = Field(default_factory=dict, description="Step-specific parameters")
+    depends_on: list[str] = Field(
+        default_factory=list,
+        description="step_ids of earlier steps that must complete before this one starts",
+    )
 
 
 class ResearchPlan(BaseModel):
@@ -49,6 +53,21 @@ class ResearchPlan(BaseModel):
     total_estimated_cost_usd: float = Field(ge=0.0, description="Sum of step estimates")
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
+    @model_validator(mode="after")
+    def _check_dependencies(self) -> ResearchPlan:
+        """Step ids are unique and steps only depend on earlier ones (so the graph is acyclic)."""
+        seen: set[str] = set()
+        for step in self.steps:
+            if step.step_id in seen:
+                raise ValueError(f"Duplicate step_id: {step.step_id}")
+            unknown = [dep for dep in step.depends_on if dep not in seen]
+            if unknown:
+                raise ValueError(
+                    f"Step {step.step_id} depends on unknown or later steps: {unknown}"
+                )
+            seen.add(step.step_id)
+        return self
+
     def model_dump_json(self, **kwargs: Any) -> str:
         """Serialize to JSON with datetime handling."""
         # Pydantic v2 handles datetime serialization natively
@@ -228,3 +247,46 @@ class AgentRunResult(BaseModel):
     def model_dump_json(self, **kwargs: Any) -> str:
         """Serialize to JSON with datetime handling."""
         return super().model_dump_json(**kwargs)
+
+
+# === Batch Agent Runs ===
+
+
+class BatchMarketStatus(str, Enum):
+    """Outcome of one market in a batch run."""
+
+    COMPLETED = "completed"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+
+class BatchMarketResult(BaseModel):
+    """Outcome of the agent workflow for one market in a batch run."""
+
+    model_config = ConfigDict(frozen=True)
+
+    ticker: str
+    event_ticker: str | None = None
+    status: BatchMarketStatus
+    result: AgentRunResult | None = None
+    reason: str | None = Field(default=None, description="Why the market failed or was skipped")
+
+
+class BatchRunResult(BaseModel):
+    """Result of a batch agent run across many markets."""
+
+    model_config = ConfigDict(frozen=True)
+
+    research_mode: str
+    markets: list[BatchMarketResult] = Field(default_factory=list)
+    events_researched: int = Field(ge=0, description="Research runs shared across markets")
+    exa_cost_usd: float = Field(ge=0.0)
+    llm_cost_usd: float = Field(ge=0.0)
+    max_exa_usd: float = Field(gt=0.0, description="Aggregate Exa budget for the batch")
+    max_llm_usd: float = Field(gt=0.0, description="Aggregate LLM budget for the batch")
+    started_at: datetime
+    finished_at: datetime
+
+    def count(self, status: BatchMarketStatus) -> int:
+        """Number of markets that ended with `status`."""
+        return sum(1 for market in self.markets if market.status == status)
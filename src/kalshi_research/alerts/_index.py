@@ -0,0 +1,133 @@
+"""Per-ticker condition index used by `AlertMonitor`."""
+
+from __future__ import annotations
+
+import bisect
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from kalshi_research.alerts.conditions import ConditionType
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from kalshi_research.alerts.conditions import AlertCondition
+
+_PRICE_TYPES = frozenset(
+    {ConditionType.PRICE_ABOVE, ConditionType.PRICE_BELOW, ConditionType.PRICE_CROSSES}
+)
+
+# (threshold, insertion sequence, condition) - sorted by threshold, ties by insertion order.
+_Entry = tuple[float, int, "AlertCondition"]
+
+
+def _threshold(entry: _Entry) -> float:
+    return entry[0]
+
+
+@dataclass
+class _TickerConditions:
+    """Conditions for one ticker: sorted threshold arrays for price checks, a list otherwise."""
+
+    sorted_by_type: dict[ConditionType, list[_Entry]] = field(default_factory=dict)
+    other: list[tuple[int, AlertCondition]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self.sorted_by_type.values()) + len(self.other)
+
+
+class ConditionIndex:
+    """
+    Index alert conditions by ticker and condition type.
+
+    Price-above/below/crosses thresholds are kept sorted per ticker, so finding the conditions
+    a new midpoint triggers is a bisect instead of a scan. Other condition types are evaluated
+    individually, but only for their own ticker.
+    """
+
+    def __init__(self) -> None:
+        self._by_ticker: dict[str, _TickerConditions] = {}
+        self._seq_by_id: dict[str, int] = {}
+        self._next_seq = 0
+
+    def __len__(self) -> int:
+        return len(self._seq_by_id)
+
+    def __contains__(self, ticker: object) -> bool:
+        return ticker in self._by_ticker
+
+    def add(self, condition: AlertCondition) -> None:
+        """Index a condition (its ID must not already be indexed)."""
+        seq = self._next_seq
+        self._next_seq += 1
+        self._seq_by_id[condition.id] = seq
+
+        bucket = self._by_ticker.setdefault(condition.ticker, _TickerConditions())
+        if condition.condition_type in _PRICE_TYPES:
+            entries = bucket.sorted_by_type.setdefault(condition.condition_type, [])
+            bisect.insort(entries, (condition.threshold, seq, condition), key=lambda e: e[:2])
+        else:
+            bucket.other.append((seq, condition))
+
+    def remove(self, condition: AlertCondition) -> bool:
+        """Remove a condition. Returns True if it was indexed."""
+        seq = self._seq_by_id.pop(condition.id, None)
+        if seq is None:
+            return False
+        bucket = self._by_ticker[condition.ticker]
+        if condition.condition_type in _PRICE_TYPES:
+            entries = bucket.sorted_by_type[condition.condition_type]
+            i = bisect.bisect_left(entries, (condition.threshold, seq), key=lambda e: e[:2])
+            del entries[i]
+        else:
+            bucket.other = [(s, c) for s, c in bucket.other if s != seq]
+        if not len(bucket):
+            del self._by_ticker[condition.ticker]
+        return True
+
+    def sequence(self, condition: AlertCondition) -> int:
+        """Insertion order of an indexed condition (used to order triggered alerts)."""
+        return self._seq_by_id[condition.id]
+
+    def candidates(
+        self,
+        ticker: str,
+        *,
+        mid_prob: float,
+        prev_mid_prob: float | None,
+    ) -> Iterator[AlertCondition]:
+        """
+        Yield the conditions on `ticker` that may trigger at `mid_prob`.
+
+        Price conditions are narrowed by bisecting their sorted thresholds; all other
+        conditions for the ticker are yielded for individual evaluation.
+        """
+        bucket = self._by_ticker.get(ticker)
+        if bucket is None:
+            return
+
+        above = bucket.sorted_by_type.get(ConditionType.PRICE_ABOVE, [])
+        # Triggered: thresholds strictly below the midpoint.
+        for _, _, condition in above[: bisect.bisect_left(above, mid_prob, key=_threshold)]:
+            yield condition
+
+        below = bucket.sorted_by_type.get(ConditionType.PRICE_BELOW, [])
+        # Triggered: thresholds strictly above the midpoint.
+        for _, _, condition in below[bisect.bisect_right(below, mid_prob, key=_threshold) :]:
+            yield condition
+
+        crosses = bucket.sorted_by_type.get(ConditionType.PRICE_CROSSES, [])
+        if crosses and prev_mid_prob is not None:
+            if prev_mid_prob < mid_prob:
+                # Crossed upward: thresholds in (prev, mid].
+                lo = bisect.bisect_right(crosses, prev_mid_prob, key=_threshold)
+                hi = bisect.bisect_right(crosses, mid_prob, key=_threshold)
+            else:
+                # Crossed downward: thresholds in [mid, prev).
+                lo = bisect.bisect_left(crosses, mid_prob, key=_threshold)
+                hi = bisect.bisect_left(crosses, prev_mid_prob, key=_threshold)
+            for _, _, condition in crosses[lo:hi]:
+                yield condition
+
+        for _, condition in bucket.other:
+            yield condition
@@ -0,0 +1,215 @@
+"""Asynchronous alert delivery (bounded queue, batching, backpressure metrics)."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
+
+import structlog
+
+from kalshi_research.constants import (
+    DEFAULT_ALERT_BATCH_SIZE,
+    DEFAULT_ALERT_BATCH_WINDOW_SECONDS,
+    DEFAULT_ALERT_QUEUE_SIZE,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from kalshi_research.alerts.conditions import Alert
+
+logger = structlog.get_logger()
+
+
+class Notifier(Protocol):
+    """Protocol for synchronous notification channels."""
+
+    def notify(self, alert: Alert) -> None:
+        """Send notification for an alert."""
+        ...
+
+
+@runtime_checkable
+class AsyncNotifier(Protocol):
+    """Protocol for notification channels that deliver batches without blocking the event loop."""
+
+    async def notify_many(self, alerts: Sequence[Alert]) -> None:
+        """Send notifications for a batch of alerts (raise on delivery failure)."""
+        ...
+
+    async def aclose(self) -> None:
+        """Release pooled resources (HTTP clients, file handles)."""
+        ...
+
+
+@dataclass
+class DeliveryStats:
+    """Counters describing alert delivery and queue backpressure."""
+
+    submitted: int = 0
+    delivered: int = 0
+    failed: int = 0
+    batches: int = 0
+    max_queue_depth: int = 0
+    enqueue_wait_seconds: float = 0.0
+    delivery_seconds: float = 0.0
+
+
+class AlertDispatcher:
+    """
+    Deliver triggered alerts to notifiers from a background task.
+
+    `submit()` only enqueues, so evaluating conditions never waits on network or disk I/O. A
+    single worker drains the queue in batches (up to `max_batch_size`, waiting at most
+    `batch_window_seconds` for a batch to fill) and hands each batch to every notifier
+    concurrently. Synchronous notifiers run in a worker thread.
+    """
+
+    def __init__(
+        self,
+        notifiers: Sequence[Notifier | AsyncNotifier] = (),
+        *,
+        max_queue_size: int = DEFAULT_ALERT_QUEUE_SIZE,
+        max_batch_size: int = DEFAULT_ALERT_BATCH_SIZE,
+        batch_window_seconds: float = DEFAULT_ALERT_BATCH_WINDOW_SECONDS,
+    ) -> None:
+        if max_queue_size <= 0:
+            raise ValueError("max_queue_size must be positive")
+        if max_batch_size <= 0:
+            raise ValueError("max_batch_size must be positive")
+        self._notifiers: list[Notifier | AsyncNotifier] = list(notifiers)
+        self._queue: asyncio.Queue[Alert] = asyncio.Queue(maxsize=max_queue_size)
+        self._max_batch_size = max_batch_size
+        self._batch_window_seconds = batch_window_seconds
+        self._worker: asyncio.Task[None] | None = None
+        self.stats = DeliveryStats()
+
+    @property
+    def running(self) -> bool:
+        """Whether the background delivery worker is running."""
+        return self._worker is not None and not self._worker.done()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of alerts waiting for delivery."""
+        return self._queue.qsize()
+
+    def add_notifier(self, notifier: Notifier | AsyncNotifier) -> None:
+        """Add a notification channel."""
+        self._notifiers.append(notifier)
+
+    async def start(self) -> None:
+        """Start the background delivery worker (idempotent)."""
+        if not self.running:
+            self._worker = asyncio.create_task(self._run(), name="alert-dispatcher")
+
+    async def submit(self, alert: Alert) -> None:
+        """Queue an alert for delivery, waiting only if the queue is full."""
+        self.stats.submitted += 1
+        if self._queue.full():
+            started = time.monotonic()
+            await self._queue.put(alert)
+            self.stats.enqueue_wait_seconds += time.monotonic() - started
+        else:
+            self._queue.put_nowait(alert)
+        self.stats.max_queue_depth = max(self.stats.max_queue_depth, self._queue.qsize())
+
+    async def deliver(self, alerts: Sequence[Alert]) -> None:
+        """Deliver a batch to every notifier now (used directly when no worker is running)."""
+        if not alerts:
+            return
+        started = time.monotonic()
+        results = await asyncio.gather(
+            *(self._deliver_to(notifier, alerts) for notifier in self._notifiers),
+            return_exceptions=True,
+        )
+        self.stats.batches += 1
+        self.stats.delivery_seconds += time.monotonic() - started
+        failed_channels = 0
+        for notifier, result in zip(self._notifiers, results, strict=True):
+            if isinstance(result, BaseException):
+                if isinstance(result, asyncio.CancelledError):
+                    raise result
+                failed_channels += 1
+                logger.warning(
+                    "Alert notification failed",
+                    notifier=type(notifier).__name__,
+                    alerts=len(alerts),
+                    error=str(result),
+                )
+        if failed_channels:
+            self.stats.failed += len(alerts)
+        else:
+            self.stats.delivered += len(alerts)
+
+    async def drain(self) -> None:
+        """Wait until every queued alert has been handed to the notifiers."""
+        if self.running:
+            await self._queue.join()
+            return
+        # No worker: flush whatever is queued inline.
+        batch: list[Alert] = []
+        while not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+            self._queue.task_done()
+        await self.deliver(batch)
+
+    async def aclose(self) -> None:
+        """Drain pending alerts, stop the worker and close async notifiers."""
+        await self.drain()
+        if self._worker is not None:
+            self._worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+        for notifier in self._notifiers:
+            if isinstance(notifier, AsyncNotifier):
+                await notifier.aclose()
+
+    async def __aenter__(self) -> AlertDispatcher:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def _deliver_to(
+        self, notifier: Notifier | AsyncNotifier, alerts: Sequence[Alert]
+    ) -> None:
+        if isinstance(notifier, AsyncNotifier):
+            await notifier.notify_many(alerts)
+            return
+
+        def _notify_all() -> None:
+            for alert in alerts:
+                notifier.notify(alert)
+
+        await asyncio.to_thread(_notify_all)
+
+    async def _next_batch(self) -> list[Alert]:
+        batch = [await self._queue.get()]
+        deadline = time.monotonic() + self._batch_window_seconds
+        while len(batch) < self._max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self.deliver(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
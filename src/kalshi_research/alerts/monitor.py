@@ -2,23 +2,20 @@
 
 import uuid
 from datetime import UTC, datetime
-from typing import Protocol, cast
+from types import TracebackType
+from typing import cast
 
+from kalshi_research.alerts._index import ConditionIndex
 from kalshi_research.alerts.conditions import (
     Alert,
     AlertCondition,
     AlertStatus,
     ConditionType,
 )
+from kalshi_research.alerts.dispatcher import AlertDispatcher, AsyncNotifier, Notifier
 from kalshi_research.api.models import Market
 
-
-class Notifier(Protocol):
-    """Protocol for notification channels."""
-
-    def notify(self, alert: Alert) -> None:
-        """Send notification for an alert."""
-        ...
+__all__ = ["AlertMonitor", "AsyncNotifier", "Notifier"]
 
 
 class AlertMonitor:
@@ -31,26 +28,56 @@ class AlertMonitor:
         monitor.add_condition(AlertCondition(...))
 
         # In your polling loop:
-        alerts = await monitor.check_conditions(markets)
+        async with monitor:
+            alerts = await monitor.check_conditions(markets)
+
+    Inside `async with monitor`, triggered alerts are queued to a background `AlertDispatcher`
+    and `check_conditions` returns without waiting on notifiers. Outside it, each check's alerts
+    are delivered as one batch before `check_conditions` returns.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, *, dispatcher: AlertDispatcher | None = None) -> None:
         self._conditions: dict[str, AlertCondition] = {}
-        self._notifiers: list[Notifier] = []
+        self._dispatcher = dispatcher or AlertDispatcher()
+        self._index = ConditionIndex()
+        self._expiring: dict[str, AlertCondition] = {}
         self._triggered_alerts: list[Alert] = []
         self._last_mid_probs: dict[str, float] = {}
+        # (yes_bid, yes_ask, volume) per indexed ticker at its last evaluation.
+        self._last_quotes: dict[str, tuple[int | None, int | None, int]] = {}
+        self._dirty_tickers: set[str] = set()
+
+    @property
+    def dispatcher(self) -> AlertDispatcher:
+        """Delivery pipeline (exposes `stats` and `queue_depth`)."""
+        return self._dispatcher
 
     def add_condition(self, condition: AlertCondition) -> None:
         """Add a condition to monitor."""
+        self.remove_condition(condition.id)
         self._conditions[condition.id] = condition
+        self._index.add(condition)
+        self._dirty_tickers.add(condition.ticker)
+        if condition.expires_at is not None:
+            self._expiring[condition.id] = condition
 
     def remove_condition(self, condition_id: str) -> bool:
         """Remove a condition by ID. Returns True if found."""
-        return self._conditions.pop(condition_id, None) is not None
+        condition = self._conditions.pop(condition_id, None)
+        if condition is None:
+            return False
+        self._index.remove(condition)
+        self._expiring.pop(condition_id, None)
+        return True
+
+    def _remove_expired(self) -> None:
+        for condition in list(self._expiring.values()):
+            if condition.is_expired():
+                self.remove_condition(condition.id)
 
-    def add_notifier(self, notifier: Notifier) -> None:
+    def add_notifier(self, notifier: Notifier | AsyncNotifier) -> None:
         """Add a notification channel."""
-        self._notifiers.append(notifier)
+        self._dispatcher.add_notifier(notifier)
 
     def list_conditions(self) -> list[AlertCondition]:
         """List all active conditions."""
@@ -69,53 +96,86 @@ class AlertMonitor:
         """
         Check all conditions against current market data.
 
+        Only tickers with conditions are evaluated, and only when their quote changed since the
+        previous check (or they have new conditions or a sentiment input). Price thresholds are
+        looked up by bisecting per-ticker sorted arrays, so cost scales with triggered
+        conditions rather than with the total number loaded.
+
         Args:
             markets: List of current market data
 
         Returns:
             List of newly triggered alerts
         """
-        new_alerts: list[Alert] = []
-        market_lookup = {m.ticker: m for m in markets}
-        current_mid_probs: dict[str, float] = {}
         shift_lookup = sentiment_shift_by_ticker or {}
+        self._remove_expired()
 
-        for condition in list(self._conditions.values()):
-            # Skip expired conditions
-            if condition.is_expired():
-                del self._conditions[condition.id]
+        triggered: list[tuple[int, Alert]] = []
+        for market in markets:
+            ticker = market.ticker
+            if ticker not in self._index:
                 continue
 
-            # Check if condition matches
-            market = market_lookup.get(condition.ticker)
-            if market is None:
+            # Unchanged quotes can't trigger anything that didn't trigger last cycle, unless the
+            # ticker has new conditions or a sentiment input this cycle.
+            quote = (market.yes_bid_cents, market.yes_ask_cents, market.volume)
+            if (
+                self._last_quotes.get(ticker) == quote
+                and ticker not in self._dirty_tickers
+                and ticker not in shift_lookup
+            ):
                 continue
 
             midpoint = market.midpoint
             if midpoint is None:
                 continue
             mid_prob = midpoint / 100.0
-            current_mid_probs[condition.ticker] = mid_prob
-            alert = self._check_condition(
-                condition,
-                market,
-                mid_prob=mid_prob,
-                prev_mid_prob=self._last_mid_probs.get(condition.ticker),
-                sentiment_shift=shift_lookup.get(condition.ticker),
-            )
-            if alert:
-                new_alerts.append(alert)
-                self._triggered_alerts.append(alert)
-
-                # Notify all channels
-                for notifier in self._notifiers:
-                    notifier.notify(alert)
+            prev_mid_prob = self._last_mid_probs.get(ticker)
+            self._last_quotes[ticker] = quote
+            self._last_mid_probs[ticker] = mid_prob
+            self._dirty_tickers.discard(ticker)
+
+            for condition in list(
+                self._index.candidates(ticker, mid_prob=mid_prob, prev_mid_prob=prev_mid_prob)
+            ):
+                alert = self._check_condition(
+                    condition,
+                    market,
+                    mid_prob=mid_prob,
+                    prev_mid_prob=prev_mid_prob,
+                    sentiment_shift=shift_lookup.get(ticker),
+                )
+                if alert:
+                    triggered.append((self._index.sequence(condition), alert))
+                    # Remove one-shot conditions after triggering
+                    self.remove_condition(condition.id)
+
+        # Report alerts in condition insertion order, independent of market order.
+        triggered.sort(key=lambda item: item[0])
+        new_alerts = [alert for _, alert in triggered]
+        self._triggered_alerts.extend(new_alerts)
+
+        # Notify all channels
+        if self._dispatcher.running:
+            for alert in new_alerts:
+                await self._dispatcher.submit(alert)
+        else:
+            await self._dispatcher.deliver(new_alerts)
+        return new_alerts
 
-                # Remove one-shot conditions after triggering
-                del self._conditions[condition.id]
+    async def __aenter__(self) -> "AlertMonitor":
+        """Start background alert delivery."""
+        await self._dispatcher.start()
+        return self
 
-        self._last_mid_probs.update(current_mid_probs)
-        return new_alerts
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Deliver queued alerts and close notifiers."""
+        await self._dispatcher.aclose()
 
     def _check_condition(
         self,
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import math
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -11,11 +13,23 @@ import structlog
 from rich.console import Console
 from rich.panel import Panel
 
+from kalshi_research.constants import (
+    DEFAULT_WEBHOOK_ALERTS_PER_REQUEST,
+    DEFAULT_WEBHOOK_MAX_RETRIES,
+    WEBHOOK_MAX_RETRY_AFTER_SECONDS,
+    WEBHOOK_RETRY_BACKOFF_SECONDS,
+)
+
 logger = structlog.get_logger()
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from kalshi_research.alerts.conditions import Alert
 
+# Webhook responses worth retrying: rate limiting and server-side failures.
+_RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
 
 class ConsoleNotifier:
     """Rich console notification output."""
@@ -42,6 +56,14 @@ class ConsoleNotifier:
             )
         )
 
+    async def notify_many(self, alerts: Sequence[Alert]) -> None:
+        """Print a batch of alerts."""
+        for alert in alerts:
+            self.notify(alert)
+
+    async def aclose(self) -> None:
+        """Nothing to release."""
+
 
 class FileNotifier:
     """JSON file logging for alerts."""
@@ -50,8 +72,8 @@ class FileNotifier:
         self._file_path = Path(file_path)
         self._file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    def notify(self, alert: Alert) -> None:
-        """Append alert to JSON lines file."""
+    @staticmethod
+    def _record(alert: Alert) -> str:
         record: dict[str, Any] = {
             "id": alert.id,
             "condition_id": alert.condition.id,
@@ -63,50 +85,147 @@ class FileNotifier:
             "triggered_at": alert.triggered_at.isoformat(),
             "market_data": alert.market_data,
         }
+        return json.dumps(record) + "\n"
 
+    def _append(self, lines: list[str]) -> None:
         with self._file_path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(record) + "\n")
+            f.write("".join(lines))
 
+    def notify(self, alert: Alert) -> None:
+        """Append alert to JSON lines file."""
+        self._append([self._record(alert)])
 
-class WebhookNotifier:
-    """HTTP webhook notification (for Slack, Discord, etc.)."""
+    async def notify_many(self, alerts: Sequence[Alert]) -> None:
+        """Append a batch of alerts with a single write, off the event loop."""
+        if alerts:
+            await asyncio.to_thread(self._append, [self._record(alert) for alert in alerts])
 
-    def __init__(self, webhook_url: str, timeout: float = 10.0) -> None:
+    async def aclose(self) -> None:
+        """Nothing to release (the file is opened per batch)."""
+
+
+class WebhookNotifier:
+    """
+    HTTP webhook notification (for Slack, Discord, etc.).
+
+    `notify()` is a blocking single POST. `notify_many()` coalesces up to
+    `max_alerts_per_request` alerts into one payload, reuses a pooled `httpx.AsyncClient`, and
+    retries transport errors, 429 and 5xx responses with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        webhook_url: str,
+        timeout: float = 10.0,
+        *,
+        max_retries: int = DEFAULT_WEBHOOK_MAX_RETRIES,
+        backoff_seconds: float = WEBHOOK_RETRY_BACKOFF_SECONDS,
+        max_alerts_per_request: int = DEFAULT_WEBHOOK_ALERTS_PER_REQUEST,
+    ) -> None:
         self._webhook_url = webhook_url
         self._timeout = timeout
-
-    def notify(self, alert: Alert) -> None:
-        """POST alert to webhook endpoint."""
-        payload = {
-            "text": f"Alert: {alert.condition.label}",
-            "attachments": [
+        self._max_retries = max_retries
+        self._backoff_seconds = backoff_seconds
+        self._max_alerts_per_request = max(1, max_alerts_per_request)
+        self._client: httpx.AsyncClient | None = None
+        self.requests_sent = 0
+        self.retries = 0
+
+    @staticmethod
+    def _attachment(alert: Alert) -> dict[str, Any]:
+        return {
+            "color": "danger",
+            "fields": [
+                {"title": "Ticker", "value": alert.condition.ticker, "short": True},
+                {
+                    "title": "Type",
+                    "value": alert.condition.condition_type.value,
+                    "short": True,
+                },
                 {
-                    "color": "danger",
-                    "fields": [
-                        {"title": "Ticker", "value": alert.condition.ticker, "short": True},
-                        {
-                            "title": "Type",
-                            "value": alert.condition.condition_type.value,
-                            "short": True,
-                        },
-                        {
-                            "title": "Current Value",
-                            "value": str(alert.current_value),
-                            "short": True,
-                        },
-                        {
-                            "title": "Threshold",
-                            "value": str(alert.condition.threshold),
-                            "short": True,
-                        },
-                    ],
-                }
+                    "title": "Current Value",
+                    "value": str(alert.current_value),
+                    "short": True,
+                },
+                {
+                    "title": "Threshold",
+                    "value": str(alert.condition.threshold),
+                    "short": True,
+                },
             ],
         }
 
+    def _payload(self, alerts: Sequence[Alert]) -> dict[str, Any]:
+        if len(alerts) == 1:
+            text = f"Alert: {alerts[0].condition.label}"
+            attachments = [self._attachment(alerts[0])]
+        else:
+            text = f"{len(alerts)} alerts triggered"
+            attachments = [
+                {"title": alert.condition.label, **self._attachment(alert)} for alert in alerts
+            ]
+        return {"text": text, "attachments": attachments}
+
+    def notify(self, alert: Alert) -> None:
+        """POST alert to webhook endpoint."""
+        payload = self._payload([alert])
+
         try:
             with httpx.Client(timeout=self._timeout) as client:
                 response = client.post(self._webhook_url, json=payload)
                 response.raise_for_status()
         except httpx.HTTPError as e:
             logger.warning("Webhook notification failed", error=str(e))
+
+    async def notify_many(self, alerts: Sequence[Alert]) -> None:
+        """POST a batch of alerts, coalesced into as few requests as allowed."""
+        step = self._max_alerts_per_request
+        for start in range(0, len(alerts), step):
+            await self._post_with_retry(self._payload(alerts[start : start + step]))
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _retry_delay(self, attempt: int, response: httpx.Response | None) -> float:
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after is not None:
+                try:
+                    delay = float(retry_after)
+                except ValueError:
+                    delay = math.nan
+                # Non-finite values ("inf", "nan") fall back to the backoff schedule.
+                if math.isfinite(delay):
+                    return min(max(0.0, delay), WEBHOOK_MAX_RETRY_AFTER_SECONDS)
+        return float(self._backoff_seconds * (2**attempt))
+
+    async def _post_with_retry(self, payload: dict[str, Any]) -> None:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self._timeout,
+                limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+            )
+
+        for attempt in range(self._max_retries + 1):
+            response: httpx.Response | None = None
+            try:
+                self.requests_sent += 1
+                response = await self._client.post(self._webhook_url, json=payload)
+                response.raise_for_status()
+                return
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code not in _RETRYABLE_STATUS_CODES:
+                    raise
+                if attempt == self._max_retries:
+                    raise
+            except httpx.TransportError:
+                if attempt == self._max_retries:
+                    raise
+
+            delay = self._retry_delay(attempt, response)
+            self.retries += 1
+            logger.info("Retrying webhook notification", attempt=attempt + 1, delay=delay)
+            await asyncio.sleep(delay)
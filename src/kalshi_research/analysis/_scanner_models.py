@@ -5,6 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
+from typing import Protocol
 
 
 class MarketClosedError(Exception):
@@ -44,3 +45,80 @@ class ScanResult:
             f"  {self.title[:50]}...\n"
             f"  Prob: {self.market_prob:.0%} | Vol: {self.volume_24h:,} | Spread: {self.spread}c"
         )
+
+
+class ScannableMarket(Protocol):
+    """
+    Read-only market view consumed by `MarketScanner` and `MarketStatusVerifier`.
+
+    Satisfied by the API `Market` model and by `MarketQuoteRow`.
+    """
+
+    @property
+    def ticker(self) -> str: ...
+
+    @property
+    def title(self) -> str: ...
+
+    @property
+    def status(self) -> str: ...
+
+    @property
+    def open_time(self) -> datetime: ...
+
+    @property
+    def close_time(self) -> datetime: ...
+
+    @property
+    def created_time(self) -> datetime | None: ...
+
+    @property
+    def volume_24h(self) -> int: ...
+
+    @property
+    def yes_bid_cents(self) -> int | None: ...
+
+    @property
+    def yes_ask_cents(self) -> int | None: ...
+
+    @property
+    def midpoint(self) -> float | None: ...
+
+    @property
+    def spread(self) -> int | None: ...
+
+
+@dataclass(frozen=True, slots=True)
+class MarketQuoteRow:
+    """
+    Lightweight market + latest quote row for scanning without Pydantic models.
+
+    Built from the `markets` and `latest_quotes` tables for offline (database-backed) scans.
+    """
+
+    ticker: str
+    event_ticker: str
+    title: str
+    status: str
+    category: str | None
+    open_time: datetime
+    close_time: datetime
+    yes_bid_cents: int | None
+    yes_ask_cents: int | None
+    volume_24h: int
+    quote_time: datetime | None = None
+    created_time: datetime | None = None
+
+    @property
+    def midpoint(self) -> float | None:
+        """Midpoint of the YES bid/ask in cents."""
+        if self.yes_bid_cents is None or self.yes_ask_cents is None:
+            return None
+        return (self.yes_bid_cents + self.yes_ask_cents) / 2
+
+    @property
+    def spread(self) -> int | None:
+        """YES bid/ask spread in cents."""
+        if self.yes_bid_cents is None or self.yes_ask_cents is None:
+            return None
+        return self.yes_ask_cents - self.yes_bid_cents
@@ -3,16 +3,16 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Mapping, Sequence
 
-    from kalshi_research.api.models.market import Market
-
-from kalshi_research.analysis._scanner_models import MarketClosedError
+from kalshi_research.analysis._scanner_models import MarketClosedError, ScannableMarket
 from kalshi_research.api.models.market import MarketStatus
 
+MarketT = TypeVar("MarketT", bound=ScannableMarket)
+
 
 class MarketStatusVerifier:
     """
@@ -39,7 +39,7 @@ class MarketStatusVerifier:
 
         return exchange_active and trading_active
 
-    def is_market_tradeable(self, market: Market) -> bool:
+    def is_market_tradeable(self, market: ScannableMarket) -> bool:
         """
         Check if a market is currently tradeable.
 
@@ -65,7 +65,7 @@ class MarketStatusVerifier:
         # Check timing - market must not be past close_time
         return now < market.close_time
 
-    def verify_market_open(self, market: Market) -> None:
+    def verify_market_open(self, market: ScannableMarket) -> None:
         """
         Verify market is open for trading, raise if not.
 
@@ -94,8 +94,9 @@ class MarketStatusVerifier:
         if not self.is_market_tradeable(market):
             now = datetime.now(UTC)
             if market.status != MarketStatus.ACTIVE:
+                status = getattr(market.status, "value", market.status)
                 raise MarketClosedError(
-                    f"Market {market.ticker} has status {market.status.value}, "
+                    f"Market {market.ticker} has status {status}, "
                     f"expected {MarketStatus.ACTIVE.value}"
                 )
             if now >= market.close_time:
@@ -104,7 +105,7 @@ class MarketStatusVerifier:
                     f"current time is {now.isoformat()}"
                 )
 
-    def filter_tradeable_markets(self, markets: list[Market]) -> list[Market]:
+    def filter_tradeable_markets(self, markets: Sequence[MarketT]) -> list[MarketT]:
         """
         Filter a list of markets to only tradeable ones.
 
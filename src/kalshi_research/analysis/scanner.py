@@ -7,12 +7,14 @@ from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, cast
 
 if TYPE_CHECKING:
-    from kalshi_research.api.models.market import Market
+    from collections.abc import Sequence
 
 # Re-export public API for backwards compatibility
 from kalshi_research.analysis._scanner_models import (
     MarketClosedError,
+    MarketQuoteRow,
     ScanFilter,
+    ScannableMarket,
     ScanResult,
 )
 from kalshi_research.analysis._verifier import MarketStatusVerifier
@@ -24,10 +26,12 @@ from kalshi_research.constants import (
 
 __all__ = [
     "MarketClosedError",
+    "MarketQuoteRow",
     "MarketScanner",
     "MarketStatusVerifier",
     "ScanFilter",
     "ScanResult",
+    "ScannableMarket",
 ]
 
 
@@ -40,6 +44,9 @@ class MarketScanner:
     - Find high-volume markets (active)
     - Find wide-spread markets (illiquid)
     - Find markets expiring soon
+
+    Scans accept any `ScannableMarket`: API `Market` models from a live sweep, or
+    `MarketQuoteRow`s loaded from the local database.
     """
 
     def __init__(
@@ -65,7 +72,7 @@ class MarketScanner:
 
     def scan_close_races(
         self,
-        markets: list[Market],
+        markets: Sequence[ScannableMarket],
         top_n: int = 10,
         min_volume_24h: int = 0,
         max_spread: int = 100,
@@ -135,7 +142,7 @@ class MarketScanner:
 
     def scan_high_volume(
         self,
-        markets: list[Market],
+        markets: Sequence[ScannableMarket],
         top_n: int = 10,
     ) -> list[ScanResult]:
         """
@@ -187,7 +194,7 @@ class MarketScanner:
 
     def scan_wide_spread(
         self,
-        markets: list[Market],
+        markets: Sequence[ScannableMarket],
         top_n: int = 10,
     ) -> list[ScanResult]:
         """
@@ -240,7 +247,7 @@ class MarketScanner:
 
     def scan_expiring_soon(
         self,
-        markets: list[Market],
+        markets: Sequence[ScannableMarket],
         hours: int = 24,
         top_n: int = 10,
     ) -> list[ScanResult]:
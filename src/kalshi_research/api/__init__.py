@@ -9,6 +9,7 @@ from kalshi_research.api.exceptions import (
     MarketNotFoundError,
     RateLimitError,
 )
+from kalshi_research.api.market_cache import MarketSweep, MarketUniverseCache
 from kalshi_research.api.models import (
     CandlePrice,
     CandleSide,
@@ -38,6 +39,8 @@ __all__ = [
     "MarketFilterStatus",
     "MarketNotFoundError",
     "MarketStatus",
+    "MarketSweep",
+    "MarketUniverseCache",
     "Orderbook",
     "RateLimitError",
     "Trade",
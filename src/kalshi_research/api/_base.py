@@ -23,6 +23,8 @@ if TYPE_CHECKING:
 
     from tenacity import RetryCallState
 
+    from kalshi_research.api.market_cache import MarketUniverseCache
+
 
 logger = structlog.get_logger()
 
@@ -49,6 +51,7 @@ class ClientBase:
     _client: httpx.AsyncClient
     _max_retries: int
     _rate_limiter: RateLimiter
+    _market_cache: MarketUniverseCache | None
 
     def __init__(
         self,
@@ -56,6 +59,9 @@ class ClientBase:
         timeout: float = 30.0,
         max_retries: int = 5,
         rate_tier: str | RateTier = RateTier.BASIC,
+        *,
+        market_cache: MarketUniverseCache | None = None,
+        rate_limiter: RateLimiter | None = None,
     ) -> None:
         config = get_config()
         if environment:
@@ -68,10 +74,15 @@ class ClientBase:
         )
         self._max_retries = max_retries
 
-        # Initialize rate limiter for read operations
-        if isinstance(rate_tier, str):
-            rate_tier = RateTier(rate_tier)
-        self._rate_limiter = RateLimiter(tier=rate_tier)
+        # Initialize rate limiter for read operations (callers may share one across clients)
+        if rate_limiter is None:
+            if isinstance(rate_tier, str):
+                rate_tier = RateTier(rate_tier)
+            rate_limiter = RateLimiter(tier=rate_tier)
+        self._rate_limiter = rate_limiter
+
+        # Shared market sweeps (see `get_all_markets(max_age=...)`); None disables caching.
+        self._market_cache = market_cache
 
     async def __aenter__(self) -> ClientBase:
         return self
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, Literal
 
 import structlog
 
+from kalshi_research.api.market_cache import MarketSweep
 from kalshi_research.api.models.candlestick import (
     Candlestick,
     CandlestickResponse,
@@ -13,10 +16,14 @@ from kalshi_research.api.models.candlestick import (
 from kalshi_research.api.models.market import Market, MarketFilterStatus
 from kalshi_research.api.models.orderbook import Orderbook
 from kalshi_research.api.models.trade import Trade
-from kalshi_research.constants import DEFAULT_ORDERBOOK_DEPTH
+from kalshi_research.constants import DEFAULT_ORDERBOOK_DEPTH, MAX_MARKET_TICKERS_PER_REQUEST
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterator, Iterable
+
+    import httpx
+
+    from kalshi_research.api.market_cache import MarketUniverseCache
 
 
 logger = structlog.get_logger()
@@ -27,6 +34,9 @@ class MarketsMixin:
 
     if TYPE_CHECKING:
         # Implemented by ClientBase
+        _client: httpx.AsyncClient
+        _market_cache: MarketUniverseCache | None
+
         async def _get(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]: ...
 
     async def get_markets_page(
@@ -160,15 +170,24 @@ class MarketsMixin:
         limit: int = 1000,
         max_pages: int | None = None,
         mve_filter: Literal["only", "exclude"] | None = None,
+        *,
+        max_age: float | None = None,
+        sweep: MarketSweep | None = None,
     ) -> AsyncIterator[Market]:
         """
         Iterate through ALL markets with automatic pagination.
 
+        When the client was built with a `MarketUniverseCache`, a cached sweep younger than
+        `max_age` seconds (default: the cache's `max_age_seconds`) is served instead of calling
+        the API, and every completed sweep is published to the cache for other processes.
+
         Args:
             status: Filter by market status (open, closed, settled)
             limit: Page size (max 1000)
             max_pages: Optional safety limit. None = iterate until exhausted.
             mve_filter: Filter for multivariate events ("only" or "exclude")
+            max_age: Maximum age in seconds of a cached sweep to serve (ignored without a cache)
+            sweep: Optional record updated with pages fetched, truncation and cache use
 
         Yields:
             Market objects
@@ -176,6 +195,27 @@ class MarketsMixin:
         Warns:
             If max_pages reached but cursor still present (data truncated)
         """
+        # A throwaway record keeps the bookkeeping below unconditional.
+        sweep = sweep if sweep is not None else MarketSweep()
+        cache = self._market_cache
+        scope = ""
+        if cache is not None:
+            scope = self._market_cache_scope(status, mve_filter)
+            effective_max_age = cache.max_age_seconds if max_age is None else max_age
+            cached = await asyncio.to_thread(
+                cache.load_sweep, scope, max_age_seconds=effective_max_age
+            )
+            if cached is not None:
+                cached_at, cached_markets = cached
+                sweep.from_cache = True
+                sweep.swept_at = cached_at
+                for market in cached_markets:
+                    yield market
+                return
+
+        swept: list[Market] = []
+        swept_at = datetime.now(UTC)
+        sweep.swept_at = swept_at
         cursor: str | None = None
         pages = 0
         while True:
@@ -185,9 +225,12 @@ class MarketsMixin:
                 cursor=cursor,
                 mve_filter=mve_filter,
             )
+            sweep.pages += 1
 
             for market in markets:
                 yield market
+            if cache is not None:
+                swept.extend(markets)
 
             if not cursor or not markets:
                 break
@@ -196,12 +239,68 @@ class MarketsMixin:
 
             # Safety limit check with warning
             if max_pages is not None and pages >= max_pages:
+                sweep.truncated = True
                 logger.warning(
                     "Pagination truncated: reached max_pages but cursor still present. "
                     "Data may be incomplete. Set max_pages=None for full iteration.",
                     max_pages=max_pages,
                 )
-                break
+                # A truncated sweep is not the market universe; don't publish it.
+                return
+
+        if cache is not None:
+            await asyncio.to_thread(cache.store, scope, swept, swept_at=swept_at)
+
+    def _market_cache_scope(
+        self,
+        status: MarketFilterStatus | str | None,
+        mve_filter: str | None,
+    ) -> str:
+        status_value = status.value if isinstance(status, MarketFilterStatus) else status
+        return f"{self._client.base_url}|status={status_value or ''}|mve={mve_filter or ''}"
+
+    async def get_markets_by_tickers(
+        self,
+        tickers: Iterable[str],
+        *,
+        status: MarketFilterStatus | str | None = None,
+        chunk_size: int = MAX_MARKET_TICKERS_PER_REQUEST,
+    ) -> list[Market]:
+        """
+        Fetch specific markets with batched `tickers=` lookups.
+
+        Tickers are de-duplicated and requested `chunk_size` at a time, following cursors within
+        each chunk. Tickers the API does not return (unknown, or filtered out by `status`) are
+        simply absent from the result.
+
+        Args:
+            tickers: Market tickers to fetch.
+            status: Optional market status filter applied to every chunk.
+            chunk_size: Tickers per request (the API accepts at most 100).
+
+        Returns:
+            Markets in the order the API returned them, one per ticker.
+        """
+        if not 1 <= chunk_size <= MAX_MARKET_TICKERS_PER_REQUEST:
+            raise ValueError(f"chunk_size must be between 1 and {MAX_MARKET_TICKERS_PER_REQUEST}")
+
+        unique = list(dict.fromkeys(tickers))
+        markets: dict[str, Market] = {}
+        for start in range(0, len(unique), chunk_size):
+            chunk = unique[start : start + chunk_size]
+            cursor: str | None = None
+            while True:
+                page, cursor = await self.get_markets_page(
+                    status=status,
+                    tickers=chunk,
+                    limit=len(chunk),
+                    cursor=cursor,
+                )
+                for market in page:
+                    markets.setdefault(market.ticker, market)
+                if not cursor or not page:
+                    break
+        return list(markets.values())
 
     async def get_market(self, ticker: str) -> Market:
         """Fetch single market by ticker."""
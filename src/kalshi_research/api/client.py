@@ -6,7 +6,7 @@ The actual implementation is composed from mixins in the _mixins/ package.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import httpx
 import structlog
@@ -32,6 +32,9 @@ from kalshi_research.api.auth import KalshiAuth
 from kalshi_research.api.exceptions import KalshiAPIError, RateLimitError
 from kalshi_research.api.rate_limiter import RateTier
 
+if TYPE_CHECKING:
+    from kalshi_research.api.market_cache import MarketUniverseCache
+
 logger = structlog.get_logger()
 
 
@@ -78,6 +81,8 @@ class KalshiClient(
         timeout: float = 30.0,
         max_retries: int = 5,
         rate_tier: str | RateTier = RateTier.BASIC,
+        *,
+        market_cache: MarketUniverseCache | None = None,
     ) -> None:
         # Initialize parent (public client infrastructure)
         super().__init__(
@@ -85,6 +90,7 @@ class KalshiClient(
             timeout=timeout,
             max_retries=max_retries,
             rate_tier=rate_tier,
+            market_cache=market_cache,
         )
 
         # Add authentication
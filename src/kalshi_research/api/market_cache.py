@@ -0,0 +1,157 @@
+"""Shared on-disk cache of market sweeps (`GET /markets` paged to exhaustion).
+
+The collector, the alert monitor daemon and ad-hoc scans all page through the same open-market
+universe. A `MarketUniverseCache` lets whichever process swept most recently publish its result,
+so the others can reuse it instead of re-paginating while it is still fresh.
+
+Each sweep is one gzip-compressed JSON file per (API base URL, status, mve_filter) scope. Files
+are written to a temporary name and renamed into place, so concurrent readers in other processes
+always see a complete sweep. The file's modification time is set to when the sweep *started*,
+which makes the freshness check a `stat()` and keeps the age honest for slow sweeps.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+import structlog
+
+from kalshi_research.api.models.market import Market
+from kalshi_research.paths import DEFAULT_MARKET_CACHE_DIR
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class MarketSweep:
+    """
+    Outcome of one `get_all_markets()` sweep, filled in as the sweep runs.
+
+    Pass an instance as `sweep=` to learn, once iteration finishes, whether the result covers
+    the whole universe (`truncated` is set when `max_pages` stopped the sweep early).
+    `swept_at` is set as soon as the first market is yielded: when the sweep started, or for a
+    sweep served `from_cache`, when the process that published it started sweeping.
+    """
+
+    pages: int = 0
+    truncated: bool = False
+    from_cache: bool = False
+    swept_at: datetime | None = None
+
+
+class MarketUniverseCache:
+    """File-backed cache of complete market sweeps, shared between processes."""
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        *,
+        max_age_seconds: float = 0.0,
+    ) -> None:
+        """
+        Args:
+            cache_dir: Directory holding sweep files (default: `data/market_cache`).
+            max_age_seconds: Default freshness limit used by `KalshiPublicClient.get_all_markets()`
+                when no explicit `max_age` is passed. 0 means never serve from the cache, but
+                still publish completed sweeps for other processes.
+        """
+        if max_age_seconds < 0:
+            raise ValueError("max_age_seconds must be non-negative")
+        self._cache_dir = cache_dir or DEFAULT_MARKET_CACHE_DIR
+        self._max_age_seconds = max_age_seconds
+
+    @property
+    def max_age_seconds(self) -> float:
+        """Default freshness limit in seconds."""
+        return self._max_age_seconds
+
+    def path_for(self, scope: str) -> Path:
+        """Return the sweep file for a scope string (base URL + filters)."""
+        digest = hashlib.sha256(scope.encode("utf-8")).hexdigest()[:16]
+        return self._cache_dir / f"markets-{digest}.json.gz"
+
+    def age_seconds(self, scope: str) -> float | None:
+        """Age of the cached sweep for `scope`, or None when nothing is cached."""
+        try:
+            mtime = self.path_for(scope).stat().st_mtime
+        except FileNotFoundError:
+            return None
+        return max(0.0, time.time() - mtime)
+
+    def load(self, scope: str, *, max_age_seconds: float) -> list[Market] | None:
+        """
+        Return the cached sweep for `scope` if it is younger than `max_age_seconds`.
+
+        Unreadable or corrupt files are treated as a miss (the next sweep overwrites them).
+        """
+        loaded = self.load_sweep(scope, max_age_seconds=max_age_seconds)
+        return loaded[1] if loaded is not None else None
+
+    def load_sweep(
+        self, scope: str, *, max_age_seconds: float
+    ) -> tuple[datetime, list[Market]] | None:
+        """Like `load`, but also return when the cached sweep started."""
+        age = self.age_seconds(scope)
+        if age is None or age >= max_age_seconds:
+            logger.debug("Market cache miss", scope=scope, age=age, max_age=max_age_seconds)
+            return None
+
+        path = self.path_for(scope)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                payload = json.load(f)
+            if payload.get("scope") != scope:
+                raise ValueError("Cached sweep belongs to a different scope")
+            swept_at = datetime.fromisoformat(payload["swept_at"])
+            markets = [Market.model_validate(m) for m in payload["markets"]]
+        except (AttributeError, OSError, EOFError, KeyError, TypeError, ValueError) as e:
+            logger.warning("Market cache read failed; ignoring entry", path=str(path), error=str(e))
+            return None
+
+        logger.info("Market cache hit", scope=scope, markets=len(markets), age=round(age, 1))
+        return swept_at, markets
+
+    def store(self, scope: str, markets: Sequence[Market], *, swept_at: datetime) -> Path:
+        """
+        Publish a complete sweep for `scope`, replacing any older one atomically.
+
+        Args:
+            scope: Scope string identifying the API environment and filters.
+            markets: Every market returned by the sweep.
+            swept_at: When the sweep started (used as the entry's age).
+
+        Returns:
+            Path of the written sweep file.
+        """
+        path = self.path_for(scope)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.tmp.{uuid.uuid4().hex}")
+        payload = {
+            "scope": scope,
+            "swept_at": swept_at.astimezone(UTC).isoformat(),
+            "markets": [m.model_dump(mode="json") for m in markets],
+        }
+        try:
+            # Level 1: sweeps are rewritten often and compress well even at the fastest setting.
+            with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=1) as f:
+                json.dump(payload, f, separators=(",", ":"))
+            started = swept_at.timestamp()
+            os.utime(tmp_path, (started, started))
+            tmp_path.replace(path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        logger.info("Published market sweep to cache", scope=scope, markets=len(markets))
+        return path
@@ -5,8 +5,11 @@ Implements a token bucket algorithm to enforce rate limits per tier.
 """
 
 import asyncio
+import multiprocessing
 import time
 from enum import Enum
+from multiprocessing.context import BaseContext
+from typing import Protocol
 
 import structlog
 
@@ -70,6 +73,69 @@ class TokenBucket:
                 self._tokens -= tokens
 
 
+class SharedTokenBucket:
+    """
+    Token bucket shared by several processes (one global budget for sharded workers).
+
+    The balance lives in shared memory. Each caller reserves its tokens under a process-shared
+    lock (the balance may go negative, which queues later callers behind it) and then sleeps
+    outside the lock. Create it in the parent and pass it to child processes at start-up.
+    `time.monotonic()` is a system-wide clock, so timestamps are comparable across processes.
+    """
+
+    def __init__(
+        self,
+        tokens_per_second: float,
+        burst_size: float | None = None,
+        *,
+        context: BaseContext | None = None,
+    ) -> None:
+        ctx = context or multiprocessing.get_context("spawn")
+        self._rate = tokens_per_second
+        self._max_tokens = burst_size or tokens_per_second
+        self._lock = ctx.Lock()
+        self._tokens = ctx.RawValue("d", float(self._max_tokens))
+        self._last_update = ctx.RawValue("d", time.monotonic())
+
+    @classmethod
+    def for_tier(
+        cls,
+        tier: RateTier,
+        *,
+        safety_margin: float = 0.9,
+        context: BaseContext | None = None,
+    ) -> "SharedTokenBucket":
+        """Create a shared read budget for a tier (same safety margin as `RateLimiter`)."""
+        return cls(TIER_LIMITS[tier]["read"] * safety_margin, context=context)
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Reserve tokens and return how many seconds the caller must wait before using them."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = max(0.0, now - float(self._last_update.value))
+            balance = min(self._max_tokens, float(self._tokens.value) + elapsed * self._rate)
+            self._last_update.value = now
+            balance -= tokens
+            self._tokens.value = balance
+        return max(0.0, -balance / self._rate)
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Acquire tokens, waiting if the shared budget is exhausted."""
+        wait_time = self.reserve(tokens)
+        if wait_time > 0:
+            if wait_time > 0.1:  # Only log significant waits
+                logger.debug("Shared rate limit wait", wait_seconds=wait_time)
+            await asyncio.sleep(wait_time)
+
+
+class TokenSource(Protocol):
+    """Anything `RateLimiter` can draw tokens from (local or shared bucket)."""
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Acquire tokens, waiting if necessary."""
+        ...
+
+
 class RateLimiter:
     """
     Manages rate limiting for Kalshi API requests.
@@ -89,6 +155,8 @@ class RateLimiter:
         self,
         tier: RateTier = RateTier.BASIC,
         safety_margin: float = 0.9,  # Use 90% of limit
+        *,
+        read_bucket: TokenSource | None = None,
     ) -> None:
         """
         Initialize rate limiter.
@@ -96,6 +164,8 @@ class RateLimiter:
         Args:
             tier: User's rate limit tier
             safety_margin: Fraction of limit to use (0.9 = 90%)
+            read_bucket: Optional read budget to draw from instead of a private bucket
+                (e.g. a `SharedTokenBucket` shared by collector shards)
         """
         self._tier = tier
         limits = TIER_LIMITS[tier]
@@ -104,7 +174,7 @@ class RateLimiter:
         read_limit = limits["read"] * safety_margin
         write_limit = limits["write"] * safety_margin
 
-        self._read_bucket = TokenBucket(read_limit)
+        self._read_bucket: TokenSource = read_bucket or TokenBucket(read_limit)
         self._write_bucket = TokenBucket(write_limit)
 
         logger.info(
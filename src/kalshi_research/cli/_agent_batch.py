@@ -0,0 +1,251 @@
+"""`kalshi agent batch`: run the agent workflow across a watchlist or scan result set."""
+
+import json
+from pathlib import Path
+from typing import Annotated, Any
+
+import typer
+from rich.table import Table
+
+from kalshi_research.cli.utils import console, exit_kalshi_api_error, run_async
+from kalshi_research.constants import (
+    DEFAULT_AGENT_BATCH_CONCURRENCY,
+    DEFAULT_AGENT_BATCH_MAX_EXA_USD,
+    DEFAULT_AGENT_BATCH_MAX_LLM_USD,
+    DEFAULT_AGENT_MAX_EXA_USD,
+    DEFAULT_AGENT_MAX_LLM_USD,
+)
+from kalshi_research.exa.policy import ExaMode
+
+
+def _read_tickers_file(path: Path) -> list[str]:
+    """Read tickers from a text file (one per line, `#` comments) or a JSON scan result set.
+
+    JSON may be a list of tickers, a list of objects with a `ticker` key, or an object whose
+    `markets` list holds either (e.g. `kalshi scan new-markets --json`).
+    """
+    text = path.read_text(encoding="utf-8")
+    if path.suffix.lower() != ".json":
+        lines = (line.split("#", 1)[0].strip() for line in text.splitlines())
+        return [line for line in lines if line]
+
+    payload = json.loads(text)
+    items = payload.get("markets") if isinstance(payload, dict) else payload
+    if not isinstance(items, list):
+        raise ValueError("expected a JSON list of tickers or an object with a 'markets' list")
+    tickers: list[str] = []
+    for item in items:
+        ticker = item.get("ticker") if isinstance(item, dict) else item
+        if not isinstance(ticker, str) or not ticker:
+            raise ValueError(f"entry without a ticker: {item!r}")
+        tickers.append(ticker)
+    return tickers
+
+
+async def _execute_batch(
+    tickers: list[str],
+    research_mode: ExaMode,
+    *,
+    max_exa_usd: float,
+    max_llm_usd: float,
+    per_event_exa_usd: float,
+    per_market_llm_usd: float,
+    concurrency: int,
+    quiet: bool,
+) -> dict[str, Any]:
+    """Run the batch workflow and return the JSON-ready result."""
+    from kalshi_research.agent import BatchAgentRunner, ResearchAgent
+    from kalshi_research.agent.providers.llm import MockSynthesizer, get_synthesizer
+    from kalshi_research.api.exceptions import KalshiAPIError
+    from kalshi_research.cli.client_factory import public_client
+    from kalshi_research.exa.client import ExaClient
+    from kalshi_research.exa.exceptions import ExaAPIError, ExaAuthError
+
+    try:
+        async with (
+            public_client() as kalshi,
+            ExaClient.from_env() as exa,
+        ):
+            synthesizer = get_synthesizer(max_cost_usd=per_market_llm_usd)
+            is_mock = isinstance(synthesizer, MockSynthesizer)
+            if is_mock and not quiet:
+                console.print(
+                    "[yellow]Warning:[/yellow] Using MockSynthesizer. "
+                    "Set KALSHI_SYNTHESIZER_BACKEND=anthropic for real analysis."
+                )
+
+            runner = BatchAgentRunner(
+                kalshi_client=kalshi,
+                research_agent=ResearchAgent(exa),
+                synthesizer=synthesizer,
+                max_exa_usd=max_exa_usd,
+                max_llm_usd=max_llm_usd,
+                per_event_exa_usd=per_event_exa_usd,
+                per_market_llm_usd=per_market_llm_usd,
+                max_concurrency=concurrency,
+            )
+
+            if not quiet:
+                console.print(
+                    f"[cyan]Analyzing {len(tickers)} market(s)[/cyan] "
+                    f"(mode: {research_mode.value}, concurrency: {concurrency})"
+                )
+            result = await runner.run(tickers, research_mode=research_mode)
+
+            output = result.model_dump(mode="json")
+            if is_mock:
+                output["warning"] = (
+                    "MockSynthesizer active. "
+                    "Set KALSHI_SYNTHESIZER_BACKEND=anthropic for real analysis."
+                )
+            return output
+
+    except KalshiAPIError as e:
+        exit_kalshi_api_error(e)
+    except ExaAuthError as e:
+        console.print(f"[red]Exa Auth Error:[/red] {e}")
+        console.print("[yellow]Hint:[/yellow] Check your EXA_API_KEY environment variable")
+        raise typer.Exit(1) from None
+    except ExaAPIError as e:
+        console.print(f"[red]Exa API Error:[/red] {e}")
+        raise typer.Exit(1) from None
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from None
+
+
+def _render_batch_summary(result: dict[str, Any]) -> None:
+    """Render one row per market plus batch totals."""
+    table = Table(title="Batch Analysis")
+    table.add_column("Ticker", style="cyan", no_wrap=True)
+    table.add_column("Status")
+    table.add_column("Market", justify="right")
+    table.add_column("Predicted", justify="right")
+    table.add_column("Confidence")
+    table.add_column("Verified")
+    table.add_column("Note", style="dim")
+
+    counts = {"completed": 0, "failed": 0, "skipped": 0}
+    for market in result.get("markets", []):
+        status = market.get("status", "")
+        counts[status] = counts.get(status, 0) + 1
+        run = market.get("result")
+        if run is None:
+            table.add_row(market.get("ticker", ""), status, "", "", "", "", market.get("reason"))
+            continue
+        analysis = run["analysis"]
+        passed = run["verification"]["passed"]
+        table.add_row(
+            market.get("ticker", ""),
+            f"[green]{status}[/green]",
+            f"{analysis['market_prob'] * 100:.1f}%",
+            f"{analysis['predicted_prob']}%",
+            analysis["confidence"],
+            "✓" if passed else "[red]✗[/red]",
+            f"${run['total_cost_usd']:.3f}",
+        )
+
+    console.print(table)
+    console.print(
+        f"\nCompleted {counts['completed']}, failed {counts['failed']}, "
+        f"skipped {counts['skipped']} | {result.get('events_researched', 0)} event(s) researched"
+    )
+    console.print(
+        f"[dim]Exa: ${result.get('exa_cost_usd', 0.0):.3f} / ${result.get('max_exa_usd', 0.0):.2f}"
+        f" | LLM: ${result.get('llm_cost_usd', 0.0):.3f} / "
+        f"${result.get('max_llm_usd', 0.0):.2f}[/dim]"
+    )
+
+
+def batch(
+    tickers: Annotated[
+        list[str] | None,
+        typer.Argument(help="Market tickers to analyze"),
+    ] = None,
+    tickers_file: Annotated[
+        Path | None,
+        typer.Option(
+            "--file",
+            "-f",
+            help="Read tickers from a text file (one per line) or scan JSON output",
+        ),
+    ] = None,
+    mode: Annotated[
+        str,
+        typer.Option("--mode", "-m", help="Research mode (fast, standard, deep)"),
+    ] = "standard",
+    max_exa_usd: Annotated[
+        float,
+        typer.Option("--max-exa-usd", help="Maximum Exa spend for the whole batch"),
+    ] = DEFAULT_AGENT_BATCH_MAX_EXA_USD,
+    max_llm_usd: Annotated[
+        float,
+        typer.Option("--max-llm-usd", help="Maximum LLM spend for the whole batch"),
+    ] = DEFAULT_AGENT_BATCH_MAX_LLM_USD,
+    per_event_exa_usd: Annotated[
+        float,
+        typer.Option("--per-event-exa-usd", help="Research budget per event"),
+    ] = DEFAULT_AGENT_MAX_EXA_USD,
+    per_market_llm_usd: Annotated[
+        float,
+        typer.Option("--per-market-llm-usd", help="LLM budget per market"),
+    ] = DEFAULT_AGENT_MAX_LLM_USD,
+    concurrency: Annotated[
+        int,
+        typer.Option("--concurrency", "-c", help="Research runs and LLM calls in flight at once"),
+    ] = DEFAULT_AGENT_BATCH_CONCURRENCY,
+    output_json: Annotated[
+        bool,
+        typer.Option("--json", help="Output as JSON"),
+    ] = False,
+    output_file: Annotated[
+        str | None,
+        typer.Option("--output", "-o", help="Write full JSON results to file"),
+    ] = None,
+) -> None:
+    """
+    Run the agent analysis workflow for many markets at once.
+
+    Markets are fetched in batches, research runs once per event and is shared by the event's
+    markets, and Exa/LLM spend is capped for the whole batch.
+
+    Examples:
+        kalshi agent batch KXFED-26MAR-T4.25 KXFED-26MAR-T4.50
+        kalshi agent batch --file watchlist.txt --output estimates.json
+        kalshi scan new-markets --json > scan.json && kalshi agent batch --file scan.json
+    """
+    from kalshi_research.cli.agent import _parse_exa_mode, _write_json_output
+
+    research_mode = _parse_exa_mode(mode)
+    if concurrency < 1:
+        console.print("[red]Error:[/red] --concurrency must be >= 1")
+        raise typer.Exit(2)
+
+    requested = list(tickers or [])
+    if tickers_file is not None:
+        try:
+            requested.extend(_read_tickers_file(tickers_file))
+        except (OSError, ValueError) as e:
+            console.print(f"[red]Error:[/red] Could not read tickers from {tickers_file}: {e}")
+            raise typer.Exit(2) from None
+    if not requested:
+        console.print("[red]Error:[/red] Provide tickers as arguments or with --file")
+        raise typer.Exit(2)
+
+    result = run_async(
+        _execute_batch(
+            requested,
+            research_mode,
+            max_exa_usd=max_exa_usd,
+            max_llm_usd=max_llm_usd,
+            per_event_exa_usd=per_event_exa_usd,
+            per_market_llm_usd=per_market_llm_usd,
+            concurrency=concurrency,
+            quiet=output_json,
+        )
+    )
+
+    if not output_json:
+        _render_batch_summary(result)
+    if output_json or output_file:
+        _write_json_output(result, output_file)
@@ -0,0 +1,108 @@
+"""`kalshi news rescore`: re-score stored articles under a sentiment method version."""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated
+
+import typer
+
+from kalshi_research.cli.utils import console, run_async
+from kalshi_research.constants import DEFAULT_RESCORE_CHUNK_ROWS, DEFAULT_SENTIMENT_METHOD
+from kalshi_research.paths import DEFAULT_DB_PATH
+
+if TYPE_CHECKING:
+    from kalshi_research.news.rescore import RescoreResult
+
+
+def _rescore_state_path(db_path: Path, method: str) -> Path:
+    return db_path.with_name(f"{db_path.name}.rescore-{method}.json")
+
+
+async def _news_rescore_async(
+    db_path: Path, *, method: str, workers: int, chunk_size: int, resume: bool
+) -> "RescoreResult":
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    from kalshi_research.cli.db import open_db
+    from kalshi_research.news import SentimentAnalyzer
+    from kalshi_research.news.rescore import RescoreCheckpoint, RescoreProgress, rescore_sentiment
+
+    state_path = _rescore_state_path(db_path, method)
+    if resume:
+        if not state_path.exists():
+            console.print(f"[red]Error:[/red] No interrupted re-score to resume ({state_path})")
+            raise typer.Exit(1)
+        checkpoint = RescoreCheckpoint.load(state_path)
+        console.print(f"Resuming after article id {checkpoint.last_article_id}")
+
+    async with open_db(db_path) as db:
+        with Progress(
+            SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console
+        ) as progress:
+            task = progress.add_task("Re-scoring...", total=None)
+
+            def _report(p: RescoreProgress) -> None:
+                progress.update(
+                    task,
+                    description=f"Re-scoring: {p.scored:,} articles ({p.rows_per_second:,.0f}/s)",
+                )
+
+            return await rescore_sentiment(
+                db,
+                SentimentAnalyzer(method=method),
+                workers=workers,
+                chunk_rows=chunk_size,
+                state_path=state_path,
+                resume=resume,
+                on_progress=_report,
+            )
+
+
+def news_rescore(
+    method: Annotated[
+        str,
+        typer.Option("--method", help="Method version to store the new scores under."),
+    ],
+    workers: Annotated[
+        int,
+        typer.Option("--workers", help="Processes scoring articles in parallel."),
+    ] = 1,
+    chunk_size: Annotated[
+        int,
+        typer.Option("--chunk-size", help="Articles read, scored and stored per transaction."),
+    ] = DEFAULT_RESCORE_CHUNK_ROWS,
+    resume: Annotated[
+        bool,
+        typer.Option(
+            "--resume", help="Continue an interrupted re-score of --method from its checkpoint."
+        ),
+    ] = False,
+    db_path: Annotated[
+        Path,
+        typer.Option("--db", "-d", help="Path to database"),
+    ] = DEFAULT_DB_PATH,
+) -> None:
+    """Re-score stored articles with the current keyword analyzer under a method version."""
+    if workers < 1:
+        console.print("[red]Error:[/red] --workers must be >= 1")
+        raise typer.Exit(2)
+    if chunk_size < 1:
+        console.print("[red]Error:[/red] --chunk-size must be >= 1")
+        raise typer.Exit(2)
+
+    try:
+        result = run_async(
+            _news_rescore_async(
+                db_path, method=method, workers=workers, chunk_size=chunk_size, resume=resume
+            )
+        )
+    except KeyboardInterrupt:
+        # Finished chunks are committed and checkpointed; --resume continues after the last one.
+        console.print("[yellow]Re-scoring interrupted.[/yellow] Re-run with --resume.")
+        raise typer.Exit(130) from None
+
+    console.print(
+        f"[green]✓[/green] Re-scored {result.scored:,} article(s) as '{method}' in "
+        f"{result.elapsed_seconds:.1f}s ({result.rows_per_second:,.0f} articles/s)"
+    )
+    if method != DEFAULT_SENTIMENT_METHOD:
+        console.print(f"[dim]View with: kalshi news sentiment <TICKER> --method {method}[/dim]")
@@ -11,6 +11,7 @@ import typer
 from rich.panel import Panel
 from rich.table import Table
 
+from kalshi_research.cli._agent_batch import batch
 from kalshi_research.cli.utils import console, exit_kalshi_api_error, run_async
 from kalshi_research.constants import DEFAULT_AGENT_MAX_EXA_USD, DEFAULT_AGENT_MAX_LLM_USD
 from kalshi_research.exa.policy import ExaMode
@@ -381,3 +382,6 @@ def analyze(
         _render_analysis_human(result)
     else:
         _output_analysis_json(result, output_file, quiet)
+
+
+app.command("batch")(batch)
@@ -40,6 +40,8 @@ def spawn_alert_monitor_daemon(
     environment: str,
     output_file: Path | None,
     webhook_url: str | None,
+    full_sweep_threshold: int | None = None,
+    market_cache_max_age: float | None = None,
 ) -> tuple[int, Path]:
     """Spawn the alert monitor as a detached background daemon.
 
@@ -63,6 +65,10 @@ def spawn_alert_monitor_daemon(
     ]
     if max_pages is not None:
         args.extend(["--max-pages", str(max_pages)])
+    if full_sweep_threshold is not None:
+        args.extend(["--full-sweep-threshold", str(full_sweep_threshold)])
+    if market_cache_max_age is not None:
+        args.extend(["--market-cache-max-age", str(market_cache_max_age)])
     if once:
         args.append("--once")
     if output_file is not None:
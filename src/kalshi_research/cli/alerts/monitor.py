@@ -13,6 +13,8 @@ from kalshi_research.cli.utils import console, run_async
 
 if TYPE_CHECKING:
     from kalshi_research.alerts import AlertMonitor
+    from kalshi_research.api import KalshiPublicClient
+    from kalshi_research.api.models.market import Market
 
 logger = structlog.get_logger()
 
@@ -24,6 +26,8 @@ async def _compute_sentiment_shifts(
 ) -> dict[str, float]:
     """Compute sentiment shifts for the given tickers.
 
+    All tickers are summarized from the daily sentiment rollups in one grouped query.
+
     Args:
         tickers: Set of market tickers to compute sentiment shifts for.
         db_path: Path to the database file.
@@ -34,14 +38,9 @@ async def _compute_sentiment_shifts(
     from kalshi_research.cli.db import open_db
     from kalshi_research.news import SentimentAggregator
 
-    shifts: dict[str, float] = {}
     try:
         async with open_db(db_path) as db:
-            aggregator = SentimentAggregator(db)
-            for ticker in tickers:
-                summary = await aggregator.get_market_summary(ticker, days=7, compare_previous=True)
-                if summary and summary.score_change is not None:
-                    shifts[ticker] = summary.score_change
+            summaries = await SentimentAggregator(db).get_market_summaries(tickers, days=7)
     except Exception as e:
         logger.warning(
             "Failed to compute sentiment shifts; sentiment alerts will be skipped",
@@ -49,7 +48,46 @@ async def _compute_sentiment_shifts(
             exc_info=True,
         )
         return {}
-    return shifts
+    return {
+        ticker: summary.score_change
+        for ticker, summary in summaries.items()
+        if summary.score_change is not None
+    }
+
+
+def _print_delivery_stats(monitor: "AlertMonitor") -> None:
+    """Print alert delivery counters (only when alerts were triggered)."""
+    stats = monitor.dispatcher.stats
+    if stats.submitted == 0:
+        return
+    console.print(
+        f"[dim]Alert delivery: {stats.delivered} delivered, {stats.failed} failed, "
+        f"{stats.batches} batches, max queue depth {stats.max_queue_depth}, "
+        f"backpressure wait {stats.enqueue_wait_seconds:.2f}s[/dim]"
+    )
+
+
+async def _fetch_markets_for_conditions(
+    client: "KalshiPublicClient",
+    monitor: "AlertMonitor",
+    *,
+    max_pages: int | None,
+    full_sweep_threshold: int,
+) -> "list[Market]":
+    """Fetch the open markets needed to evaluate the monitor's conditions.
+
+    With at most `full_sweep_threshold` conditions, only the referenced tickers are fetched
+    (batched `tickers=` lookups). Larger condition sets fall back to paging through every open
+    market, which is cheaper once conditions cover a large part of the market universe.
+    """
+    conditions = monitor.list_conditions()
+    if len(conditions) <= full_sweep_threshold:
+        tickers = sorted({c.ticker for c in conditions})
+        console.print(f"[dim]Fetching {len(tickers)} watched markets...[/dim]", end="")
+        return await client.get_markets_by_tickers(tickers, status="open")
+
+    console.print("[dim]Fetching markets...[/dim]", end="")
+    return [m async for m in client.get_all_markets(status="open", max_pages=max_pages)]
 
 
 async def _run_alert_monitor_loop(
@@ -58,26 +96,39 @@ async def _run_alert_monitor_loop(
     once: bool,
     max_pages: int | None,
     monitor: "AlertMonitor",
+    full_sweep_threshold: int | None = None,
+    market_cache_max_age: float | None = None,
 ) -> None:
     """Monitor alerts by periodically fetching markets and evaluating conditions.
 
     Args:
         interval: Sleep interval (seconds) between checks (ignored when `once=True`).
         once: If true, run a single check and exit.
-        max_pages: Maximum pages to fetch when listing open markets.
+        max_pages: Maximum pages to fetch when listing open markets (full sweeps only).
         monitor: Alert monitor containing configured conditions.
+        full_sweep_threshold: Condition count above which every open market is fetched instead
+            of only the referenced tickers (default: `DEFAULT_ALERT_FULL_SWEEP_THRESHOLD`).
+        market_cache_max_age: Reuse full sweeps from the shared market cache when younger than
+            this many seconds (None = no cache).
     """
     from kalshi_research.alerts.conditions import ConditionType
     from kalshi_research.cli.client_factory import public_client
+    from kalshi_research.constants import DEFAULT_ALERT_FULL_SWEEP_THRESHOLD
     from kalshi_research.paths import DEFAULT_DB_PATH
 
-    async with public_client() as client:
+    if full_sweep_threshold is None:
+        full_sweep_threshold = DEFAULT_ALERT_FULL_SWEEP_THRESHOLD
+
+    # Entering the monitor starts background alert delivery; leaving it flushes the queue.
+    async with public_client(market_cache_max_age=market_cache_max_age) as client, monitor:
         try:
             while True:
-                console.print("[dim]Fetching markets...[/dim]", end="")
-                markets = [
-                    m async for m in client.get_all_markets(status="open", max_pages=max_pages)
-                ]
+                markets = await _fetch_markets_for_conditions(
+                    client,
+                    monitor,
+                    max_pages=max_pages,
+                    full_sweep_threshold=full_sweep_threshold,
+                )
                 console.print(f"[dim] ({len(markets)} markets)[/dim]")
 
                 sentiment_conditions = [
@@ -104,12 +155,15 @@ async def _run_alert_monitor_loop(
                     )
 
                 if once:
+                    await monitor.dispatcher.drain()
+                    _print_delivery_stats(monitor)
                     console.print("[green]✓[/green] Single check complete")
                     return
 
                 await asyncio.sleep(interval)
         except KeyboardInterrupt:
             console.print("\n[yellow]Monitoring stopped[/yellow]")
+            _print_delivery_stats(monitor)
 
 
 def alerts_monitor(
@@ -125,7 +179,29 @@ def alerts_monitor(
         int | None,
         typer.Option(
             "--max-pages",
-            help="Optional pagination safety limit for market fetch (None = full).",
+            help="Optional pagination safety limit for full market sweeps (None = full).",
+        ),
+    ] = None,
+    full_sweep_threshold: Annotated[
+        int | None,
+        typer.Option(
+            "--full-sweep-threshold",
+            min=0,
+            help=(
+                "Fetch every open market when more than this many conditions are active; "
+                "otherwise fetch only the watched tickers (default: 500)."
+            ),
+        ),
+    ] = None,
+    market_cache_max_age: Annotated[
+        float | None,
+        typer.Option(
+            "--market-cache-max-age",
+            min=0,
+            help=(
+                "Share open-market sweeps with other processes via data/market_cache: reuse a "
+                "sweep younger than this many seconds (0 = always sweep, but publish it)."
+            ),
         ),
     ] = None,
     output_file: Annotated[
@@ -167,6 +243,8 @@ def alerts_monitor(
                 interval=interval,
                 once=once,
                 max_pages=max_pages,
+                full_sweep_threshold=full_sweep_threshold,
+                market_cache_max_age=market_cache_max_age,
                 environment=environment_value,
                 output_file=output_file,
                 webhook_url=webhook_url,
@@ -222,5 +300,7 @@ def alerts_monitor(
             once=once,
             max_pages=max_pages,
             monitor=monitor,
+            full_sweep_threshold=full_sweep_threshold,
+            market_cache_max_age=market_cache_max_age,
         )
     )
@@ -169,10 +169,17 @@ def analysis_correlation(
         float, typer.Option("--min", help="Minimum correlation threshold")
     ] = 0.5,
     top_n: Annotated[int, typer.Option("--top", "-n", help="Number of results")] = 10,
+    replica_max_age: Annotated[
+        int | None,
+        typer.Option(
+            "--replica-max-age",
+            help="Read from a backup copy of the DB, refreshed when older than N minutes.",
+        ),
+    ] = None,
 ) -> None:
     """Analyze correlations between markets."""
     from kalshi_research.analysis.correlation import CorrelationAnalyzer
-    from kalshi_research.cli.db import open_db_session
+    from kalshi_research.cli.db import open_readonly_session
 
     if not db_path.exists():
         console.print(f"[red]Error:[/red] Database not found at {db_path}")
@@ -181,7 +188,9 @@ def analysis_correlation(
     async def _analyze() -> None:
         from kalshi_research.data.repositories import PriceRepository
 
-        async with open_db_session(db_path) as session:
+        async with open_readonly_session(
+            db_path, replica_max_age_minutes=replica_max_age
+        ) as session:
             price_repo = PriceRepository(session)
 
             # Fetch price snapshots
@@ -5,16 +5,29 @@ commands, avoiding repeated environment resolution logic and making testing easi
 via factory function patching.
 """
 
-from kalshi_research.api import KalshiClient, KalshiPublicClient
+from kalshi_research.api import KalshiClient, KalshiPublicClient, MarketUniverseCache
 from kalshi_research.api.rate_limiter import RateTier
 
 
+def market_cache(max_age_seconds: float | None) -> MarketUniverseCache | None:
+    """Build the shared market-universe cache for a `--market-cache-max-age` option value.
+
+    Args:
+        max_age_seconds: Serve cached sweeps younger than this; 0 only publishes sweeps.
+            None disables the cache entirely.
+    """
+    if max_age_seconds is None:
+        return None
+    return MarketUniverseCache(max_age_seconds=max_age_seconds)
+
+
 def public_client(
     *,
     environment: str | None = None,
     timeout: float = 30.0,
     max_retries: int = 5,
     rate_tier: str | RateTier = RateTier.BASIC,
+    market_cache_max_age: float | None = None,
 ) -> KalshiPublicClient:
     """Create a KalshiPublicClient with consistent defaults.
 
@@ -23,6 +36,8 @@ def public_client(
         timeout: Request timeout in seconds.
         max_retries: Maximum number of retry attempts on transient failures.
         rate_tier: API rate limit tier (basic/advanced/premier/prime).
+        market_cache_max_age: Share `get_all_markets()` sweeps through the on-disk market
+            cache, serving sweeps younger than this many seconds (None = no cache).
 
     Returns:
         Configured KalshiPublicClient instance (use as async context manager).
@@ -38,6 +53,7 @@ def public_client(
         timeout=timeout,
         max_retries=max_retries,
         rate_tier=rate_tier,
+        market_cache=market_cache(market_cache_max_age),
     )
 
 
@@ -7,7 +7,9 @@ from typing import Annotated
 import typer
 
 from kalshi_research.cli.utils import console, run_async
-from kalshi_research.paths import DEFAULT_DB_PATH
+from kalshi_research.paths import DEFAULT_COLLECTOR_STATUS_PATH, DEFAULT_DB_PATH
+
+_MARKET_SYNC_INTERVAL_SECONDS = 3600
 
 
 def data_collect(
@@ -37,13 +39,116 @@ def data_collect(
             help="Also sync multivariate events via /events/multivariate.",
         ),
     ] = False,
+    sqlite_profile: Annotated[
+        str,
+        typer.Option(
+            "--sqlite-profile",
+            help="SQLite tuning profile: default, collector, bulk-load, analytics.",
+        ),
+    ] = "default",
+    market_cache_max_age: Annotated[
+        float | None,
+        typer.Option(
+            "--market-cache-max-age",
+            min=0,
+            help=(
+                "Share open-market sweeps with other processes via data/market_cache: reuse a "
+                "sweep younger than this many seconds (0 = always sweep, but publish it)."
+            ),
+        ),
+    ] = None,
+    shards: Annotated[
+        int,
+        typer.Option(
+            "--shards",
+            min=1,
+            help=(
+                "Sweep snapshots with this many worker processes (partitioned by market "
+                "creation time) sharing one rate budget; the main process stays the only writer."
+            ),
+        ),
+    ] = 1,
+    rate_tier: Annotated[
+        str | None,
+        typer.Option(
+            "--rate-tier",
+            help=(
+                "API rate limit tier shared by --shards workers (basic/advanced/premier/prime). "
+                "Defaults to KALSHI_RATE_TIER or basic."
+            ),
+            show_default=False,
+        ),
+    ] = None,
+    jitter: Annotated[
+        float,
+        typer.Option(
+            "--jitter",
+            min=0,
+            help="Delay each scheduled run by a random 0..SECONDS to spread load.",
+        ),
+    ] = 0.0,
+    deadline: Annotated[
+        float | None,
+        typer.Option(
+            "--deadline",
+            min=0,
+            help="Cancel a scheduled snapshot or sync run that takes longer than SECONDS.",
+        ),
+    ] = None,
+    status_file: Annotated[
+        Path,
+        typer.Option(
+            "--status-file",
+            help="JSON file updated with scheduler run statistics after every scheduled run.",
+        ),
+    ] = DEFAULT_COLLECTOR_STATUS_PATH,
+    stats: Annotated[
+        bool,
+        typer.Option(
+            "--stats",
+            help="Print run statistics from --status-file (of a running collector) and exit.",
+        ),
+    ] = False,
 ) -> None:
     """Run continuous data collection."""
+    if stats:
+        _print_collector_stats(status_file)
+        return
+
+    from kalshi_research.api.config import get_config
+    from kalshi_research.cli.client_factory import market_cache
     from kalshi_research.cli.db import open_db
-    from kalshi_research.data import DataFetcher, DataScheduler
+    from kalshi_research.cli.portfolio._helpers import resolve_rate_tier_override
+    from kalshi_research.data import (
+        SQLITE_PROFILES,
+        DataFetcher,
+        DataScheduler,
+        ShardedSnapshotCollector,
+    )
+
+    if sqlite_profile not in SQLITE_PROFILES:
+        console.print(
+            f"[red]Error:[/red] Unknown SQLite profile: {sqlite_profile}. "
+            f"Available: {', '.join(SQLITE_PROFILES)}"
+        )
+        raise typer.Exit(2)
+
+    # Both scheduled jobs use the same jitter, so it must fit the shorter of their intervals.
+    if jitter >= min(_MARKET_SYNC_INTERVAL_SECONDS, interval * 60):
+        console.print(
+            "[red]Error:[/red] --jitter must be shorter than --interval "
+            "and than the hourly market sync."
+        )
+        raise typer.Exit(2)
+
+    cache = market_cache(market_cache_max_age)
+    tier = resolve_rate_tier_override(rate_tier)
 
     async def _collect() -> None:
-        async with open_db(db_path) as db, DataFetcher(db) as fetcher:
+        async with (
+            open_db(db_path, profile=sqlite_profile) as db,
+            DataFetcher(db, market_cache=cache) as fetcher,
+        ):
             if once:
                 counts = await fetcher.full_sync(
                     max_pages=max_pages,
@@ -56,8 +161,20 @@ def data_collect(
                 )
                 return
 
-            scheduler = DataScheduler()
+            scheduler = DataScheduler(status_path=status_file)
             write_lock = asyncio.Lock()
+            sharded = (
+                ShardedSnapshotCollector(
+                    fetcher,
+                    shards=shards,
+                    rate_tier=tier,
+                    # Spawned workers don't inherit a `--env` override; pass it explicitly.
+                    environment=get_config().environment.value,
+                    max_pages=max_pages,
+                )
+                if shards > 1
+                else None
+            )
 
             async def sync_task() -> None:
                 async with write_lock:
@@ -65,21 +182,28 @@ def data_collect(
 
             async def snapshot_task() -> None:
                 async with write_lock:
-                    count = await fetcher.take_snapshot(status="open", max_pages=max_pages)
+                    if sharded is not None:
+                        count = await sharded.take_snapshot()
+                    else:
+                        count = await fetcher.take_snapshot(status="open", max_pages=max_pages)
                     console.print(f"[dim]Took {count} snapshots[/dim]")
 
             # Schedule tasks
             await scheduler.schedule_interval(
                 "market_sync",
                 sync_task,
-                interval_seconds=3600,  # Hourly
+                interval_seconds=_MARKET_SYNC_INTERVAL_SECONDS,
                 run_immediately=False,
+                jitter_seconds=jitter,
+                deadline_seconds=deadline,
             )
             await scheduler.schedule_interval(
                 "price_snapshot",
                 snapshot_task,
                 interval_seconds=interval * 60,
                 run_immediately=False,
+                jitter_seconds=jitter,
+                deadline_seconds=deadline,
             )
 
             # Initial sync before starting scheduled tasks.
@@ -103,3 +227,68 @@ def data_collect(
                     pass
 
     run_async(_collect())
+
+
+def _print_collector_stats(status_file: Path) -> None:
+    """Render the scheduler status file written by a running `kalshi data collect`."""
+    import json
+
+    from rich.table import Table
+
+    try:
+        payload = json.loads(status_file.read_text(encoding="utf-8"))
+        tasks = payload["tasks"]
+    except FileNotFoundError:
+        console.print(f"[red]Error:[/red] No collector status at {status_file}")
+        console.print("[dim]Status is written after the first scheduled run.[/dim]")
+        raise typer.Exit(1) from None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        console.print(f"[red]Error:[/red] Unreadable collector status at {status_file}: {e}")
+        raise typer.Exit(1) from None
+
+    def _secs(value: float | None) -> str:
+        return "-" if value is None else f"{value:.1f}s"
+
+    table = Table(title=f"Collector Run Statistics (updated {payload.get('updated_at', '?')})")
+    for column in (
+        "Task",
+        "Interval",
+        "Runs",
+        "Failed",
+        "Timeouts",
+        "Overruns",
+        "Missed",
+        "Last",
+        "Mean",
+        "p95",
+        "Max",
+        "Max Lag",
+        "Next Run",
+    ):
+        table.add_column(column, style="cyan" if column == "Task" else None)
+
+    for name, t in tasks.items():
+        overruns = str(t["overruns"])
+        table.add_row(
+            name,
+            _secs(t["interval_seconds"]),
+            str(t["runs"]),
+            str(t["failures"]),
+            str(t["timeouts"]),
+            f"[red]{overruns}[/red]" if t["overruns"] else overruns,
+            str(t["missed_runs"]),
+            _secs(t["last_duration_seconds"]),
+            _secs(t["mean_duration_seconds"]),
+            _secs(t["p95_duration_seconds"]),
+            _secs(t["max_duration_seconds"]),
+            _secs(t["max_lag_seconds"]),
+            t["next_run_at"] or "-",
+        )
+    console.print(table)
+
+    slow = [n for n, t in tasks.items() if t["max_duration_seconds"] > t["interval_seconds"]]
+    if slow:
+        console.print(
+            f"[yellow]Warning:[/yellow] {', '.join(slow)} took longer than the interval; "
+            "consider a longer --interval or --shards."
+        )
@@ -7,6 +7,7 @@ import typer
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from kalshi_research.cli.utils import console
+from kalshi_research.constants import DEFAULT_EXPORT_COMPACT_MIN_FILES
 from kalshi_research.paths import DEFAULT_DB_PATH, DEFAULT_EXPORTS_DIR
 
 
@@ -23,6 +24,20 @@ def data_export(
         str,
         typer.Option("--format", "-f", help="Export format (parquet, csv)."),
     ] = "parquet",
+    incremental: Annotated[
+        bool,
+        typer.Option(
+            "--incremental",
+            help="Parquet only: append snapshot rows added since the last export.",
+        ),
+    ] = False,
+    compact_min_files: Annotated[
+        int,
+        typer.Option(
+            "--compact-min-files",
+            help="With --incremental, compact month partitions holding at least N files.",
+        ),
+    ] = DEFAULT_EXPORT_COMPACT_MIN_FILES,
 ) -> None:
     """Export data to Parquet or CSV for analysis."""
     from kalshi_research.data.export import export_to_csv, export_to_parquet
@@ -31,6 +46,13 @@ def data_export(
         console.print(f"[red]Error:[/red] Database not found at {db_path}")
         raise typer.Exit(1)
 
+    if incremental and format_type != "parquet":
+        console.print("[red]Error:[/red] --incremental is only supported for parquet exports")
+        raise typer.Exit(2)
+    if compact_min_files < 2:
+        console.print("[red]Error:[/red] --compact-min-files must be >= 2")
+        raise typer.Exit(2)
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -39,7 +61,12 @@ def data_export(
         progress.add_task(f"Exporting to {format_type}...", total=None)
 
         if format_type == "parquet":
-            export_to_parquet(db_path, output)
+            export_to_parquet(
+                db_path,
+                output,
+                incremental=incremental,
+                compact_min_files=compact_min_files if incremental else None,
+            )
         elif format_type == "csv":
             export_to_csv(db_path, output)
         else:
@@ -2,14 +2,164 @@
 
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
+from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 from kalshi_research.cli.utils import console, run_async
+from kalshi_research.constants import DEFAULT_PRUNE_CHUNK_ROWS, DEFAULT_PRUNE_PAUSE_SECONDS
 from kalshi_research.paths import DEFAULT_DB_PATH
 
+if TYPE_CHECKING:
+    from kalshi_research.data.chunked_prune import ChunkedPruneResult, PruneProgress
+    from kalshi_research.data.maintenance import PruneCounts
+
+
+def _prune_state_path(db_path: Path) -> Path:
+    return db_path.with_name(f"{db_path.name}.prune-state.json")
+
+
+def _cutoff(now: datetime, days: int | None) -> datetime | None:
+    return now - timedelta(days=days) if days is not None else None
+
+
+def _validate_chunk_options(*, chunk_size: int, pause: float, resume: bool, dry_run: bool) -> None:
+    if chunk_size < 1:
+        console.print("[red]Error:[/red] --chunk-size must be >= 1")
+        raise typer.Exit(2)
+    if pause < 0:
+        console.print("[red]Error:[/red] --pause must be >= 0")
+        raise typer.Exit(2)
+    if resume and dry_run:
+        console.print("[red]Error:[/red] --resume requires --apply")
+        raise typer.Exit(2)
+
+
+def _apply_chunked_prune(
+    db_path: Path,
+    *,
+    snapshots_before: datetime | None,
+    news_before: datetime | None,
+    hourly_rollups_before: datetime | None,
+    chunk_rows: int,
+    pause_seconds: float,
+    resume: bool,
+    incremental_vacuum: bool,
+) -> "ChunkedPruneResult":
+    try:
+        return run_async(
+            _run_chunked_prune(
+                db_path,
+                snapshots_before=snapshots_before,
+                news_before=news_before,
+                hourly_rollups_before=hourly_rollups_before,
+                chunk_rows=chunk_rows,
+                pause_seconds=pause_seconds,
+                resume=resume,
+                incremental_vacuum=incremental_vacuum,
+            )
+        )
+    except KeyboardInterrupt:
+        # The checkpoint written after the last finished chunk is left for --resume.
+        console.print("[yellow]Prune interrupted.[/yellow] Re-run with --apply --resume.")
+        raise typer.Exit(130) from None
+
+
+def _print_throughput(result: "ChunkedPruneResult", *, incremental_vacuum: bool) -> None:
+    console.print(
+        f"Deleted {result.counts.total_rows:,} rows in {result.elapsed_seconds:.1f}s "
+        f"({result.rows_per_second:,.0f} rows/s, {result.chunks} chunks)"
+    )
+    if incremental_vacuum and not result.incremental_vacuum:
+        console.print(
+            "[yellow]Warning:[/yellow] auto_vacuum is not INCREMENTAL; freed pages were "
+            "kept. Run `kalshi data vacuum --incremental` once to enable it."
+        )
+
+
+async def _run_chunked_prune(
+    db_path: Path,
+    *,
+    snapshots_before: datetime | None,
+    news_before: datetime | None,
+    hourly_rollups_before: datetime | None,
+    chunk_rows: int,
+    pause_seconds: float,
+    resume: bool,
+    incremental_vacuum: bool,
+) -> "ChunkedPruneResult":
+    from kalshi_research.cli.db import open_db
+    from kalshi_research.data.chunked_prune import prune_in_chunks
+
+    async with open_db(db_path) as db:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+        ) as progress:
+            task = progress.add_task("Pruning...", total=None)
+
+            def _report(p: "PruneProgress") -> None:
+                progress.update(
+                    task,
+                    description=(
+                        f"Pruning {p.stage}: {p.deleted:,} rows ({p.rows_per_second:,.0f} rows/s)"
+                    ),
+                )
+
+            return await prune_in_chunks(
+                db,
+                snapshots_before=snapshots_before,
+                news_before=news_before,
+                hourly_rollups_before=hourly_rollups_before,
+                chunk_rows=chunk_rows,
+                pause_seconds=pause_seconds,
+                state_path=_prune_state_path(db_path),
+                resume=resume,
+                incremental_vacuum=incremental_vacuum,
+                on_progress=_report,
+            )
+
+
+def _print_prune_summary(
+    counts: "PruneCounts",
+    *,
+    snapshots_before: datetime | None,
+    news_before: datetime | None,
+    hourly_rollups_before: datetime | None,
+) -> None:
+    table = Table(title="Prune Summary")
+    table.add_column("Category", style="cyan")
+    table.add_column("Cutoff", style="dim")
+    table.add_column("Rows", justify="right", style="green")
+
+    if snapshots_before is not None:
+        table.add_row("price_snapshots", snapshots_before.isoformat(), str(counts.price_snapshots))
+        table.add_row(
+            "snapshot_batches", snapshots_before.isoformat(), str(counts.snapshot_batches)
+        )
+    if hourly_rollups_before is not None:
+        table.add_row(
+            "price_rollups (1h)", hourly_rollups_before.isoformat(), str(counts.hourly_rollups)
+        )
+    if news_before is not None:
+        table.add_row("news_articles", news_before.isoformat(), str(counts.news_articles))
+        table.add_row(
+            "news_article_markets",
+            news_before.isoformat(),
+            str(counts.news_article_markets),
+        )
+        table.add_row(
+            "news_article_events",
+            news_before.isoformat(),
+            str(counts.news_article_events),
+        )
+        table.add_row("news_sentiments", news_before.isoformat(), str(counts.news_sentiments))
+
+    console.print(table)
+
 
 def data_prune(
     db_path: Annotated[
@@ -30,6 +180,13 @@ def data_prune(
             help="Delete collected news articles older than N days (by collected_at).",
         ),
     ] = None,
+    hourly_rollups_older_than_days: Annotated[
+        int | None,
+        typer.Option(
+            "--hourly-rollups-older-than-days",
+            help="Delete hourly price rollups older than N days (daily rollups are kept).",
+        ),
+    ] = None,
     dry_run: Annotated[
         bool,
         typer.Option(
@@ -37,89 +194,115 @@ def data_prune(
             help="Preview deletions without applying changes (default: dry-run).",
         ),
     ] = True,
+    chunk_size: Annotated[
+        int,
+        typer.Option("--chunk-size", help="Maximum rows deleted per transaction."),
+    ] = DEFAULT_PRUNE_CHUNK_ROWS,
+    pause: Annotated[
+        float,
+        typer.Option("--pause", help="Seconds to pause between chunks (lets writers in)."),
+    ] = DEFAULT_PRUNE_PAUSE_SECONDS,
+    resume: Annotated[
+        bool,
+        typer.Option("--resume", help="Continue an interrupted --apply run with its cutoffs."),
+    ] = False,
+    incremental_vacuum: Annotated[
+        bool,
+        typer.Option(
+            "--incremental-vacuum",
+            help="Release freed pages after every chunk (needs `data vacuum --incremental`).",
+        ),
+    ] = False,
 ) -> None:
-    """Prune old rows to keep the database manageable."""
+    """Prune old rows to keep the database manageable.
+
+    Pruned price snapshots are downsampled first: their hourly/daily rollups are kept.
+    `--apply` deletes in short chunked transactions, so it can run while the collector is
+    writing; an interrupted run can be continued with `--resume`.
+    """
     from kalshi_research.cli.db import open_db_session
-    from kalshi_research.data.maintenance import (
-        PruneCounts,
-        apply_prune,
-        compute_prune_counts,
-    )
+    from kalshi_research.data.chunked_prune import PruneCheckpoint
+    from kalshi_research.data.maintenance import compute_prune_counts
 
     if not db_path.exists():
         console.print(f"[red]Error:[/red] Database not found at {db_path}")
         raise typer.Exit(1)
 
+    _validate_chunk_options(chunk_size=chunk_size, pause=pause, resume=resume, dry_run=dry_run)
     if snapshots_older_than_days is not None and snapshots_older_than_days < 0:
         console.print("[red]Error:[/red] --snapshots-older-than-days must be >= 0")
         raise typer.Exit(2)
     if news_older_than_days is not None and news_older_than_days < 0:
         console.print("[red]Error:[/red] --news-older-than-days must be >= 0")
         raise typer.Exit(2)
+    if hourly_rollups_older_than_days is not None and hourly_rollups_older_than_days < 0:
+        console.print("[red]Error:[/red] --hourly-rollups-older-than-days must be >= 0")
+        raise typer.Exit(2)
 
-    if snapshots_older_than_days is None and news_older_than_days is None:
+    if not resume and (
+        snapshots_older_than_days is None
+        and news_older_than_days is None
+        and hourly_rollups_older_than_days is None
+    ):
         console.print("[red]Error:[/red] No prune targets specified.")
         console.print(
-            "[dim]Provide at least one of --snapshots-older-than-days or --news-older-than-days."
-            "[/dim]"
+            "[dim]Provide at least one of --snapshots-older-than-days, --news-older-than-days "
+            "or --hourly-rollups-older-than-days.[/dim]"
         )
         raise typer.Exit(2)
 
     now = datetime.now(UTC)
-    snapshots_before = (
-        now - timedelta(days=snapshots_older_than_days)
-        if snapshots_older_than_days is not None
-        else None
-    )
-    news_before = (
-        now - timedelta(days=news_older_than_days) if news_older_than_days is not None else None
-    )
-
-    async def _prune() -> tuple[datetime, PruneCounts]:
-        async with open_db_session(db_path) as session:
-            if dry_run:
-                counts = await compute_prune_counts(
-                    session,
-                    snapshots_before=snapshots_before,
-                    news_before=news_before,
-                )
-                return (now, counts)
-
-            async with session.begin():
-                counts = await apply_prune(
-                    session,
-                    snapshots_before=snapshots_before,
-                    news_before=news_before,
-                )
-            return (now, counts)
+    snapshots_before = _cutoff(now, snapshots_older_than_days)
+    news_before = _cutoff(now, news_older_than_days)
+    hourly_rollups_before = _cutoff(now, hourly_rollups_older_than_days)
 
-    pruned_at, counts = run_async(_prune())
+    if resume:
+        state_path = _prune_state_path(db_path)
+        if not state_path.exists():
+            console.print(f"[red]Error:[/red] No interrupted prune to resume ({state_path})")
+            raise typer.Exit(1)
+        checkpoint = PruneCheckpoint.load(state_path)
+        snapshots_before = checkpoint.snapshots_before
+        news_before = checkpoint.news_before
+        hourly_rollups_before = checkpoint.hourly_rollups_before
 
-    table = Table(title="Prune Summary")
-    table.add_column("Category", style="cyan")
-    table.add_column("Cutoff", style="dim")
-    table.add_column("Rows", justify="right", style="green")
+    async def _dry_run() -> "PruneCounts":
+        async with open_db_session(db_path) as session:
+            return await compute_prune_counts(
+                session,
+                snapshots_before=snapshots_before,
+                news_before=news_before,
+                hourly_rollups_before=hourly_rollups_before,
+            )
 
-    if snapshots_before is not None:
-        table.add_row("price_snapshots", snapshots_before.isoformat(), str(counts.price_snapshots))
-    if news_before is not None:
-        table.add_row("news_articles", news_before.isoformat(), str(counts.news_articles))
-        table.add_row(
-            "news_article_markets",
-            news_before.isoformat(),
-            str(counts.news_article_markets),
-        )
-        table.add_row(
-            "news_article_events",
-            news_before.isoformat(),
-            str(counts.news_article_events),
+    result = (
+        None
+        if dry_run
+        else _apply_chunked_prune(
+            db_path,
+            snapshots_before=snapshots_before,
+            news_before=news_before,
+            hourly_rollups_before=hourly_rollups_before,
+            chunk_rows=chunk_size,
+            pause_seconds=pause,
+            resume=resume,
+            incremental_vacuum=incremental_vacuum,
         )
-        table.add_row("news_sentiments", news_before.isoformat(), str(counts.news_sentiments))
+    )
+    counts = run_async(_dry_run()) if result is None else result.counts
 
-    console.print(table)
+    _print_prune_summary(
+        counts,
+        snapshots_before=snapshots_before,
+        news_before=news_before,
+        hourly_rollups_before=hourly_rollups_before,
+    )
+
+    if result is not None:
+        _print_throughput(result, incremental_vacuum=incremental_vacuum)
 
     mode = "dry-run" if dry_run else "applied"
-    console.print(f"[green]✓[/green] Prune {mode} at {pruned_at.isoformat()} (UTC)")
+    console.print(f"[green]✓[/green] Prune {mode} at {now.isoformat()} (UTC)")
 
 
 def data_vacuum(
@@ -127,6 +310,14 @@ def data_vacuum(
         Path,
         typer.Option("--db", "-d", help="Path to SQLite database file."),
     ] = DEFAULT_DB_PATH,
+    incremental: Annotated[
+        bool,
+        typer.Option(
+            "--incremental",
+            help="Switch the database to auto_vacuum=INCREMENTAL (used by prune "
+            "--incremental-vacuum) while vacuuming.",
+        ),
+    ] = False,
 ) -> None:
     """Run SQLite VACUUM to reclaim disk space after large deletes."""
     from sqlalchemy import create_engine, text
@@ -138,7 +329,11 @@ def data_vacuum(
     engine = create_engine(f"sqlite:///{db_path}")
     try:
         with engine.connect() as conn:
-            conn.execution_options(isolation_level="AUTOCOMMIT").execute(text("VACUUM"))
+            autocommit = conn.execution_options(isolation_level="AUTOCOMMIT")
+            if incremental:
+                # The mode change only takes effect on an existing database through VACUUM.
+                autocommit.execute(text("PRAGMA auto_vacuum=INCREMENTAL"))
+            autocommit.execute(text("VACUUM"))
     finally:
         engine.dispose()
 
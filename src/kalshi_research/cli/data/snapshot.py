@@ -26,13 +26,30 @@ def data_snapshot(
             help="Optional pagination safety limit. None = iterate until exhausted.",
         ),
     ] = None,
+    market_cache_max_age: Annotated[
+        float | None,
+        typer.Option(
+            "--market-cache-max-age",
+            min=0,
+            help=(
+                "Share open-market sweeps with other processes via data/market_cache: reuse a "
+                "sweep younger than this many seconds (0 = always sweep, but publish it)."
+            ),
+        ),
+    ] = None,
 ) -> None:
     """Take a price snapshot of all markets."""
+    from kalshi_research.cli.client_factory import market_cache
     from kalshi_research.cli.db import open_db
     from kalshi_research.data import DataFetcher
 
+    cache = market_cache(market_cache_max_age)
+
     async def _snapshot() -> None:
-        async with open_db(db_path) as db, DataFetcher(db) as fetcher:
+        async with (
+            open_db(db_path) as db,
+            DataFetcher(db, market_cache=cache) as fetcher,
+        ):
             with Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
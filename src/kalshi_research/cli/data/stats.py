@@ -37,6 +37,7 @@ def data_stats(
             events = await event_repo.get_all()
             markets = await market_repo.get_all()
             market_counts = await market_repo.count_by_status()
+            quote_count, latest_quote_time = await price_repo.latest_quote_stats()
 
             # Sample snapshot counts for a few markets
             active_markets = await market_repo.get_active()
@@ -55,6 +56,12 @@ def data_stats(
         for status, count in sorted(market_counts.items()):
             table.add_row(f"  - {status}", str(count))
 
+        table.add_row("Markets With Quotes", str(quote_count))
+        table.add_row(
+            "Latest Quote",
+            latest_quote_time.isoformat() if latest_quote_time is not None else "N/A",
+        )
+
         if snapshot_counts:
             table.add_row("Sample Snapshot Counts", "")
             for ticker, count in snapshot_counts.items():
@@ -15,9 +15,14 @@ if TYPE_CHECKING:
 
 
 @asynccontextmanager
-async def open_db(db_path: Path) -> AsyncIterator[DatabaseManager]:
-    """Open a database manager and ensure tables exist before yielding."""
-    async with DatabaseManager(db_path) as db:
+async def open_db(db_path: Path, *, profile: str | None = None) -> AsyncIterator[DatabaseManager]:
+    """Open a database manager and ensure tables exist before yielding.
+
+    Args:
+        db_path: Path to the SQLite database file.
+        profile: Optional SQLite performance profile name (see `SQLITE_PROFILES`).
+    """
+    async with DatabaseManager(db_path, profile=profile) as db:
         await db.create_tables()
         yield db
 
@@ -27,3 +32,31 @@ async def open_db_session(db_path: Path) -> AsyncIterator[AsyncSession]:
     """Open a database session and ensure tables exist before yielding."""
     async with open_db(db_path) as db, db.session_factory() as session:
         yield session
+
+
+@asynccontextmanager
+async def open_readonly_session(
+    db_path: Path,
+    *,
+    replica_max_age_minutes: int | None = None,
+) -> AsyncIterator[AsyncSession]:
+    """Open a read-only session for long analytic reads.
+
+    With `replica_max_age_minutes`, reads run against a backup copy of the database (refreshed
+    when older than the given age) so they never pin the live database's WAL.
+    """
+    import asyncio
+
+    from kalshi_research.data.replica import refresh_replica
+
+    read_path = db_path
+    if replica_max_age_minutes is not None:
+        read_path = await asyncio.to_thread(
+            refresh_replica, db_path, max_age_seconds=replica_max_age_minutes * 60
+        )
+
+    async with (
+        DatabaseManager(read_path, read_only=True) as db,
+        db.session_factory() as session,
+    ):
+        yield session
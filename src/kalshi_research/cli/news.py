@@ -6,7 +6,9 @@ from typing import TYPE_CHECKING, Annotated
 import typer
 from rich.table import Table
 
+from kalshi_research.cli._news_rescore import news_rescore
 from kalshi_research.cli.utils import console, print_budget_exhausted, run_async
+from kalshi_research.constants import DEFAULT_NEWS_COLLECT_CONCURRENCY, DEFAULT_SENTIMENT_METHOD
 from kalshi_research.exa.policy import ExaMode
 from kalshi_research.paths import DEFAULT_DB_PATH
 
@@ -244,6 +246,24 @@ def news_collect(
         int,
         typer.Option("--max-per-query", help="Max articles per query"),
     ] = 25,
+    concurrency: Annotated[
+        int,
+        typer.Option("--concurrency", help="Exa queries in flight at once (all tracked items)."),
+    ] = DEFAULT_NEWS_COLLECT_CONCURRENCY,
+    two_phase: Annotated[
+        bool,
+        typer.Option(
+            "--two-phase",
+            help="Search without contents, then fetch text only for URLs not already stored.",
+        ),
+    ] = False,
+    sentiment_method: Annotated[
+        str,
+        typer.Option(
+            "--sentiment-method",
+            help="Method version to store new articles' sentiment under (see `news rescore`).",
+        ),
+    ] = DEFAULT_SENTIMENT_METHOD,
     db_path: Annotated[
         Path,
         typer.Option("--db", "-d", help="Path to database"),
@@ -258,6 +278,10 @@ def news_collect(
     from kalshi_research.exa.policy import ExaPolicy
     from kalshi_research.news import NewsCollector, SentimentAnalyzer
 
+    if concurrency < 1:
+        console.print("[red]Error:[/red] --concurrency must be >= 1")
+        raise typer.Exit(2)
+
     async def _collect() -> None:
         try:
             config = ExaConfig.from_env()
@@ -276,10 +300,11 @@ def news_collect(
             collector = NewsCollector(
                 exa=exa,
                 db=db,
-                sentiment_analyzer=SentimentAnalyzer(),
+                sentiment_analyzer=SentimentAnalyzer(method=sentiment_method),
                 lookback_days=lookback_days,
                 max_articles_per_query=max_per_query,
                 policy=policy,
+                two_phase=two_phase,
             )
 
             if ticker:
@@ -298,7 +323,7 @@ def news_collect(
                 print_budget_exhausted(collector)
                 return
 
-            results = await collector.collect_all()
+            results = await collector.collect_all(concurrency=concurrency)
             if not results:
                 console.print("[yellow]No tracked items.[/yellow]")
                 return
@@ -314,6 +339,10 @@ def news_sentiment(
     ticker: Annotated[str, typer.Argument(help="Market (or event) ticker")],
     event: Annotated[bool, typer.Option("--event", "-e", help="Treat as event ticker")] = False,
     days: Annotated[int, typer.Option("--days", help="Days to analyze")] = 7,
+    method: Annotated[
+        str,
+        typer.Option("--method", help="Sentiment method version to aggregate."),
+    ] = DEFAULT_SENTIMENT_METHOD,
     db_path: Annotated[
         Path,
         typer.Option("--db", "-d", help="Path to database"),
@@ -325,7 +354,7 @@ def news_sentiment(
 
     async def _report() -> None:
         async with open_db(db_path) as db:
-            aggregator = SentimentAggregator(db)
+            aggregator = SentimentAggregator(db, method=method)
             summary = (
                 await aggregator.get_event_summary(ticker, days=days)
                 if event
@@ -355,3 +384,6 @@ def news_sentiment(
                 console.print(f"• {kw} ({count})")
 
     run_async(_report())
+
+
+app.command("rescore")(news_rescore)
@@ -30,8 +30,31 @@ def research_cache_clear(
     """Clear Exa response cache entries on disk."""
     from kalshi_research.exa.cache import ExaCache
 
-    cache = ExaCache(cache_dir) if cache_dir else ExaCache()
-    removed = cache.clear() if clear_all else cache.clear_expired()
+    with ExaCache(cache_dir) as cache:
+        removed = cache.clear() if clear_all else cache.clear_expired()
 
     mode = "all" if clear_all else "expired"
     console.print(f"[green]✓[/green] Cleared {removed} Exa cache entries ({mode})")
+
+
+@cache_app.command("stats")
+def research_cache_stats(
+    cache_dir: Annotated[
+        Path | None,
+        typer.Option(
+            "--cache-dir",
+            help="Optional override for Exa cache directory (default: data/exa_cache/).",
+        ),
+    ] = None,
+) -> None:
+    """Show the number of cached Exa responses and their compressed size."""
+    from kalshi_research.exa.cache import ExaCache
+
+    with ExaCache(cache_dir) as cache:
+        stats = cache.stats()
+
+    cap = f"{stats.max_bytes / 1024**2:.1f} MiB" if stats.max_bytes else "none"
+    console.print(
+        f"Exa cache: {stats.entries} entries, {stats.size_bytes / 1024**2:.1f} MiB "
+        f"(cap {cap}) in {cache.path}"
+    )
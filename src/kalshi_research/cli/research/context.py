@@ -110,17 +110,17 @@ async def _run_market_context_research(
 
     try:
         async with ExaClient.from_env() as exa:
-            cache = ExaCache()
-            policy = ExaPolicy.from_mode(mode=mode, budget_usd=budget_usd)
-            researcher = MarketContextResearcher(
-                exa,
-                cache=cache,
-                max_news_results=max_news,
-                max_paper_results=max_papers,
-                news_recency_days=days,
-                policy=policy,
-            )
-            return await researcher.research_market(market)
+            with ExaCache() as cache:
+                policy = ExaPolicy.from_mode(mode=mode, budget_usd=budget_usd)
+                researcher = MarketContextResearcher(
+                    exa,
+                    cache=cache,
+                    max_news_results=max_news,
+                    max_paper_results=max_papers,
+                    news_recency_days=days,
+                    policy=policy,
+                )
+                return await researcher.research_market(market)
     except ValueError as e:
         console.print(f"[red]Error:[/red] {e}")
         console.print("[dim]Check EXA_API_KEY and --budget-usd (must be > 0).[/dim]")
@@ -77,10 +77,10 @@ async def _run_topic_research(
 
     try:
         async with ExaClient.from_env() as exa:
-            cache = ExaCache()
-            policy = ExaPolicy.from_mode(mode=mode, budget_usd=budget_usd)
-            researcher = TopicResearcher(exa, cache=cache, policy=policy)
-            return await researcher.research_topic(topic, include_answer=include_answer)
+            with ExaCache() as cache:
+                policy = ExaPolicy.from_mode(mode=mode, budget_usd=budget_usd)
+                researcher = TopicResearcher(exa, cache=cache, policy=policy)
+                return await researcher.research_topic(topic, include_answer=include_answer)
     except ValueError as e:
         console.print(f"[red]Error:[/red] {e}")
         console.print("[dim]Check EXA_API_KEY and --budget-usd (must be > 0).[/dim]")
@@ -0,0 +1,170 @@
+"""Database-backed market loading for offline scans."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import typer
+
+from kalshi_research.cli.utils import console
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from kalshi_research.analysis.scanner import MarketQuoteRow
+    from kalshi_research.cli.scan._opportunities_helpers import ScanProfile
+
+
+def _as_utc(dt: datetime) -> datetime:
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=UTC)
+    return dt
+
+
+def _require_db(db_path: Path) -> None:
+    if not db_path.exists():
+        console.print(f"[red]Error:[/red] Database not found at {db_path}")
+        console.print("[dim]Run `kalshi data sync-markets` and `kalshi data snapshot` first.[/dim]")
+        raise typer.Exit(1)
+
+
+async def refresh_snapshot_if_stale(
+    db_path: Path,
+    *,
+    max_age_minutes: int,
+    max_pages: int | None,
+) -> bool:
+    """Take a fresh price snapshot when the newest stored quote is older than `max_age_minutes`.
+
+    Returns:
+        True when a snapshot was taken.
+    """
+    from kalshi_research.cli.db import open_db, open_db_session
+    from kalshi_research.data import DataFetcher
+    from kalshi_research.data.repositories import PriceRepository
+
+    _require_db(db_path)
+    async with open_db_session(db_path) as session:
+        _, latest_quote_time = await PriceRepository(session).latest_quote_stats()
+
+    cutoff = datetime.now(UTC) - timedelta(minutes=max_age_minutes)
+    if latest_quote_time is not None and _as_utc(latest_quote_time) >= cutoff:
+        return False
+
+    async with open_db(db_path) as db, DataFetcher(db) as fetcher:
+        count = await fetcher.take_snapshot(max_pages=max_pages)
+    console.print(f"[dim]Refreshed {count} quotes from the API.[/dim]")
+    return True
+
+
+async def load_markets_from_db(
+    db_path: Path,
+    *,
+    category: str | None,
+    no_sports: bool,
+    event_prefix: str | None,
+) -> list[MarketQuoteRow]:
+    """Load active markets and their latest quotes from the local database."""
+    from kalshi_research.analysis.categories import SPORTS_CATEGORY, normalize_category
+    from kalshi_research.analysis.scanner import MarketQuoteRow
+    from kalshi_research.cli.db import open_readonly_session
+    from kalshi_research.data.repositories import MarketRepository
+
+    _require_db(db_path)
+
+    async with open_readonly_session(db_path) as session:
+        rows = await MarketRepository(session).get_with_latest_quotes(
+            event_prefix=event_prefix,
+            category=normalize_category(category) if category else None,
+            exclude_category=SPORTS_CATEGORY if no_sports else None,
+        )
+
+    return [
+        MarketQuoteRow(
+            ticker=ticker,
+            event_ticker=event_ticker,
+            title=title,
+            status=status,
+            category=row_category,
+            open_time=_as_utc(open_time),
+            close_time=_as_utc(close_time),
+            yes_bid_cents=yes_bid,
+            yes_ask_cents=yes_ask,
+            volume_24h=volume_24h,
+            quote_time=_as_utc(snapshot_time),
+        )
+        for (
+            ticker,
+            event_ticker,
+            title,
+            status,
+            row_category,
+            open_time,
+            close_time,
+            yes_bid,
+            yes_ask,
+            volume_24h,
+            snapshot_time,
+        ) in rows
+    ]
+
+
+async def scan_opportunities_from_db(
+    *,
+    db_path: Path,
+    refresh_if_older: int | None,
+    profile: ScanProfile,
+    filter_type: str | None,
+    category: str | None,
+    no_sports: bool,
+    event_prefix: str | None,
+    full: bool,
+    top_n: int,
+    min_volume: int,
+    max_spread: int,
+    early_hours: int,
+    max_pages: int | None,
+) -> None:
+    """Scan markets using only the local database (`markets` + `latest_quotes`)."""
+    from kalshi_research.cli.scan._opportunities_helpers import (
+        render_opportunities_table,
+        scan_markets,
+    )
+
+    if refresh_if_older is not None:
+        await refresh_snapshot_if_stale(
+            db_path, max_age_minutes=refresh_if_older, max_pages=max_pages
+        )
+
+    markets = await load_markets_from_db(
+        db_path, category=category, no_sports=no_sports, event_prefix=event_prefix
+    )
+    if not markets:
+        console.print("[yellow]No markets with stored quotes found in the database.[/yellow]")
+        return
+
+    selected = scan_markets(
+        markets,
+        profile=profile,
+        filter_type=filter_type,
+        exchange_status=None,
+        top_n=top_n,
+        min_volume=min_volume,
+        max_spread=max_spread,
+        early_hours=early_hours,
+    )
+    if selected is None:
+        return
+
+    oldest_quote = min(m.quote_time for m in markets if m.quote_time is not None)
+    console.print(f"[dim]Using stored quotes (oldest from {oldest_quote.isoformat()}).[/dim]")
+    results, title = selected
+    render_opportunities_table(
+        results,
+        title,
+        full=full,
+        show_liquidity=False,
+        min_liquidity=None,
+        liquidity_by_ticker={},
+    )
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import asyncio
+from datetime import UTC, datetime, timedelta
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
 
 import typer
 from rich.console import Console
@@ -13,11 +14,12 @@ from rich.table import Table
 from kalshi_research.cli.utils import console
 
 if TYPE_CHECKING:
-    from datetime import datetime
+    from collections.abc import Sequence
 
-    from kalshi_research.analysis.scanner import MarketScanner, ScanResult
+    from kalshi_research.analysis.scanner import MarketScanner, ScannableMarket, ScanResult
     from kalshi_research.api import KalshiPublicClient
-    from kalshi_research.api.models.market import Market
+
+MarketT = TypeVar("MarketT", bound="ScannableMarket")
 
 
 class ScanProfile(str, Enum):
@@ -43,16 +45,16 @@ def scan_profile_defaults(profile: ScanProfile) -> tuple[int, int, int | None]:
 
 
 def filter_markets_by_age(
-    markets: list[Market],
+    markets: Sequence[MarketT],
     *,
     cutoff: datetime,
-) -> tuple[list[Market], int]:
+) -> tuple[list[MarketT], int]:
     """Filter markets by age, returning those created/opened after cutoff.
 
     Returns:
         Tuple of (filtered_markets, missing_created_time_count).
     """
-    filtered_markets: list[Market] = []
+    filtered_markets: list[MarketT] = []
     missing_created_time = 0
 
     for market in markets:
@@ -68,7 +70,7 @@ def filter_markets_by_age(
 
 def select_opportunity_results(
     scanner: MarketScanner,
-    markets: list[Market],
+    markets: Sequence[ScannableMarket],
     *,
     filter_type: str | None,
     top_n: int,
@@ -108,6 +110,51 @@ def select_opportunity_results(
     raise typer.Exit(1)
 
 
+def scan_markets(
+    markets: Sequence[MarketT],
+    *,
+    profile: ScanProfile,
+    filter_type: str | None,
+    exchange_status: dict[str, object] | None,
+    top_n: int,
+    min_volume: int,
+    max_spread: int,
+    early_hours: int,
+) -> tuple[list[ScanResult], str] | None:
+    """Apply the profile's age filter and run the selected scan (None when nothing matched)."""
+    from kalshi_research.analysis.scanner import MarketScanner, MarketStatusVerifier
+
+    if profile is ScanProfile.EARLY:
+        if early_hours <= 0:
+            console.print("[red]Error:[/red] --early-hours must be positive.")
+            raise typer.Exit(1)
+
+        cutoff = datetime.now(UTC) - timedelta(hours=early_hours)
+        markets, missing_created_time = filter_markets_by_age(markets, cutoff=cutoff)
+        if not markets:
+            console.print(f"[yellow]No markets found in the last {early_hours} hours.[/yellow]")
+            return None
+        if missing_created_time:
+            console.print(
+                "[yellow]Warning:[/yellow] Some markets are missing created_time; "
+                "approximating newness with open_time."
+            )
+
+    scanner = MarketScanner(verifier=MarketStatusVerifier(exchange_status=exchange_status))
+    results, title = select_opportunity_results(
+        scanner,
+        markets,
+        filter_type=filter_type,
+        top_n=top_n,
+        min_volume=min_volume,
+        max_spread=max_spread,
+    )
+    if not results:
+        console.print("[yellow]No markets found matching criteria.[/yellow]")
+        return None
+    return results, title
+
+
 def filter_results_by_liquidity(
     results: list[ScanResult],
     liquidity_by_ticker: dict[str, int],
@@ -31,6 +31,9 @@ class MoverRow(TypedDict):
 # Period map for scan_movers: period string -> hours
 _MOVERS_PERIOD_MAP: dict[str, int] = {"1h": 1, "6h": 6, "24h": 24, "7d": 168}
 
+# Price points per period worth reading; longer periods are served from hourly rollups.
+_MOVERS_POINTS_PER_PERIOD = 100
+
 
 def _parse_movers_period(period: str) -> int:
     """Parse period string to hours, raising Exit(1) on invalid input."""
@@ -63,20 +66,20 @@ async def _compute_movers(
     db_path: Path,
     hours_back: int,
     period_label: str,
+    *,
+    replica_max_age_minutes: int | None = None,
 ) -> list[MoverRow]:
-    """Compute price movers from historical snapshots."""
+    """Compute price movers from historical snapshots (or rollups, for long periods)."""
     from datetime import UTC
 
-    from kalshi_research.cli.db import open_db_session
+    from kalshi_research.cli.db import open_readonly_session
     from kalshi_research.data.repositories import PriceRepository
 
-    def _as_utc(dt: datetime) -> datetime:
-        if dt.tzinfo is None:
-            return dt.replace(tzinfo=UTC)
-        return dt.astimezone(UTC)
-
+    granularity = timedelta(hours=hours_back) / _MOVERS_POINTS_PER_PERIOD
     movers: list[MoverRow] = []
-    async with open_db_session(db_path) as session:
+    async with open_readonly_session(
+        db_path, replica_max_age_minutes=replica_max_age_minutes
+    ) as session:
         price_repo = PriceRepository(session)
         cutoff_time = datetime.now(UTC) - timedelta(hours=hours_back)
 
@@ -88,16 +91,14 @@ async def _compute_movers(
             progress.add_task(f"Analyzing price movements ({period_label})...", total=None)
 
             for ticker, market in market_lookup.items():
-                snapshots = await price_repo.get_for_market(ticker, limit=1000)
-                if not snapshots:
-                    continue
-
-                recent_snaps = [s for s in snapshots if _as_utc(s.snapshot_time) >= cutoff_time]
-                if len(recent_snaps) < 2:
+                history = await price_repo.get_history(
+                    ticker, start_time=cutoff_time, granularity=granularity
+                )
+                if len(history) < 2:
                     continue
 
-                oldest = recent_snaps[-1]
-                newest = recent_snaps[0]
+                oldest = history[-1]
+                newest = history[0]
 
                 old_prob = oldest.implied_probability
                 new_prob = newest.implied_probability
@@ -163,11 +164,18 @@ async def _scan_movers_async(
     top_n: int,
     max_pages: int | None,
     full: bool,
+    replica_max_age_minutes: int | None = None,
 ) -> None:
     """Async implementation of scan_movers."""
     hours_back = _parse_movers_period(period)
     market_lookup = await _fetch_movers_market_lookup(max_pages)
-    movers = await _compute_movers(market_lookup, db_path, hours_back, period)
+    movers = await _compute_movers(
+        market_lookup,
+        db_path,
+        hours_back,
+        period,
+        replica_max_age_minutes=replica_max_age_minutes,
+    )
 
     if not movers:
         console.print(f"[yellow]No significant price movements in the last {period}[/yellow]")
@@ -199,6 +207,13 @@ def scan_movers(
         bool,
         typer.Option("--full", "-F", help="Show full titles without truncation."),
     ] = False,
+    replica_max_age: Annotated[
+        int | None,
+        typer.Option(
+            "--replica-max-age",
+            help="Read from a backup copy of the DB, refreshed when older than N minutes.",
+        ),
+    ] = None,
 ) -> None:
     """Show biggest price movers over a time period."""
     if not db_path.exists():
@@ -213,5 +228,6 @@ def scan_movers(
             top_n=top_n,
             max_pages=max_pages,
             full=full,
+            replica_max_age_minutes=replica_max_age,
         )
     )
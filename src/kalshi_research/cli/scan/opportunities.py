@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from pathlib import Path  # noqa: TC003 - Required at runtime for Typer introspection
 from typing import TYPE_CHECKING, Annotated
 
 import typer
@@ -14,11 +14,13 @@ from kalshi_research.cli.scan._opportunities_helpers import (
     filter_markets_by_age,
     filter_results_by_liquidity,
     render_opportunities_table,
+    scan_markets,
     scan_profile_defaults,
     select_opportunity_results,
 )
 from kalshi_research.cli.utils import console, run_async
 from kalshi_research.constants import DEFAULT_PAGINATION_LIMIT
+from kalshi_research.paths import DEFAULT_DB_PATH
 
 if TYPE_CHECKING:
     from kalshi_research.analysis.scanner import ScanResult
@@ -126,9 +128,12 @@ async def _scan_opportunities_async(
     min_liquidity: int | None,
     show_liquidity: bool,
     liquidity_depth: int,
+    from_db: bool = False,
+    db_path: Path = DEFAULT_DB_PATH,
+    refresh_if_older: int | None = None,
+    market_cache_max_age: float | None = None,
 ) -> None:
     """Async implementation of scan_opportunities."""
-    from kalshi_research.analysis.scanner import MarketScanner, MarketStatusVerifier
     from kalshi_research.cli.client_factory import public_client
 
     profile_min_volume, profile_max_spread, profile_min_liquidity = scan_profile_defaults(profile)
@@ -136,9 +141,35 @@ async def _scan_opportunities_async(
     effective_max_spread = max_spread if max_spread is not None else profile_max_spread
     effective_min_liquidity = min_liquidity if min_liquidity is not None else profile_min_liquidity
 
+    if from_db:
+        if show_liquidity or effective_min_liquidity is not None:
+            console.print(
+                "[red]Error:[/red] Liquidity scoring needs live orderbooks; it cannot be used "
+                "with --from-db (use --profile raw/tradeable and omit liquidity options)."
+            )
+            raise typer.Exit(2)
+        from kalshi_research.cli.scan._db_markets import scan_opportunities_from_db
+
+        await scan_opportunities_from_db(
+            db_path=db_path,
+            refresh_if_older=refresh_if_older,
+            profile=profile,
+            filter_type=filter_type,
+            category=category,
+            no_sports=no_sports,
+            event_prefix=event_prefix,
+            full=full,
+            top_n=top_n,
+            min_volume=effective_min_volume,
+            max_spread=effective_max_spread,
+            early_hours=early_hours,
+            max_pages=max_pages,
+        )
+        return
+
     scan_top_n = top_n if effective_min_liquidity is None else min(top_n * 5, 50)
 
-    async with public_client() as client:
+    async with public_client(market_cache_max_age=market_cache_max_age) as client:
         exchange_status = await fetch_exchange_status(client)
 
         with Progress(
@@ -159,40 +190,19 @@ async def _scan_opportunities_async(
                 console.print("[yellow]No markets found matching category filters.[/yellow]")
                 return
 
-            if profile is ScanProfile.EARLY:
-                from datetime import UTC
-
-                if early_hours <= 0:
-                    console.print("[red]Error:[/red] --early-hours must be positive.")
-                    raise typer.Exit(1)
-
-                now = datetime.now(UTC)
-                cutoff = now - timedelta(hours=early_hours)
-                markets, missing_created_time = filter_markets_by_age(markets, cutoff=cutoff)
-                if not markets:
-                    console.print(
-                        f"[yellow]No markets found in the last {early_hours} hours.[/yellow]"
-                    )
-                    return
-                if missing_created_time:
-                    console.print(
-                        "[yellow]Warning:[/yellow] Some markets are missing created_time; "
-                        "approximating newness with open_time."
-                    )
-
-            scanner = MarketScanner(verifier=MarketStatusVerifier(exchange_status=exchange_status))
-            results, title = select_opportunity_results(
-                scanner,
+            selected = scan_markets(
                 markets,
+                profile=profile,
                 filter_type=filter_type,
+                exchange_status=exchange_status,
                 top_n=scan_top_n,
                 min_volume=effective_min_volume,
                 max_spread=effective_max_spread,
+                early_hours=early_hours,
             )
-
-            if not results:
-                console.print("[yellow]No markets found matching criteria.[/yellow]")
+            if selected is None:
                 return
+            results, title = selected
 
             liquidity_by_ticker: dict[str, int] = {}
             if show_liquidity or effective_min_liquidity is not None:
@@ -318,6 +328,36 @@ def scan_opportunities(
         bool,
         typer.Option("--full", "-F", help="Show full tickers/titles without truncation."),
     ] = False,
+    from_db: Annotated[
+        bool,
+        typer.Option(
+            "--from-db",
+            help="Scan stored markets and latest quotes from the local database (no API sweep).",
+        ),
+    ] = False,
+    db_path: Annotated[
+        Path,
+        typer.Option("--db", "-d", help="Path to SQLite database file (with --from-db)."),
+    ] = DEFAULT_DB_PATH,
+    refresh_if_older: Annotated[
+        int | None,
+        typer.Option(
+            "--refresh-if-older",
+            help="With --from-db: take a fresh snapshot first if stored quotes are older than "
+            "this many minutes.",
+        ),
+    ] = None,
+    market_cache_max_age: Annotated[
+        float | None,
+        typer.Option(
+            "--market-cache-max-age",
+            min=0,
+            help=(
+                "Share open-market sweeps with other processes via data/market_cache: reuse a "
+                "sweep younger than this many seconds (0 = always sweep, but publish it)."
+            ),
+        ),
+    ] = None,
 ) -> None:
     """Scan markets for opportunities."""
     run_async(
@@ -336,5 +376,9 @@ def scan_opportunities(
             min_liquidity=min_liquidity,
             show_liquidity=show_liquidity,
             liquidity_depth=liquidity_depth,
+            from_db=from_db,
+            db_path=db_path,
+            refresh_if_older=refresh_if_older,
+            market_cache_max_age=market_cache_max_age,
         )
     )
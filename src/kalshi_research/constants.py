@@ -27,6 +27,84 @@ from __future__ import annotations
 # that balances throughput with memory usage and rate limiting.
 DEFAULT_PAGINATION_LIMIT: int = 200
 
+# Maximum market tickers in a single `GET /markets?tickers=...` batch lookup.
+#
+# Used by:
+# - api/_mixins/markets.py: get_markets_by_tickers() chunking
+#
+# See docs/_vendor-docs/kalshi-api-reference.md ("Up to 100 tickers per request").
+MAX_MARKET_TICKERS_PER_REQUEST: int = 100
+
+# Pages each sharded-snapshot worker may buffer ahead of the database writer.
+#
+# Used by:
+# - data/sharded_collector.py: ShardedSnapshotCollector queue bound
+#
+# Workers block once the queue holds shards * this many pages, which caps parent memory at
+# a few thousand markets per shard when SQLite writes are slower than the API sweep.
+DEFAULT_SHARD_QUEUE_PAGES_PER_WORKER: int = 4
+
+# Price snapshot rows committed per write transaction.
+#
+# Used by:
+# - data/_snapshot_writer.py: write_snapshot() page size
+#
+# Each page is one short SQLite transaction, so other writers wait at most one page for the
+# lock. The price_rollups upsert binds 19 parameters per row, well under SQLite's limit.
+DEFAULT_SNAPSHOT_WRITE_BATCH_SIZE: int = 500
+
+# Validated snapshot pages the fetch producer may buffer ahead of the database writer.
+#
+# Used by:
+# - data/_snapshot_writer.py: write_snapshot() queue bound
+DEFAULT_SNAPSHOT_QUEUE_PAGES: int = 4
+
+# =============================================================================
+# Scheduler
+# =============================================================================
+
+# Upper bounds (seconds) of the run-duration histogram kept for each scheduled task.
+#
+# Used by:
+# - data/_scheduler_stats.py: TaskStats.duration_buckets
+# - cli/data/collect.py: `kalshi data collect --stats`
+#
+# Spans sub-second jobs up to the default 15-minute snapshot interval and beyond; runs slower
+# than the last bound land in an overflow bucket.
+SCHEDULER_DURATION_BUCKETS_SECONDS: tuple[float, ...] = (
+    1.0,
+    5.0,
+    15.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+    600.0,
+    900.0,
+    1800.0,
+)
+
+# =============================================================================
+# Maintenance
+# =============================================================================
+
+# Rows deleted per transaction by `kalshi data prune --apply`.
+#
+# Used by:
+# - data/chunked_prune.py: prune_in_chunks()
+# - cli/data/maintenance.py: `kalshi data prune --chunk-size`
+#
+# Small enough that a concurrent collector waits well under a second for the write lock and
+# the WAL grows by a few MiB per chunk, large enough that per-transaction overhead is noise.
+DEFAULT_PRUNE_CHUNK_ROWS: int = 5_000
+
+# Pause between prune chunks, leaving the write lock free for other writers.
+#
+# Used by:
+# - data/chunked_prune.py: prune_in_chunks()
+# - cli/data/maintenance.py: `kalshi data prune --pause`
+DEFAULT_PRUNE_PAUSE_SECONDS: float = 0.05
+
 # =============================================================================
 # Orderbook
 # =============================================================================
@@ -155,6 +233,33 @@ DEFAULT_AGENT_MAX_EXA_USD: float = 0.25
 # Set conservatively low; typical single-market synthesis is well under this.
 DEFAULT_AGENT_MAX_LLM_USD: float = 0.25
 
+# Research plan steps the research agent runs at once.
+#
+# Used by:
+# - agent/research_agent/_agent.py: ResearchAgent default max_concurrency
+#
+# Plans have at most five steps; four lets the news searches and the answer call overlap while
+# a deep research task polls, without bursting past Exa's per-key request rate.
+DEFAULT_AGENT_RESEARCH_CONCURRENCY: int = 4
+
+# Aggregate spend limits for one `kalshi agent batch` run.
+#
+# Used by:
+# - agent/batch.py: BatchAgentRunner default budgets
+# - cli/_agent_batch.py: --max-exa-usd / --max-llm-usd option defaults
+#
+# Each event's research is still capped by DEFAULT_AGENT_MAX_EXA_USD and each market's synthesis
+# by DEFAULT_AGENT_MAX_LLM_USD; these bound the whole batch (e.g. a nightly watchlist refresh).
+DEFAULT_AGENT_BATCH_MAX_EXA_USD: float = 20.0
+DEFAULT_AGENT_BATCH_MAX_LLM_USD: float = 20.0
+
+# Research runs and LLM syntheses a batch agent run keeps in flight at once.
+#
+# Used by:
+# - agent/batch.py: BatchAgentRunner default concurrency
+# - cli/_agent_batch.py: --concurrency option default
+DEFAULT_AGENT_BATCH_CONCURRENCY: int = 8
+
 # =============================================================================
 # Exa API Cost Estimates (Vendor Pricing)
 # =============================================================================
@@ -199,6 +304,7 @@ EXA_DEEP_SEARCH_COST_LARGE_USD: float = 0.075
 #
 # Used by:
 # - exa/policy.py: estimate_search_cost_usd(), estimate_find_similar_cost_usd()
+# - exa/policy.py: estimate_contents_cost_usd()
 #
 # Each result with full text adds $0.001; highlights adds $0.001.
 EXA_PER_RESULT_TEXT_COST_USD: float = 0.001
@@ -218,7 +324,141 @@ EXA_ANSWER_WITHOUT_TEXT_COST_USD: float = 0.03
 #
 # Used by:
 # - exa/policy.py: estimate_search_cost_usd(), estimate_find_similar_cost_usd()
+# - exa/policy.py: estimate_contents_cost_usd()
 #
 # Multiplier applied to estimates to account for minor pricing drift or
 # unexpected backend choices (e.g., "auto" type choosing deep search).
 EXA_COST_ESTIMATE_SAFETY_FACTOR: float = 1.2
+
+# =============================================================================
+# Exa Response Cache
+# =============================================================================
+
+# Upper bound on the compressed payload bytes kept in the Exa response cache.
+#
+# Used by:
+# - exa/cache.py: ExaCache (default max_bytes)
+#
+# Least recently used entries are evicted once stored payloads exceed this. Compressed search
+# responses with full text are typically 5-30 KiB, so 256 MiB holds tens of thousands of them.
+DEFAULT_EXA_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+
+# =============================================================================
+# News Collection
+# =============================================================================
+
+# Exa news queries in flight at once during `kalshi news collect`.
+#
+# Used by:
+# - news/collector.py: NewsCollector.collect_all()
+# - cli/news.py: `kalshi news collect --concurrency`
+#
+# Exa allows several requests per second per key; four keeps a large watchlist moving without
+# tripping 429s, and each in-flight query holds its estimated cost against the budget.
+DEFAULT_NEWS_COLLECT_CONCURRENCY: int = 4
+
+# URLs per `/contents` request in two-phase news collection.
+#
+# Used by:
+# - news/collector.py: NewsCollector (two_phase=True)
+#
+# Matches the default search page size, so one query's unseen results usually need one request.
+NEWS_CONTENTS_BATCH_SIZE: int = 25
+
+# Texts per process-pool task in `SentimentAnalyzer.analyze_many(..., workers=N)`.
+#
+# Used by:
+# - news/sentiment.py: SentimentAnalyzer.analyze_many()
+#
+# Large enough that pickling the analyzer and results is a small fraction of the work per task.
+SENTIMENT_BATCH_CHUNK_SIZE: int = 500
+
+# `news_sentiments.method` written by the keyword analyzer and read by sentiment aggregation.
+#
+# Used by:
+# - news/sentiment.py: SentimentAnalyzer
+# - news/aggregator.py: SentimentAggregator
+# - cli/news.py: `kalshi news collect --sentiment-method`, `kalshi news sentiment --method`
+#
+# Re-scoring under a new name (e.g. "keyword-v2") keeps the old scores until it is selected;
+# collect with `--sentiment-method` set to the same name to keep scoring new articles under it.
+DEFAULT_SENTIMENT_METHOD: str = "keyword"
+
+# Articles read, scored and upserted per transaction by `kalshi news rescore`.
+#
+# Used by:
+# - news/rescore.py: rescore_sentiment()
+# - cli/news.py: `kalshi news rescore --chunk-size`
+#
+# Bounds memory to one page of full article texts; each page is also a resume point.
+DEFAULT_RESCORE_CHUNK_ROWS: int = 1000
+
+# =============================================================================
+# Data Export
+# =============================================================================
+
+# Minimum number of Parquet files in a snapshot month partition before it is compacted.
+#
+# Used by:
+# - data/export.py: compact_parquet_partitions(), export_to_parquet()
+# - cli/data/export_cmd.py: --compact-min-files option default
+#
+# Incremental exports add one part file per affected partition per run; 24 files is
+# one day of hourly exports.
+DEFAULT_EXPORT_COMPACT_MIN_FILES: int = 24
+
+# =============================================================================
+# Alert Delivery
+# =============================================================================
+
+# Maximum number of triggered alerts waiting for delivery.
+#
+# Used by:
+# - alerts/dispatcher.py: AlertDispatcher queue bound
+#
+# When the queue is full, `AlertDispatcher.submit()` waits (backpressure) and the
+# wait time is reported in `DeliveryStats.enqueue_wait_seconds`.
+DEFAULT_ALERT_QUEUE_SIZE: int = 1000
+
+# Maximum number of alerts handed to notifiers in one delivery batch.
+#
+# Used by:
+# - alerts/dispatcher.py: AlertDispatcher worker batching
+DEFAULT_ALERT_BATCH_SIZE: int = 100
+
+# How long the delivery worker waits for more alerts before sending a partial batch.
+#
+# Used by:
+# - alerts/dispatcher.py: AlertDispatcher worker batching
+DEFAULT_ALERT_BATCH_WINDOW_SECONDS: float = 0.25
+
+# Maximum alerts coalesced into a single webhook POST.
+#
+# Used by:
+# - alerts/notifiers.py: WebhookNotifier.notify_many()
+#
+# Slack caps message attachments at 100; smaller payloads keep chat messages readable.
+DEFAULT_WEBHOOK_ALERTS_PER_REQUEST: int = 20
+
+# Retry policy for webhook deliveries (transport errors, 429 and 5xx responses).
+#
+# Used by:
+# - alerts/notifiers.py: WebhookNotifier.notify_many()
+#
+# Delay before retry N is WEBHOOK_RETRY_BACKOFF_SECONDS * 2**N (or Retry-After when sent).
+# A server's Retry-After is capped at WEBHOOK_MAX_RETRY_AFTER_SECONDS so one endpoint cannot stall
+# alert delivery indefinitely.
+DEFAULT_WEBHOOK_MAX_RETRIES: int = 3
+WEBHOOK_RETRY_BACKOFF_SECONDS: float = 0.5
+WEBHOOK_MAX_RETRY_AFTER_SECONDS: float = 60.0
+
+# Fall back to a full open-market sweep when more alert conditions than this are active.
+#
+# Used by:
+# - cli/alerts/monitor.py: `kalshi alerts monitor --full-sweep-threshold`
+#
+# Below the threshold the monitor fetches only the referenced tickers, costing one request per
+# MAX_MARKET_TICKERS_PER_REQUEST tickers. A full sweep costs one request per 1000 open markets
+# regardless of how many conditions exist, so it only wins once conditions cover a large share
+# of the open-market universe.
+DEFAULT_ALERT_FULL_SWEEP_THRESHOLD: int = 500
@@ -1,11 +1,13 @@
 """Data layer for persistent storage of Kalshi market data."""
 
-from kalshi_research.data.database import DatabaseManager
+from kalshi_research.data.database import SQLITE_PROFILES, DatabaseManager, SQLiteProfile
 from kalshi_research.data.fetcher import DataFetcher
 from kalshi_research.data.models import (
     Base,
     Event,
+    LatestQuote,
     Market,
+    PriceRollup,
     PriceSnapshot,
     Settlement,
 )
@@ -13,21 +15,30 @@ from kalshi_research.data.repositories import (
     EventRepository,
     MarketRepository,
     PriceRepository,
+    PriceRollupRepository,
     SettlementRepository,
 )
-from kalshi_research.data.scheduler import DataScheduler
+from kalshi_research.data.scheduler import DataScheduler, TaskStats
+from kalshi_research.data.sharded_collector import ShardedSnapshotCollector
 
 __all__ = [
+    "SQLITE_PROFILES",
     "Base",
     "DataFetcher",
     "DataScheduler",
     "DatabaseManager",
     "Event",
     "EventRepository",
+    "LatestQuote",
     "Market",
     "MarketRepository",
     "PriceRepository",
+    "PriceRollup",
+    "PriceRollupRepository",
     "PriceSnapshot",
+    "SQLiteProfile",
     "Settlement",
     "SettlementRepository",
+    "ShardedSnapshotCollector",
+    "TaskStats",
 ]
@@ -0,0 +1,137 @@
+"""Per-task run statistics for `DataScheduler` (durations, overruns, missed runs, lag)."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any, Literal
+
+from kalshi_research.constants import SCHEDULER_DURATION_BUCKETS_SECONDS
+
+RunOutcome = Literal["ok", "failed", "timeout"]
+
+
+@dataclass
+class TaskStats:
+    """
+    Running statistics for one scheduled task.
+
+    Durations are kept as a (non-cumulative) histogram: `duration_buckets[i]` counts runs that took
+    at most `SCHEDULER_DURATION_BUCKETS_SECONDS[i]` (and more than the previous bound); the final
+    bucket counts runs slower than every bound.
+    """
+
+    name: str
+    interval_seconds: float
+    jitter_seconds: float = 0.0
+    deadline_seconds: float | None = None
+
+    runs: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    # Runs that took longer than the interval, i.e. ran into the next scheduled slot.
+    overruns: int = 0
+    # Scheduled slots skipped because the previous run was still in progress.
+    missed_runs: int = 0
+
+    last_outcome: RunOutcome | None = None
+    last_started_at: datetime | None = None
+    next_run_at: datetime | None = None
+    last_duration_seconds: float = 0.0
+    max_duration_seconds: float = 0.0
+    total_duration_seconds: float = 0.0
+    # How late a run started relative to its planned start (schedule + jitter).
+    last_lag_seconds: float = 0.0
+    max_lag_seconds: float = 0.0
+    duration_buckets: list[int] = field(
+        default_factory=lambda: [0] * (len(SCHEDULER_DURATION_BUCKETS_SECONDS) + 1)
+    )
+
+    @property
+    def mean_duration_seconds(self) -> float:
+        """Average run duration (0 before the first run)."""
+        return self.total_duration_seconds / self.runs if self.runs else 0.0
+
+    def duration_quantile(self, q: float) -> float | None:
+        """
+        Upper bound of the histogram bucket containing quantile `q` (e.g. 0.95).
+
+        Returns None before the first run, and `max_duration_seconds` when the quantile falls
+        in the overflow bucket.
+        """
+        if not 0 < q <= 1:
+            raise ValueError("q must be in (0, 1]")
+        if not self.runs:
+            return None
+        target = q * self.runs
+        seen = 0
+        for bound, count in zip(
+            SCHEDULER_DURATION_BUCKETS_SECONDS, self.duration_buckets, strict=False
+        ):
+            seen += count
+            if seen >= target:
+                return bound
+        return self.max_duration_seconds
+
+    def record_run(
+        self,
+        *,
+        started_at: datetime,
+        duration_seconds: float,
+        lag_seconds: float,
+        outcome: RunOutcome,
+        missed_runs: int,
+    ) -> None:
+        """Fold one completed run into the statistics."""
+        self.runs += 1
+        if outcome == "failed":
+            self.failures += 1
+        elif outcome == "timeout":
+            self.timeouts += 1
+        if duration_seconds > self.interval_seconds:
+            self.overruns += 1
+        self.missed_runs += missed_runs
+
+        self.last_outcome = outcome
+        self.last_started_at = started_at
+        self.last_duration_seconds = duration_seconds
+        self.max_duration_seconds = max(self.max_duration_seconds, duration_seconds)
+        self.total_duration_seconds += duration_seconds
+        self.last_lag_seconds = lag_seconds
+        self.max_lag_seconds = max(self.max_lag_seconds, lag_seconds)
+
+        bucket = len(SCHEDULER_DURATION_BUCKETS_SECONDS)
+        for i, bound in enumerate(SCHEDULER_DURATION_BUCKETS_SECONDS):
+            if duration_seconds <= bound:
+                bucket = i
+                break
+        self.duration_buckets[bucket] += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable view (used for the collector status file)."""
+
+        def _iso(value: datetime | None) -> str | None:
+            return value.astimezone(UTC).isoformat() if value is not None else None
+
+        bounds = [f"le_{b:g}" for b in SCHEDULER_DURATION_BUCKETS_SECONDS] + ["inf"]
+        return {
+            "name": self.name,
+            "interval_seconds": self.interval_seconds,
+            "jitter_seconds": self.jitter_seconds,
+            "deadline_seconds": self.deadline_seconds,
+            "runs": self.runs,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "overruns": self.overruns,
+            "missed_runs": self.missed_runs,
+            "last_outcome": self.last_outcome,
+            "last_started_at": _iso(self.last_started_at),
+            "next_run_at": _iso(self.next_run_at),
+            "last_duration_seconds": round(self.last_duration_seconds, 3),
+            "mean_duration_seconds": round(self.mean_duration_seconds, 3),
+            "p95_duration_seconds": self.duration_quantile(0.95),
+            "max_duration_seconds": round(self.max_duration_seconds, 3),
+            "last_lag_seconds": round(self.last_lag_seconds, 3),
+            "max_lag_seconds": round(self.max_lag_seconds, 3),
+            "duration_histogram": dict(zip(bounds, self.duration_buckets, strict=True)),
+        }
@@ -0,0 +1,286 @@
+"""Pipelined price-snapshot writer used by `DataFetcher.take_snapshot_from()`.
+
+A producer task consumes the market source (an API sweep or the sharded collector) and converts
+each page into ORM rows; the writer commits one short transaction per page. The two are joined
+by a bounded queue, so a slow network never holds the SQLite write lock and a slow disk applies
+backpressure to the sweep instead of buffering the whole universe in memory.
+
+Each run is recorded in `snapshot_batches`: the batch row is committed as "running" before the
+first page and marked "complete" (or "failed") after the last, so readers can tell a complete
+point-in-time snapshot from one that is still being written or was aborted. Every snapshot row
+carries its `batch_id`, so "as of the latest complete batch" is an indexed join rather than a
+`MAX(snapshot_time)` scan.
+
+A batch is stamped with the time its sweep started (`MarketSweep.swept_at`), not the time it
+is written. A sweep served from the shared market cache therefore keeps its original time, and
+a cached sweep that already has a batch is not written again (its quotes would otherwise be
+recorded, and rolled up, a second time as if they were current).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+import structlog
+from sqlalchemy.exc import IntegrityError
+
+from kalshi_research.constants import (
+    DEFAULT_SNAPSHOT_QUEUE_PAGES,
+    DEFAULT_SNAPSHOT_WRITE_BATCH_SIZE,
+)
+from kalshi_research.data._converters import api_market_to_db, api_market_to_snapshot
+from kalshi_research.data.models import Event as DBEvent
+from kalshi_research.data.repositories import (
+    EventRepository,
+    MarketRepository,
+    PriceRepository,
+    PriceRollupRepository,
+    SnapshotBatchRepository,
+)
+from kalshi_research.data.repositories.snapshot_batches import BATCH_COMPLETE, BATCH_FAILED
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
+    from kalshi_research.api import Market, MarketSweep
+    from kalshi_research.data.database import DatabaseManager
+    from kalshi_research.data.models import Market as DBMarket
+    from kalshi_research.data.models import PriceSnapshot
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class _SnapshotPage:
+    """Validated rows for one write transaction."""
+
+    events: dict[str, DBEvent] = field(default_factory=dict)
+    markets: list[DBMarket] = field(default_factory=list)
+    snapshots: list[PriceSnapshot] = field(default_factory=list)
+
+
+@dataclass
+class _Progress:
+    skipped_missing_quotes: int = 0
+
+
+# Queue items: a page to write, the producer's exception, or None when the source is exhausted.
+_QueueItem = _SnapshotPage | BaseException | None
+
+
+async def _produce_pages(
+    markets: AsyncIterable[Market],
+    snapshot_time: datetime,
+    batch_id: int,
+    out: asyncio.Queue[_QueueItem],
+    progress: _Progress,
+    batch_size: int,
+) -> None:
+    page = _SnapshotPage()
+    try:
+        async for api_market in markets:
+            try:
+                snapshot = api_market_to_snapshot(api_market, snapshot_time)
+            except ValueError as exc:
+                progress.skipped_missing_quotes += 1
+                logger.warning(
+                    "Skipping market snapshot due to invalid/missing dollar quotes",
+                    ticker=api_market.ticker,
+                    error=str(exc),
+                )
+                continue
+            snapshot.batch_id = batch_id
+
+            # Placeholder event + market rows keep the FKs satisfied without racing other writers.
+            page.events.setdefault(
+                api_market.event_ticker,
+                DBEvent(
+                    ticker=api_market.event_ticker,
+                    series_ticker=api_market.series_ticker or api_market.event_ticker,
+                    title=api_market.event_ticker,  # Placeholder
+                    mutually_exclusive=False,
+                ),
+            )
+            page.markets.append(api_market_to_db(api_market))
+            page.snapshots.append(snapshot)
+            if len(page.snapshots) >= batch_size:
+                await out.put(page)
+                page = _SnapshotPage()
+        if page.snapshots:
+            await out.put(page)
+    except Exception as exc:
+        await out.put(exc)
+        return
+    await out.put(None)
+
+
+async def _resume_source(
+    head: list[Market], rest: AsyncIterator[Market], error: Exception | None
+) -> AsyncIterator[Market]:
+    """Replay the market read ahead of the batch (or its error), then the rest of the source."""
+    if error is not None:
+        raise error
+    for market in head:
+        yield market
+    async for market in rest:
+        yield market
+
+
+async def _start_batch(
+    db: DatabaseManager, snapshot_time: datetime, *, status_filter: str | None, dedupe: bool
+) -> int | None:
+    """Record a running batch; None if `dedupe` and the sweep already has one."""
+    try:
+        async with db.session_factory() as session, session.begin():
+            repo = SnapshotBatchRepository(session)
+            if dedupe and await repo.get_by_snapshot_time(snapshot_time) is not None:
+                return None
+            batch = await repo.start(snapshot_time, status_filter=status_filter)
+            return batch.id
+    except IntegrityError:
+        # Another process started a batch for the same cached sweep first.
+        if not dedupe:
+            raise
+        return None
+
+
+async def _write_page(db: DatabaseManager, page: _SnapshotPage) -> None:
+    async with db.session_factory() as session, session.begin():
+        event_repo = EventRepository(session)
+        market_repo = MarketRepository(session)
+        price_repo = PriceRepository(session)
+        for event in page.events.values():
+            await event_repo.insert_ignore(event)
+        for market in page.markets:
+            await market_repo.insert_ignore(market)
+        for snapshot in page.snapshots:
+            await price_repo.add(snapshot, flush=False)
+        await session.flush()
+        # Same transaction as the page's snapshots, so latest_quotes and the hourly/daily
+        # rollups never run ahead.
+        await price_repo.upsert_latest_quotes(page.snapshots)
+        await PriceRollupRepository(session).upsert_snapshots(page.snapshots)
+
+
+async def _finish_batch(
+    db: DatabaseManager,
+    batch_id: int,
+    *,
+    status: str,
+    count: int,
+    progress: _Progress,
+    truncated: bool = False,
+) -> None:
+    async with db.session_factory() as session, session.begin():
+        await SnapshotBatchRepository(session).finish(
+            batch_id,
+            status=status,
+            market_count=count,
+            skipped_count=progress.skipped_missing_quotes,
+            truncated=truncated,
+        )
+
+
+async def write_snapshot(
+    db: DatabaseManager,
+    markets: AsyncIterable[Market],
+    *,
+    batch_size: int = DEFAULT_SNAPSHOT_WRITE_BATCH_SIZE,
+    queue_pages: int = DEFAULT_SNAPSHOT_QUEUE_PAGES,
+    status_filter: str | None = None,
+    sweep: MarketSweep | None = None,
+) -> int:
+    """
+    Snapshot `markets` as one batch, committing page-sized transactions as pages arrive.
+
+    Args:
+        db: Database to write to.
+        markets: API markets to snapshot (each ticker should appear once).
+        batch_size: Snapshot rows per write transaction.
+        queue_pages: Validated pages the producer may buffer ahead of the writer.
+        status_filter: Market status the sweep was restricted to (recorded on the batch).
+        sweep: Sweep metadata filled in by the source; a truncated sweep marks the batch
+            `truncated` once the source is exhausted, and `swept_at` stamps the batch.
+
+    Returns:
+        Number of snapshots written (0 if the sweep was already recorded).
+
+    Raises:
+        Whatever the market source raised; the batch is then marked "failed".
+    """
+    # Read ahead one market: the source sets `sweep.swept_at` when it starts producing.
+    source = aiter(markets)
+    head: list[Market] = []
+    source_error: Exception | None = None
+    try:
+        head.append(await anext(source))
+    except StopAsyncIteration:
+        pass
+    except Exception as exc:
+        source_error = exc
+
+    swept_at = sweep.swept_at if sweep is not None else None
+    snapshot_time = swept_at or datetime.now(UTC)
+    logger.info("Taking price snapshot", snapshot_time=snapshot_time.isoformat())
+    batch_id = await _start_batch(
+        db, snapshot_time, status_filter=status_filter, dedupe=swept_at is not None
+    )
+    if batch_id is None:
+        logger.info(
+            "Sweep already recorded as a snapshot batch; skipping",
+            snapshot_time=snapshot_time.isoformat(),
+            from_cache=sweep.from_cache if sweep is not None else False,
+        )
+        return 0
+
+    pages: asyncio.Queue[_QueueItem] = asyncio.Queue(maxsize=queue_pages)
+    progress = _Progress()
+    producer = asyncio.create_task(
+        _produce_pages(
+            _resume_source(head, source, source_error),
+            snapshot_time,
+            batch_id,
+            pages,
+            progress,
+            batch_size,
+        )
+    )
+    count = 0
+    try:
+        while (item := await pages.get()) is not None:
+            if isinstance(item, BaseException):
+                raise item
+            await _write_page(db, item)
+            count += len(item.snapshots)
+            logger.debug("Took snapshots so far", count=count)
+        await producer
+    except BaseException:
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+        try:
+            await _finish_batch(db, batch_id, status=BATCH_FAILED, count=count, progress=progress)
+        except Exception:
+            logger.exception("Failed to mark snapshot batch as failed", batch_id=batch_id)
+        logger.warning("Price snapshot aborted", batch_id=batch_id, written=count)
+        raise
+
+    truncated = sweep.truncated if sweep is not None else False
+    await _finish_batch(
+        db,
+        batch_id,
+        status=BATCH_COMPLETE,
+        count=count,
+        progress=progress,
+        truncated=truncated,
+    )
+    logger.info(
+        "Took price snapshots",
+        count=count,
+        skipped_missing_quotes=progress.skipped_missing_quotes,
+        batch_id=batch_id,
+        truncated=truncated,
+    )
+    return count
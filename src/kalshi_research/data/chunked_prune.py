@@ -0,0 +1,386 @@
+"""Chunked, resumable pruning used by `kalshi data prune --apply`.
+
+`apply_prune()` deletes everything in one transaction, which on a database with tens of
+millions of snapshots holds the SQLite write lock for minutes and grows the WAL by everything
+it deletes. `prune_in_chunks()` deletes at most `chunk_rows` rows per transaction and pauses
+between chunks, so a running collector waits for at most one chunk.
+
+Deletes are driven by the cutoff predicates (through their indexes), so re-running a chunk is
+harmless. Progress is checkpointed to a small JSON file after every chunk; an interrupted run
+resumes with the same cutoffs and carries its earlier counts forward.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+import uuid
+from dataclasses import asdict, dataclass, field, fields
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any, cast
+
+import structlog
+from sqlalchemy import Integer, delete, func, literal_column, select
+
+from kalshi_research.constants import DEFAULT_PRUNE_CHUNK_ROWS, DEFAULT_PRUNE_PAUSE_SECONDS
+from kalshi_research.data.maintenance import PruneCounts
+from kalshi_research.data.models import (
+    NewsArticle,
+    NewsArticleEvent,
+    NewsArticleMarket,
+    NewsSentiment,
+    PriceRollup,
+    PriceSnapshot,
+    SnapshotBatch,
+)
+from kalshi_research.data.repositories.rollups import HOURLY, PriceRollupRepository
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from sqlalchemy import CursorResult, Delete
+
+    from kalshi_research.data.database import DatabaseManager
+
+logger = structlog.get_logger()
+
+# Stages run in FK-safe order; rollups are backfilled before the snapshots they summarize go.
+STAGES = ("rollup_backfill", "price_snapshots", "snapshot_batches", "hourly_rollups", "news")
+
+# SQLite's `auto_vacuum` value for INCREMENTAL mode.
+_AUTO_VACUUM_INCREMENTAL = 2
+
+
+@dataclass(frozen=True)
+class PruneProgress:
+    """Progress of one prune stage, reported after every chunk."""
+
+    stage: str
+    deleted: int
+    elapsed_seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        """Deletion throughput of this run so far."""
+        return self.deleted / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+@dataclass(frozen=True)
+class ChunkedPruneResult:
+    """Outcome of `prune_in_chunks()`."""
+
+    counts: PruneCounts
+    elapsed_seconds: float
+    chunks: int
+    resumed: bool
+    # False when incremental vacuum was requested but the database is not in INCREMENTAL mode.
+    incremental_vacuum: bool
+
+    @property
+    def rows_per_second(self) -> float:
+        """Overall deletion throughput (rows removed in this run and any resumed run)."""
+        return self.counts.total_rows / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+@dataclass
+class PruneCheckpoint:
+    """Cutoffs and progress of a prune run, persisted between chunks."""
+
+    snapshots_before: datetime | None
+    news_before: datetime | None
+    hourly_rollups_before: datetime | None
+    completed_stages: list[str] = field(default_factory=list)
+    backfilled_until: datetime | None = None
+    counts: dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path) -> PruneCheckpoint:
+        """Read a checkpoint written by `save()`."""
+        raw: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+        for name in (
+            "snapshots_before",
+            "news_before",
+            "hourly_rollups_before",
+            "backfilled_until",
+        ):
+            raw[name] = datetime.fromisoformat(raw[name]) if raw.get(name) else None
+        return cls(**raw)
+
+    def save(self, path: Path) -> None:
+        """Atomically write the checkpoint as JSON."""
+        payload = {
+            key: value.isoformat() if isinstance(value, datetime) else value
+            for key, value in asdict(self).items()
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.tmp.{uuid.uuid4().hex}")
+        try:
+            tmp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            tmp_path.replace(path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+
+class _ChunkedPruner:
+    def __init__(
+        self,
+        db: DatabaseManager,
+        checkpoint: PruneCheckpoint,
+        *,
+        chunk_rows: int,
+        pause_seconds: float,
+        state_path: Path | None,
+        on_progress: Callable[[PruneProgress], None] | None,
+    ) -> None:
+        self._db = db
+        self._checkpoint = checkpoint
+        self._chunk_rows = chunk_rows
+        self._pause_seconds = pause_seconds
+        self._state_path = state_path
+        self._on_progress = on_progress
+        self._vacuum = False
+        self._started = time.monotonic()
+        self.chunks = 0
+
+    async def run(self, *, incremental_vacuum: bool) -> bool:
+        """Run every remaining stage. Returns whether incremental vacuum was applied."""
+        if incremental_vacuum:
+            async with self._db.engine.connect() as conn:
+                mode = (await conn.exec_driver_sql("PRAGMA auto_vacuum")).scalar()
+            self._vacuum = mode == _AUTO_VACUUM_INCREMENTAL
+            if not self._vacuum:
+                logger.warning("auto_vacuum is not INCREMENTAL; skipping incremental vacuum")
+
+        cp = self._checkpoint
+        stages = {
+            "rollup_backfill": self._backfill_rollups,
+            "price_snapshots": self._prune_snapshots,
+            "snapshot_batches": self._prune_batches,
+            "hourly_rollups": self._prune_hourly_rollups,
+            "news": self._prune_news,
+        }
+        for stage in STAGES:
+            if stage not in cp.completed_stages:
+                await stages[stage]()
+                cp.completed_stages.append(stage)
+                self._save()
+        return self._vacuum
+
+    async def _backfill_rollups(self) -> None:
+        cutoff = self._checkpoint.snapshots_before
+        if cutoff is None:
+            return
+        start = self._checkpoint.backfilled_until
+        if start is None:
+            async with self._db.session_factory() as session:
+                oldest = (
+                    await session.execute(
+                        select(func.min(PriceSnapshot.snapshot_time)).where(
+                            PriceSnapshot.snapshot_time < cutoff
+                        )
+                    )
+                ).scalar_one_or_none()
+            if oldest is None:
+                return
+            start = _as_utc(oldest).replace(hour=0, minute=0, second=0, microsecond=0)
+        # One day per transaction: day windows never split an hourly or daily bucket. The last
+        # window covers the whole day holding the cutoff, including snapshots that are kept:
+        # buckets it writes are never completed later (backfill skips existing buckets).
+        while start < cutoff:
+            end = start + timedelta(days=1)
+            async with self._db.session_factory() as session, session.begin():
+                await PriceRollupRepository(session).backfill(after=start, before=end)
+            self._checkpoint.backfilled_until = start = end
+            await self._after_chunk("rollup_backfill", 0)
+
+    async def _prune_snapshots(self) -> None:
+        cutoff = self._checkpoint.snapshots_before
+        if cutoff is None:
+            return
+        # Batch rows share their batch's snapshot_time, so this drops whole batches (and legacy
+        # rows written outside one) while walking idx_snapshots_time.
+        chunk = (
+            select(PriceSnapshot.id)
+            .where(PriceSnapshot.snapshot_time < cutoff)
+            .order_by(PriceSnapshot.snapshot_time)
+            .limit(self._chunk_rows)
+        )
+        await self._drain(
+            "price_snapshots", delete(PriceSnapshot).where(PriceSnapshot.id.in_(chunk))
+        )
+
+    async def _prune_batches(self) -> None:
+        cutoff = self._checkpoint.snapshots_before
+        if cutoff is None:
+            return
+        chunk = (
+            select(SnapshotBatch.id)
+            .where(SnapshotBatch.snapshot_time < cutoff)
+            .limit(self._chunk_rows)
+        )
+        await self._drain(
+            "snapshot_batches", delete(SnapshotBatch).where(SnapshotBatch.id.in_(chunk))
+        )
+
+    async def _prune_hourly_rollups(self) -> None:
+        cutoff = self._checkpoint.hourly_rollups_before
+        if cutoff is None:
+            return
+        rowid = literal_column("rowid", Integer)
+        chunk = (
+            select(rowid)
+            .select_from(PriceRollup)
+            .where(PriceRollup.resolution == HOURLY, PriceRollup.bucket_start < cutoff)
+            .limit(self._chunk_rows)
+        )
+        await self._drain("hourly_rollups", delete(PriceRollup).where(rowid.in_(chunk)))
+
+    async def _prune_news(self) -> None:
+        cutoff = self._checkpoint.news_before
+        if cutoff is None:
+            return
+        counts = self._checkpoint.counts
+        chunk = (
+            select(NewsArticle.id)
+            .where(NewsArticle.collected_at < cutoff)
+            .order_by(NewsArticle.id)
+            .limit(self._chunk_rows)
+        )
+        dependents = (
+            ("news_sentiments", delete(NewsSentiment).where(NewsSentiment.article_id.in_(chunk))),
+            (
+                "news_article_markets",
+                delete(NewsArticleMarket).where(NewsArticleMarket.article_id.in_(chunk)),
+            ),
+            (
+                "news_article_events",
+                delete(NewsArticleEvent).where(NewsArticleEvent.article_id.in_(chunk)),
+            ),
+        )
+        while True:
+            # The chunk subquery selects the same articles until they are deleted last.
+            async with self._db.session_factory() as session, session.begin():
+                for key, stmt in dependents:
+                    result = cast("CursorResult[Any]", await session.execute(stmt))
+                    counts[key] = counts.get(key, 0) + result.rowcount
+                result = cast(
+                    "CursorResult[Any]",
+                    await session.execute(delete(NewsArticle).where(NewsArticle.id.in_(chunk))),
+                )
+            counts["news_articles"] = counts.get("news_articles", 0) + result.rowcount
+            await self._after_chunk("news", counts["news_articles"])
+            if result.rowcount < self._chunk_rows:
+                return
+
+    async def _drain(self, key: str, stmt: Delete) -> None:
+        """Run a chunked DELETE until it removes fewer rows than a full chunk."""
+        counts = self._checkpoint.counts
+        while True:
+            async with self._db.session_factory() as session, session.begin():
+                result = cast("CursorResult[Any]", await session.execute(stmt))
+            counts[key] = counts.get(key, 0) + result.rowcount
+            await self._after_chunk(key, counts[key])
+            if result.rowcount < self._chunk_rows:
+                return
+
+    async def _after_chunk(self, stage: str, deleted: int) -> None:
+        self.chunks += 1
+        if self._vacuum:
+            async with self._db.engine.connect() as conn:
+                # A single statement step frees one page; executescript() runs the pragma to
+                # completion and drains the whole freelist.
+                driver = (await conn.get_raw_connection()).driver_connection
+                if driver is not None:
+                    await driver.executescript("PRAGMA incremental_vacuum")
+        self._save()
+        if self._on_progress is not None:
+            self._on_progress(PruneProgress(stage, deleted, time.monotonic() - self._started))
+        # Leave the write lock free for the collector between chunks.
+        await asyncio.sleep(self._pause_seconds)
+
+    def _save(self) -> None:
+        if self._state_path is not None:
+            self._checkpoint.save(self._state_path)
+
+
+async def prune_in_chunks(
+    db: DatabaseManager,
+    *,
+    snapshots_before: datetime | None,
+    news_before: datetime | None,
+    hourly_rollups_before: datetime | None = None,
+    chunk_rows: int = DEFAULT_PRUNE_CHUNK_ROWS,
+    pause_seconds: float = DEFAULT_PRUNE_PAUSE_SECONDS,
+    state_path: Path | None = None,
+    resume: bool = False,
+    incremental_vacuum: bool = False,
+    on_progress: Callable[[PruneProgress], None] | None = None,
+) -> ChunkedPruneResult:
+    """
+    Prune like `apply_prune()`, but in short transactions that other writers can interleave.
+
+    Args:
+        db: Database to prune.
+        snapshots_before: Delete price snapshots (and their batches) older than this.
+        news_before: Delete news articles (and their links/sentiments) collected before this.
+        hourly_rollups_before: Delete hourly rollups whose bucket starts before this.
+        chunk_rows: Maximum rows deleted per transaction (articles, for the news stage).
+        pause_seconds: Sleep between chunks.
+        state_path: Checkpoint file, rewritten after every chunk and removed on success.
+        resume: Continue the run recorded in `state_path`; its cutoffs replace the ones given.
+        incremental_vacuum: Run `PRAGMA incremental_vacuum` after every chunk (only effective
+            when the database uses `auto_vacuum=INCREMENTAL`; see `kalshi data vacuum`).
+        on_progress: Called after every chunk.
+
+    Raises:
+        FileNotFoundError: If `resume` is set and there is no checkpoint to resume.
+    """
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows must be at least 1")
+    if resume:
+        if state_path is None:
+            raise ValueError("resume requires a state_path")
+        checkpoint = PruneCheckpoint.load(state_path)
+    else:
+        checkpoint = PruneCheckpoint(
+            snapshots_before=snapshots_before,
+            news_before=news_before,
+            hourly_rollups_before=hourly_rollups_before,
+        )
+
+    pruner = _ChunkedPruner(
+        db,
+        checkpoint,
+        chunk_rows=chunk_rows,
+        pause_seconds=pause_seconds,
+        state_path=state_path,
+        on_progress=on_progress,
+    )
+    started = time.monotonic()
+    vacuumed = await pruner.run(incremental_vacuum=incremental_vacuum)
+    elapsed = time.monotonic() - started
+    if state_path is not None:
+        state_path.unlink(missing_ok=True)
+
+    known = {f.name for f in fields(PruneCounts)}
+    counts = PruneCounts(**{k: v for k, v in checkpoint.counts.items() if k in known})
+    logger.info(
+        "Pruned database",
+        rows=counts.total_rows,
+        chunks=pruner.chunks,
+        seconds=round(elapsed, 2),
+        rows_per_second=round(counts.total_rows / elapsed, 1) if elapsed > 0 else None,
+    )
+    return ChunkedPruneResult(
+        counts=counts,
+        elapsed_seconds=elapsed,
+        chunks=pruner.chunks,
+        resumed=resume,
+        incremental_vacuum=vacuumed,
+    )
+
+
+def _as_utc(ts: datetime) -> datetime:
+    return ts.replace(tzinfo=UTC) if ts.tzinfo is None else ts.astimezone(UTC)
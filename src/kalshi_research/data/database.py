@@ -3,14 +3,22 @@
 from __future__ import annotations
 
 import asyncio
+from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
-from sqlalchemy import event
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 import kalshi_research.portfolio.models  # noqa: F401
 from kalshi_research.data.models import Base
+from kalshi_research.data.repositories.prices import REBUILD_LATEST_QUOTES_SQL
+from kalshi_research.data.repositories.rollups import (
+    BACKFILL_ROLLUPS_SQL,
+    ROLLUP_RESOLUTIONS,
+    backfill_params,
+)
+from kalshi_research.data.repositories.sentiment_rollups import BACKFILL_SENTIMENT_DAILY_SQL
 from kalshi_research.paths import DEFAULT_DB_PATH
 
 if TYPE_CHECKING:
@@ -19,6 +27,108 @@ if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncEngine
 
 
+@dataclass(frozen=True)
+class SQLiteProfile:
+    """
+    Connection and pool tuning applied to every connection of one engine.
+
+    Fields left as None keep SQLite's (or SQLAlchemy's) default.
+    """
+
+    name: str
+    # WAL + NORMAL only fsyncs at checkpoints: a power loss can drop the last commits, but the
+    # database is never corrupted. FULL fsyncs on every commit.
+    synchronous: Literal["OFF", "NORMAL", "FULL"] | None = None
+    cache_size_kib: int | None = None
+    mmap_size_bytes: int | None = None
+    temp_store: Literal["DEFAULT", "FILE", "MEMORY"] | None = None
+    wal_autocheckpoint_pages: int | None = None
+    busy_timeout_ms: int | None = None
+    pool_size: int | None = None
+    max_overflow: int | None = None
+
+    def pragmas(self) -> list[str]:
+        """Return the PRAGMA statements implementing this profile."""
+        statements: list[str] = []
+        if self.synchronous is not None:
+            statements.append(f"PRAGMA synchronous={self.synchronous}")
+        if self.cache_size_kib is not None:
+            # Negative cache_size is interpreted as KiB rather than pages.
+            statements.append(f"PRAGMA cache_size=-{int(self.cache_size_kib)}")
+        if self.mmap_size_bytes is not None:
+            statements.append(f"PRAGMA mmap_size={int(self.mmap_size_bytes)}")
+        if self.temp_store is not None:
+            statements.append(f"PRAGMA temp_store={self.temp_store}")
+        if self.wal_autocheckpoint_pages is not None:
+            statements.append(f"PRAGMA wal_autocheckpoint={int(self.wal_autocheckpoint_pages)}")
+        if self.busy_timeout_ms is not None:
+            statements.append(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+        return statements
+
+    def engine_kwargs(self) -> dict[str, Any]:
+        """Return pool sizing arguments for `create_async_engine`."""
+        kwargs: dict[str, Any] = {}
+        if self.pool_size is not None:
+            kwargs["pool_size"] = self.pool_size
+        if self.max_overflow is not None:
+            kwargs["max_overflow"] = self.max_overflow
+        return kwargs
+
+
+_KIB_PER_MIB = 1024
+_BYTES_PER_MIB = 1024 * 1024
+SQLITE_PROFILES: dict[str, SQLiteProfile] = {
+    # SQLite defaults (FULL sync in WAL mode, 2 MiB cache).
+    "default": SQLiteProfile(name="default"),
+    # Long-running daemon with one writer: durable across process crashes, fsync per checkpoint.
+    "collector": SQLiteProfile(
+        name="collector",
+        synchronous="NORMAL",
+        cache_size_kib=64 * _KIB_PER_MIB,
+        temp_store="MEMORY",
+        wal_autocheckpoint_pages=1000,
+        busy_timeout_ms=30_000,
+        pool_size=2,
+        max_overflow=2,
+    ),
+    # One-off imports that can be rerun from scratch: no fsyncs, rare checkpoints.
+    "bulk-load": SQLiteProfile(
+        name="bulk-load",
+        synchronous="OFF",
+        cache_size_kib=256 * _KIB_PER_MIB,
+        temp_store="MEMORY",
+        wal_autocheckpoint_pages=10_000,
+        busy_timeout_ms=60_000,
+        pool_size=1,
+        max_overflow=0,
+    ),
+    # Large scans and aggregations: memory-mapped reads and a big page cache.
+    "analytics": SQLiteProfile(
+        name="analytics",
+        cache_size_kib=64 * _KIB_PER_MIB,
+        mmap_size_bytes=256 * _BYTES_PER_MIB,
+        temp_store="MEMORY",
+        busy_timeout_ms=30_000,
+    ),
+}
+
+
+def resolve_sqlite_profile(profile: str | SQLiteProfile) -> SQLiteProfile:
+    """Look up a profile by name (or pass a custom profile through).
+
+    Raises:
+        ValueError: If the profile name is unknown
+    """
+    if isinstance(profile, SQLiteProfile):
+        return profile
+    try:
+        return SQLITE_PROFILES[profile]
+    except KeyError:
+        raise ValueError(
+            f"Unknown SQLite profile: {profile}. Available: {', '.join(SQLITE_PROFILES)}"
+        ) from None
+
+
 class DatabaseManager:
     """
     Async database connection manager for SQLite.
@@ -30,6 +140,9 @@ class DatabaseManager:
         self,
         db_path: str | Path = DEFAULT_DB_PATH,
         echo: bool = False,
+        *,
+        read_only: bool = False,
+        profile: str | SQLiteProfile | None = None,
     ) -> None:
         """
         Initialize database manager.
@@ -37,38 +150,86 @@ class DatabaseManager:
         Args:
             db_path: Path to SQLite database file
             echo: Whether to echo SQL statements (for debugging)
+            read_only: Open the file with `mode=ro` and `PRAGMA query_only` so the engine can
+                never write.
+            profile: Performance profile name (see `SQLITE_PROFILES`) or custom profile.
+                Defaults to "analytics" for read-only managers and "default" otherwise.
+
+        Raises:
+            ValueError: If the profile name is unknown
         """
         self._db_path = Path(db_path)
         self._echo = echo
+        self._read_only = read_only
+        if profile is None:
+            profile = "analytics" if read_only else "default"
+        self._profile = resolve_sqlite_profile(profile)
         self._engine: AsyncEngine | None = None
         self._session_factory: async_sessionmaker[AsyncSession] | None = None
 
+    @property
+    def db_path(self) -> Path:
+        """Path to the SQLite database file."""
+        return self._db_path
+
+    @property
+    def read_only(self) -> bool:
+        """Whether this manager opens read-only connections."""
+        return self._read_only
+
+    @property
+    def profile(self) -> SQLiteProfile:
+        """Performance profile applied to this manager's connections."""
+        return self._profile
+
     @property
     def engine(self) -> AsyncEngine:
         """Get or create the async engine."""
         if self._engine is None:
-            # Ensure parent directory exists
-            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+            if self._read_only:
+                # A read-only URI cannot create the file; fail fast instead of on first query.
+                if not self._db_path.exists():
+                    raise FileNotFoundError(f"Database not found: {self._db_path}")
+                url = f"sqlite+aiosqlite:///file:{self._db_path.resolve()}?mode=ro&uri=true"
+            else:
+                # Ensure parent directory exists
+                self._db_path.parent.mkdir(parents=True, exist_ok=True)
+                # Use aiosqlite for async SQLite
+                url = f"sqlite+aiosqlite:///{self._db_path}"
 
-            # Use aiosqlite for async SQLite
-            url = f"sqlite+aiosqlite:///{self._db_path}"
             self._engine = create_async_engine(
                 url,
                 echo=self._echo,
                 # SQLite-specific: enable WAL mode for better concurrency
                 connect_args={"check_same_thread": False},
+                **self._profile.engine_kwargs(),
             )
+            read_only = self._read_only
+            profile_pragmas = self._profile.pragmas()
 
             # Enable foreign keys for SQLite
             @event.listens_for(self._engine.sync_engine, "connect")
             def set_sqlite_pragma(dbapi_connection: Any, _connection_record: Any) -> None:
                 cursor = dbapi_connection.cursor()
-                cursor.execute("PRAGMA foreign_keys=ON")
-                cursor.execute("PRAGMA journal_mode=WAL")
+                if read_only:
+                    # journal_mode is a property of the file; the writer already set WAL.
+                    cursor.execute("PRAGMA query_only=ON")
+                else:
+                    cursor.execute("PRAGMA foreign_keys=ON")
+                    cursor.execute("PRAGMA journal_mode=WAL")
+                for pragma in profile_pragmas:
+                    cursor.execute(pragma)
                 cursor.close()
 
         return self._engine
 
+    def reader(self) -> DatabaseManager:
+        """Return a read-only manager for the same file with its own connection pool.
+
+        Long analytic reads on the reader never hold the writer's pooled connections.
+        """
+        return DatabaseManager(self._db_path, echo=self._echo, read_only=True, profile="analytics")
+
     @property
     def session_factory(self) -> async_sessionmaker[AsyncSession]:
         """Get or create the session factory."""
@@ -82,11 +243,32 @@ class DatabaseManager:
 
     async def create_tables(self) -> None:
         """Create all database tables."""
+        if self._read_only:
+            raise RuntimeError("Cannot create tables through a read-only DatabaseManager")
         async with self.engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+            # Databases created before `news_sentiment_daily` existed get it populated once.
+            if (
+                await conn.execute(text("SELECT 1 FROM news_sentiment_daily LIMIT 1"))
+            ).first() is None:
+                await conn.execute(text(BACKFILL_SENTIMENT_DAILY_SQL))
+            has_snapshots = (
+                await conn.execute(text("SELECT 1 FROM price_snapshots LIMIT 1"))
+            ).first() is not None
+            if not has_snapshots:
+                return
+            # Databases created before `latest_quotes` / `price_rollups` existed get them
+            # populated once.
+            if (await conn.execute(text("SELECT 1 FROM latest_quotes LIMIT 1"))).first() is None:
+                await conn.execute(text(REBUILD_LATEST_QUOTES_SQL))
+            if (await conn.execute(text("SELECT 1 FROM price_rollups LIMIT 1"))).first() is None:
+                for resolution in ROLLUP_RESOLUTIONS:
+                    await conn.execute(text(BACKFILL_ROLLUPS_SQL), backfill_params(resolution))
 
     async def drop_tables(self) -> None:
         """Drop all database tables (use with caution!)."""
+        if self._read_only:
+            raise RuntimeError("Cannot drop tables through a read-only DatabaseManager")
         async with self.engine.begin() as conn:
             await conn.run_sync(Base.metadata.drop_all)
 
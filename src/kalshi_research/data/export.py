@@ -2,35 +2,198 @@
 
 from __future__ import annotations
 
+import json
+import os
+import uuid
+from datetime import UTC, datetime
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import structlog
 
+from kalshi_research.constants import DEFAULT_EXPORT_COMPACT_MIN_FILES
+
+if TYPE_CHECKING:
+    import duckdb
+
 logger = structlog.get_logger()
 
 # Allowed tables for export (prevents SQL injection via table names)
 ALLOWED_TABLES = frozenset({"price_snapshots", "markets", "events", "settlements"})
 
+# Watermarks for incremental exports live next to the exported files.
+EXPORT_STATE_FILENAME = ".export_state.json"
+EXPORT_STATE_VERSION = 1
+
+
+def _load_export_state(output_dir: Path) -> dict[str, Any]:
+    """Load per-table export watermarks (empty when no incremental export has run)."""
+    state_path = output_dir / EXPORT_STATE_FILENAME
+    if not state_path.exists():
+        return {}
+    with state_path.open(encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or data.get("version") != EXPORT_STATE_VERSION:
+        raise ValueError(f"Export state file has an unexpected schema: {state_path}")
+    tables = data.get("tables", {})
+    if not isinstance(tables, dict):
+        raise ValueError(f"Export state file has an unexpected schema: {state_path}")
+    return tables
+
+
+def _save_export_state(output_dir: Path, tables: dict[str, Any]) -> None:
+    """Persist per-table export watermarks atomically."""
+    state_path = output_dir / EXPORT_STATE_FILENAME
+    tmp_path = state_path.with_suffix(f".tmp.{uuid.uuid4().hex}")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        json.dump({"version": EXPORT_STATE_VERSION, "tables": tables}, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    tmp_path.replace(state_path)
+
+
+def _export_snapshots(
+    conn: duckdb.DuckDBPyConnection,
+    table_dir: Path,
+    state: dict[str, Any],
+    *,
+    incremental: bool,
+) -> None:
+    """Export `price_snapshots` into month partitions and update its watermark in `state`.
+
+    A full export replaces the partition directory. An incremental export appends uniquely named
+    part files holding only rows above the recorded `last_id` to the affected partitions.
+    """
+    previous = state.get("price_snapshots") if incremental else None
+    after_id = int(previous["last_id"]) if previous else None
+    lower = 0 if after_id is None else after_id
+    row = conn.execute(
+        """
+        SELECT max(id), max(snapshot_time), count(*)
+        FROM kalshi.price_snapshots
+        WHERE id > ?
+        """,
+        [lower],
+    ).fetchone()
+    if row is None or row[0] is None:
+        if after_id is None:
+            state.pop("price_snapshots", None)
+        logger.info("No new snapshot rows to export", incremental=after_id is not None)
+        return
+
+    upper = int(row[0])
+    copy_options = (
+        "OVERWRITE true" if after_id is None else "APPEND true, FILENAME_PATTERN 'part-{uuid}'"
+    )
+    conn.execute(f"""
+        COPY (
+            SELECT *, strftime(snapshot_time, '%Y-%m') as month
+            FROM kalshi.price_snapshots
+            WHERE id > {lower} AND id <= {upper}
+        ) TO '{table_dir}'
+        (FORMAT PARQUET, PARTITION_BY (month), {copy_options});
+    """)
+    state["price_snapshots"] = {
+        "last_id": upper,
+        "last_snapshot_time": str(row[1]),
+        "rows": int(row[2]),
+        "exported_at": datetime.now(UTC).isoformat(),
+    }
+    logger.info("Exported snapshot rows", incremental=after_id is not None, rows=int(row[2]))
+
+
+def compact_parquet_partitions(
+    table_dir: str | Path,
+    *,
+    min_files: int = DEFAULT_EXPORT_COMPACT_MIN_FILES,
+) -> int:
+    """
+    Merge small Parquet files inside each hive partition of an exported table.
+
+    The merged file is written and renamed into place before the originals are removed, so an
+    interrupted compaction can leave duplicate rows behind but never loses data.
+
+    Args:
+        table_dir: Partitioned table directory (e.g. `exports/price_snapshots`)
+        min_files: Only compact partitions holding at least this many files
+
+    Returns:
+        Number of partitions compacted
+    """
+    import duckdb
+
+    table_dir = Path(table_dir).resolve()
+
+    if any(c in str(table_dir) for c in ["'", '"', ";", "--"]):
+        raise ValueError(f"Invalid characters in path: {table_dir}")
+    if min_files < 2:
+        raise ValueError("min_files must be >= 2")
+    if not table_dir.is_dir():
+        return 0
+
+    compacted = 0
+    conn = duckdb.connect()
+    try:
+        for partition in sorted(p for p in table_dir.iterdir() if p.is_dir()):
+            files = sorted(partition.glob("*.parquet"))
+            if len(files) < min_files:
+                continue
+
+            name = f"part-compacted-{uuid.uuid4().hex}"
+            tmp_path = partition / f".{name}.tmp"
+            file_list = ", ".join(f"'{f}'" for f in files)
+            conn.execute(f"""
+                COPY (SELECT * FROM read_parquet([{file_list}]) ORDER BY id)
+                TO '{tmp_path}' (FORMAT PARQUET);
+            """)
+            tmp_path.replace(partition / f"{name}.parquet")
+            for f in files:
+                f.unlink()
+
+            compacted += 1
+            logger.info(
+                "Compacted Parquet partition",
+                partition=str(partition),
+                files=len(files),
+            )
+    finally:
+        conn.close()
+
+    return compacted
+
 
 def export_to_parquet(
     sqlite_path: str | Path,
     output_dir: str | Path,
     tables: list[str] | None = None,
+    *,
+    incremental: bool = False,
+    compact_min_files: int | None = None,
 ) -> None:
     """
     Export SQLite data to partitioned Parquet files for efficient analysis.
 
     Uses DuckDB for high-performance data transfer.
 
+    In incremental mode, `price_snapshots` is exported append-only: only rows with an id above
+    the watermark recorded in `.export_state.json` are written, as new part files in their month
+    partitions. The first incremental run (no watermark yet) performs a full export. Reference
+    tables (`markets`, `events`, `settlements`) are mutated in place by upserts, so they are
+    always rewritten in full; they are small compared to the snapshot history.
+
     Args:
         sqlite_path: Path to SQLite database file
         output_dir: Directory to write Parquet files
         tables: List of tables to export (default: all)
+        incremental: Export only snapshot rows added since the previous export
+        compact_min_files: After an incremental export, compact snapshot partitions that hold
+            at least this many files (default: no compaction)
 
     Raises:
         FileNotFoundError: If SQLite database doesn't exist
         ValueError: If paths contain invalid characters
         ValueError: If an invalid table name is requested
+        ValueError: If the export state file is corrupt
     """
     import duckdb
 
@@ -46,6 +209,7 @@ def export_to_parquet(
             raise ValueError(f"Invalid characters in path: {path}")
 
     output_dir.mkdir(parents=True, exist_ok=True)
+    state = _load_export_state(output_dir)
 
     conn = duckdb.connect()
     try:
@@ -69,13 +233,7 @@ def export_to_parquet(
 
             if table == "price_snapshots":
                 # Partition snapshots by month for efficient time-based queries
-                conn.execute(f"""
-                    COPY (
-                        SELECT *, strftime(snapshot_time, '%Y-%m') as month
-                        FROM kalshi.{table}
-                    ) TO '{table_dir}'
-                    (FORMAT PARQUET, PARTITION_BY (month), OVERWRITE_OR_IGNORE true);
-                """)
+                _export_snapshots(conn, table_dir, state, incremental=incremental)
             else:
                 # Export other tables as single files
                 conn.execute(f"""
@@ -91,6 +249,11 @@ def export_to_parquet(
     finally:
         conn.close()
 
+    if "price_snapshots" in tables:
+        _save_export_state(output_dir, state)
+        if incremental and compact_min_files is not None:
+            compact_parquet_partitions(output_dir / "price_snapshots", min_files=compact_min_files)
+
 
 def export_to_csv(
     sqlite_path: str | Path,
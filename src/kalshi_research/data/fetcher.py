@@ -2,33 +2,33 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Literal
 
 import structlog
 from sqlalchemy import select, update
 
-from kalshi_research.api import KalshiPublicClient
+from kalshi_research.api import KalshiPublicClient, MarketSweep
 from kalshi_research.api.models.market import MarketFilterStatus
 from kalshi_research.constants import DEFAULT_PAGINATION_LIMIT
 from kalshi_research.data._converters import (
     api_event_to_db,
     api_market_to_db,
     api_market_to_settlement,
-    api_market_to_snapshot,
 )
+from kalshi_research.data._snapshot_writer import write_snapshot
 from kalshi_research.data.models import Event as DBEvent
 from kalshi_research.data.models import Market as DBMarket
 from kalshi_research.data.repositories import (
     EventRepository,
     MarketRepository,
-    PriceRepository,
     SettlementRepository,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterable
     from types import TracebackType
 
+    from kalshi_research.api import Market, MarketUniverseCache
     from kalshi_research.data.database import DatabaseManager
 
 logger = structlog.get_logger()
@@ -45,6 +45,8 @@ class DataFetcher:
         self,
         db: DatabaseManager,
         client: KalshiPublicClient | None = None,
+        *,
+        market_cache: MarketUniverseCache | None = None,
     ) -> None:
         """
         Initialize the data fetcher.
@@ -52,15 +54,18 @@ class DataFetcher:
         Args:
             db: Database manager for persistence
             client: Optional API client (creates one if not provided)
+            market_cache: Shared market-sweep cache for the client this fetcher creates
+                (ignored when `client` is provided)
         """
         self._db = db
         self._client = client
         self._owns_client = client is None
+        self._market_cache = market_cache
 
     async def __aenter__(self) -> DataFetcher:
         """Enter async context manager."""
         if self._client is None:
-            self._client = KalshiPublicClient()
+            self._client = KalshiPublicClient(market_cache=self._market_cache)
             await self._client.__aenter__()
         return self
 
@@ -255,6 +260,8 @@ class DataFetcher:
         Notes:
             - Robust to missing market rows: upserts minimal Market records before inserting
               snapshots to satisfy foreign key constraints.
+            - Rows are committed page by page (see `take_snapshot_from`); `latest_quotes` is
+              updated in the same transaction as each page's `price_snapshots`.
             - Markets missing required `*_dollars` quotes are skipped (logged) to avoid inserting
               NULL quote values into the database.
 
@@ -265,52 +272,39 @@ class DataFetcher:
         Returns:
             Number of snapshots taken
         """
-        snapshot_time = datetime.now(UTC)
-        logger.info("Taking price snapshot", snapshot_time=snapshot_time.isoformat())
-        count = 0
-        skipped_missing_quotes = 0
+        sweep = MarketSweep()
+        return await self.take_snapshot_from(
+            self.client.get_all_markets(status=status, max_pages=max_pages, sweep=sweep),
+            status_filter=status,
+            sweep=sweep,
+        )
 
-        async with self._db.session_factory() as session, session.begin():
-            price_repo = PriceRepository(session)
-            market_repo = MarketRepository(session)
-            event_repo = EventRepository(session)
+    async def take_snapshot_from(
+        self,
+        markets: AsyncIterable[Market],
+        *,
+        status_filter: str | None = None,
+        sweep: MarketSweep | None = None,
+    ) -> int:
+        """
+        Snapshot markets from any source as one snapshot batch.
 
-            async for api_market in self.client.get_all_markets(status=status, max_pages=max_pages):
-                # Ensure event + market exist (FK robustness) without racing other writers.
-                await event_repo.insert_ignore(
-                    DBEvent(
-                        ticker=api_market.event_ticker,
-                        series_ticker=api_market.series_ticker or api_market.event_ticker,
-                        title=api_market.event_ticker,  # Placeholder
-                        mutually_exclusive=False,
-                    )
-                )
-                await market_repo.insert_ignore(api_market_to_db(api_market))
-
-                try:
-                    snapshot = api_market_to_snapshot(api_market, snapshot_time)
-                except ValueError as exc:
-                    skipped_missing_quotes += 1
-                    logger.warning(
-                        "Skipping market snapshot due to invalid/missing dollar quotes",
-                        ticker=api_market.ticker,
-                        error=str(exc),
-                    )
-                    continue
-                await price_repo.add(snapshot, flush=False)
-                count += 1
+        `take_snapshot` feeds this from a single API sweep; the sharded collector feeds it from
+        its worker processes. The source is consumed by a producer task while rows are committed
+        in page-sized transactions, so the SQLite write lock is never held across network waits.
+        The run is recorded in `snapshot_batches` and only marked "complete" once every page is
+        written; if the source raises, the batch is marked "failed" and the error re-raised.
 
-                # Flush in batches to avoid memory issues (still within transaction)
-                if count % 100 == 0:
-                    await session.flush()
-                    logger.debug("Took snapshots so far", count=count)
+        Args:
+            markets: API markets to snapshot (each ticker should appear once)
+            status_filter: Market status the source was restricted to (recorded on the batch)
+            sweep: Sweep metadata filled in by the source; marks the batch truncated when the
+                sweep stopped at `max_pages`
 
-        logger.info(
-            "Took price snapshots",
-            count=count,
-            skipped_missing_quotes=skipped_missing_quotes,
-        )
-        return count
+        Returns:
+            Number of snapshots taken
+        """
+        return await write_snapshot(self._db, markets, status_filter=status_filter, sweep=sweep)
 
     async def full_sync(
         self,
@@ -3,21 +3,31 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import timedelta
 from typing import TYPE_CHECKING
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, func, or_, select
 
 from kalshi_research.data.models import (
     NewsArticle,
     NewsArticleEvent,
     NewsArticleMarket,
     NewsSentiment,
+    PriceRollup,
     PriceSnapshot,
+    SnapshotBatch,
+)
+from kalshi_research.data.repositories.rollups import (
+    DAILY,
+    HOURLY,
+    PriceRollupRepository,
+    bucket_start,
 )
 
 if TYPE_CHECKING:
     from datetime import datetime
 
+    from sqlalchemy import ColumnElement
     from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -26,6 +36,8 @@ class PruneCounts:
     """Row counts that would be (or were) pruned."""
 
     price_snapshots: int = 0
+    snapshot_batches: int = 0
+    hourly_rollups: int = 0
     news_articles: int = 0
     news_article_markets: int = 0
     news_article_events: int = 0
@@ -36,6 +48,8 @@ class PruneCounts:
         """Return the total number of rows represented by these prune counts."""
         return (
             self.price_snapshots
+            + self.snapshot_batches
+            + self.hourly_rollups
             + self.news_articles
             + self.news_article_markets
             + self.news_article_events
@@ -43,22 +57,54 @@ class PruneCounts:
         )
 
 
+def _old_snapshots(snapshots_before: datetime) -> ColumnElement[bool]:
+    """Snapshots in batches older than the cutoff, plus legacy rows written outside a batch.
+
+    Pruning drops whole batches, so the snapshot rows are found through the `batch_id` index.
+    """
+    old_batch_ids = select(SnapshotBatch.id).where(SnapshotBatch.snapshot_time < snapshots_before)
+    return or_(
+        PriceSnapshot.batch_id.in_(old_batch_ids),
+        (PriceSnapshot.batch_id.is_(None)) & (PriceSnapshot.snapshot_time < snapshots_before),
+    )
+
+
+def _old_hourly_rollups(hourly_rollups_before: datetime) -> list[ColumnElement[bool]]:
+    return [PriceRollup.resolution == HOURLY, PriceRollup.bucket_start < hourly_rollups_before]
+
+
 async def compute_prune_counts(
     session: AsyncSession,
     *,
     snapshots_before: datetime | None,
     news_before: datetime | None,
+    hourly_rollups_before: datetime | None = None,
 ) -> PruneCounts:
     """Compute how many rows match the prune criteria."""
     snapshot_count = 0
+    batch_count = 0
     if snapshots_before is not None:
         result = await session.execute(
-            select(func.count(PriceSnapshot.id)).where(
-                PriceSnapshot.snapshot_time < snapshots_before
-            )
+            select(func.count(PriceSnapshot.id)).where(_old_snapshots(snapshots_before))
         )
         snapshot_count = int(result.scalar_one())
 
+        result = await session.execute(
+            select(func.count(SnapshotBatch.id)).where(
+                SnapshotBatch.snapshot_time < snapshots_before
+            )
+        )
+        batch_count = int(result.scalar_one())
+
+    hourly_rollup_count = 0
+    if hourly_rollups_before is not None:
+        result = await session.execute(
+            select(func.count())
+            .select_from(PriceRollup)
+            .where(*_old_hourly_rollups(hourly_rollups_before))
+        )
+        hourly_rollup_count = int(result.scalar_one())
+
     news_article_count = 0
     news_market_count = 0
     news_event_count = 0
@@ -94,6 +140,8 @@ async def compute_prune_counts(
 
     return PruneCounts(
         price_snapshots=snapshot_count,
+        snapshot_batches=batch_count,
+        hourly_rollups=hourly_rollup_count,
         news_articles=news_article_count,
         news_article_markets=news_market_count,
         news_article_events=news_event_count,
@@ -106,17 +154,39 @@ async def apply_prune(
     *,
     snapshots_before: datetime | None,
     news_before: datetime | None,
+    hourly_rollups_before: datetime | None = None,
 ) -> PruneCounts:
-    """Apply pruning for the given criteria. Returns counts removed."""
+    """Apply pruning for the given criteria. Returns counts removed.
+
+    Raw snapshots are downsampled rather than lost: any of their hourly/daily buckets missing
+    from `price_rollups` is filled in before they are deleted. Daily rollups are never pruned.
+    Everything runs in the caller's transaction; on a live database prefer
+    `chunked_prune.prune_in_chunks()`.
+    """
     counts = await compute_prune_counts(
         session,
         snapshots_before=snapshots_before,
         news_before=news_before,
+        hourly_rollups_before=hourly_rollups_before,
     )
 
-    if snapshots_before is not None and counts.price_snapshots:
+    if snapshots_before is not None:
+        if counts.price_snapshots:
+            # Through the end of the cutoff's day, so the buckets straddling it are complete.
+            await PriceRollupRepository(session).backfill(
+                before=bucket_start(snapshots_before, DAILY) + timedelta(days=1)
+            )
+        # FK-safe order: snapshots first, then the batch rows they reference.
+        if counts.price_snapshots:
+            await session.execute(delete(PriceSnapshot).where(_old_snapshots(snapshots_before)))
+        if counts.snapshot_batches:
+            await session.execute(
+                delete(SnapshotBatch).where(SnapshotBatch.snapshot_time < snapshots_before)
+            )
+
+    if hourly_rollups_before is not None and counts.hourly_rollups:
         await session.execute(
-            delete(PriceSnapshot).where(PriceSnapshot.snapshot_time < snapshots_before)
+            delete(PriceRollup).where(*_old_hourly_rollups(hourly_rollups_before))
         )
 
     if news_before is not None and counts.news_articles:
@@ -97,6 +97,10 @@ class PriceSnapshot(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     ticker: Mapped[str] = mapped_column(String, ForeignKey("markets.ticker"), nullable=False)
     snapshot_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    # The snapshot run that wrote this row (NULL only for rows written outside a batch).
+    batch_id: Mapped[int | None] = mapped_column(
+        Integer, ForeignKey("snapshot_batches.id"), nullable=True
+    )
 
     yes_bid: Mapped[int] = mapped_column(Integer, nullable=False)
     yes_ask: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -114,6 +118,7 @@ class PriceSnapshot(Base):
     __table_args__ = (
         Index("idx_snapshots_ticker_time", "ticker", "snapshot_time"),
         Index("idx_snapshots_time", "snapshot_time"),
+        Index("idx_snapshots_batch_ticker", "batch_id", "ticker"),
     )
 
     @property
@@ -132,6 +137,128 @@ class PriceSnapshot(Base):
         return self.midpoint / 100.0
 
 
+class LatestQuote(Base):
+    """Most recent price snapshot per market.
+
+    Maintained by `DataFetcher.take_snapshot` in the same transaction as each page of
+    `price_snapshots` inserts, so "current price" lookups are a primary-key join that does not
+    grow with history.
+    """
+
+    __tablename__ = "latest_quotes"
+
+    ticker: Mapped[str] = mapped_column(String, ForeignKey("markets.ticker"), primary_key=True)
+    snapshot_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    yes_bid: Mapped[int] = mapped_column(Integer, nullable=False)
+    yes_ask: Mapped[int] = mapped_column(Integer, nullable=False)
+    no_bid: Mapped[int] = mapped_column(Integer, nullable=False)
+    no_ask: Mapped[int] = mapped_column(Integer, nullable=False)
+    last_price: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+    volume: Mapped[int] = mapped_column(Integer, nullable=False)
+    volume_24h: Mapped[int] = mapped_column(Integer, nullable=False)
+    open_interest: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    __table_args__ = (Index("idx_latest_quotes_snapshot_time", "snapshot_time"),)
+
+    @property
+    def midpoint(self) -> float:
+        """Calculate midpoint price."""
+        return (self.yes_bid + self.yes_ask) / 2.0
+
+    @property
+    def spread(self) -> int:
+        """Calculate bid-ask spread."""
+        return self.yes_ask - self.yes_bid
+
+    @property
+    def implied_probability(self) -> float:
+        """Convert midpoint to probability (0-1 scale)."""
+        return self.midpoint / 100.0
+
+
+class PriceRollup(Base):
+    """Hourly or daily aggregate of a market's price snapshots.
+
+    Maintained incrementally by the snapshot writer (same transaction as each page of
+    `price_snapshots`), so coarse history survives pruning of the raw snapshots. Prices are in
+    cents: OHLC of the yes midpoint, plus the last quote seen in the bucket (`snapshot_time`
+    is that quote's time), so rows can stand in for a `PriceSnapshot` in coarse analyses.
+    """
+
+    __tablename__ = "price_rollups"
+
+    ticker: Mapped[str] = mapped_column(String, ForeignKey("markets.ticker"), primary_key=True)
+    resolution: Mapped[str] = mapped_column(String(8), primary_key=True)  # "1h" or "1d"
+    bucket_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+
+    first_snapshot_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    snapshot_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    sample_count: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    open_mid: Mapped[float] = mapped_column(Float, nullable=False)
+    high_mid: Mapped[float] = mapped_column(Float, nullable=False)
+    low_mid: Mapped[float] = mapped_column(Float, nullable=False)
+    close_mid: Mapped[float] = mapped_column(Float, nullable=False)
+    # Cumulative volume at the bucket's first snapshot; `volume` is the value at its last.
+    open_volume: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    yes_bid: Mapped[int] = mapped_column(Integer, nullable=False)
+    yes_ask: Mapped[int] = mapped_column(Integer, nullable=False)
+    no_bid: Mapped[int] = mapped_column(Integer, nullable=False)
+    no_ask: Mapped[int] = mapped_column(Integer, nullable=False)
+    last_price: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+    volume: Mapped[int] = mapped_column(Integer, nullable=False)
+    volume_24h: Mapped[int] = mapped_column(Integer, nullable=False)
+    open_interest: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    __table_args__ = (Index("idx_price_rollups_resolution_bucket", "resolution", "bucket_start"),)
+
+    @property
+    def midpoint(self) -> float:
+        """Midpoint of the bucket's last quote."""
+        return self.close_mid
+
+    @property
+    def implied_probability(self) -> float:
+        """Convert midpoint to probability (0-1 scale)."""
+        return self.midpoint / 100.0
+
+    @property
+    def volume_traded(self) -> int:
+        """Contracts traded within the bucket (between its first and last snapshot)."""
+        return self.volume - self.open_volume
+
+
+class SnapshotBatch(Base):
+    """One `take_snapshot` run: every `price_snapshots` row it writes shares `snapshot_time`.
+
+    The snapshot writer commits rows page by page, so a batch is only a consistent point-in-time
+    view once `status` is "complete"; "running" batches are in progress and "failed" batches
+    were aborted part-way through. Rows reference their batch through `PriceSnapshot.batch_id`.
+    """
+
+    __tablename__ = "snapshot_batches"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    snapshot_time: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, unique=True
+    )
+    status: Mapped[str] = mapped_column(String, nullable=False, default="running")
+    started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Coverage: snapshots written, and markets skipped for missing quotes.
+    market_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    skipped_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # `status=` filter of the sweep (e.g. "open"), and whether `max_pages` cut it short.
+    status_filter: Mapped[str | None] = mapped_column(String, nullable=True)
+    truncated: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+
+    __table_args__ = (Index("idx_snapshot_batches_status_time", "status", "snapshot_time"),)
+
+
 class Settlement(Base):
     """Settlement outcome for a resolved market."""
 
@@ -241,4 +368,31 @@ class NewsSentiment(Base):
 
     article: Mapped[NewsArticle] = relationship("NewsArticle", back_populates="sentiments")
 
-    __table_args__ = (Index("idx_news_sentiments_analyzed_at", "analyzed_at"),)
+    __table_args__ = (
+        Index("idx_news_sentiments_analyzed_at", "analyzed_at"),
+        # One score per article and analyzer version; re-scoring upserts on it.
+        Index("uq_news_sentiments_article_method", "article_id", "method", unique=True),
+    )
+
+
+class NewsSentimentDaily(Base):
+    """Daily sentiment totals of a market's linked articles, per sentiment method.
+
+    Buckets are UTC days of `news_articles.collected_at`. Rows are recomputed from
+    `news_sentiments` whenever articles of a bucket are scored, re-scored or linked, so many
+    markets can be summarized in one grouped query, and they outlive pruned articles.
+    """
+
+    __tablename__ = "news_sentiment_daily"
+
+    ticker: Mapped[str] = mapped_column(String(100), ForeignKey("markets.ticker"), primary_key=True)
+    method: Mapped[str] = mapped_column(String(50), primary_key=True)
+    bucket_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+
+    article_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    score_sum: Mapped[float] = mapped_column(Float, nullable=False)
+    # Sum of squared scores, for the standard deviation of a period.
+    score_sq_sum: Mapped[float] = mapped_column(Float, nullable=False)
+    positive_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    negative_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    neutral_count: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -0,0 +1,104 @@
+"""Point-in-time database copies for long analytic reads.
+
+Long read transactions against the live database pin the WAL: SQLite cannot checkpoint past the
+oldest active reader, so the `-wal` file keeps growing while a scan runs. Analysis can instead
+run against a replica produced with SQLite's online backup API, which copies a consistent
+snapshot and releases the source as soon as the copy completes.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+import uuid
+from contextlib import closing
+from pathlib import Path
+
+import structlog
+
+logger = structlog.get_logger()
+
+
+def default_replica_path(db_path: str | Path) -> Path:
+    """Return the replica location used for `db_path` (`kalshi.db` -> `kalshi.replica.db`)."""
+    db_path = Path(db_path)
+    return db_path.with_name(f"{db_path.stem}.replica{db_path.suffix}")
+
+
+def backup_database(source: str | Path, destination: str | Path) -> Path:
+    """
+    Copy a live SQLite database to `destination` using the online backup API.
+
+    The copy is written to a temporary file and renamed into place, so readers of an existing
+    replica keep a consistent file until they reopen it.
+
+    Args:
+        source: Path to the live database (may be in WAL mode with an active writer)
+        destination: Path to write the copy to
+
+    Returns:
+        The destination path
+
+    Raises:
+        FileNotFoundError: If the source database doesn't exist
+    """
+    source = Path(source).resolve()
+    destination = Path(destination).resolve()
+
+    if not source.exists():
+        raise FileNotFoundError(f"SQLite database not found: {source}")
+    if source == destination:
+        raise ValueError("Replica path must differ from the source database path")
+
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = destination.with_name(f".{destination.name}.tmp.{uuid.uuid4().hex}")
+
+    started = time.monotonic()
+    try:
+        with (
+            closing(sqlite3.connect(f"file:{source}?mode=ro", uri=True)) as src,
+            closing(sqlite3.connect(tmp_path)) as dst,
+        ):
+            # Copy in one step: a multi-step backup restarts whenever the writer commits.
+            src.backup(dst)
+            # The copy has no concurrent writers; a rollback journal keeps it a single file.
+            dst.execute("PRAGMA journal_mode=DELETE")
+        tmp_path.replace(destination)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    logger.info(
+        "Refreshed database replica",
+        source=str(source),
+        replica=str(destination),
+        seconds=round(time.monotonic() - started, 3),
+    )
+    return destination
+
+
+def refresh_replica(
+    source: str | Path,
+    replica: str | Path | None = None,
+    *,
+    max_age_seconds: float,
+) -> Path:
+    """
+    Ensure a replica of `source` exists and is no older than `max_age_seconds`.
+
+    Args:
+        source: Path to the live database
+        replica: Replica path (default: `default_replica_path(source)`)
+        max_age_seconds: Refresh the replica when its copy is older than this
+
+    Returns:
+        Path to the (possibly refreshed) replica
+    """
+    replica_path = Path(replica) if replica is not None else default_replica_path(source)
+
+    if replica_path.exists():
+        age = time.time() - replica_path.stat().st_mtime
+        if age <= max_age_seconds:
+            logger.debug("Using existing database replica", replica=str(replica_path), age=age)
+            return replica_path
+
+    return backup_database(source, replica_path)
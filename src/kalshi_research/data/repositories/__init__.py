@@ -3,14 +3,20 @@
 from kalshi_research.data.repositories.events import EventRepository
 from kalshi_research.data.repositories.markets import MarketRepository
 from kalshi_research.data.repositories.prices import PriceRepository
+from kalshi_research.data.repositories.rollups import PriceRollupRepository
 from kalshi_research.data.repositories.search import MarketSearchResult, SearchRepository
+from kalshi_research.data.repositories.sentiment_rollups import SentimentRollupRepository
 from kalshi_research.data.repositories.settlements import SettlementRepository
+from kalshi_research.data.repositories.snapshot_batches import SnapshotBatchRepository
 
 __all__ = [
     "EventRepository",
     "MarketRepository",
     "MarketSearchResult",
     "PriceRepository",
+    "PriceRollupRepository",
     "SearchRepository",
+    "SentimentRollupRepository",
     "SettlementRepository",
+    "SnapshotBatchRepository",
 ]
@@ -4,14 +4,17 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
-from kalshi_research.data.models import Market, utc_now
+from kalshi_research.data.models import Event, LatestQuote, Market, utc_now
 from kalshi_research.data.repositories.base import BaseRepository
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
+    from datetime import datetime
+
+    from sqlalchemy import Row
 
 
 class MarketRepository(BaseRepository[Market]):
@@ -91,8 +94,60 @@ class MarketRepository(BaseRepository[Market]):
 
     async def count_by_status(self) -> dict[str, int]:
         """Count markets by status."""
-        from sqlalchemy import func
-
         stmt = select(Market.status, func.count(Market.ticker)).group_by(Market.status)
         result = await self._session.execute(stmt)
         return {str(row[0]): int(row[1]) for row in result.all()}
+
+    async def get_with_latest_quotes(
+        self,
+        *,
+        status: str | None = "active",
+        event_prefix: str | None = None,
+        category: str | None = None,
+        exclude_category: str | None = None,
+    ) -> Sequence[
+        Row[tuple[str, str, str, str, str | None, datetime, datetime, int, int, int, datetime]]
+    ]:
+        """
+        Get markets joined with their latest quote, as plain column rows.
+
+        Markets without a row in `latest_quotes` are omitted. Category filters match the event
+        category (falling back to the market category) case-insensitively.
+
+        Returns:
+            Rows of (ticker, event_ticker, title, status, category, open_time, close_time,
+            yes_bid, yes_ask, volume_24h, snapshot_time).
+        """
+        category_col = func.coalesce(Event.category, Market.category)
+        stmt = (
+            select(
+                Market.ticker,
+                Market.event_ticker,
+                Market.title,
+                Market.status,
+                category_col.label("category"),
+                Market.open_time,
+                Market.close_time,
+                LatestQuote.yes_bid,
+                LatestQuote.yes_ask,
+                LatestQuote.volume_24h,
+                LatestQuote.snapshot_time,
+            )
+            .join(LatestQuote, LatestQuote.ticker == Market.ticker)
+            .outerjoin(Event, Event.ticker == Market.event_ticker)
+        )
+        if status is not None:
+            stmt = stmt.where(Market.status == status)
+        if event_prefix:
+            stmt = stmt.where(
+                func.upper(Market.event_ticker).startswith(event_prefix.upper(), autoescape=True)
+            )
+        if category:
+            stmt = stmt.where(func.lower(func.trim(category_col)) == category.strip().lower())
+        if exclude_category:
+            stmt = stmt.where(
+                func.coalesce(func.lower(func.trim(category_col)), "")
+                != exclude_category.strip().lower()
+            )
+        result = await self._session.execute(stmt)
+        return result.all()
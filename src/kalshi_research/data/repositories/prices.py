@@ -2,17 +2,45 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
-from kalshi_research.data.models import PriceSnapshot
+from kalshi_research.data.models import LatestQuote, PriceRollup, PriceSnapshot, SnapshotBatch
 from kalshi_research.data.repositories.base import BaseRepository
+from kalshi_research.data.repositories.rollups import (
+    HOURLY,
+    ROLLUP_RESOLUTIONS,
+    PriceRollupRepository,
+)
+from kalshi_research.data.repositories.snapshot_batches import complete_batch_filter
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+_QUOTE_COLUMNS = (
+    "snapshot_time",
+    "yes_bid",
+    "yes_ask",
+    "no_bid",
+    "no_ask",
+    "last_price",
+    "volume",
+    "volume_24h",
+    "open_interest",
+)
+
+# SQLite returns bare columns from the row holding MAX(), so this picks each ticker's newest
+# snapshot in a single pass over the (ticker, snapshot_time) index.
+REBUILD_LATEST_QUOTES_SQL = f"""
+    INSERT OR REPLACE INTO latest_quotes (ticker, {", ".join(_QUOTE_COLUMNS)})
+    SELECT ticker, MAX(snapshot_time), {", ".join(_QUOTE_COLUMNS[1:])}
+    FROM price_snapshots
+    GROUP BY ticker
+"""
+
 
 class PriceRepository(BaseRepository[PriceSnapshot]):
     """Repository for PriceSnapshot entities."""
@@ -42,6 +70,44 @@ class PriceRepository(BaseRepository[PriceSnapshot]):
         result = await self._session.execute(stmt)
         return result.scalars().all()
 
+    async def get_history(
+        self,
+        ticker: str,
+        *,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        granularity: timedelta | None = None,
+        limit: int | None = None,
+    ) -> Sequence[PriceSnapshot] | Sequence[PriceRollup]:
+        """Price history at the coarsest stored resolution that is at least as fine as needed.
+
+        Daily or hourly rollups are used when their bucket width fits within `granularity`
+        (and they have rows in range); otherwise raw snapshots. When no raw snapshots remain in
+        range (they were pruned after downsampling), hourly rollups are returned instead.
+        Rows are newest first; `PriceRollup` rows expose the same `snapshot_time`, `midpoint`
+        and `implied_probability` as snapshots.
+
+        Args:
+            ticker: Market ticker.
+            start_time: Optional inclusive lower bound.
+            end_time: Optional inclusive upper bound.
+            granularity: Coarsest spacing between points the caller can use (None = raw).
+            limit: Optional maximum number of rows.
+        """
+        rollups = PriceRollupRepository(self._session)
+        if granularity is not None:
+            for resolution, width in reversed(ROLLUP_RESOLUTIONS.items()):
+                if width > granularity:
+                    continue
+                rows = await rollups.get_for_market(ticker, resolution, start_time, end_time, limit)
+                if rows:
+                    return rows
+
+        snapshots = await self.get_for_market(ticker, start_time, end_time, limit)
+        if snapshots:
+            return snapshots
+        return await rollups.get_for_market(ticker, HOURLY, start_time, end_time, limit)
+
     async def get_latest(self, ticker: str) -> PriceSnapshot | None:
         """Get the most recent price snapshot for a market."""
         stmt = (
@@ -59,3 +125,80 @@ class PriceRepository(BaseRepository[PriceSnapshot]):
         result = await self._session.execute(stmt)
         count = result.scalar()
         return count if count is not None else 0
+
+    async def get_latest_batch_snapshots(
+        self,
+        tickers: Sequence[str] | None = None,
+        *,
+        include_truncated: bool = False,
+    ) -> Sequence[PriceSnapshot]:
+        """Snapshots from the most recent complete batch (a consistent point-in-time view).
+
+        Resolves the batch from `snapshot_batches` and joins on `batch_id`, so the query reads
+        one index range instead of scanning for `MAX(snapshot_time)`.
+
+        Args:
+            tickers: Optional tickers to restrict to (default: every market in the batch).
+            include_truncated: Also accept batches whose sweep was cut short by `max_pages`.
+        """
+        latest_batch_id = (
+            select(SnapshotBatch.id)
+            .where(*complete_batch_filter(include_truncated=include_truncated))
+            .order_by(SnapshotBatch.snapshot_time.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        stmt = select(PriceSnapshot).where(PriceSnapshot.batch_id == latest_batch_id)
+        if tickers is not None:
+            stmt = stmt.where(PriceSnapshot.ticker.in_(list(tickers)))
+        result = await self._session.execute(stmt.order_by(PriceSnapshot.ticker))
+        return result.scalars().all()
+
+    async def upsert_latest_quotes(self, snapshots: Sequence[PriceSnapshot]) -> None:
+        """Record snapshots in `latest_quotes`, keeping the newest quote per ticker.
+
+        Runs in the caller's transaction so `latest_quotes` never runs ahead of
+        `price_snapshots`.
+        """
+        if not snapshots:
+            return
+        rows = [
+            {"ticker": s.ticker, **{col: getattr(s, col) for col in _QUOTE_COLUMNS}}
+            for s in snapshots
+        ]
+        stmt = sqlite_insert(LatestQuote).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[LatestQuote.ticker],
+            set_={col: getattr(stmt.excluded, col) for col in _QUOTE_COLUMNS},
+            where=stmt.excluded.snapshot_time >= LatestQuote.snapshot_time,
+        )
+        await self._session.execute(stmt)
+
+    async def rebuild_latest_quotes(self) -> int:
+        """Recompute `latest_quotes` from the full snapshot history.
+
+        Returns:
+            Number of tickers with a latest quote.
+        """
+        await self._session.execute(text(REBUILD_LATEST_QUOTES_SQL))
+        result = await self._session.execute(select(func.count()).select_from(LatestQuote))
+        return int(result.scalar_one())
+
+    async def get_latest_quote(self, ticker: str) -> LatestQuote | None:
+        """Get the latest quote for a market (primary-key lookup)."""
+        return await self._session.get(LatestQuote, ticker)
+
+    async def get_latest_quotes(self, tickers: Sequence[str]) -> dict[str, LatestQuote]:
+        """Get latest quotes for many markets, keyed by ticker."""
+        if not tickers:
+            return {}
+        stmt = select(LatestQuote).where(LatestQuote.ticker.in_(list(tickers)))
+        result = await self._session.execute(stmt)
+        return {quote.ticker: quote for quote in result.scalars().all()}
+
+    async def latest_quote_stats(self) -> tuple[int, datetime | None]:
+        """Return (number of quoted markets, most recent quote time)."""
+        stmt = select(func.count(LatestQuote.ticker), func.max(LatestQuote.snapshot_time))
+        result = await self._session.execute(stmt)
+        count, latest = result.one()
+        return int(count or 0), latest
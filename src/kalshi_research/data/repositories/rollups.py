@@ -0,0 +1,209 @@
+"""Price rollup repository (hourly/daily aggregates of price snapshots)."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import case, func, select, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from kalshi_research.data.models import PriceRollup
+from kalshi_research.data.repositories.base import BaseRepository
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from kalshi_research.data.models import PriceSnapshot
+
+HOURLY = "1h"
+DAILY = "1d"
+
+# Bucket width of each rollup resolution, finest first.
+ROLLUP_RESOLUTIONS: dict[str, timedelta] = {
+    HOURLY: timedelta(hours=1),
+    DAILY: timedelta(days=1),
+}
+
+# strftime() patterns producing bucket starts in SQLAlchemy's SQLite DATETIME storage format.
+_BUCKET_FORMATS = {
+    HOURLY: "%Y-%m-%d %H:00:00.000000",
+    DAILY: "%Y-%m-%d 00:00:00.000000",
+}
+
+_LAST_QUOTE_COLUMNS = (
+    "yes_bid",
+    "yes_ask",
+    "no_bid",
+    "no_ask",
+    "last_price",
+    "volume",
+    "volume_24h",
+    "open_interest",
+)
+
+# Recomputes rollups from raw snapshots with window functions: one row per (ticker, bucket),
+# taking the last quote of the bucket plus OHLC of the midpoint. Existing rollups are kept
+# (they were built incrementally and may cover snapshots that have since been pruned).
+BACKFILL_ROLLUPS_SQL = f"""
+    INSERT INTO price_rollups (
+        ticker, resolution, bucket_start, first_snapshot_time, snapshot_time, sample_count,
+        open_mid, high_mid, low_mid, close_mid, open_volume, {", ".join(_LAST_QUOTE_COLUMNS)}
+    )
+    SELECT
+        ticker, :resolution, bucket_start, first_snapshot_time, snapshot_time, sample_count,
+        open_mid, high_mid, low_mid, mid, open_volume, {", ".join(_LAST_QUOTE_COLUMNS)}
+    FROM (
+        SELECT
+            *,
+            ROW_NUMBER() OVER (bucket ORDER BY snapshot_time DESC) AS rn,
+            FIRST_VALUE(mid) OVER (bucket ORDER BY snapshot_time) AS open_mid,
+            FIRST_VALUE(volume) OVER (bucket ORDER BY snapshot_time) AS open_volume,
+            MIN(snapshot_time) OVER bucket AS first_snapshot_time,
+            MAX(mid) OVER bucket AS high_mid,
+            MIN(mid) OVER bucket AS low_mid,
+            COUNT(*) OVER bucket AS sample_count
+        FROM (
+            SELECT
+                ticker, snapshot_time, strftime(:bucket_format, snapshot_time) AS bucket_start,
+                (yes_bid + yes_ask) / 2.0 AS mid, {", ".join(_LAST_QUOTE_COLUMNS)}
+            FROM price_snapshots
+            WHERE snapshot_time >= COALESCE(:after, '')
+                AND snapshot_time < COALESCE(:before, '9999-12-31')
+        )
+        WINDOW bucket AS (PARTITION BY ticker, bucket_start)
+    )
+    WHERE rn = 1
+    ON CONFLICT (ticker, resolution, bucket_start) DO NOTHING
+"""
+
+
+def bucket_start(ts: datetime, resolution: str) -> datetime:
+    """Start of the `resolution` bucket containing `ts` (UTC)."""
+    ts = ts.astimezone(UTC) if ts.tzinfo is not None else ts.replace(tzinfo=UTC)
+    if resolution == HOURLY:
+        return ts.replace(minute=0, second=0, microsecond=0)
+    if resolution == DAILY:
+        return ts.replace(hour=0, minute=0, second=0, microsecond=0)
+    raise ValueError(f"Unknown rollup resolution: {resolution!r}")
+
+
+def backfill_params(
+    resolution: str, before: datetime | None = None, after: datetime | None = None
+) -> dict[str, Any]:
+    """Bind parameters for `BACKFILL_ROLLUPS_SQL` (also used by `create_tables()`)."""
+    return {
+        "resolution": resolution,
+        "bucket_format": _BUCKET_FORMATS[resolution],
+        "before": _sqlite_datetime(before),
+        "after": _sqlite_datetime(after),
+    }
+
+
+def _sqlite_datetime(ts: datetime | None) -> str | None:
+    return ts.astimezone(UTC).strftime("%Y-%m-%d %H:%M:%S.%f") if ts is not None else None
+
+
+class PriceRollupRepository(BaseRepository[PriceRollup]):
+    """Repository for PriceRollup entities."""
+
+    model = PriceRollup
+
+    async def upsert_snapshots(self, snapshots: Sequence[PriceSnapshot]) -> None:
+        """Fold new snapshots into their hourly and daily buckets.
+
+        Runs in the caller's transaction (the snapshot writer's page transaction), so rollups
+        never run ahead of `price_snapshots`. Each snapshot must be folded in exactly once.
+        """
+        if not snapshots:
+            return
+        for resolution in ROLLUP_RESOLUTIONS:
+            rows = [_rollup_row(s, resolution) for s in snapshots]
+            stmt = sqlite_insert(PriceRollup).values(rows)
+            new = stmt.excluded
+            newer = new.snapshot_time >= PriceRollup.snapshot_time
+            older = new.first_snapshot_time < PriceRollup.first_snapshot_time
+            set_: dict[str, Any] = {
+                "snapshot_time": case((newer, new.snapshot_time), else_=PriceRollup.snapshot_time),
+                "first_snapshot_time": case(
+                    (older, new.first_snapshot_time), else_=PriceRollup.first_snapshot_time
+                ),
+                "sample_count": PriceRollup.sample_count + new.sample_count,
+                "open_mid": case((older, new.open_mid), else_=PriceRollup.open_mid),
+                "open_volume": case((older, new.open_volume), else_=PriceRollup.open_volume),
+                "high_mid": func.max(PriceRollup.high_mid, new.high_mid),
+                "low_mid": func.min(PriceRollup.low_mid, new.low_mid),
+                "close_mid": case((newer, new.close_mid), else_=PriceRollup.close_mid),
+            }
+            for col in _LAST_QUOTE_COLUMNS:
+                set_[col] = case((newer, new[col]), else_=getattr(PriceRollup, col))
+            await self._session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[
+                        PriceRollup.ticker,
+                        PriceRollup.resolution,
+                        PriceRollup.bucket_start,
+                    ],
+                    set_=set_,
+                )
+            )
+
+    async def backfill(
+        self, *, before: datetime | None = None, after: datetime | None = None
+    ) -> None:
+        """Create rollups for buckets that have raw snapshots but no rollup row yet.
+
+        Used before raw snapshots are pruned (so nothing is lost at coarse resolution) and to
+        seed rollups for history recorded before they existed. `after`/`before` bound the
+        snapshots read; keep them on day boundaries so no bucket is built from partial data.
+        """
+        for resolution in ROLLUP_RESOLUTIONS:
+            await self._session.execute(
+                text(BACKFILL_ROLLUPS_SQL), backfill_params(resolution, before, after)
+            )
+
+    async def get_for_market(
+        self,
+        ticker: str,
+        resolution: str,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        limit: int | None = None,
+    ) -> Sequence[PriceRollup]:
+        """Rollups for a market, newest first; times filter on each bucket's last quote."""
+        stmt = select(PriceRollup).where(
+            PriceRollup.ticker == ticker, PriceRollup.resolution == resolution
+        )
+        if start_time is not None:
+            # The bucket_start bound keeps the scan on the primary key.
+            stmt = stmt.where(
+                PriceRollup.bucket_start > start_time - ROLLUP_RESOLUTIONS[resolution],
+                PriceRollup.snapshot_time >= start_time,
+            )
+        if end_time is not None:
+            stmt = stmt.where(
+                PriceRollup.bucket_start <= end_time, PriceRollup.snapshot_time <= end_time
+            )
+        stmt = stmt.order_by(PriceRollup.bucket_start.desc())
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        result = await self._session.execute(stmt)
+        return result.scalars().all()
+
+
+def _rollup_row(snapshot: PriceSnapshot, resolution: str) -> dict[str, Any]:
+    mid = snapshot.midpoint
+    return {
+        "ticker": snapshot.ticker,
+        "resolution": resolution,
+        "bucket_start": bucket_start(snapshot.snapshot_time, resolution),
+        "first_snapshot_time": snapshot.snapshot_time,
+        "snapshot_time": snapshot.snapshot_time,
+        "sample_count": 1,
+        "open_mid": mid,
+        "high_mid": mid,
+        "low_mid": mid,
+        "close_mid": mid,
+        "open_volume": snapshot.volume,
+        **{col: getattr(snapshot, col) for col in _LAST_QUOTE_COLUMNS},
+    }
@@ -6,9 +6,9 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, and_, cast, column, func, or_, select, table, text
+from sqlalchemy import String, and_, cast, column, or_, select, table, text
 
-from kalshi_research.data.models import Event, Market, PriceSnapshot
+from kalshi_research.data.models import Event, LatestQuote, Market
 from kalshi_research.data.search_utils import fts_tables_exist, has_fts5_support
 
 if TYPE_CHECKING:
@@ -121,16 +121,6 @@ class SearchRepository:
         limit: int = 20,
     ) -> Sequence[MarketSearchResult]:
         """Search using FTS5 virtual tables."""
-        # Build latest snapshot CTE
-        latest_cte = (
-            select(
-                PriceSnapshot.ticker,
-                func.max(PriceSnapshot.snapshot_time).label("max_time"),
-            )
-            .group_by(PriceSnapshot.ticker)
-            .cte("latest")
-        )
-
         # Create a virtual table reference for the FTS5 table
         market_fts = table(
             "market_fts",
@@ -150,23 +140,16 @@ class SearchRepository:
                 Market.event_ticker,
                 Event.category,
                 Market.status,
-                ((PriceSnapshot.yes_bid + PriceSnapshot.yes_ask) / 2.0).label("midpoint"),
-                (PriceSnapshot.yes_ask - PriceSnapshot.yes_bid).label("spread"),
-                PriceSnapshot.volume_24h,
+                ((LatestQuote.yes_bid + LatestQuote.yes_ask) / 2.0).label("midpoint"),
+                (LatestQuote.yes_ask - LatestQuote.yes_bid).label("spread"),
+                LatestQuote.volume_24h,
                 Market.close_time,
                 Market.expiration_time,
             )
             .select_from(market_fts)
             .join(Market, market_fts.c.ticker == Market.ticker)
             .join(Event, Market.event_ticker == Event.ticker)
-            .outerjoin(latest_cte, Market.ticker == latest_cte.c.ticker)
-            .outerjoin(
-                PriceSnapshot,
-                and_(
-                    PriceSnapshot.ticker == Market.ticker,
-                    PriceSnapshot.snapshot_time == latest_cte.c.max_time,
-                ),
-            )
+            .outerjoin(LatestQuote, LatestQuote.ticker == Market.ticker)
             .where(text("market_fts MATCH :query"))
             .order_by(text("rank"))
         )
@@ -182,9 +165,9 @@ class SearchRepository:
         if series_ticker:
             conditions.append(Market.series_ticker == series_ticker)
         if min_volume is not None:
-            conditions.append(PriceSnapshot.volume_24h >= min_volume)
+            conditions.append(LatestQuote.volume_24h >= min_volume)
         if max_spread is not None:
-            conditions.append((PriceSnapshot.yes_ask - PriceSnapshot.yes_bid) <= max_spread)
+            conditions.append((LatestQuote.yes_ask - LatestQuote.yes_bid) <= max_spread)
 
         if conditions:
             stmt = stmt.where(and_(*conditions))
@@ -224,16 +207,6 @@ class SearchRepository:
         limit: int = 20,
     ) -> Sequence[MarketSearchResult]:
         """Search using LIKE fallback (when FTS5 is unavailable)."""
-        # Build latest snapshot CTE
-        latest_cte = (
-            select(
-                PriceSnapshot.ticker,
-                func.max(PriceSnapshot.snapshot_time).label("max_time"),
-            )
-            .group_by(PriceSnapshot.ticker)
-            .cte("latest")
-        )
-
         # Build the base query
         stmt = (
             select(
@@ -243,22 +216,15 @@ class SearchRepository:
                 Market.event_ticker,
                 Event.category,
                 Market.status,
-                ((PriceSnapshot.yes_bid + PriceSnapshot.yes_ask) / 2.0).label("midpoint"),
-                (PriceSnapshot.yes_ask - PriceSnapshot.yes_bid).label("spread"),
-                PriceSnapshot.volume_24h,
+                ((LatestQuote.yes_bid + LatestQuote.yes_ask) / 2.0).label("midpoint"),
+                (LatestQuote.yes_ask - LatestQuote.yes_bid).label("spread"),
+                LatestQuote.volume_24h,
                 Market.close_time,
                 Market.expiration_time,
             )
             .select_from(Market)
             .join(Event, Market.event_ticker == Event.ticker)
-            .outerjoin(latest_cte, Market.ticker == latest_cte.c.ticker)
-            .outerjoin(
-                PriceSnapshot,
-                and_(
-                    PriceSnapshot.ticker == Market.ticker,
-                    PriceSnapshot.snapshot_time == latest_cte.c.max_time,
-                ),
-            )
+            .outerjoin(LatestQuote, LatestQuote.ticker == Market.ticker)
         )
 
         # Apply keyword search using LIKE
@@ -283,9 +249,9 @@ class SearchRepository:
         if series_ticker:
             conditions.append(Market.series_ticker == series_ticker)
         if min_volume is not None:
-            conditions.append(PriceSnapshot.volume_24h >= min_volume)
+            conditions.append(LatestQuote.volume_24h >= min_volume)
         if max_spread is not None:
-            conditions.append((PriceSnapshot.yes_ask - PriceSnapshot.yes_bid) <= max_spread)
+            conditions.append((LatestQuote.yes_ask - LatestQuote.yes_bid) <= max_spread)
 
         if conditions:
             stmt = stmt.where(and_(*conditions))
@@ -0,0 +1,121 @@
+"""Daily news sentiment rollup repository (per market and sentiment method)."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import case, func, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from kalshi_research.data.models import (
+    NewsArticle,
+    NewsArticleMarket,
+    NewsSentiment,
+    NewsSentimentDaily,
+)
+from kalshi_research.data.repositories.base import BaseRepository
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+    from sqlalchemy import ColumnElement, Select
+
+# strftime() pattern producing day buckets in SQLAlchemy's SQLite DATETIME storage format.
+_DAY_FORMAT = "%Y-%m-%d 00:00:00.000000"
+
+_TOTAL_COLUMNS = (
+    "article_count",
+    "score_sum",
+    "score_sq_sum",
+    "positive_count",
+    "negative_count",
+    "neutral_count",
+)
+
+# Builds every daily rollup from stored sentiment; existing rows are kept (they may cover
+# articles that have since been pruned).
+BACKFILL_SENTIMENT_DAILY_SQL = f"""
+    INSERT INTO news_sentiment_daily (ticker, method, bucket_start, {", ".join(_TOTAL_COLUMNS)})
+    SELECT
+        m.ticker,
+        s.method,
+        strftime('{_DAY_FORMAT}', a.collected_at),
+        COUNT(*),
+        SUM(s.score),
+        SUM(s.score * s.score),
+        SUM(s.label = 'positive'),
+        SUM(s.label = 'negative'),
+        SUM(s.label = 'neutral')
+    FROM news_sentiments s
+    JOIN news_articles a ON a.id = s.article_id
+    JOIN news_article_markets m ON m.article_id = a.id
+    WHERE true
+    GROUP BY 1, 2, 3
+    ON CONFLICT (ticker, method, bucket_start) DO NOTHING
+"""
+
+
+def _label_count(label: str) -> ColumnElement[Any]:
+    return func.sum(case((NewsSentiment.label == label, 1), else_=0))
+
+
+def _daily_totals(sign: int = 1) -> Select[Any]:
+    day = func.strftime(_DAY_FORMAT, NewsArticle.collected_at)
+    return (
+        select(
+            NewsArticleMarket.ticker,
+            NewsSentiment.method,
+            day,
+            func.count() * sign,
+            func.sum(NewsSentiment.score) * sign,
+            func.sum(NewsSentiment.score * NewsSentiment.score) * sign,
+            _label_count("positive") * sign,
+            _label_count("negative") * sign,
+            _label_count("neutral") * sign,
+        )
+        .join(NewsArticle, NewsArticle.id == NewsSentiment.article_id)
+        .join(NewsArticleMarket, NewsArticleMarket.article_id == NewsArticle.id)
+        .group_by(NewsArticleMarket.ticker, NewsSentiment.method, day)
+    )
+
+
+class SentimentRollupRepository(BaseRepository[NewsSentimentDaily]):
+    """Repository for NewsSentimentDaily entities.
+
+    Rollups are maintained by deltas rather than rebuilt from `news_sentiments`: a day's totals
+    may include articles that `kalshi data prune` has since deleted, and rebuilding the day
+    from the articles still stored would drop them.
+    """
+
+    model = NewsSentimentDaily
+
+    async def remove_articles(self, article_ids: Collection[int]) -> None:
+        """Subtract the articles' current sentiment rows from their market rollups.
+
+        Call before scoring, re-scoring or linking the articles, and `add_articles()` with the
+        same ids afterwards, in the same transaction.
+        """
+        await self._apply(article_ids, sign=-1)
+
+    async def add_articles(self, article_ids: Collection[int]) -> None:
+        """Add the articles' current sentiment rows to their market rollups."""
+        await self._apply(article_ids, sign=1)
+
+    async def _apply(self, article_ids: Collection[int], *, sign: int) -> None:
+        if not article_ids:
+            return
+        totals = _daily_totals(sign).where(NewsSentiment.article_id.in_(article_ids))
+        stmt = sqlite_insert(NewsSentimentDaily).from_select(
+            ["ticker", "method", "bucket_start", *_TOTAL_COLUMNS], totals
+        )
+        daily = NewsSentimentDaily.__table__.c
+        await self._session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[
+                    NewsSentimentDaily.ticker,
+                    NewsSentimentDaily.method,
+                    NewsSentimentDaily.bucket_start,
+                ],
+                set_={column: daily[column] + stmt.excluded[column] for column in _TOTAL_COLUMNS},
+            )
+        )
@@ -0,0 +1,87 @@
+"""Snapshot batch repository for data access."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import ColumnElement, select, update
+
+from kalshi_research.data.models import SnapshotBatch, utc_now
+from kalshi_research.data.repositories.base import BaseRepository
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+BATCH_RUNNING = "running"
+BATCH_COMPLETE = "complete"
+BATCH_FAILED = "failed"
+
+
+class SnapshotBatchRepository(BaseRepository[SnapshotBatch]):
+    """Repository for SnapshotBatch entities (snapshot run markers)."""
+
+    model = SnapshotBatch
+
+    async def start(
+        self, snapshot_time: datetime, *, status_filter: str | None = None
+    ) -> SnapshotBatch:
+        """Record a new running batch for `snapshot_time`."""
+        return await self.add(
+            SnapshotBatch(
+                snapshot_time=snapshot_time,
+                status=BATCH_RUNNING,
+                status_filter=status_filter,
+            )
+        )
+
+    async def finish(
+        self,
+        batch_id: int,
+        *,
+        status: str,
+        market_count: int,
+        skipped_count: int,
+        truncated: bool = False,
+    ) -> None:
+        """Mark a batch complete or failed and record its coverage."""
+        await self._session.execute(
+            update(SnapshotBatch)
+            .where(SnapshotBatch.id == batch_id)
+            .values(
+                status=status,
+                finished_at=utc_now(),
+                market_count=market_count,
+                skipped_count=skipped_count,
+                truncated=truncated,
+            )
+        )
+
+    async def get_by_snapshot_time(self, snapshot_time: datetime) -> SnapshotBatch | None:
+        """Batch recorded for `snapshot_time`, if any (snapshot times are unique)."""
+        result = await self._session.execute(
+            select(SnapshotBatch).where(SnapshotBatch.snapshot_time == snapshot_time)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_latest_complete(self, *, include_truncated: bool = False) -> SnapshotBatch | None:
+        """Most recent batch whose rows form a complete point-in-time snapshot.
+
+        Args:
+            include_truncated: Also accept batches whose sweep was cut short by `max_pages`.
+        """
+        stmt = (
+            select(SnapshotBatch)
+            .where(*complete_batch_filter(include_truncated=include_truncated))
+            .order_by(SnapshotBatch.snapshot_time.desc())
+            .limit(1)
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
+
+def complete_batch_filter(*, include_truncated: bool = False) -> list[ColumnElement[bool]]:
+    """WHERE clauses selecting complete (and, by default, untruncated) batches."""
+    clauses = [SnapshotBatch.status == BATCH_COMPLETE]
+    if not include_truncated:
+        clauses.append(SnapshotBatch.truncated.is_(False))
+    return clauses
@@ -3,88 +3,181 @@
 from __future__ import annotations
 
 import asyncio
+import json
+import random
 import time
+import uuid
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 
 import structlog
 
+from kalshi_research.data._scheduler_stats import RunOutcome, TaskStats
+
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
+    from pathlib import Path
 
 logger = structlog.get_logger()
 
+__all__ = ["DataScheduler", "TaskStats"]
+
 
 class DataScheduler:
     """
     Async scheduler for data collection tasks with drift correction.
 
     Uses monotonic time to prevent drift from execution time or
-    system clock changes.
+    system clock changes. Interval tasks keep per-task `TaskStats` (run durations,
+    overruns, skipped slots, start lag), optionally written to a JSON status file
+    after every run.
     """
 
-    def __init__(self) -> None:
-        """Initialize the scheduler."""
+    def __init__(self, *, status_path: Path | None = None) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            status_path: Optional JSON file rewritten with every task's stats after each run.
+        """
         self.tasks: list[asyncio.Task[None]] = []
         self.running = False
+        self._started = asyncio.Event()
+        self._stats: dict[str, TaskStats] = {}
+        self._status_path = status_path
+
+    @property
+    def stats(self) -> dict[str, TaskStats]:
+        """Run statistics for each interval task, keyed by task name."""
+        return dict(self._stats)
 
     async def schedule_interval(
         self,
         name: str,
         func: Callable[[], Awaitable[None]],
-        interval_seconds: int,
+        interval_seconds: float,
         *,
         run_immediately: bool = True,
+        jitter_seconds: float = 0.0,
+        deadline_seconds: float | None = None,
     ) -> None:
         """
         Schedule a function to run at fixed intervals.
 
-        Corrects for execution time drift using monotonic clock.
+        Corrects for execution time drift using monotonic clock. Runs never overlap: a run
+        that outlasts its interval is counted as an overrun and the slots it covered are
+        skipped (counted as missed runs).
 
         Args:
             name: Human-readable name for logging
             func: Async function to call
             interval_seconds: Interval between runs in seconds
             run_immediately: Whether to run once immediately after start
+            jitter_seconds: Delay each run by a random 0..jitter_seconds (spreads load from
+                several collectors); the schedule itself does not drift
+            deadline_seconds: Cancel a run that takes longer than this (counted as a timeout)
         """
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be positive")
+        if jitter_seconds < 0 or jitter_seconds >= interval_seconds:
+            raise ValueError("jitter_seconds must be in [0, interval_seconds)")
+        if deadline_seconds is not None and deadline_seconds <= 0:
+            raise ValueError("deadline_seconds must be positive")
+
+        stats = TaskStats(
+            name=name,
+            interval_seconds=interval_seconds,
+            jitter_seconds=jitter_seconds,
+            deadline_seconds=deadline_seconds,
+        )
+        self._stats[name] = stats
 
         async def runner() -> None:
+            # Allow scheduling before start(); tasks wait until the scheduler is running.
+            await self._started.wait()
             # Use monotonic time for drift correction (safer than wall clock)
-            initialized = False
-            next_run = 0.0
+            now = time.monotonic()
+            next_run = now if run_immediately else now + interval_seconds
             while True:
-                if not self.running:
-                    # Allow scheduling before start(); tasks will wait until running = True.
-                    initialized = False
-                    await asyncio.sleep(0.1)
-                    continue
-
-                if not initialized:
-                    now = time.monotonic()
-                    next_run = now if run_immediately else now + interval_seconds
-                    initialized = True
-
-                now = time.monotonic()
-                if now >= next_run:
-                    try:
-                        logger.info("Running scheduled task", task_name=name)
-                        await func()
-                        logger.info("Scheduled task completed", task_name=name)
-                    except Exception:
-                        logger.exception("Scheduled task failed", task_name=name)
-
-                    # Calculate next run time
+                planned = next_run + (random.uniform(0, jitter_seconds) if jitter_seconds else 0)
+                stats.next_run_at = _wall_clock_at(planned)
+                await asyncio.sleep(max(0.0, planned - time.monotonic()))
+
+                started = time.monotonic()
+                started_at = datetime.now(UTC)
+                outcome = await self._run_once(name, func, deadline_seconds)
+                finished = time.monotonic()
+
+                # Calculate next run time; skip slots that passed while this run was in progress.
+                next_run += interval_seconds
+                missed = 0
+                while next_run <= finished:
                     next_run += interval_seconds
-                    # If we fell way behind, skip intervals to catch up
-                    while next_run <= time.monotonic():
-                        next_run += interval_seconds
-
-                # Sleep until next run
-                sleep_duration = max(0, next_run - time.monotonic())
-                await asyncio.sleep(sleep_duration)
+                    missed += 1
+
+                duration = finished - started
+                stats.record_run(
+                    started_at=started_at,
+                    duration_seconds=duration,
+                    lag_seconds=max(0.0, started - planned),
+                    outcome=outcome,
+                    missed_runs=missed,
+                )
+                stats.next_run_at = _wall_clock_at(next_run)
+                if duration > interval_seconds:
+                    logger.warning(
+                        "Scheduled task overran its interval",
+                        task_name=name,
+                        duration_seconds=round(duration, 3),
+                        interval_seconds=interval_seconds,
+                        missed_runs=missed,
+                    )
+                await self._write_status()
 
         task = asyncio.create_task(runner())
         self.tasks.append(task)
 
+    async def _run_once(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[None]],
+        deadline_seconds: float | None,
+    ) -> RunOutcome:
+        deadline = asyncio.timeout(deadline_seconds)
+        try:
+            logger.info("Running scheduled task", task_name=name)
+            async with deadline:
+                await func()
+            logger.info("Scheduled task completed", task_name=name)
+        except TimeoutError:
+            if not deadline.expired():
+                logger.exception("Scheduled task failed", task_name=name)
+                return "failed"
+            logger.warning(
+                "Scheduled task cancelled at deadline",
+                task_name=name,
+                deadline_seconds=deadline_seconds,
+            )
+            return "timeout"
+        except Exception:
+            logger.exception("Scheduled task failed", task_name=name)
+            return "failed"
+        return "ok"
+
+    async def _write_status(self) -> None:
+        if self._status_path is None:
+            return
+        payload: dict[str, object] = {
+            "updated_at": datetime.now(UTC).isoformat(),
+            "tasks": {name: s.to_dict() for name, s in self._stats.items()},
+        }
+        try:
+            await asyncio.to_thread(_write_json_atomic, self._status_path, payload)
+        except OSError as e:
+            logger.warning(
+                "Failed to write scheduler status", path=str(self._status_path), error=str(e)
+            )
+
     async def schedule_once(
         self,
         name: str,
@@ -116,11 +209,13 @@ class DataScheduler:
     async def start(self) -> None:
         """Start the scheduler."""
         self.running = True
+        self._started.set()
         logger.info("Scheduler started")
 
     async def stop(self) -> None:
         """Stop all scheduled tasks."""
         self.running = False
+        self._started.clear()
         for task in self.tasks:
             task.cancel()
         await asyncio.gather(*self.tasks, return_exceptions=True)
@@ -140,3 +235,18 @@ class DataScheduler:
     ) -> None:
         """Exit async context manager."""
         await self.stop()
+
+
+def _wall_clock_at(monotonic_ts: float) -> datetime:
+    """Convert a future `time.monotonic()` timestamp to an approximate UTC datetime."""
+    return datetime.now(UTC) + timedelta(seconds=monotonic_ts - time.monotonic())
+
+
+def _write_json_atomic(path: Path, payload: dict[str, object]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp.{uuid.uuid4().hex}")
+    try:
+        tmp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        tmp_path.replace(path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
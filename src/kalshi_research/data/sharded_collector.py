@@ -0,0 +1,300 @@
+"""Sharded price snapshots: parallel API sweeps in worker processes, one database writer.
+
+A single `get_all_markets()` sweep is sequential (each page needs the previous page's cursor),
+so snapshot cycle time is bounded by page latency rather than by the account's rate tier. The
+`ShardedSnapshotCollector` splits the open-market universe into disjoint `created_ts` windows,
+sweeps each window in its own process, and streams the pages back over a bounded queue to the
+parent, which remains the only process writing to SQLite.
+
+All workers draw from one `SharedTokenBucket`, so N shards together stay within the tier's
+read budget. Window boundaries are re-planned every cycle from the creation times seen in the
+previous cycle, which keeps shards roughly equal in size as the universe changes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import queue
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from kalshi_research.api.client import KalshiPublicClient
+from kalshi_research.api.market_cache import MarketSweep
+from kalshi_research.api.rate_limiter import RateLimiter, RateTier, SharedTokenBucket
+from kalshi_research.constants import DEFAULT_SHARD_QUEUE_PAGES_PER_WORKER
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
+    from multiprocessing.process import BaseProcess
+
+    from kalshi_research.api import Market
+    from kalshi_research.data.fetcher import DataFetcher
+
+logger = structlog.get_logger()
+
+# How long the writer waits on the queue before checking that workers are still alive.
+_QUEUE_POLL_SECONDS = 1.0
+
+
+@dataclass(frozen=True)
+class MarketShard:
+    """One partition of the market universe: markets created within a time window."""
+
+    index: int
+    min_created_ts: int | None = None
+    max_created_ts: int | None = None
+
+
+@dataclass(frozen=True)
+class ShardMessage:
+    """A message from a shard worker: a page of markets, completion, or failure."""
+
+    shard: int
+    markets: list[Market] = field(default_factory=list)
+    done: bool = False
+    # Set on the completion message when the shard stopped at `max_pages`.
+    truncated: bool = False
+    error: str | None = None
+
+
+def plan_shards(created_ts: Sequence[int], shards: int) -> list[MarketShard]:
+    """
+    Split the universe into `shards` windows holding roughly equal numbers of markets.
+
+    Boundaries are quantiles of `created_ts` (creation times seen in the previous sweep). The
+    first window is open below and the last open above, so markets created since the previous
+    sweep still land in a shard. Adjacent windows overlap by a second on each side to cover
+    either boundary semantics of the API filters; the writer drops the duplicates.
+
+    Args:
+        created_ts: Unix creation timestamps from the previous sweep (may be empty).
+        shards: Desired number of shards.
+
+    Returns:
+        The shard plan (a single unbounded shard when there is no usable history).
+    """
+    if shards <= 1 or len(created_ts) < shards:
+        return [MarketShard(0)]
+
+    ordered = sorted(created_ts)
+    bounds = sorted({ordered[len(ordered) * k // shards] for k in range(1, shards)})
+    plan: list[MarketShard] = []
+    for i in range(len(bounds) + 1):
+        plan.append(
+            MarketShard(
+                index=i,
+                min_created_ts=bounds[i - 1] - 1 if i > 0 else None,
+                max_created_ts=bounds[i] + 1 if i < len(bounds) else None,
+            )
+        )
+    return plan
+
+
+async def sweep_shard(
+    client: KalshiPublicClient,
+    shard: MarketShard,
+    out: Any,
+    *,
+    status: str | None = "open",
+    max_pages: int | None = None,
+    sweep: MarketSweep | None = None,
+) -> int:
+    """
+    Page through one shard and put each page on `out` (a queue with a blocking `put`).
+
+    `sweep`, when given, is filled in with the page count and whether `max_pages` cut the
+    shard short.
+
+    Returns:
+        Number of markets sent.
+    """
+    sent = 0
+    pages = 0
+    cursor: str | None = None
+    while True:
+        # 1000 is Kalshi API max limit per page (see docs/_vendor-docs/kalshi-api-reference.md)
+        markets, cursor = await client.get_markets_page(
+            status=status,
+            min_created_ts=shard.min_created_ts,
+            max_created_ts=shard.max_created_ts,
+            limit=1000,
+            cursor=cursor,
+        )
+        if markets:
+            # A full queue means the writer is behind; block this worker until it catches up.
+            await asyncio.to_thread(out.put, ShardMessage(shard.index, markets))
+            sent += len(markets)
+        if sweep is not None:
+            sweep.pages += 1
+        if not cursor or not markets:
+            break
+        pages += 1
+        if max_pages is not None and pages >= max_pages:
+            logger.warning("Shard sweep truncated by max_pages", shard=shard.index)
+            if sweep is not None:
+                sweep.truncated = True
+            break
+    return sent
+
+
+def run_shard_worker(
+    shard: MarketShard,
+    out: Any,
+    read_bucket: SharedTokenBucket,
+    *,
+    environment: str | None,
+    rate_tier: str,
+    status: str | None,
+    max_pages: int | None,
+) -> None:
+    """Process entry point: sweep one shard, then report completion or failure on `out`."""
+    sweep = MarketSweep()
+
+    async def _run() -> int:
+        limiter = RateLimiter(RateTier(rate_tier), read_bucket=read_bucket)
+        async with KalshiPublicClient(environment=environment, rate_limiter=limiter) as client:
+            return await sweep_shard(
+                client, shard, out, status=status, max_pages=max_pages, sweep=sweep
+            )
+
+    try:
+        sent = asyncio.run(_run())
+    except Exception as exc:
+        out.put(ShardMessage(shard.index, error=f"{type(exc).__name__}: {exc}"))
+    else:
+        out.put(ShardMessage(shard.index, done=True, truncated=sweep.truncated))
+        logger.debug("Shard sweep complete", shard=shard.index, markets=sent)
+
+
+class ShardedSnapshotCollector:
+    """
+    Take price snapshots by sweeping the universe in parallel worker processes.
+
+    Workers only fetch and validate API pages; every row is written by the parent through
+    `DataFetcher.take_snapshot_from()` as one snapshot batch, exactly like `take_snapshot()`.
+    The first cycle has no creation-time history and runs as a single shard.
+    """
+
+    def __init__(
+        self,
+        fetcher: DataFetcher,
+        *,
+        shards: int,
+        rate_tier: RateTier | str = RateTier.BASIC,
+        environment: str | None = None,
+        status: str | None = "open",
+        max_pages: int | None = None,
+    ) -> None:
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        if status not in (None, "open", "unopened"):
+            # The API only combines created_ts filters with these statuses.
+            raise ValueError("Sharded snapshots support status open, unopened or None")
+        self._fetcher = fetcher
+        self._shards = shards
+        self._rate_tier = RateTier(rate_tier)
+        self._environment = environment
+        self._status = status
+        self._max_pages = max_pages
+        self._context = multiprocessing.get_context("spawn")
+        self._created_ts: list[int] = []
+
+    def plan(self) -> list[MarketShard]:
+        """Shard plan for the next cycle."""
+        return plan_shards(self._created_ts, self._shards)
+
+    async def take_snapshot(self) -> int:
+        """Run one sharded sweep and write it as a single snapshot. Returns snapshots taken."""
+        plan = self.plan()
+        out = self._context.Queue(maxsize=len(plan) * DEFAULT_SHARD_QUEUE_PAGES_PER_WORKER)
+        bucket = SharedTokenBucket.for_tier(self._rate_tier, context=self._context)
+        logger.info("Starting sharded snapshot", shards=len(plan), rate_tier=self._rate_tier.value)
+
+        workers = self._start_workers(plan, out, bucket)
+        created_ts: list[int] = []
+        sweep = MarketSweep()
+        try:
+            count = await self._fetcher.take_snapshot_from(
+                self._markets_from_workers(out, workers, created_ts, sweep),
+                status_filter=self._status,
+                sweep=sweep,
+            )
+        finally:
+            for worker in workers:
+                if worker.is_alive():
+                    worker.terminate()
+                worker.join(timeout=5)
+            out.close()
+
+        self._created_ts = created_ts
+        return count
+
+    def _start_workers(
+        self, plan: Sequence[MarketShard], out: Any, bucket: SharedTokenBucket
+    ) -> list[BaseProcess]:
+        workers: list[BaseProcess] = []
+        for shard in plan:
+            worker = self._context.Process(
+                target=run_shard_worker,
+                args=(shard, out, bucket),
+                kwargs={
+                    "environment": self._environment,
+                    "rate_tier": self._rate_tier.value,
+                    "status": self._status,
+                    "max_pages": self._max_pages,
+                },
+                name=f"kalshi-snapshot-shard-{shard.index}",
+                daemon=True,
+            )
+            worker.start()
+            workers.append(worker)
+        return workers
+
+    async def _markets_from_workers(
+        self,
+        out: Any,
+        workers: Sequence[BaseProcess],
+        created_ts: list[int],
+        sweep: MarketSweep | None = None,
+    ) -> AsyncIterator[Market]:
+        """Yield each market once, as pages arrive, until every shard reports completion.
+
+        `sweep` is marked truncated if any shard stopped at `max_pages`.
+        """
+        pending = set(range(len(workers)))
+        seen: set[str] = set()
+        idle_polls = 0
+        while pending:
+            try:
+                message: ShardMessage = await asyncio.to_thread(out.get, True, _QUEUE_POLL_SECONDS)
+            except queue.Empty:
+                # A worker that died without reporting (killed, crashed interpreter) never will.
+                # Allow one extra poll for messages it flushed just before exiting.
+                dead = [i for i in pending if not workers[i].is_alive()]
+                idle_polls = idle_polls + 1 if dead else 0
+                if dead and idle_polls > 1:
+                    raise RuntimeError(
+                        f"Snapshot shard worker(s) exited unexpectedly: {dead}"
+                    ) from None
+                continue
+
+            idle_polls = 0
+            if message.error is not None:
+                raise RuntimeError(f"Snapshot shard {message.shard} failed: {message.error}")
+            if message.done:
+                pending.discard(message.shard)
+                if sweep is not None and message.truncated:
+                    sweep.truncated = True
+                continue
+            if sweep is not None:
+                sweep.pages += 1
+            for market in message.markets:
+                if market.ticker in seen:
+                    continue
+                seen.add(market.ticker)
+                if market.created_time is not None:
+                    created_ts.append(int(market.created_time.timestamp()))
+                yield market
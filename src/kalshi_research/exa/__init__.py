@@ -1,12 +1,13 @@
 """Exa API integration (typed async client + models)."""
 
-from kalshi_research.exa.cache import CacheEntry, ExaCache
+from kalshi_research.exa.cache import CacheEntry, CacheStats, ExaCache
 from kalshi_research.exa.client import ExaClient
 from kalshi_research.exa.config import ExaConfig
 from kalshi_research.exa.exceptions import ExaAPIError, ExaAuthError, ExaError, ExaRateLimitError
 
 __all__ = [
     "CacheEntry",
+    "CacheStats",
     "ExaAPIError",
     "ExaAuthError",
     "ExaCache",
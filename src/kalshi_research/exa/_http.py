@@ -7,11 +7,14 @@ import json
 import math
 from datetime import UTC, datetime
 from email.utils import parsedate_to_datetime
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 import httpx
 import structlog
 
+from kalshi_research.exa._singleflight import SingleFlight
+from kalshi_research.exa.cache import make_cache_key
 from kalshi_research.exa.config import ExaConfig
 from kalshi_research.exa.exceptions import ExaAPIError, ExaAuthError, ExaRateLimitError
 
@@ -20,6 +23,13 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger()
 
+# POST endpoints that only read, and so may share an in-flight response.
+_COALESCED_POST_PATHS = frozenset({"/search", "/findSimilar", "/contents", "/answer"})
+
+
+def _is_coalesced(method: str, path: str) -> bool:
+    return method == "GET" or (method == "POST" and path in _COALESCED_POST_PATHS)
+
 
 class ExaHTTPBase:
     """
@@ -34,6 +44,7 @@ class ExaHTTPBase:
     def __init__(self, config: ExaConfig) -> None:
         self._config = config
         self._client: httpx.AsyncClient | None = None
+        self._single_flight = SingleFlight()
 
     @classmethod
     def from_env(cls) -> ExaHTTPBase:
@@ -103,6 +114,10 @@ class ExaHTTPBase:
     ) -> dict[str, Any]:
         """Send an Exa API request with retries and JSON parsing.
 
+        Read-only requests (`GET`, plus `POST` to read-only endpoints) are coalesced: while one is
+        in flight, identical requests from other tasks await its outcome instead of being sent;
+        their copies of the response carry no `costDollars`.
+
         Retries transient failures up to `self._config.max_retries`:
         - `429` responses are retried using the `Retry-After` header when available.
         - `5xx` responses are retried with a linear backoff.
@@ -122,6 +137,28 @@ class ExaHTTPBase:
             ExaRateLimitError: If Exa returns `429` and retries are exhausted.
             ExaAPIError: For other non-success status codes or invalid JSON responses.
         """
+        if not _is_coalesced(method, path):
+            return await self._send_request(method, path, params=params, json_body=json_body)
+        key = make_cache_key(f"{method} {path}", {"params": params, "json": json_body})
+        data, coalesced = await self._single_flight.run(
+            key,
+            partial(self._send_request, method, path, params=params, json_body=json_body),
+        )
+        if coalesced and "costDollars" in data:
+            # Only the caller that sent the request paid for it; budgets and research steps of
+            # the callers sharing its response record zero cost.
+            data = {name: value for name, value in data.items() if name != "costDollars"}
+        return data
+
+    async def _send_request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json_body: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Send one request (no coalescing); see `_request`."""
         last_exception: Exception | None = None
 
         for attempt in range(self._config.max_retries):
@@ -0,0 +1,75 @@
+"""In-flight request coalescing ("single flight") for Exa clients.
+
+`ExaCache` only helps once a response has been stored. Researchers, the agent and the news
+collector sharing a client often fire the same search at the same moment; a `SingleFlight` lets
+the first caller's request serve every identical request issued while it is still in flight.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+import structlog
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+logger = structlog.get_logger()
+
+_T = TypeVar("_T")
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time and shares its outcome with concurrent callers.
+
+    The first caller for a key runs the call in its own task; callers arriving while it runs
+    await its result (or exception) instead, so results must be treated as read-only. Completed
+    calls are forgotten immediately: this deduplicates concurrent work, it does not cache. If the
+    running caller is cancelled, its waiters are not: one of them runs the call again.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[str, asyncio.Future[Any]] = {}
+        self.coalesced = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running."""
+        return len(self._flights)
+
+    async def run(self, key: str, call: Callable[[], Awaitable[_T]]) -> tuple[_T, bool]:
+        """Await `call()`, or the already running call registered under `key`.
+
+        Returns:
+            The result, and whether it was shared from another caller's call. Only the caller
+            that ran the call should account for its cost.
+        """
+        while (flight := self._flights.get(key)) is not None:
+            self.coalesced += 1
+            logger.debug("Coalesced in-flight Exa request", key=key)
+            try:
+                return cast("_T", await asyncio.shield(flight)), True
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if not flight.cancelled() or (task is not None and task.cancelling()):
+                    raise
+                # The running caller was cancelled, not us: take over the call.
+
+        flight = asyncio.get_running_loop().create_future()
+        self._flights[key] = flight
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except BaseException as exc:
+            flight.set_exception(exc)
+            # Mark the exception retrieved: with no waiters it would be logged as unhandled.
+            flight.exception()
+            raise
+        else:
+            flight.set_result(result)
+            return result, False
+        finally:
+            del self._flights[key]
@@ -1,22 +1,73 @@
-"""Simple file-based cache for Exa API responses."""
+"""SQLite-backed cache for Exa API responses.
+
+All entries live in one SQLite file (`exa_cache.db` in the cache directory) instead of one JSON
+file per key. Payloads are stored zlib-compressed, expiry and recency are indexed, and the total
+payload size is capped: once it exceeds `max_bytes`, expired entries and then the least recently
+used ones are evicted. The database runs in WAL mode, so several processes can share a cache.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
+import sqlite3
+import threading
+import time
+import zlib
 from dataclasses import dataclass
-from datetime import UTC, datetime, timedelta
-from typing import TYPE_CHECKING, Any
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Self
 
 import structlog
 
-from kalshi_research.paths import DEFAULT_DATA_DIR
+from kalshi_research.constants import DEFAULT_EXA_CACHE_MAX_BYTES
+from kalshi_research.paths import DEFAULT_EXA_CACHE_DIR
 
 if TYPE_CHECKING:
     from pathlib import Path
 
 logger = structlog.get_logger()
 
+_DB_FILENAME = "exa_cache.db"
+
+# Writes between recounts of the stored size. Other processes sharing the file change it too, so
+# the running total is only an estimate between recounts.
+_RESYNC_EVERY_SETS = 100
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS exa_cache (
+        key TEXT PRIMARY KEY,
+        operation TEXT NOT NULL,
+        created_at REAL NOT NULL,
+        expires_at REAL NOT NULL,
+        accessed_at REAL NOT NULL,
+        size INTEGER NOT NULL,
+        payload BLOB NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS ix_exa_cache_expires_at ON exa_cache (expires_at);
+    -- Covers the LRU scan and the total-size sum without touching payload pages.
+    CREATE INDEX IF NOT EXISTS ix_exa_cache_lru ON exa_cache (accessed_at, size);
+"""
+
+# Deletes everything beyond the `max_bytes` most recently used payload bytes.
+_EVICT_LRU_SQL = """
+    DELETE FROM exa_cache WHERE key IN (
+        SELECT key FROM (
+            SELECT key, SUM(size) OVER (ORDER BY accessed_at DESC, key) AS kept
+            FROM exa_cache
+        )
+        WHERE kept > ?
+    )
+"""
+
+
+def make_cache_key(operation: str, params: dict[str, Any]) -> str:
+    """Stable key for an operation and its params (dict order does not matter)."""
+    param_str = json.dumps(params, sort_keys=True, default=str, separators=(",", ":"))
+    content = f"{operation}:{param_str}"
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
 
 @dataclass(frozen=True)
 class CacheEntry:
@@ -28,60 +79,106 @@ class CacheEntry:
     expires_at: datetime
 
 
+@dataclass(frozen=True)
+class CacheStats:
+    """Cache size plus this instance's lookup counters."""
+
+    entries: int
+    size_bytes: int
+    max_bytes: int | None
+    hits: int
+    misses: int
+    evictions: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
 class ExaCache:
-    """Simple JSON-on-disk cache keyed by operation + params."""
+    """Compressed SQLite cache keyed by operation + params, with TTLs and an LRU size cap.
+
+    `get`/`set` block on SQLite; async callers should use `aget`/`aset`, which run the same
+    operations in a worker thread. One connection is shared under a lock, so an instance is safe
+    to use from several threads and tasks at once.
+    """
 
     def __init__(
         self,
         cache_dir: Path | None = None,
         *,
         default_ttl: timedelta = timedelta(hours=24),
+        max_bytes: int | None = DEFAULT_EXA_CACHE_MAX_BYTES,
     ) -> None:
-        self._cache_dir = cache_dir or (DEFAULT_DATA_DIR / "exa_cache")
+        """
+        Args:
+            cache_dir: Directory holding the cache database (default: `data/exa_cache`).
+            default_ttl: Lifetime of entries stored without an explicit `ttl`.
+            max_bytes: Cap on the total compressed payload size; None disables eviction.
+        """
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be positive")
+        self._cache_dir = cache_dir or DEFAULT_EXA_CACHE_DIR
         self._cache_dir.mkdir(parents=True, exist_ok=True)
         self._default_ttl = default_ttl
+        self._max_bytes = max_bytes
+        self._hits = self._misses = self._evictions = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, timeout=30.0, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        # Running payload total, so `set()` checks the cap without summing the table each time.
+        self._size_bytes = self._total_bytes()
+        self._sets_since_resync = 0
 
-    def _make_key(self, operation: str, params: dict[str, Any]) -> str:
-        param_str = json.dumps(params, sort_keys=True, default=str, separators=(",", ":"))
-        content = f"{operation}:{param_str}"
-        return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+    @property
+    def path(self) -> Path:
+        """Location of the cache database."""
+        return self._cache_dir / _DB_FILENAME
 
-    def _path_for_key(self, key: str) -> Path:
-        return self._cache_dir / f"{key}.json"
+    def _make_key(self, operation: str, params: dict[str, Any]) -> str:
+        return make_cache_key(operation, params)
 
     def get(self, operation: str, params: dict[str, Any]) -> dict[str, Any] | None:
         """Return cached data when present and not expired."""
         key = self._make_key(operation, params)
-        path = self._path_for_key(key)
-
-        if not path.exists():
-            return None
-
-        try:
-            with path.open(encoding="utf-8") as f:
-                entry = json.load(f)
+        now = time.time()
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT expires_at, payload FROM exa_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and row[0] <= now:
+                    self._conn.execute("DELETE FROM exa_cache WHERE key = ?", (key,))
+                    self._size_bytes -= len(row[1])
+                    row = None
+                if row is None:
+                    self._misses += 1
+                    return None
 
-            expires_at = datetime.fromisoformat(entry["expires_at"])
-            if datetime.now(UTC) > expires_at:
-                path.unlink(missing_ok=True)
+                data = json.loads(zlib.decompress(row[1]))
+                if not isinstance(data, dict):
+                    raise TypeError("Cached 'data' must be a dict")
+                self._conn.execute("UPDATE exa_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            except (sqlite3.Error, zlib.error, ValueError, TypeError) as e:
+                logger.warning(
+                    "Exa cache read failed; evicting entry",
+                    operation=operation,
+                    key=key,
+                    error=str(e),
+                    exc_info=True,
+                )
+                self._misses += 1
+                self._delete_quietly(key)
                 return None
+            self._hits += 1
 
-            logger.debug("Exa cache hit", operation=operation, key=key)
-            data = entry["data"]
-            if not isinstance(data, dict):
-                raise TypeError("Cached 'data' must be a dict")
-            return data
-
-        except (json.JSONDecodeError, KeyError, ValueError, TypeError, OSError) as e:
-            logger.warning(
-                "Exa cache read failed; evicting entry",
-                operation=operation,
-                key=key,
-                error=str(e),
-                exc_info=True,
-            )
-            path.unlink(missing_ok=True)
-            return None
+        logger.debug("Exa cache hit", operation=operation, key=key)
+        return data
 
     def set(
         self,
@@ -91,61 +188,139 @@ class ExaCache:
         *,
         ttl: timedelta | None = None,
     ) -> None:
-        """Store response data for an operation."""
+        """Store response data for an operation, evicting old entries if over the size cap."""
         key = self._make_key(operation, params)
-        path = self._path_for_key(key)
-
-        now = datetime.now(UTC)
         ttl = ttl or self._default_ttl
+        payload = zlib.compress(
+            json.dumps(data, default=str, separators=(",", ":")).encode("utf-8")
+        )
+        now = time.time()
 
-        entry = {
-            "key": key,
-            "operation": operation,
-            "params": params,
-            "data": data,
-            "created_at": now.isoformat(),
-            "expires_at": (now + ttl).isoformat(),
-        }
-
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(entry, f, indent=2, default=str, sort_keys=True)
+        with self._lock:
+            try:
+                replaced = self._conn.execute(
+                    "SELECT size FROM exa_cache WHERE key = ?", (key,)
+                ).fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO exa_cache "
+                    "(key, operation, created_at, expires_at, accessed_at, size, payload) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, operation, now, now + ttl.total_seconds(), now, len(payload), payload),
+                )
+                self._size_bytes += len(payload) - (replaced[0] if replaced else 0)
+                self._evict_over_cap(now)
+            except sqlite3.Error as e:
+                # A cache write failure must not fail the (already paid for) request.
+                logger.warning("Exa cache write failed", operation=operation, key=key, error=str(e))
+                return
 
         logger.debug(
             "Exa cache set",
             operation=operation,
             key=key,
+            size_bytes=len(payload),
             ttl_seconds=int(ttl.total_seconds()),
         )
 
+    async def aget(self, operation: str, params: dict[str, Any]) -> dict[str, Any] | None:
+        """`get` without blocking the event loop."""
+        return await asyncio.to_thread(self.get, operation, params)
+
+    async def aset(
+        self,
+        operation: str,
+        params: dict[str, Any],
+        data: dict[str, Any],
+        *,
+        ttl: timedelta | None = None,
+    ) -> None:
+        """`set` without blocking the event loop."""
+        await asyncio.to_thread(self.set, operation, params, data, ttl=ttl)
+
+    def _total_bytes(self) -> int:
+        return int(self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM exa_cache").fetchone()[0])
+
+    def _evict_over_cap(self, now: float) -> None:
+        if self._max_bytes is None:
+            return
+        self._sets_since_resync += 1
+        if self._sets_since_resync >= _RESYNC_EVERY_SETS:
+            self._resync_size()
+        if self._size_bytes <= self._max_bytes:
+            return
+        # Recount before evicting: other processes may have evicted entries already.
+        self._resync_size()
+        if self._size_bytes <= self._max_bytes:
+            return
+        evicted = self._conn.execute("DELETE FROM exa_cache WHERE expires_at <= ?", (now,)).rowcount
+        self._resync_size()
+        if self._size_bytes > self._max_bytes:
+            evicted += self._conn.execute(_EVICT_LRU_SQL, (self._max_bytes,)).rowcount
+            self._resync_size()
+        self._evictions += evicted
+        logger.debug("Exa cache evicted entries", evicted=evicted, max_bytes=self._max_bytes)
+
+    def _resync_size(self) -> None:
+        self._size_bytes = self._total_bytes()
+        self._sets_since_resync = 0
+
+    def _delete_quietly(self, key: str) -> None:
+        try:
+            self._conn.execute("DELETE FROM exa_cache WHERE key = ?", (key,))
+        except sqlite3.Error:
+            logger.debug("Exa cache delete failed", key=key, exc_info=True)
+
+    def stats(self) -> CacheStats:
+        """Return the entry count and payload size, plus hits/misses/evictions of this instance."""
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM exa_cache"
+            ).fetchone()
+            return CacheStats(
+                entries=int(entries),
+                size_bytes=int(size),
+                max_bytes=self._max_bytes,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+            )
+
     def clear(self) -> int:
-        """Clear all cache entries. Returns number of files removed."""
+        """Clear all cache entries. Returns number of entries removed.
+
+        Also removes JSON files left by the previous one-file-per-entry cache layout.
+        """
+        with self._lock:
+            count = self._conn.execute("DELETE FROM exa_cache").rowcount
+            self._resync_size()
+        return count + self._remove_legacy_files()
+
+    def clear_expired(self) -> int:
+        """Clear only expired cache entries. Returns number of entries removed.
+
+        Legacy JSON files are never read by this cache, so they are removed as well.
+        """
+        with self._lock:
+            count = self._conn.execute(
+                "DELETE FROM exa_cache WHERE expires_at <= ?", (time.time(),)
+            ).rowcount
+            self._resync_size()
+        return count + self._remove_legacy_files()
+
+    def _remove_legacy_files(self) -> int:
         count = 0
         for path in self._cache_dir.glob("*.json"):
             path.unlink(missing_ok=True)
             count += 1
         return count
 
-    def clear_expired(self) -> int:
-        """Clear only expired cache entries. Returns number of files removed."""
-        now = datetime.now(UTC)
-        count = 0
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
 
-        for path in self._cache_dir.glob("*.json"):
-            try:
-                with path.open(encoding="utf-8") as f:
-                    entry = json.load(f)
-                expires_at = datetime.fromisoformat(entry["expires_at"])
-                if now > expires_at:
-                    path.unlink(missing_ok=True)
-                    count += 1
-            except (json.JSONDecodeError, KeyError, ValueError, TypeError, OSError):
-                # Log before deleting so we know why the cache entry was invalid
-                logger.debug(
-                    "Evicting invalid cache entry",
-                    path=str(path),
-                    exc_info=True,
-                )
-                path.unlink(missing_ok=True)
-                count += 1
+    def __enter__(self) -> Self:
+        return self
 
-        return count
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -163,6 +163,21 @@ class ExaPolicy:
 
         return (base_cost + (float(num_results) * per_page_cost)) * EXA_COST_ESTIMATE_SAFETY_FACTOR
 
+    def estimate_contents_cost_usd(
+        self,
+        *,
+        num_urls: int,
+        include_text: bool,
+        include_highlights: bool,
+    ) -> float:
+        """Estimate an upper-bound cost for a `/contents` request (priced per page only)."""
+        per_page_cost = 0.0
+        if include_text:
+            per_page_cost += EXA_PER_RESULT_TEXT_COST_USD
+        if include_highlights:
+            per_page_cost += EXA_PER_RESULT_HIGHLIGHTS_COST_USD
+        return float(max(num_urls, 0)) * per_page_cost * EXA_COST_ESTIMATE_SAFETY_FACTOR
+
     def normalize_cache_params(self, params: dict[str, object]) -> dict[str, object]:
         """Return a stable cache params mapping for ExaCache keys.
 
@@ -183,31 +198,55 @@ class ExaPolicy:
 
 @dataclass
 class ExaBudget:
-    """Mutable budget tracker for a single CLI command invocation."""
+    """Mutable budget tracker for a single CLI command invocation.
+
+    Concurrent callers should `reserve()` an estimate before each API call and `settle()` it
+    with the actual cost afterwards, so in-flight calls count against the limit. Both methods
+    are synchronous, which makes them atomic with respect to other asyncio tasks.
+    """
 
     limit_usd: float
     spent_usd: float = 0.0
+    reserved_usd: float = 0.0
 
     def __post_init__(self) -> None:
         if self.limit_usd <= 0:
             raise ValueError("limit_usd must be positive")
         if self.spent_usd < 0:
             raise ValueError("spent_usd must be non-negative")
+        if self.reserved_usd < 0:
+            raise ValueError("reserved_usd must be non-negative")
 
     @property
     def remaining_usd(self) -> float:
-        return max(0.0, self.limit_usd - self.spent_usd)
+        return max(0.0, self.limit_usd - self.spent_usd - self.reserved_usd)
 
     def can_spend(self, estimated_usd: float) -> bool:
         if estimated_usd < 0:
             raise ValueError("estimated_usd must be non-negative")
-        return (self.spent_usd + estimated_usd) <= self.limit_usd
+        return (self.spent_usd + self.reserved_usd + estimated_usd) <= self.limit_usd
 
     def record_spend(self, actual_usd: float) -> None:
         if actual_usd < 0:
             raise ValueError("actual_usd must be non-negative")
         self.spent_usd += actual_usd
 
+    def reserve(self, estimated_usd: float) -> bool:
+        """Hold `estimated_usd` against the limit until `settle()`. False if it does not fit."""
+        if not self.can_spend(estimated_usd):
+            return False
+        self.reserved_usd += estimated_usd
+        return True
+
+    def settle(self, reserved_usd: float, actual_usd: float) -> None:
+        """Release a reservation made with `reserve()` and record the call's actual cost."""
+        if reserved_usd < 0:
+            raise ValueError("reserved_usd must be non-negative")
+        self.record_spend(actual_usd)
+        remaining = self.reserved_usd - reserved_usd
+        # Snap float drift so a fully settled budget reads exactly zero reserved.
+        self.reserved_usd = remaining if remaining > 1e-12 else 0.0
+
 
 def extract_exa_cost_total(response: object) -> float:
     """Best-effort extraction of `cost_dollars.total` from an Exa response model."""
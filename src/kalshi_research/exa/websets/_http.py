@@ -7,20 +7,30 @@ import json
 import math
 from datetime import UTC, datetime
 from email.utils import parsedate_to_datetime
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 import httpx
 import structlog
 
+from kalshi_research.exa.cache import make_cache_key
 from kalshi_research.exa.exceptions import ExaAPIError, ExaAuthError, ExaRateLimitError
 
 if TYPE_CHECKING:
     from types import TracebackType
 
+    from kalshi_research.exa._singleflight import SingleFlight
     from kalshi_research.exa.config import ExaConfig
 
 logger = structlog.get_logger()
 
+# POST endpoints that only read, and so may share an in-flight response.
+_COALESCED_POST_PATHS = frozenset({"/v0/websets/preview"})
+
+
+def _is_coalesced(method: str, path: str) -> bool:
+    return method == "GET" or (method == "POST" and path in _COALESCED_POST_PATHS)
+
 
 class ExaWebsetsHttpMixin:
     """
@@ -34,6 +44,7 @@ class ExaWebsetsHttpMixin:
 
     _config: ExaConfig
     _client: httpx.AsyncClient | None
+    _single_flight: SingleFlight
 
     async def open(self) -> None:
         """Initialize the underlying `httpx.AsyncClient` if needed."""
@@ -93,6 +104,9 @@ class ExaWebsetsHttpMixin:
     ) -> dict[str, Any]:
         """Send an Exa Websets API request with retries and JSON parsing.
 
+        Read-only requests (`GET`, plus `POST` to read-only endpoints) are coalesced: while one is
+        in flight, identical requests from other tasks await its outcome instead of being sent.
+
         Retries transient failures up to `self._config.max_retries`:
         - `429` responses are retried using the `Retry-After` header when available.
         - `5xx` responses are retried with a linear backoff.
@@ -112,6 +126,24 @@ class ExaWebsetsHttpMixin:
             ExaRateLimitError: If Exa returns `429` and retries are exhausted.
             ExaAPIError: For other non-success status codes or invalid JSON responses.
         """
+        if not _is_coalesced(method, path):
+            return await self._send_request(method, path, params=params, json_body=json_body)
+        key = make_cache_key(f"{method} {path}", {"params": params, "json": json_body})
+        data, _ = await self._single_flight.run(
+            key,
+            partial(self._send_request, method, path, params=params, json_body=json_body),
+        )
+        return data
+
+    async def _send_request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json_body: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Send one request (no coalescing); see `_request`."""
         last_exception: Exception | None = None
 
         for attempt in range(self._config.max_retries):
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from kalshi_research.exa._singleflight import SingleFlight
 from kalshi_research.exa.config import ExaConfig
 
 if TYPE_CHECKING:
@@ -39,6 +40,7 @@ class ExaWebsetsClient(
     def __init__(self, config: ExaConfig) -> None:
         self._config = config
         self._client: httpx.AsyncClient | None = None
+        self._single_flight = SingleFlight()
 
     @classmethod
     def from_env(cls) -> ExaWebsetsClient:
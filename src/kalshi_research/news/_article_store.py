@@ -0,0 +1,212 @@
+"""Batched persistence of Exa news results (articles, tracked-item links, sentiment)."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from kalshi_research.data.models import (
+    NewsArticle,
+    NewsArticleEvent,
+    NewsArticleMarket,
+    NewsSentiment,
+)
+from kalshi_research.data.repositories.sentiment_rollups import SentimentRollupRepository
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable, Sequence
+
+    from sqlalchemy.dialects.sqlite import Insert
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from kalshi_research.data.database import DatabaseManager
+    from kalshi_research.data.models import TrackedItem
+    from kalshi_research.exa.models.search import SearchResult
+    from kalshi_research.news.sentiment import SentimentAnalyzer
+
+
+def url_hash(url: str) -> str:
+    """Dedup key of an article URL (`news_articles.url_hash`)."""
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+def extract_domain(url: str) -> str:
+    return urlparse(url).netloc.replace("www.", "")
+
+
+def match_contents(
+    requested: Sequence[SearchResult], fetched: Sequence[SearchResult]
+) -> dict[str, SearchResult]:
+    """Pair `/contents` results with the requested results, keyed by requested URL hash.
+
+    Exa may answer with a normalized or redirected URL, so results are matched by URL, then by
+    `id` (the requested URL or its search document id), then by position when the response has
+    exactly one result per requested URL. Requested URLs without a match are left out.
+    """
+    keys = [url_hash(result.url) for result in requested]
+    wanted = set(keys)
+    by_id = {ident: key for key, r in zip(keys, requested, strict=True) for ident in (r.url, r.id)}
+    matched: dict[str, SearchResult] = {}
+    leftover: list[int] = []
+    for i, result in enumerate(fetched):
+        key = url_hash(result.url)
+        if key not in wanted or key in matched:
+            key = by_id.get(result.id, "")
+        if key and key not in matched:
+            matched[key] = result
+        else:
+            leftover.append(i)
+    if leftover and len(fetched) == len(requested):
+        for i in leftover:
+            if keys[i] not in matched:
+                matched[keys[i]] = fetched[i]
+    return matched
+
+
+async def _article_ids(session: AsyncSession, hashes: Collection[str]) -> dict[str, int]:
+    if not hashes:
+        return {}
+    result = await session.execute(
+        select(NewsArticle.url_hash, NewsArticle.id).where(NewsArticle.url_hash.in_(hashes))
+    )
+    return dict(result.tuples().all())
+
+
+async def known_url_hashes(db: DatabaseManager, hashes: Collection[str]) -> set[str]:
+    """Return the subset of `hashes` already stored in `news_articles` (one indexed lookup)."""
+    async with db.session_factory() as session:
+        return set(await _article_ids(session, hashes))
+
+
+def _link_statement(tracked: TrackedItem, article_ids: Iterable[int]) -> Insert:
+    if tracked.item_type == "event":
+        return sqlite_insert(NewsArticleEvent).values(
+            [{"article_id": i, "event_ticker": tracked.ticker} for i in article_ids]
+        )
+    return sqlite_insert(NewsArticleMarket).values(
+        [{"article_id": i, "ticker": tracked.ticker} for i in article_ids]
+    )
+
+
+async def store_articles(
+    db: DatabaseManager,
+    tracked: TrackedItem,
+    results: Sequence[SearchResult],
+    *,
+    request_id: str | None,
+    sentiment: SentimentAnalyzer | None,
+) -> int:
+    """Store Exa results in a single transaction; returns the number of new articles.
+
+    Known URLs are resolved with one `IN (...)` lookup and new articles are bulk-inserted, so a
+    response costs a handful of statements however many results it has. Every result, new or
+    already stored, is linked to `tracked`, and a market's daily sentiment rollups are updated.
+    """
+    by_hash: dict[str, SearchResult] = {}
+    for result in results:
+        by_hash.setdefault(url_hash(result.url), result)
+    if not by_hash:
+        return 0
+
+    now = datetime.now(UTC)
+    async with db.session_factory() as session, session.begin():
+        ids = await _article_ids(session, by_hash)
+        new_rows = [
+            {
+                "url": result.url,
+                "url_hash": key,
+                "title": result.title,
+                "source_domain": extract_domain(result.url),
+                "published_at": result.published_date,
+                "collected_at": now,
+                "text_snippet": result.highlights[0] if result.highlights else None,
+                "full_text": result.text,
+                "exa_request_id": request_id,
+            }
+            for key, result in by_hash.items()
+            if key not in ids
+        ]
+        inserted: dict[str, int] = {}
+        if new_rows:
+            # A concurrent writer may have stored the same URL since the lookup; such rows are
+            # skipped here and linked below like any other known article.
+            inserted = dict(
+                (
+                    await session.execute(
+                        sqlite_insert(NewsArticle)
+                        .values(new_rows)
+                        .on_conflict_do_nothing()
+                        .returning(NewsArticle.url_hash, NewsArticle.id)
+                    )
+                )
+                .tuples()
+                .all()
+            )
+            ids.update(inserted)
+            if len(ids) < len(by_hash):
+                ids.update(await _article_ids(session, [k for k in by_hash if k not in ids]))
+
+        rollups = SentimentRollupRepository(session) if tracked.item_type == "market" else None
+        if rollups is not None:
+            await rollups.remove_articles(list(ids.values()))
+        await session.execute(_link_statement(tracked, ids.values()).on_conflict_do_nothing())
+
+        if sentiment is not None:
+            sentiment_rows = []
+            for key, article_id in inserted.items():
+                result = by_hash[key]
+                if not result.text:
+                    continue
+                scored = sentiment.analyze(result.text, result.title)
+                sentiment_rows.append(
+                    {
+                        "article_id": article_id,
+                        "analyzed_at": now,
+                        "score": scored.score,
+                        "label": scored.label,
+                        "confidence": scored.confidence,
+                        "method": scored.method,
+                        "keywords_matched": json.dumps(scored.keywords_matched),
+                    }
+                )
+            if sentiment_rows:
+                await session.execute(insert(NewsSentiment).values(sentiment_rows))
+
+        if rollups is not None:
+            await rollups.add_articles(list(ids.values()))
+
+    return len(inserted)
+
+
+async def link_articles(db: DatabaseManager, links: Iterable[tuple[TrackedItem, str]]) -> None:
+    """Link stored articles (by URL hash) to tracked items; hashes never stored are ignored."""
+    by_item: dict[int, tuple[TrackedItem, set[str]]] = {}
+    for tracked, key in links:
+        by_item.setdefault(tracked.id, (tracked, set()))[1].add(key)
+    if not by_item:
+        return
+
+    async with db.session_factory() as session, session.begin():
+        ids = await _article_ids(session, {k for _, keys in by_item.values() for k in keys})
+        market_article_ids = {
+            ids[k]
+            for tracked, keys in by_item.values()
+            if tracked.item_type == "market"
+            for k in keys
+            if k in ids
+        }
+        rollups = SentimentRollupRepository(session)
+        await rollups.remove_articles(market_article_ids)
+        for tracked, keys in by_item.values():
+            article_ids = [ids[k] for k in keys if k in ids]
+            if article_ids:
+                await session.execute(
+                    _link_statement(tracked, article_ids).on_conflict_do_nothing()
+                )
+        await rollups.add_articles(market_article_ids)
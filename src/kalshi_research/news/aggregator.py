@@ -3,21 +3,30 @@
 from __future__ import annotations
 
 import json
+import math
 import statistics
 from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime, timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import func, select
+from sqlalchemy import case, func, select
 
+from kalshi_research.constants import DEFAULT_SENTIMENT_METHOD
 from kalshi_research.data.models import (
     NewsArticle,
     NewsArticleEvent,
     NewsArticleMarket,
     NewsSentiment,
+    NewsSentimentDaily,
 )
+from kalshi_research.data.repositories.rollups import DAILY, bucket_start
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
+    from sqlalchemy import ColumnElement
+    from sqlalchemy.orm import InstrumentedAttribute
+
     from kalshi_research.data.database import DatabaseManager
 
 
@@ -30,7 +39,7 @@ class SentimentSummary:
     period_end: datetime
 
     avg_score: float
-    median_score: float
+    median_score: float | None  # None when built from daily rollups
     score_std: float
 
     total_articles: int
@@ -70,8 +79,96 @@ class SentimentSummary:
 class SentimentAggregator:
     """Aggregates sentiment data for reporting and alerting."""
 
-    def __init__(self, db: DatabaseManager) -> None:
+    def __init__(self, db: DatabaseManager, *, method: str = DEFAULT_SENTIMENT_METHOD) -> None:
+        """
+        Args:
+            method: Sentiment method version to aggregate (`news_sentiments.method`); other
+                versions of the same articles are ignored.
+        """
         self._db = db
+        self._method = method
+
+    async def get_market_summaries(
+        self,
+        tickers: Collection[str],
+        *,
+        days: int = 7,
+        compare_previous: bool = True,
+    ) -> dict[str, SentimentSummary]:
+        """Summarize many markets from the daily sentiment rollups in one grouped query.
+
+        Periods are whole UTC days: the current period is the last `days` days including today
+        and the previous period the `days` before it. Rollups keep sums and label counts only,
+        so `median_score` is None and `top_keywords` is empty. Markets without articles in the
+        current period are left out.
+        """
+        if days < 1:
+            raise ValueError("days must be at least 1")
+        if not tickers:
+            return {}
+
+        period_end = datetime.now(UTC)
+        period_start = bucket_start(period_end, DAILY) - timedelta(days=days - 1)
+        prev_start = period_start - timedelta(days=days)
+        daily = NewsSentimentDaily
+        current = daily.bucket_start >= period_start
+
+        def current_sum(column: InstrumentedAttribute[Any]) -> ColumnElement[Any]:
+            return func.sum(case((current, column), else_=0))
+
+        def previous_sum(column: InstrumentedAttribute[Any]) -> ColumnElement[Any]:
+            return func.sum(case((current, 0), else_=column))
+
+        query = (
+            select(
+                daily.ticker,
+                current_sum(daily.article_count).label("articles"),
+                current_sum(daily.score_sum).label("total"),
+                current_sum(daily.score_sq_sum).label("sq_total"),
+                current_sum(daily.positive_count).label("positive"),
+                current_sum(daily.negative_count).label("negative"),
+                current_sum(daily.neutral_count).label("neutral"),
+                previous_sum(daily.article_count).label("prev_count"),
+                previous_sum(daily.score_sum).label("prev_total"),
+            )
+            .where(
+                daily.ticker.in_(tickers),
+                daily.method == self._method,
+                daily.bucket_start >= (prev_start if compare_previous else period_start),
+                daily.bucket_start <= period_end,
+            )
+            .group_by(daily.ticker)
+        )
+        async with self._db.session_factory() as session:
+            rows = (await session.execute(query)).all()
+
+        summaries: dict[str, SentimentSummary] = {}
+        for row in rows:
+            if not row.articles:
+                continue
+            avg_score = row.total / row.articles
+            # Sample variance from the sums, as `statistics.stdev` computes it from the scores.
+            variance = (
+                (row.sq_total - row.total * avg_score) / (row.articles - 1)
+                if row.articles > 1
+                else 0.0
+            )
+            prev_avg = row.prev_total / row.prev_count if row.prev_count else None
+            summaries[row.ticker] = SentimentSummary(
+                ticker=row.ticker,
+                period_start=period_start,
+                period_end=period_end,
+                avg_score=avg_score,
+                median_score=None,
+                score_std=math.sqrt(max(variance, 0.0)),
+                total_articles=row.articles,
+                positive_count=row.positive,
+                negative_count=row.negative,
+                neutral_count=row.neutral,
+                previous_avg_score=prev_avg,
+                score_change=avg_score - prev_avg if prev_avg is not None else None,
+            )
+        return summaries
 
     async def get_market_summary(
         self,
@@ -90,6 +187,7 @@ class SentimentAggregator:
                 .join(NewsArticle, NewsSentiment.article_id == NewsArticle.id)
                 .join(NewsArticleMarket, NewsArticle.id == NewsArticleMarket.article_id)
                 .where(NewsArticleMarket.ticker == ticker)
+                .where(NewsSentiment.method == self._method)
                 .where(
                     NewsArticle.collected_at >= period_start,
                     NewsArticle.collected_at <= period_end,
@@ -143,6 +241,7 @@ class SentimentAggregator:
                 .join(NewsArticle, NewsSentiment.article_id == NewsArticle.id)
                 .join(NewsArticleMarket, NewsArticle.id == NewsArticleMarket.article_id)
                 .where(NewsArticleMarket.ticker == ticker)
+                .where(NewsSentiment.method == self._method)
                 .where(
                     NewsArticle.collected_at >= prev_start,
                     NewsArticle.collected_at <= prev_end,
@@ -175,6 +274,7 @@ class SentimentAggregator:
                 .join(NewsArticle, NewsSentiment.article_id == NewsArticle.id)
                 .join(NewsArticleEvent, NewsArticle.id == NewsArticleEvent.article_id)
                 .where(NewsArticleEvent.event_ticker == event_ticker)
+                .where(NewsSentiment.method == self._method)
                 .where(
                     NewsArticle.collected_at >= period_start,
                     NewsArticle.collected_at <= period_end,
@@ -228,6 +328,7 @@ class SentimentAggregator:
                 .join(NewsArticle, NewsSentiment.article_id == NewsArticle.id)
                 .join(NewsArticleEvent, NewsArticle.id == NewsArticleEvent.article_id)
                 .where(NewsArticleEvent.event_ticker == event_ticker)
+                .where(NewsSentiment.method == self._method)
                 .where(
                     NewsArticle.collected_at >= prev_start,
                     NewsArticle.collected_at <= prev_end,
@@ -2,32 +2,43 @@
 
 from __future__ import annotations
 
-import hashlib
+import asyncio
 import json
+from collections import deque
 from datetime import UTC, datetime, timedelta
-from typing import TYPE_CHECKING, Protocol
-from urllib.parse import urlparse
+from functools import partial
+from itertools import zip_longest
+from typing import TYPE_CHECKING, Protocol, TypeVar
 
 import structlog
 from sqlalchemy import select, update
-from sqlalchemy.exc import IntegrityError
-
-from kalshi_research.data.models import (
-    NewsArticle,
-    NewsArticleEvent,
-    NewsArticleMarket,
-    NewsSentiment,
-    TrackedItem,
+
+from kalshi_research.constants import (
+    DEFAULT_NEWS_COLLECT_CONCURRENCY,
+    NEWS_CONTENTS_BATCH_SIZE,
 )
+from kalshi_research.data.models import TrackedItem
 from kalshi_research.exa.policy import ExaBudget, ExaPolicy, extract_exa_cost_total
+from kalshi_research.news._article_store import (
+    known_url_hashes,
+    link_articles,
+    match_contents,
+    store_articles,
+    url_hash,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
+
     from kalshi_research.data.database import DatabaseManager
-    from kalshi_research.exa.models.search import SearchResponse
+    from kalshi_research.exa.models.contents import ContentsResponse
+    from kalshi_research.exa.models.search import SearchResponse, SearchResult
     from kalshi_research.news.sentiment import SentimentAnalyzer
 
 logger = structlog.get_logger()
 
+_R = TypeVar("_R")
+
 
 class ExaNewsClient(Protocol):
     async def search_and_contents(
@@ -44,6 +55,28 @@ class ExaNewsClient(Protocol):
         """Search Exa with contents enabled (text/highlights)."""
         ...
 
+    async def search(
+        self,
+        query: str,
+        *,
+        search_type: str = "auto",
+        num_results: int = 10,
+        start_published_date: datetime | None = None,
+        category: str | None = None,
+    ) -> SearchResponse:
+        """Search Exa without contents (used by two-phase collection)."""
+        ...
+
+    async def get_contents(
+        self,
+        urls: list[str],
+        *,
+        text: bool = True,
+        highlights: bool = False,
+    ) -> ContentsResponse:
+        """Fetch contents for URLs (used by two-phase collection)."""
+        ...
+
 
 class NewsCollector:
     """Collects news for tracked items and stores it in the database."""
@@ -57,7 +90,13 @@ class NewsCollector:
         lookback_days: int = 7,
         max_articles_per_query: int = 25,
         policy: ExaPolicy | None = None,
+        two_phase: bool = False,
     ) -> None:
+        """
+        Args:
+            two_phase: Search without contents first, then fetch contents only for URLs that
+                are not already stored (or being fetched by another query in this run).
+        """
         self._exa = exa
         self._db = db
         self._sentiment = sentiment_analyzer
@@ -66,6 +105,13 @@ class NewsCollector:
         self._policy = policy or ExaPolicy.from_mode()
         self._budget = ExaBudget(limit_usd=self._policy.budget_usd)
         self._budget_exhausted = False
+        # Guards budget reservations of concurrent queries; notified whenever one settles.
+        self._budget_settled = asyncio.Condition()
+        self._in_flight = 0
+        self._two_phase = two_phase
+        # Two-phase state: URL hashes being fetched in this run, and links to make once stored.
+        self._claimed: set[str] = set()
+        self._deferred_links: list[tuple[TrackedItem, str]] = []
 
     @property
     def budget(self) -> ExaBudget:
@@ -75,141 +121,251 @@ class NewsCollector:
     def budget_exhausted(self) -> bool:
         return self._budget_exhausted
 
-    def _url_hash(self, url: str) -> str:
-        return hashlib.sha256(url.encode("utf-8")).hexdigest()
-
-    def _extract_domain(self, url: str) -> str:
-        return urlparse(url).netloc.replace("www.", "")
-
     async def collect_for_tracked_item(self, tracked: TrackedItem) -> int:
         """Collect news for a single tracked market/event and persist new articles."""
+        results = await self._collect([tracked], concurrency=1)
+        return results.get(tracked.ticker, 0)
+
+    async def collect_all(
+        self, *, concurrency: int = DEFAULT_NEWS_COLLECT_CONCURRENCY
+    ) -> dict[str, int]:
+        """Collect news for all active tracked items and return per-ticker insert counts.
+
+        Up to `concurrency` Exa queries run at once. Queries are scheduled round-robin across
+        items (every item's first query before any item's second), so an item with many queries
+        cannot starve the others of workers or of budget. Items never reached because the budget
+        ran out are left out of the result.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        async with self._db.session_factory() as session:
+            tracked_items = (
+                (
+                    await session.execute(
+                        select(TrackedItem).where(TrackedItem.is_active == True)  # noqa: E712
+                    )
+                )
+                .scalars()
+                .all()
+            )
+        return await self._collect(tracked_items, concurrency=concurrency)
+
+    async def _collect(
+        self, tracked_items: Sequence[TrackedItem], *, concurrency: int
+    ) -> dict[str, int]:
         if self._budget_exhausted:
-            return 0
+            return {}
 
-        queries = json.loads(tracked.search_queries)
         cutoff = datetime.now(UTC) - timedelta(days=self._lookback_days)
+        results: dict[str, int] = {}
+        started: list[TrackedItem] = []
+        per_item: list[list[tuple[TrackedItem, str]]] = []
+        for tracked in tracked_items:
+            queries = json.loads(tracked.search_queries)
+            if queries:
+                per_item.append([(tracked, query) for query in queries])
+            else:
+                results[tracked.ticker] = 0
+                started.append(tracked)
+        jobs = deque(job for round_ in zip_longest(*per_item) for job in round_ if job is not None)
 
-        new_articles = 0
-        for query in queries:
-            include_text = self._policy.include_full_text
-            include_highlights = True
-            estimated_cost = self._policy.estimate_search_cost_usd(
-                num_results=self._max_articles_per_query,
-                include_text=include_text,
-                include_highlights=include_highlights,
-                search_type=self._policy.exa_search_type,
-            )
-            if not self._budget.can_spend(estimated_cost):
+        async def worker() -> None:
+            while jobs and not self._budget_exhausted:
+                tracked, query = jobs.popleft()
+                if tracked.ticker not in results:
+                    results[tracked.ticker] = 0
+                    started.append(tracked)
+                inserted = await self._collect_query(tracked, query, cutoff)
+                results[tracked.ticker] += inserted
+
+        tasks = [asyncio.create_task(worker()) for _ in range(min(concurrency, len(jobs)))]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        await link_articles(self._db, self._deferred_links)
+        self._deferred_links.clear()
+        if started:
+            async with self._db.session_factory() as session, session.begin():
+                await session.execute(
+                    update(TrackedItem)
+                    .where(TrackedItem.id.in_([tracked.id for tracked in started]))
+                    .values(last_collected_at=datetime.now(UTC))
+                )
+        for ticker, new_articles in results.items():
+            logger.info("Collected news", ticker=ticker, new_articles=new_articles)
+        return results
+
+    async def _reserve(self, estimated_cost: float) -> bool:
+        """Reserve budget for one query, waiting for in-flight queries to settle if needed."""
+        async with self._budget_settled:
+            while not self._budget.reserve(estimated_cost):
+                if self._in_flight == 0:
+                    return False
+                await self._budget_settled.wait()
+            self._in_flight += 1
+            return True
+
+    async def _settle(self, estimated_cost: float, actual_cost: float) -> None:
+        async with self._budget_settled:
+            self._budget.settle(estimated_cost, actual_cost)
+            self._in_flight -= 1
+            self._budget_settled.notify_all()
+
+    async def _call_exa(
+        self,
+        estimated_cost: float,
+        call: Callable[[], Awaitable[_R]],
+        *,
+        tracked: TrackedItem,
+        query: str,
+    ) -> _R | None:
+        """Run one Exa call under a budget reservation; None if over budget or the call failed."""
+        if not await self._reserve(estimated_cost):
+            if not self._budget_exhausted:
                 self._budget_exhausted = True
                 logger.info(
                     "News collection budget exhausted",
                     budget_spent_usd=self._budget.spent_usd,
                     budget_limit_usd=self._budget.limit_usd,
                 )
-                break
+            return None
+
+        actual_cost = 0.0
+        try:
+            response = await call()
+            actual_cost = extract_exa_cost_total(response)
+            return response
+        except Exception as exc:
+            logger.warning(
+                "Failed to collect news for query",
+                ticker=tracked.ticker,
+                query=query,
+                error=str(exc),
+                exc_info=True,
+            )
+            return None
+        finally:
+            await self._settle(estimated_cost, actual_cost)
+
+    async def _collect_query(self, tracked: TrackedItem, query: str, cutoff: datetime) -> int:
+        if self._two_phase:
+            return await self._collect_query_two_phase(tracked, query, cutoff)
+
+        include_text = self._policy.include_full_text
+        estimated_cost = self._policy.estimate_search_cost_usd(
+            num_results=self._max_articles_per_query,
+            include_text=include_text,
+            include_highlights=True,
+            search_type=self._policy.exa_search_type,
+        )
+        response = await self._call_exa(
+            estimated_cost,
+            partial(
+                self._exa.search_and_contents,
+                query,
+                num_results=self._max_articles_per_query,
+                search_type=self._policy.exa_search_type,
+                text=include_text,
+                highlights=True,
+                category="news",
+                start_published_date=cutoff,
+            ),
+            tracked=tracked,
+            query=query,
+        )
+        if response is None:
+            return 0
+        return await store_articles(
+            self._db,
+            tracked,
+            response.results,
+            request_id=response.request_id,
+            sentiment=self._sentiment,
+        )
+
+    async def _collect_query_two_phase(
+        self, tracked: TrackedItem, query: str, cutoff: datetime
+    ) -> int:
+        """Search without contents, then fetch contents only for URLs not stored or claimed."""
+        estimated_cost = self._policy.estimate_search_cost_usd(
+            num_results=self._max_articles_per_query,
+            include_text=False,
+            include_highlights=False,
+            search_type=self._policy.exa_search_type,
+        )
+        search = await self._call_exa(
+            estimated_cost,
+            partial(
+                self._exa.search,
+                query,
+                num_results=self._max_articles_per_query,
+                search_type=self._policy.exa_search_type,
+                start_published_date=cutoff,
+                category="news",
+            ),
+            tracked=tracked,
+            query=query,
+        )
+        if search is None:
+            return 0
+
+        by_hash = {url_hash(result.url): result for result in search.results}
+        known = await known_url_hashes(self._db, by_hash)
+        unseen: list[SearchResult] = []
+        for key, result in by_hash.items():
+            if key in known or key in self._claimed:
+                # Stored already, or being fetched by another query: only link it, after the run.
+                self._deferred_links.append((tracked, key))
+            else:
+                self._claimed.add(key)
+                unseen.append(result)
 
-            try:
-                response = await self._exa.search_and_contents(
-                    query,
-                    num_results=self._max_articles_per_query,
-                    search_type=self._policy.exa_search_type,
+        new_articles = 0
+        include_text = self._policy.include_full_text
+        for start in range(0, len(unseen), NEWS_CONTENTS_BATCH_SIZE):
+            batch = unseen[start : start + NEWS_CONTENTS_BATCH_SIZE]
+            contents = await self._call_exa(
+                self._policy.estimate_contents_cost_usd(
+                    num_urls=len(batch), include_text=include_text, include_highlights=True
+                ),
+                partial(
+                    self._exa.get_contents,
+                    [result.url for result in batch],
                     text=include_text,
-                    highlights=include_highlights,
-                    category="news",
-                    start_published_date=cutoff,
-                )
-                self._budget.record_spend(extract_exa_cost_total(response))
-            except Exception as exc:
+                    highlights=True,
+                ),
+                tracked=tracked,
+                query=query,
+            )
+            fetched = match_contents(batch, contents.results) if contents else {}
+            if contents and len(fetched) < len(batch):
                 logger.warning(
-                    "Failed to collect news for query",
+                    "Exa contents missing for requested URLs",
                     ticker=tracked.ticker,
                     query=query,
-                    error=str(exc),
-                    exc_info=True,
+                    request_id=contents.request_id,
+                    urls=[r.url for r in batch if url_hash(r.url) not in fetched],
                 )
-                continue
-
-            for result in response.results:
-                url_hash = self._url_hash(result.url)
-                async with self._db.session_factory() as session:
-                    try:
-                        async with session.begin():
-                            existing = (
-                                await session.execute(
-                                    select(NewsArticle.id).where(NewsArticle.url_hash == url_hash)
-                                )
-                            ).scalar_one_or_none()
-                            if existing is not None:
-                                continue
-
-                            article = NewsArticle(
-                                url=result.url,
-                                url_hash=url_hash,
-                                title=result.title,
-                                source_domain=self._extract_domain(result.url),
-                                published_at=result.published_date,
-                                text_snippet=(result.highlights[0] if result.highlights else None),
-                                full_text=result.text,
-                                exa_request_id=response.request_id,
-                            )
-                            session.add(article)
-                            await session.flush()
-
-                            if tracked.item_type == "event":
-                                session.add(
-                                    NewsArticleEvent(
-                                        article_id=article.id, event_ticker=tracked.ticker
-                                    )
-                                )
-                            else:
-                                session.add(
-                                    NewsArticleMarket(article_id=article.id, ticker=tracked.ticker)
-                                )
-
-                            if self._sentiment and result.text:
-                                sentiment = self._sentiment.analyze(result.text, result.title)
-                                session.add(
-                                    NewsSentiment(
-                                        article_id=article.id,
-                                        score=sentiment.score,
-                                        label=sentiment.label,
-                                        confidence=sentiment.confidence,
-                                        method=sentiment.method,
-                                        keywords_matched=json.dumps(sentiment.keywords_matched),
-                                    )
-                                )
-
-                            new_articles += 1
-                    except IntegrityError:
-                        # Duplicate article (race condition) - skip and continue
-                        continue
-
-        async with self._db.session_factory() as session, session.begin():
-            await session.execute(
-                update(TrackedItem)
-                .where(TrackedItem.id == tracked.id)
-                .values(last_collected_at=datetime.now(UTC))
-            )
-
-        logger.info("Collected news", ticker=tracked.ticker, new_articles=new_articles)
-        return new_articles
-
-    async def collect_all(self) -> dict[str, int]:
-        """Collect news for all active tracked items and return per-ticker insert counts."""
-        results: dict[str, int] = {}
-        async with self._db.session_factory() as session:
-            tracked_items = (
-                (
-                    await session.execute(
-                        select(TrackedItem).where(TrackedItem.is_active == True)  # noqa: E712
-                    )
+            # Search metadata (title, published date) plus the fetched text and highlights.
+            articles = [
+                result.model_copy(
+                    update={"text": fetched[key].text, "highlights": fetched[key].highlights}
                 )
-                .scalars()
-                .all()
+                for result in batch
+                if (key := url_hash(result.url)) in fetched
+            ]
+            # URLs that could not be fetched can be retried by a later query or run.
+            self._claimed.difference_update(
+                url_hash(result.url) for result in batch if url_hash(result.url) not in fetched
             )
-
-        for tracked in tracked_items:
-            results[tracked.ticker] = await self.collect_for_tracked_item(tracked)
-            if self._budget_exhausted:
-                break
-        return results
+            new_articles += await store_articles(
+                self._db,
+                tracked,
+                articles,
+                request_id=contents.request_id if contents else None,
+                sentiment=self._sentiment,
+            )
+        return new_articles
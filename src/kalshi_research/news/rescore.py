@@ -0,0 +1,214 @@
+"""Re-score stored news articles under a new sentiment method version."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import multiprocessing
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from functools import partial
+from typing import TYPE_CHECKING
+
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from kalshi_research.constants import DEFAULT_RESCORE_CHUNK_ROWS
+from kalshi_research.data.models import NewsArticle, NewsSentiment
+from kalshi_research.data.repositories.sentiment_rollups import SentimentRollupRepository
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from pathlib import Path
+
+    from kalshi_research.data.database import DatabaseManager
+    from kalshi_research.news.sentiment import SentimentAnalyzer, SentimentResult
+
+
+@dataclass(frozen=True, slots=True)
+class RescoreProgress:
+    """Progress after one chunk of articles has been scored and stored."""
+
+    last_article_id: int
+    scored: int
+    elapsed_seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.scored / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class RescoreResult:
+    """Outcome of a `rescore_sentiment` run."""
+
+    method: str
+    scored: int
+    chunks: int
+    after_article_id: int
+    last_article_id: int
+    elapsed_seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.scored / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class RescoreCheckpoint:
+    """Where an interrupted re-score of `method` left off, persisted between chunks."""
+
+    method: str
+    last_article_id: int
+
+    @classmethod
+    def load(cls, path: Path) -> RescoreCheckpoint:
+        """Read a checkpoint written by `save()`."""
+        raw = json.loads(path.read_text(encoding="utf-8"))
+        return cls(method=str(raw["method"]), last_article_id=int(raw["last_article_id"]))
+
+    def save(self, path: Path) -> None:
+        """Atomically write the checkpoint as JSON."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.tmp.{uuid.uuid4().hex}")
+        try:
+            tmp_path.write_text(json.dumps(asdict(self), indent=2), encoding="utf-8")
+            tmp_path.replace(path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+
+async def rescore_sentiment(
+    db: DatabaseManager,
+    analyzer: SentimentAnalyzer,
+    *,
+    workers: int = 1,
+    chunk_rows: int = DEFAULT_RESCORE_CHUNK_ROWS,
+    state_path: Path | None = None,
+    resume: bool = False,
+    on_progress: Callable[[RescoreProgress], None] | None = None,
+) -> RescoreResult:
+    """Score every stored article with text under `analyzer.method` and upsert the results.
+
+    Articles are read in pages of `chunk_rows` by id (keyset pagination, so memory stays bounded
+    and no read transaction is held between pages). Each page is scored across `workers`
+    processes and upserted on `(article_id, method)` in one transaction, together with the
+    affected daily sentiment rollups; existing rows of other methods are left untouched.
+
+    `state_path` is rewritten after every chunk and removed on success. With `resume`, the run
+    continues after the last article recorded there. Progress is not read back from
+    `news_sentiments`: rows of `analyzer.method` may already exist past that point (the collector
+    writes new articles under its method), so they say nothing about what this run has covered.
+
+    Raises:
+        FileNotFoundError: If `resume` is set and there is no checkpoint to resume.
+        ValueError: If the checkpoint was written for a different method.
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows must be at least 1")
+    after_article_id = 0
+    if resume:
+        if state_path is None:
+            raise ValueError("resume requires a state_path")
+        checkpoint = RescoreCheckpoint.load(state_path)
+        if checkpoint.method != analyzer.method:
+            raise ValueError(
+                f"checkpoint {state_path} is for method {checkpoint.method!r}, "
+                f"not {analyzer.method!r}"
+            )
+        after_article_id = checkpoint.last_article_id
+
+    started = time.monotonic()
+    scored = chunks = 0
+    last_id = after_article_id
+    pool = (
+        ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        if workers > 1
+        else nullcontext()
+    )
+    with pool as executor:
+        while True:
+            async with db.session_factory() as session:
+                page = (
+                    await session.execute(
+                        select(NewsArticle.id, NewsArticle.title, NewsArticle.full_text)
+                        .where(
+                            NewsArticle.id > last_id,
+                            NewsArticle.full_text.is_not(None),
+                            NewsArticle.full_text != "",
+                        )
+                        .order_by(NewsArticle.id)
+                        .limit(chunk_rows)
+                    )
+                ).all()
+            if not page:
+                break
+
+            # Scoring is CPU-bound: keep it off the event loop, fanned out over the pool.
+            results = await asyncio.to_thread(
+                partial(
+                    analyzer.analyze_many,
+                    [row.full_text for row in page],
+                    [row.title for row in page],
+                    chunk_size=-(-len(page) // workers),
+                    executor=executor,
+                )
+            )
+            await _upsert_sentiments(db, [row.id for row in page], results)
+
+            last_id = page[-1].id
+            scored += len(page)
+            chunks += 1
+            if state_path is not None:
+                RescoreCheckpoint(analyzer.method, last_id).save(state_path)
+            if on_progress is not None:
+                on_progress(RescoreProgress(last_id, scored, time.monotonic() - started))
+
+    if state_path is not None:
+        state_path.unlink(missing_ok=True)
+    return RescoreResult(
+        method=analyzer.method,
+        scored=scored,
+        chunks=chunks,
+        after_article_id=after_article_id,
+        last_article_id=last_id,
+        elapsed_seconds=time.monotonic() - started,
+    )
+
+
+async def _upsert_sentiments(
+    db: DatabaseManager, article_ids: Sequence[int], results: Sequence[SentimentResult]
+) -> None:
+    now = datetime.now(UTC)
+    stmt = sqlite_insert(NewsSentiment).values(
+        [
+            {
+                "article_id": article_id,
+                "analyzed_at": now,
+                "score": result.score,
+                "label": result.label,
+                "confidence": result.confidence,
+                "method": result.method,
+                "keywords_matched": json.dumps(result.keywords_matched),
+            }
+            for article_id, result in zip(article_ids, results, strict=True)
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[NewsSentiment.article_id, NewsSentiment.method],
+        set_={
+            column: stmt.excluded[column]
+            for column in ("analyzed_at", "score", "label", "confidence", "keywords_matched")
+        },
+    )
+    async with db.session_factory() as session, session.begin():
+        rollups = SentimentRollupRepository(session)
+        await rollups.remove_articles(article_ids)
+        await session.execute(stmt)
+        await rollups.add_articles(article_ids)
@@ -2,21 +2,27 @@
 
 from __future__ import annotations
 
+import multiprocessing
 import re
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import dataclass
+from itertools import chain, compress
 from typing import TYPE_CHECKING, ClassVar
 
 import structlog
 
 if TYPE_CHECKING:
-    from collections.abc import Set
+    from collections.abc import Sequence
 
     from kalshi_research.exa.client import ExaClient
 
+from kalshi_research.constants import DEFAULT_SENTIMENT_METHOD, SENTIMENT_BATCH_CHUNK_SIZE
 from kalshi_research.exa.models.common import SummaryOptions
 
 logger = structlog.get_logger()
 
+_NON_TOKEN_CHARS = re.compile(r"[^\w\s']")
+
 
 @dataclass(frozen=True, slots=True)
 class SentimentResult:
@@ -139,59 +145,48 @@ class SentimentAnalyzer:
         positive_weight: float = 1.0,
         negative_weight: float = 1.0,
         title_weight: float = 2.0,
+        method: str = DEFAULT_SENTIMENT_METHOD,
     ) -> None:
+        """
+        Args:
+            method: Recorded as `news_sentiments.method`; name a new version (e.g. "keyword-v2")
+                when changing keywords or weights, so old and new scores can coexist.
+        """
+        self.method = method
         self.positive_weight = positive_weight
         self.negative_weight = negative_weight
         self.title_weight = title_weight
-
-    def _tokenize(self, text: str) -> list[str]:
-        text = text.lower()
-        text = re.sub(r"[^\w\s']", " ", text)
-        return text.split()
-
-    def _count_keywords(self, tokens: list[str], keywords: Set[str]) -> tuple[float, list[str]]:
+        self._keywords = self.POSITIVE_KEYWORDS | self.NEGATIVE_KEYWORDS
+
+    def _scan(self, text: str) -> tuple[float, float, list[str]]:
+        """Weighted positive/negative keyword counts of `text`, from a single token pass."""
+        tokens = _NON_TOKEN_CHARS.sub(" ", text.lower()).split()
+        # Select (previous token, keyword) pairs with C-level iterators; only the few keyword
+        # hits reach the Python loop.
+        pairs = zip(chain(("",), tokens), tokens, strict=False)
+        hits = compress(pairs, map(self._keywords.__contains__, tokens))
+        positive = negative = 0.0
         matched: list[str] = []
-        count = 0.0
-
-        for i, token in enumerate(tokens):
-            if token not in keywords:
+        for previous, keyword in hits:
+            if previous in self.NEGATORS:
                 continue
-
-            if i > 0 and tokens[i - 1] in self.NEGATORS:
-                continue
-
-            multiplier = 1.0
-            if i > 0 and tokens[i - 1] in self.INTENSIFIERS:
-                multiplier = 1.5
-
-            count += multiplier
-            matched.append(token)
-
-        return count, matched
+            weight = 1.5 if previous in self.INTENSIFIERS else 1.0
+            if keyword in self.POSITIVE_KEYWORDS:
+                positive += weight
+            else:
+                negative += weight
+            matched.append(keyword)
+        return positive, negative, matched
 
     def analyze(self, text: str, title: str | None = None) -> SentimentResult:
         """Analyze sentiment using a deterministic keyword-based heuristic."""
-        all_matched: list[str] = []
-
-        text_tokens = self._tokenize(text)
-        pos_count, pos_matched = self._count_keywords(text_tokens, self.POSITIVE_KEYWORDS)
-        neg_count, neg_matched = self._count_keywords(text_tokens, self.NEGATIVE_KEYWORDS)
-
-        all_matched.extend(pos_matched)
-        all_matched.extend(neg_matched)
+        pos_count, neg_count, all_matched = self._scan(text)
 
         if title:
-            title_tokens = self._tokenize(title)
-            title_pos, title_pos_matched = self._count_keywords(
-                title_tokens, self.POSITIVE_KEYWORDS
-            )
-            title_neg, title_neg_matched = self._count_keywords(
-                title_tokens, self.NEGATIVE_KEYWORDS
-            )
+            title_pos, title_neg, title_matched = self._scan(title)
             pos_count += title_pos * self.title_weight
             neg_count += title_neg * self.title_weight
-            all_matched.extend(title_pos_matched)
-            all_matched.extend(title_neg_matched)
+            all_matched.extend(title_matched)
 
         pos_count *= self.positive_weight
         neg_count *= self.negative_weight
@@ -215,10 +210,58 @@ class SentimentAnalyzer:
             score=score,
             label=label,
             confidence=confidence,
-            method="keyword",
+            method=self.method,
             keywords_matched=sorted(set(all_matched)),
         )
 
+    def analyze_many(
+        self,
+        texts: Sequence[str],
+        titles: Sequence[str | None] | None = None,
+        *,
+        workers: int = 1,
+        chunk_size: int = SENTIMENT_BATCH_CHUNK_SIZE,
+        executor: Executor | None = None,
+    ) -> list[SentimentResult]:
+        """Analyze many texts (e.g. a re-scoring backfill); results are in input order.
+
+        With `workers > 1` the texts are scored in chunks of `chunk_size` across a process pool,
+        which pays off for thousands of full article texts; small batches stay in-process.
+        Pass a process `executor` to reuse one pool across calls (`workers` is then ignored).
+        """
+        if titles is None:
+            titles = [None] * len(texts)
+        elif len(titles) != len(texts):
+            raise ValueError("titles must have the same length as texts")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        if (executor is None and workers == 1) or len(texts) <= chunk_size:
+            return _analyze_chunk(self, texts, titles)
+
+        starts = range(0, len(texts), chunk_size)
+        args = (
+            [self] * len(starts),
+            [texts[i : i + chunk_size] for i in starts],
+            [titles[i : i + chunk_size] for i in starts],
+        )
+        if executor is not None:
+            return [result for chunk in executor.map(_analyze_chunk, *args) for result in chunk]
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(starts)),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            return [result for chunk in pool.map(_analyze_chunk, *args) for result in chunk]
+
+
+def _analyze_chunk(
+    analyzer: SentimentAnalyzer, texts: Sequence[str], titles: Sequence[str | None]
+) -> list[SentimentResult]:
+    # Module-level so process-pool workers can unpickle it.
+    return [analyzer.analyze(text, title) for text, title in zip(texts, titles, strict=True)]
+
 
 class SummarySentimentAnalyzer:
     """
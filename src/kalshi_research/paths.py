@@ -12,15 +12,21 @@ DEFAULT_DB_PATH = DEFAULT_DATA_DIR / "kalshi.db"
 DEFAULT_ALERTS_PATH = DEFAULT_DATA_DIR / "alerts.json"
 DEFAULT_THESES_PATH = DEFAULT_DATA_DIR / "theses.json"
 DEFAULT_EXPORTS_DIR = DEFAULT_DATA_DIR / "exports"
+DEFAULT_EXA_CACHE_DIR = DEFAULT_DATA_DIR / "exa_cache"
+DEFAULT_MARKET_CACHE_DIR = DEFAULT_DATA_DIR / "market_cache"
 DEFAULT_ALERT_LOG = DEFAULT_DATA_DIR / "alert_monitor.log"
+DEFAULT_COLLECTOR_STATUS_PATH = DEFAULT_DATA_DIR / "collector_status.json"
 DEFAULT_TRADE_AUDIT_LOG = DEFAULT_DATA_DIR / "trade_audit.log"
 
 __all__ = [
     "DEFAULT_ALERTS_PATH",
     "DEFAULT_ALERT_LOG",
+    "DEFAULT_COLLECTOR_STATUS_PATH",
     "DEFAULT_DATA_DIR",
     "DEFAULT_DB_PATH",
+    "DEFAULT_EXA_CACHE_DIR",
     "DEFAULT_EXPORTS_DIR",
+    "DEFAULT_MARKET_CACHE_DIR",
     "DEFAULT_THESES_PATH",
     "DEFAULT_TRADE_AUDIT_LOG",
 ]
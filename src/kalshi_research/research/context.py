@@ -138,7 +138,7 @@ class MarketContextResearcher:
         include_highlights: bool,
     ) -> tuple[SearchResponse | None, bool]:
         cache_params = self._policy.normalize_cache_params(params)
-        cached = self._cache.get("search", cache_params) if self._cache else None
+        cached = await self._cache.aget("search", cache_params) if self._cache else None
         if cached:
             return (SearchResponse.model_validate(cached), True)
 
@@ -163,7 +163,7 @@ class MarketContextResearcher:
         )
 
         if self._cache:
-            self._cache.set(
+            await self._cache.aset(
                 "search",
                 cache_params,
                 response.model_dump(mode="json", by_alias=True, exclude_none=True),
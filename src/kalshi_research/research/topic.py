@@ -59,7 +59,7 @@ class TopicResearcher:
     ) -> tuple[AnswerResponse | None, bool]:
         params: dict[str, object] = {"query": topic, "text": True}
         cache_params = self._policy.normalize_cache_params(params)
-        cached = self._cache.get("answer", cache_params) if self._cache else None
+        cached = await self._cache.aget("answer", cache_params) if self._cache else None
         if cached:
             return (AnswerResponse.model_validate(cached), False)
 
@@ -74,7 +74,7 @@ class TopicResearcher:
             return (None, False)
 
         if self._cache:
-            self._cache.set(
+            await self._cache.aset(
                 "answer",
                 cache_params,
                 response.model_dump(mode="json", by_alias=True, exclude_none=True),
@@ -95,7 +95,7 @@ class TopicResearcher:
             "highlights": include_highlights,
         }
         cache_params = self._policy.normalize_cache_params(params)
-        cached = self._cache.get("search", cache_params) if self._cache else None
+        cached = await self._cache.aget("search", cache_params) if self._cache else None
         if cached:
             return (SearchResponse.model_validate(cached), False)
 
@@ -121,7 +121,7 @@ class TopicResearcher:
             return (None, False)
 
         if self._cache:
-            self._cache.set(
+            await self._cache.aset(
                 "search",
                 cache_params,
                 response.model_dump(mode="json", by_alias=True, exclude_none=True),
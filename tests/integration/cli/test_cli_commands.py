@@ -220,7 +220,10 @@ def test_data_collect_daemon_schedules_tasks_and_exits_cleanly(runner: CliRunner
             *,
             interval_seconds: int,
             run_immediately: bool = True,
+            jitter_seconds: float = 0.0,
+            deadline_seconds: float | None = None,
         ) -> None:
+            del jitter_seconds, deadline_seconds
             self.scheduled.append((name, task, interval_seconds, run_immediately))
 
         async def __aenter__(self) -> _FakeScheduler:
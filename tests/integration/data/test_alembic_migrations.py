@@ -41,6 +41,10 @@ def test_alembic_upgrade_downgrade_roundtrip(tmp_path) -> None:
         "news_article_markets",
         "news_article_events",
         "news_sentiments",
+        "latest_quotes",
+        "snapshot_batches",
+        "price_rollups",
+        "news_sentiment_daily",
     ):
         assert table in tables_after_upgrade
     assert app_logger.disabled is False
@@ -60,6 +64,10 @@ def test_alembic_upgrade_downgrade_roundtrip(tmp_path) -> None:
         "news_article_markets",
         "news_article_events",
         "news_sentiments",
+        "latest_quotes",
+        "snapshot_batches",
+        "price_rollups",
+        "news_sentiment_daily",
     ):
         assert table not in tables_after_downgrade
     assert app_logger.disabled is False
@@ -79,6 +87,10 @@ def test_alembic_upgrade_downgrade_roundtrip(tmp_path) -> None:
         "news_article_markets",
         "news_article_events",
         "news_sentiments",
+        "latest_quotes",
+        "snapshot_batches",
+        "price_rollups",
+        "news_sentiment_daily",
     ):
         assert table in tables_after_reupgrade
     assert app_logger.disabled is False
@@ -0,0 +1,232 @@
+"""Unit tests for the batch agent runner."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from kalshi_research.agent.batch import BatchAgentRunner
+from kalshi_research.agent.providers.llm import MockSynthesizer
+from kalshi_research.agent.schemas import BatchMarketStatus, ResearchSummary
+from kalshi_research.api.models.market import Market
+from kalshi_research.exa.exceptions import ExaAPIError
+from kalshi_research.exa.policy import ExaMode
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from kalshi_research.agent.providers.llm import SynthesisInput
+    from kalshi_research.agent.schemas import AnalysisResult
+
+
+class _FakeResearchAgent:
+    def __init__(
+        self,
+        *,
+        cost_usd: float = 0.10,
+        fail_events: frozenset[str] = frozenset(),
+        broken_events: frozenset[str] = frozenset(),
+    ):
+        self.cost_usd = cost_usd
+        self.fail_events = fail_events
+        self.broken_events = broken_events
+        self.calls: list[tuple[str, float]] = []
+
+    async def research(self, market: Market, *, mode: ExaMode, budget_usd: float) -> Any:
+        self.calls.append((market.ticker, budget_usd))
+        if market.event_ticker in self.fail_events:
+            raise ExaAPIError("upstream unavailable", status_code=503)
+        if market.event_ticker in self.broken_events:
+            raise ValueError("malformed research payload")
+        return ResearchSummary(
+            ticker=market.ticker,
+            title=market.title,
+            mode=mode,
+            total_cost_usd=self.cost_usd,
+            budget_usd=budget_usd,
+            researched_at=datetime.now(UTC),
+        )
+
+
+class _TrackingSynthesizer(MockSynthesizer):
+    def __init__(self, *, cost_usd: float = 0.0, fail_tickers: frozenset[str] = frozenset()):
+        super().__init__()
+        self.cost_usd = cost_usd
+        self.fail_tickers = fail_tickers
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def synthesize(self, *, input: SynthesisInput) -> AnalysisResult:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if input.market.ticker in self.fail_tickers:
+                raise RuntimeError("no tool_use block")
+            self._last_cost_usd = self.cost_usd
+            return await super().synthesize(input=input)
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def market(make_market: Callable[..., dict[str, Any]]) -> Callable[[str, str], Market]:
+    def _build(ticker: str, event_ticker: str) -> Market:
+        return Market.model_validate(
+            make_market(
+                ticker=ticker,
+                event_ticker=event_ticker,
+                yes_bid_dollars="0.4500",
+                yes_ask_dollars="0.4700",
+                no_bid_dollars="0.5300",
+                no_ask_dollars="0.5500",
+            )
+        )
+
+    return _build
+
+
+def _client(markets: list[Market]) -> MagicMock:
+    client = MagicMock()
+    client.get_markets_by_tickers = AsyncMock(return_value=markets)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_batch_shares_market_fetch_and_event_research(
+    market: Callable[[str, str], Market],
+) -> None:
+    markets = [market("A-1", "EVT-A"), market("B-1", "EVT-B"), market("A-2", "EVT-A")]
+    client = _client(markets)
+    research_agent = _FakeResearchAgent(cost_usd=0.10)
+    runner = BatchAgentRunner(
+        kalshi_client=client,
+        research_agent=research_agent,  # type: ignore[arg-type]
+        synthesizer=MockSynthesizer(),
+    )
+
+    result = await runner.run(["A-1", "B-1", "GONE", "A-2", "A-1"], research_mode=ExaMode.FAST)
+
+    client.get_markets_by_tickers.assert_awaited_once_with(["A-1", "B-1", "GONE", "A-2"])
+    client.get_orderbook.assert_not_called()
+    assert sorted(ticker for ticker, _ in research_agent.calls) == ["A-1", "B-1"]
+    assert [m.ticker for m in result.markets] == ["A-1", "B-1", "GONE", "A-2"]
+    assert [m.status for m in result.markets] == [
+        BatchMarketStatus.COMPLETED,
+        BatchMarketStatus.COMPLETED,
+        BatchMarketStatus.SKIPPED,
+        BatchMarketStatus.COMPLETED,
+    ]
+    assert result.markets[2].reason == "not_found"
+    assert result.events_researched == 2
+    assert result.exa_cost_usd == pytest.approx(0.20)
+
+    a1, a2 = result.markets[0].result, result.markets[3].result
+    assert a1 is not None and a2 is not None
+    assert a1.research is a2.research
+    assert a1.total_cost_usd == pytest.approx(0.05)
+    # Snapshot comes from the batched market's top of book.
+    assert a1.analysis.market_prob == pytest.approx(0.46)
+
+
+@pytest.mark.asyncio
+async def test_batch_skips_work_beyond_aggregate_budgets(
+    market: Callable[[str, str], Market],
+) -> None:
+    markets = [market("A-1", "EVT-A"), market("B-1", "EVT-B"), market("B-2", "EVT-B")]
+    runner = BatchAgentRunner(
+        kalshi_client=_client(markets),
+        research_agent=_FakeResearchAgent(cost_usd=0.20),  # type: ignore[arg-type]
+        synthesizer=_TrackingSynthesizer(cost_usd=0.20),
+        max_exa_usd=0.5,
+        max_llm_usd=0.3,
+        per_event_exa_usd=0.25,
+        per_market_llm_usd=0.25,
+        max_concurrency=1,
+    )
+
+    result = await runner.run(["A-1", "B-1", "B-2"])
+
+    # After A-1 settles at 0.20, the remaining 0.10 cannot cover another 0.25 reservation.
+    assert [(m.status, m.reason) for m in result.markets] == [
+        (BatchMarketStatus.COMPLETED, None),
+        (BatchMarketStatus.SKIPPED, "llm_budget_exhausted"),
+        (BatchMarketStatus.SKIPPED, "llm_budget_exhausted"),
+    ]
+    assert result.llm_cost_usd == pytest.approx(0.20)
+    assert result.llm_cost_usd <= result.max_llm_usd
+
+    exa_limited = BatchAgentRunner(
+        kalshi_client=_client(markets),
+        research_agent=_FakeResearchAgent(cost_usd=0.20),  # type: ignore[arg-type]
+        synthesizer=MockSynthesizer(),
+        max_exa_usd=0.3,
+        per_event_exa_usd=0.25,
+        max_concurrency=1,
+    )
+    result = await exa_limited.run(["A-1", "B-1", "B-2"])
+
+    assert [(m.status, m.reason) for m in result.markets] == [
+        (BatchMarketStatus.COMPLETED, None),
+        (BatchMarketStatus.SKIPPED, "exa_budget_exhausted"),
+        (BatchMarketStatus.SKIPPED, "exa_budget_exhausted"),
+    ]
+    assert result.events_researched == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_bounds_concurrency_and_isolates_failures(
+    market: Callable[[str, str], Market],
+) -> None:
+    markets = [market(f"A-{i}", "EVT-A") for i in range(6)] + [market("B-1", "EVT-B")]
+    synthesizer = _TrackingSynthesizer(fail_tickers=frozenset({"A-3"}))
+    runner = BatchAgentRunner(
+        kalshi_client=_client(markets),
+        research_agent=_FakeResearchAgent(fail_events=frozenset({"EVT-B"})),  # type: ignore[arg-type]
+        synthesizer=synthesizer,
+        max_concurrency=2,
+    )
+
+    result = await runner.run([m.ticker for m in markets])
+
+    assert synthesizer.peak_in_flight == 2
+    statuses = {m.ticker: m for m in result.markets}
+    assert statuses["A-3"].status == BatchMarketStatus.FAILED
+    assert statuses["A-3"].reason == "synthesis: no tool_use block"
+    assert statuses["B-1"].status == BatchMarketStatus.FAILED
+    assert statuses["B-1"].reason is not None and statuses["B-1"].reason.startswith("research:")
+    assert result.count(BatchMarketStatus.COMPLETED) == 5
+    # The failed call's cost is unknown, so it is charged at the per-market reservation.
+    assert result.llm_cost_usd == pytest.approx(runner.per_market_llm_usd)
+
+
+@pytest.mark.asyncio
+async def test_batch_records_non_exa_research_errors_per_event(
+    market: Callable[[str, str], Market],
+) -> None:
+    markets = [market("A-1", "EVT-A"), market("B-1", "EVT-B"), market("B-2", "EVT-B")]
+    runner = BatchAgentRunner(
+        kalshi_client=_client(markets),
+        research_agent=_FakeResearchAgent(broken_events=frozenset({"EVT-B"})),  # type: ignore[arg-type]
+        synthesizer=MockSynthesizer(),
+    )
+
+    result = await runner.run(["A-1", "B-1", "B-2"])
+
+    assert [(m.ticker, m.status) for m in result.markets] == [
+        ("A-1", BatchMarketStatus.COMPLETED),
+        ("B-1", BatchMarketStatus.FAILED),
+        ("B-2", BatchMarketStatus.FAILED),
+    ]
+    assert result.markets[1].reason == "research: malformed research payload"
+
+
+def test_batch_runner_rejects_invalid_concurrency() -> None:
+    with pytest.raises(ValueError, match="max_concurrency"):
+        BatchAgentRunner(
+            kalshi_client=MagicMock(), synthesizer=MockSynthesizer(), max_concurrency=0
+        )
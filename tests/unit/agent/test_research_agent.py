@@ -1,5 +1,6 @@
 """Unit tests for ResearchAgent plan building and budget enforcement."""
 
+import asyncio
 from datetime import UTC, datetime
 from pathlib import Path
 from unittest.mock import AsyncMock
@@ -874,3 +875,157 @@ async def test_execute_step_unknown_endpoint_raises(
 
     with pytest.raises(ValueError, match="Unknown research step endpoint"):
         await agent._execute_step(step, sample_market)
+
+
+def _step(
+    step_id: str,
+    *,
+    endpoint: str = "search",
+    cost: float = 0.01,
+    depends_on: list[str] | None = None,
+) -> ResearchStep:
+    return ResearchStep(
+        step_id=step_id,
+        endpoint=endpoint,
+        description=step_id,
+        estimated_cost_usd=cost,
+        params={"query": step_id},
+        depends_on=depends_on or [],
+    )
+
+
+def _plan(steps: list[ResearchStep]) -> ResearchPlan:
+    return ResearchPlan(
+        plan_id="graph-plan",
+        ticker="TEST-01JAN25",
+        mode="deep",
+        steps=steps,
+        total_estimated_cost_usd=sum(step.estimated_cost_usd for step in steps),
+    )
+
+
+class _Tracker:
+    """Fake `execute_step` recording how many steps overlap."""
+
+    def __init__(self, *, fail: set[str] | None = None) -> None:
+        self.active: list[str] = []
+        self.peak = 0
+        self.started: list[str] = []
+        self.overlapping_research = False
+        self._fail = fail or set()
+
+    async def __call__(self, step: ResearchStep, market: Market) -> ResearchStepResult:
+        _ = market
+        if step.endpoint == "research" and any(a.startswith("deep") for a in self.active):
+            self.overlapping_research = True
+        self.active.append(step.step_id)
+        self.started.append(step.step_id)
+        self.peak = max(self.peak, len(self.active))
+        try:
+            await asyncio.sleep(0.01)
+            if step.step_id in self._fail:
+                raise ExaAPIError("boom", status_code=500)
+        finally:
+            self.active.remove(step.step_id)
+        return ResearchStepResult(
+            step_id=step.step_id,
+            status=ResearchStepStatus.COMPLETED,
+            actual_cost_usd=step.estimated_cost_usd,
+            sources_found=1,
+            factors=[],
+        )
+
+
+@pytest.mark.asyncio
+async def test_execute_plan_runs_independent_steps_concurrently_in_plan_order(
+    agent: ResearchAgent, sample_market: Market, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    tracker = _Tracker()
+    monkeypatch.setattr(agent._executor, "execute_step", tracker)
+    agent._max_concurrency = 3
+    plan = _plan([_step(f"news_search_{i}") for i in range(1, 6)])
+
+    summary = await agent.execute_plan(plan, sample_market, budget=ExaBudget(limit_usd=1.0))
+
+    assert tracker.peak == 3
+    assert [record["step_id"] for record in summary.steps_executed] == [
+        step.step_id for step in plan.steps
+    ]
+    assert summary.queries_used == [step.step_id for step in plan.steps]
+    assert summary.total_cost_usd == pytest.approx(0.05)
+
+
+@pytest.mark.asyncio
+async def test_execute_plan_honours_dependencies_and_serializes_deep_research(
+    agent: ResearchAgent, sample_market: Market, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    tracker = _Tracker(fail={"news_search_1"})
+    monkeypatch.setattr(agent._executor, "execute_step", tracker)
+    plan = _plan(
+        [
+            _step("news_search_1"),
+            _step("news_search_2"),
+            _step("answer_3", endpoint="answer", depends_on=["news_search_1"]),
+            _step("deep_research_4", endpoint="research", depends_on=["news_search_2"]),
+            _step("deep_research_5", endpoint="research"),
+        ]
+    )
+
+    summary = await agent.execute_plan(plan, sample_market, budget=ExaBudget(limit_usd=1.0))
+
+    statuses = {record["step_id"]: record["status"] for record in summary.steps_executed}
+    assert statuses == {
+        "news_search_1": ResearchStepStatus.FAILED.value,
+        "news_search_2": ResearchStepStatus.COMPLETED.value,
+        "answer_3": ResearchStepStatus.SKIPPED.value,
+        "deep_research_4": ResearchStepStatus.COMPLETED.value,
+        "deep_research_5": ResearchStepStatus.COMPLETED.value,
+    }
+    assert summary.steps_executed[2]["reason"] == "dependency_not_completed"
+    assert tracker.started.index("deep_research_4") > tracker.started.index("news_search_2")
+    assert not tracker.overlapping_research
+
+
+@pytest.mark.asyncio
+async def test_execute_plan_concurrent_steps_never_overspend_budget(
+    agent: ResearchAgent, sample_market: Market, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    tracker = _Tracker()
+    monkeypatch.setattr(agent._executor, "execute_step", tracker)
+    plan = _plan([_step(f"news_search_{i}", cost=0.04) for i in range(1, 5)])
+    budget = ExaBudget(limit_usd=0.1)
+
+    summary = await agent.execute_plan(plan, sample_market, budget=budget)
+
+    # Two steps fit at once; the third waits for them to settle, then no longer fits.
+    assert tracker.peak == 2
+    assert tracker.started == ["news_search_1", "news_search_2"]
+    assert summary.budget_exhausted is True
+    assert budget.spent_usd == pytest.approx(0.08)
+    assert budget.reserved_usd == 0.0
+
+
+@pytest.mark.asyncio
+async def test_execute_plan_cancels_running_steps_on_unexpected_error(
+    agent: ResearchAgent, sample_market: Market, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cancelled: list[str] = []
+
+    async def execute_step(step: ResearchStep, market: Market) -> ResearchStepResult:
+        _ = market
+        if step.step_id == "crash":
+            raise RuntimeError("kaboom")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(step.step_id)
+            raise
+        raise AssertionError("unreachable")
+
+    monkeypatch.setattr(agent._executor, "execute_step", execute_step)
+    plan = _plan([_step("deep_research_1", endpoint="research"), _step("crash")])
+
+    with pytest.raises(RuntimeError, match="kaboom"):
+        await agent.execute_plan(plan, sample_market, budget=ExaBudget(limit_usd=1.0))
+
+    assert cancelled == ["deep_research_1"]
@@ -181,3 +181,23 @@ def test_research_step_result_failed() -> None:
 
     assert result.status == ResearchStepStatus.FAILED
     assert result.error_message == "API timeout"
+
+
+@pytest.mark.parametrize("depends_on", [["missing"], ["step_2"]])
+def test_research_plan_rejects_unknown_or_forward_dependencies(depends_on: list[str]) -> None:
+    steps = [
+        ResearchStep(
+            step_id="step_1",
+            endpoint="search",
+            description="First",
+            estimated_cost_usd=0.01,
+            depends_on=depends_on,
+        ),
+        ResearchStep(
+            step_id="step_2", endpoint="answer", description="Second", estimated_cost_usd=0.01
+        ),
+    ]
+    with pytest.raises(ValueError, match="depends on unknown or later steps"):
+        ResearchPlan(
+            plan_id="p", ticker="T", mode="standard", steps=steps, total_estimated_cost_usd=0.02
+        )
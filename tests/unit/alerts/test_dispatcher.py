@@ -0,0 +1,121 @@
+"""Tests for asynchronous alert delivery."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+import pytest
+
+from kalshi_research.alerts.conditions import Alert, AlertCondition, AlertStatus, ConditionType
+from kalshi_research.alerts.dispatcher import AlertDispatcher
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+def _make_alert(i: int) -> Alert:
+    condition = AlertCondition(
+        id=f"cond-{i}",
+        condition_type=ConditionType.PRICE_ABOVE,
+        ticker=f"TICKER-{i}",
+        threshold=0.5,
+        label=f"price TICKER-{i} > 0.5",
+    )
+    return Alert(
+        id=f"alert-{i}",
+        condition=condition,
+        triggered_at=datetime.now(UTC),
+        status=AlertStatus.TRIGGERED,
+        current_value=0.6,
+    )
+
+
+class RecordingNotifier:
+    def __init__(self, *, delay: float = 0.0, fail: bool = False) -> None:
+        self.batches: list[list[str]] = []
+        self.closed = False
+        self._delay = delay
+        self._fail = fail
+
+    async def notify_many(self, alerts: Sequence[Alert]) -> None:
+        await asyncio.sleep(self._delay)
+        if self._fail:
+            raise RuntimeError("channel down")
+        self.batches.append([a.id for a in alerts])
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_submit_does_not_wait_for_slow_notifier() -> None:
+    notifier = RecordingNotifier(delay=0.2)
+    dispatcher = AlertDispatcher([notifier], max_batch_size=100, batch_window_seconds=0.01)
+
+    async with dispatcher:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        for i in range(500):
+            await dispatcher.submit(_make_alert(i))
+        assert loop.time() - started < 0.1
+
+    assert notifier.closed
+    delivered = [alert_id for batch in notifier.batches for alert_id in batch]
+    assert delivered == [f"alert-{i}" for i in range(500)]
+    assert len(notifier.batches) == 5
+    assert dispatcher.stats.delivered == 500
+    assert dispatcher.stats.batches == 5
+    assert dispatcher.stats.max_queue_depth >= 400
+
+
+@pytest.mark.asyncio
+async def test_failed_channel_is_counted_and_does_not_block_others() -> None:
+    good = RecordingNotifier()
+    bad = RecordingNotifier(fail=True)
+    dispatcher = AlertDispatcher([good, bad])
+
+    await dispatcher.deliver([_make_alert(1), _make_alert(2)])
+
+    assert good.batches == [["alert-1", "alert-2"]]
+    assert dispatcher.stats.failed == 2
+    assert dispatcher.stats.delivered == 0
+
+
+@pytest.mark.asyncio
+async def test_sync_notifier_runs_off_the_event_loop() -> None:
+    threads: list[int] = []
+
+    class SyncNotifier:
+        def notify(self, alert: Alert) -> None:
+            del alert
+            threads.append(threading.get_ident())
+
+    dispatcher = AlertDispatcher([SyncNotifier()])
+    await dispatcher.deliver([_make_alert(1)])
+
+    assert threads
+    assert threads[0] != threading.get_ident()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_applies_backpressure() -> None:
+    notifier = RecordingNotifier(delay=0.05)
+    dispatcher = AlertDispatcher([notifier], max_queue_size=2, max_batch_size=1)
+
+    async with dispatcher:
+        for i in range(6):
+            await dispatcher.submit(_make_alert(i))
+
+    assert dispatcher.stats.enqueue_wait_seconds > 0
+    assert dispatcher.stats.max_queue_depth <= 2
+    assert dispatcher.stats.delivered == 6
+
+
+def test_rejects_non_positive_limits() -> None:
+    with pytest.raises(ValueError, match="max_queue_size"):
+        AlertDispatcher(max_queue_size=0)
+    with pytest.raises(ValueError, match="max_batch_size"):
+        AlertDispatcher(max_batch_size=0)
@@ -0,0 +1,64 @@
+"""Tests for the per-ticker alert condition index."""
+
+from __future__ import annotations
+
+import pytest
+
+from kalshi_research.alerts._index import ConditionIndex
+from kalshi_research.alerts.conditions import AlertCondition, ConditionType
+
+
+def _condition(cid: str, condition_type: ConditionType, threshold: float) -> AlertCondition:
+    return AlertCondition(
+        id=cid, condition_type=condition_type, ticker="T", threshold=threshold, label=cid
+    )
+
+
+def _ids(index: ConditionIndex, mid: float, prev: float | None = None) -> set[str]:
+    return {c.id for c in index.candidates("T", mid_prob=mid, prev_mid_prob=prev)}
+
+
+@pytest.fixture
+def index() -> ConditionIndex:
+    index = ConditionIndex()
+    for i, threshold in enumerate((0.2, 0.4, 0.6, 0.8)):
+        index.add(_condition(f"above-{i}", ConditionType.PRICE_ABOVE, threshold))
+        index.add(_condition(f"below-{i}", ConditionType.PRICE_BELOW, threshold))
+        index.add(_condition(f"cross-{i}", ConditionType.PRICE_CROSSES, threshold))
+    return index
+
+
+def test_above_and_below_use_strict_comparisons(index: ConditionIndex) -> None:
+    assert _ids(index, 0.6) == {"above-0", "above-1", "below-3"}
+
+
+def test_crosses_up_and_down(index: ConditionIndex) -> None:
+    up = _ids(index, 0.6, prev=0.3) - {"above-0", "above-1", "below-3"}
+    assert up == {"cross-1", "cross-2"}
+
+    down = _ids(index, 0.4, prev=0.7) - {"above-0", "below-2", "below-3"}
+    assert down == {"cross-1", "cross-2"}
+
+    assert not {c for c in _ids(index, 0.5, prev=0.5) if c.startswith("cross")}
+
+
+def test_other_condition_types_are_always_candidates(index: ConditionIndex) -> None:
+    index.add(_condition("spread", ConditionType.SPREAD_ABOVE, 5))
+
+    assert "spread" in _ids(index, 0.5)
+
+
+def test_remove_keeps_arrays_sorted_and_drops_empty_tickers() -> None:
+    index = ConditionIndex()
+    first = _condition("a", ConditionType.PRICE_ABOVE, 0.5)
+    duplicate_threshold = _condition("b", ConditionType.PRICE_ABOVE, 0.5)
+    index.add(first)
+    index.add(duplicate_threshold)
+
+    assert index.remove(first)
+    assert _ids(index, 0.9) == {"b"}
+    assert not index.remove(first)
+
+    assert index.remove(duplicate_threshold)
+    assert "T" not in index
+    assert len(index) == 0
@@ -388,6 +388,131 @@ class TestAlertMonitor:
         assert len(notifications) == 1
         assert notifications[0].condition.id == "notify-test"
 
+    @pytest.mark.asyncio
+    async def test_background_delivery_inside_context(self) -> None:
+        """Inside `async with monitor`, checks return before slow notifiers finish."""
+        import asyncio
+
+        delivered: list[str] = []
+        release = asyncio.Event()
+
+        class SlowNotifier:
+            async def notify_many(self, alerts) -> None:
+                await release.wait()
+                delivered.extend(a.condition.id for a in alerts)
+
+            async def aclose(self) -> None:
+                pass
+
+        monitor = AlertMonitor()
+        monitor.add_notifier(SlowNotifier())
+        for i in range(3):
+            monitor.add_condition(
+                AlertCondition(
+                    id=f"bg-{i}",
+                    condition_type=ConditionType.PRICE_ABOVE,
+                    ticker=f"T{i}",
+                    threshold=0.5,
+                    label="bg",
+                )
+            )
+
+        async with monitor:
+            alerts = await monitor.check_conditions(
+                [make_market(ticker=f"T{i}", yes_price=60) for i in range(3)]
+            )
+            assert len(alerts) == 3
+            assert delivered == []
+            release.set()
+
+        assert sorted(delivered) == ["bg-0", "bg-1", "bg-2"]
+        assert monitor.dispatcher.stats.delivered == 3
+
+    @pytest.mark.asyncio
+    async def test_unchanged_quotes_are_skipped_but_new_conditions_evaluated(self) -> None:
+        """Tickers are re-evaluated only when quotes change or conditions are added."""
+        monitor = AlertMonitor()
+        evaluated: list[str] = []
+        original = monitor._check_condition
+
+        def spy(condition, *args, **kwargs):
+            evaluated.append(condition.id)
+            return original(condition, *args, **kwargs)
+
+        monitor._check_condition = spy  # type: ignore[method-assign]
+        monitor.add_condition(
+            AlertCondition(
+                id="vol",
+                condition_type=ConditionType.VOLUME_ABOVE,
+                ticker="TEST",
+                threshold=50000,
+                label="vol",
+            )
+        )
+        market = make_market(ticker="TEST", yes_price=40)
+
+        await monitor.check_conditions([market])
+        await monitor.check_conditions([market])
+        assert evaluated == ["vol"]
+
+        monitor.add_condition(
+            AlertCondition(
+                id="price",
+                condition_type=ConditionType.PRICE_ABOVE,
+                ticker="TEST",
+                threshold=0.3,
+                label="price",
+            )
+        )
+        alerts = await monitor.check_conditions([market])
+        assert [a.condition.id for a in alerts] == ["price"]
+
+    @pytest.mark.asyncio
+    async def test_alerts_follow_condition_order_across_markets(self) -> None:
+        """Triggered alerts are reported in condition insertion order."""
+        monitor = AlertMonitor()
+        for cid, ticker in (("first", "B"), ("second", "A")):
+            monitor.add_condition(
+                AlertCondition(
+                    id=cid,
+                    condition_type=ConditionType.PRICE_ABOVE,
+                    ticker=ticker,
+                    threshold=0.5,
+                    label=cid,
+                )
+            )
+
+        alerts = await monitor.check_conditions(
+            [make_market(ticker="A", yes_price=60), make_market(ticker="B", yes_price=60)]
+        )
+
+        assert [a.condition.id for a in alerts] == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_thousands_of_conditions_trigger_only_crossed_thresholds(self) -> None:
+        """Many thresholds per ticker: only those below the midpoint fire."""
+        monitor = AlertMonitor()
+        tickers = [f"T{i}" for i in range(50)]
+        for ticker in tickers:
+            for step in range(100):
+                monitor.add_condition(
+                    AlertCondition(
+                        id=f"{ticker}-{step}",
+                        condition_type=ConditionType.PRICE_ABOVE,
+                        ticker=ticker,
+                        threshold=step / 100,
+                        label="grid",
+                    )
+                )
+
+        alerts = await monitor.check_conditions(
+            [make_market(ticker=ticker, yes_price=50) for ticker in tickers]
+        )
+
+        # midpoint 0.50 > thresholds 0.00 .. 0.49
+        assert len(alerts) == 50 * 50
+        assert len(monitor.list_conditions()) == 50 * 50
+
     @pytest.mark.asyncio
     async def test_missing_ticker_no_alert(self) -> None:
         """Test that no alert is triggered if market ticker is not found."""
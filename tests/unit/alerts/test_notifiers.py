@@ -7,9 +7,12 @@ from datetime import UTC, datetime
 from unittest.mock import MagicMock, patch
 
 import httpx
+import pytest
+import respx
 
 from kalshi_research.alerts.conditions import Alert, AlertCondition, AlertStatus, ConditionType
 from kalshi_research.alerts.notifiers import ConsoleNotifier, FileNotifier, WebhookNotifier
+from kalshi_research.constants import WEBHOOK_MAX_RETRY_AFTER_SECONDS
 
 
 def _make_alert() -> Alert:
@@ -107,3 +110,70 @@ def test_webhook_notifier_swallows_non_2xx_status() -> None:
         notifier.notify(alert)
 
     response_mock.raise_for_status.assert_called_once()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_webhook_notify_many_coalesces_alerts_into_one_post() -> None:
+    route = respx.post("https://example.com/webhook").mock(return_value=httpx.Response(200))
+    notifier = WebhookNotifier("https://example.com/webhook", max_alerts_per_request=2)
+
+    await notifier.notify_many([_make_alert(), _make_alert(), _make_alert()])
+    await notifier.aclose()
+
+    assert route.call_count == 2
+    payload = json.loads(route.calls[0].request.content)
+    assert payload["text"] == "2 alerts triggered"
+    assert len(payload["attachments"]) == 2
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_webhook_notify_many_retries_server_errors() -> None:
+    route = respx.post("https://example.com/webhook").mock(
+        side_effect=[httpx.Response(503), httpx.Response(200)]
+    )
+    notifier = WebhookNotifier("https://example.com/webhook", backoff_seconds=0.0)
+
+    await notifier.notify_many([_make_alert()])
+    await notifier.aclose()
+
+    assert route.call_count == 2
+    assert notifier.retries == 1
+
+
+def test_webhook_retry_delay_bounds_retry_after() -> None:
+    notifier = WebhookNotifier("https://example.com/webhook", backoff_seconds=0.5)
+
+    def delay(retry_after: str) -> float:
+        response = httpx.Response(429, headers={"Retry-After": retry_after})
+        return notifier._retry_delay(1, response)
+
+    assert delay("2") == 2.0
+    assert delay("-5") == 0.0
+    assert delay("1e9") == WEBHOOK_MAX_RETRY_AFTER_SECONDS
+    # Non-finite or unparsable values use the exponential backoff instead.
+    assert delay("inf") == delay("nan") == delay("soon") == 1.0
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_webhook_notify_many_does_not_retry_client_errors() -> None:
+    route = respx.post("https://example.com/webhook").mock(return_value=httpx.Response(400))
+    notifier = WebhookNotifier("https://example.com/webhook", backoff_seconds=0.0)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await notifier.notify_many([_make_alert()])
+    await notifier.aclose()
+
+    assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_file_notifier_notify_many_appends_batch(tmp_path) -> None:
+    out = tmp_path / "alerts.jsonl"
+    notifier = FileNotifier(out)
+
+    await notifier.notify_many([_make_alert(), _make_alert()])
+
+    assert len(out.read_text().splitlines()) == 2
@@ -460,3 +460,45 @@ class TestExpiringSoonScan:
         results = scanner.scan_expiring_soon(markets, hours=24)
 
         assert results == []
+
+
+class TestMarketQuoteRowScanning:
+    """Scanner works on lightweight database rows as well as API models."""
+
+    def _row(self, ticker: str, yes_bid: int, yes_ask: int, **overrides: object):
+        from kalshi_research.analysis.scanner import MarketQuoteRow
+
+        now = datetime.now(UTC)
+        fields: dict[str, object] = {
+            "ticker": ticker,
+            "event_ticker": "EVENT-1",
+            "title": f"Row {ticker}",
+            "status": "active",
+            "category": None,
+            "open_time": now - timedelta(days=1),
+            "close_time": now + timedelta(days=1),
+            "yes_bid_cents": yes_bid,
+            "yes_ask_cents": yes_ask,
+            "volume_24h": 5000,
+        }
+        fields.update(overrides)
+        return MarketQuoteRow(**fields)  # type: ignore[arg-type]
+
+    def test_close_races_from_rows(self) -> None:
+        scanner = MarketScanner()
+        rows = [
+            self._row("NEAR", 48, 52),
+            self._row("FAR", 5, 9),
+            self._row("CLOSED", 49, 51, status="closed"),
+        ]
+
+        results = scanner.scan_close_races(rows)
+
+        assert [r.ticker for r in results] == ["NEAR"]
+        assert results[0].spread == 4
+
+    def test_verifier_rejects_string_status(self) -> None:
+        verifier = MarketStatusVerifier()
+
+        with pytest.raises(MarketClosedError, match="has status closed"):
+            verifier.verify_market_open(self._row("CLOSED", 49, 51, status="closed"))
@@ -177,3 +177,65 @@ class TestMarketFilterParameters:
         params = route.calls[0].request.url.params
         assert params["tickers"] == "TICKER-A,TICKER-B"
         assert params["min_created_ts"] == "1700000000"
+
+
+class TestGetMarketsByTickers:
+    """Tests for batched ticker lookups (chunked `tickers=` requests)."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_chunks_dedupes_and_forwards_status(self, make_market) -> None:
+        def _respond(request):
+            tickers = request.url.params["tickers"].split(",")
+            # Drop one ticker to simulate an unknown/closed market.
+            return Response(
+                200,
+                json={
+                    "markets": [make_market(ticker=t) for t in tickers if t != "MKT-007"],
+                    "cursor": None,
+                },
+            )
+
+        route = respx.get("https://api.elections.kalshi.com/trade-api/v2/markets").mock(
+            side_effect=_respond
+        )
+        tickers = [f"MKT-{i:03d}" for i in range(150)] + ["MKT-000", "MKT-001"]
+
+        async with KalshiPublicClient() as client:
+            markets = await client.get_markets_by_tickers(tickers, status="open")
+
+        assert route.call_count == 2
+        first, second = (call.request.url.params for call in route.calls)
+        assert len(first["tickers"].split(",")) == 100
+        assert len(second["tickers"].split(",")) == 50
+        assert first["limit"] == "100"
+        assert first["status"] == "open"
+        assert len(markets) == 149
+        assert "MKT-007" not in {m.ticker for m in markets}
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_follows_cursor_within_chunk(self, make_market) -> None:
+        route = respx.get("https://api.elections.kalshi.com/trade-api/v2/markets").mock(
+            side_effect=[
+                Response(200, json={"markets": [make_market(ticker="A")], "cursor": "next"}),
+                Response(200, json={"markets": [make_market(ticker="B")], "cursor": None}),
+            ]
+        )
+
+        async with KalshiPublicClient() as client:
+            markets = await client.get_markets_by_tickers(["A", "B"])
+
+        assert [m.ticker for m in markets] == ["A", "B"]
+        assert route.calls[1].request.url.params["cursor"] == "next"
+
+    @pytest.mark.asyncio
+    async def test_empty_tickers_make_no_requests(self) -> None:
+        async with KalshiPublicClient() as client:
+            assert await client.get_markets_by_tickers([]) == []
+
+    @pytest.mark.asyncio
+    async def test_rejects_oversized_chunks(self) -> None:
+        async with KalshiPublicClient() as client:
+            with pytest.raises(ValueError, match="chunk_size"):
+                await client.get_markets_by_tickers(["A"], chunk_size=101)
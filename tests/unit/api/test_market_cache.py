@@ -0,0 +1,140 @@
+"""Tests for the shared market-universe cache and `get_all_markets(max_age=...)`."""
+
+from __future__ import annotations
+
+import gzip
+import os
+import time
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+import pytest
+import respx
+from httpx import Response
+
+from kalshi_research.api import KalshiPublicClient, Market, MarketSweep, MarketUniverseCache
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+MARKETS_URL = "https://api.elections.kalshi.com/trade-api/v2/markets"
+SCOPE = "https://example.test|status=open|mve="
+
+
+def _markets(make_market: Callable[..., dict[str, Any]], *tickers: str) -> list[Market]:
+    return [Market.model_validate(make_market(ticker=t)) for t in tickers]
+
+
+class TestMarketUniverseCache:
+    def test_store_and_load_round_trip(self, tmp_path: Path, make_market) -> None:
+        cache = MarketUniverseCache(tmp_path)
+        markets = _markets(make_market, "A", "B")
+
+        cache.store(SCOPE, markets, swept_at=datetime.now(UTC))
+
+        assert cache.load(SCOPE, max_age_seconds=60) == markets
+        assert cache.load("other-scope", max_age_seconds=60) is None
+
+    def test_age_is_measured_from_sweep_start(self, tmp_path: Path, make_market) -> None:
+        cache = MarketUniverseCache(tmp_path)
+        swept_at = datetime.now(UTC) - timedelta(minutes=10)
+
+        cache.store(SCOPE, _markets(make_market, "A"), swept_at=swept_at)
+
+        age = cache.age_seconds(SCOPE)
+        assert age is not None
+        assert age >= 600
+        assert cache.load(SCOPE, max_age_seconds=300) is None
+        assert cache.load(SCOPE, max_age_seconds=900) is not None
+
+    def test_zero_max_age_never_serves(self, tmp_path: Path, make_market) -> None:
+        cache = MarketUniverseCache(tmp_path)
+        cache.store(SCOPE, _markets(make_market, "A"), swept_at=datetime.now(UTC))
+
+        assert cache.load(SCOPE, max_age_seconds=0) is None
+
+    def test_corrupt_file_is_a_miss(self, tmp_path: Path) -> None:
+        cache = MarketUniverseCache(tmp_path)
+        path = cache.path_for(SCOPE)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            f.write("{not json")
+        os.utime(path, (time.time(), time.time()))
+
+        assert cache.load(SCOPE, max_age_seconds=60) is None
+
+    def test_rejects_negative_max_age(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="max_age_seconds"):
+            MarketUniverseCache(tmp_path, max_age_seconds=-1)
+
+
+class TestGetAllMarketsWithCache:
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_sweep_is_published_and_reused(self, tmp_path: Path, make_market) -> None:
+        route = respx.get(MARKETS_URL).mock(
+            side_effect=[
+                Response(200, json={"markets": [make_market(ticker="A")], "cursor": "next"}),
+                Response(200, json={"markets": [make_market(ticker="B")], "cursor": None}),
+                Response(200, json={"markets": [], "cursor": None}),
+            ]
+        )
+
+        # First process sweeps (max_age 0 = never serve, but publish).
+        first = MarketSweep()
+        async with KalshiPublicClient(market_cache=MarketUniverseCache(tmp_path)) as client:
+            swept = [m.ticker async for m in client.get_all_markets(status="open", sweep=first)]
+
+        # Second process reuses the fresh sweep without any API calls.
+        cache = MarketUniverseCache(tmp_path, max_age_seconds=60)
+        sweep = MarketSweep()
+        async with KalshiPublicClient(market_cache=cache) as client:
+            cached = [m.ticker async for m in client.get_all_markets(status="open", sweep=sweep)]
+            # A different status is a different scope.
+            assert [m async for m in client.get_all_markets(status="closed")] == []
+
+        assert swept == cached == ["A", "B"]
+        # The reused sweep keeps the time it was originally taken.
+        assert first.swept_at is not None
+        assert sweep == MarketSweep(
+            pages=0, truncated=False, from_cache=True, swept_at=first.swept_at
+        )
+        assert route.call_count == 3
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_explicit_max_age_overrides_cache_default(
+        self, tmp_path: Path, make_market
+    ) -> None:
+        route = respx.get(MARKETS_URL).mock(
+            return_value=Response(200, json={"markets": [make_market(ticker="A")], "cursor": None})
+        )
+        cache = MarketUniverseCache(tmp_path, max_age_seconds=60)
+
+        async with KalshiPublicClient(market_cache=cache) as client:
+            [m async for m in client.get_all_markets(status="open")]
+            [m async for m in client.get_all_markets(status="open", max_age=0)]
+
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_truncated_sweep_is_not_published(self, tmp_path: Path, make_market) -> None:
+        respx.get(MARKETS_URL).mock(
+            return_value=Response(
+                200, json={"markets": [make_market(ticker="A")], "cursor": "more"}
+            )
+        )
+        cache = MarketUniverseCache(tmp_path, max_age_seconds=60)
+
+        sweep = MarketSweep()
+
+        async with KalshiPublicClient(market_cache=cache) as client:
+            markets = [
+                m async for m in client.get_all_markets(status="open", max_pages=1, sweep=sweep)
+            ]
+
+        assert len(markets) == 1
+        assert (sweep.pages, sweep.truncated, sweep.from_cache) == (1, True, False)
+        assert not list(tmp_path.iterdir())
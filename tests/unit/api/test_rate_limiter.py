@@ -8,7 +8,12 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from kalshi_research.api.rate_limiter import RateLimiter, RateTier, TokenBucket
+from kalshi_research.api.rate_limiter import (
+    RateLimiter,
+    RateTier,
+    SharedTokenBucket,
+    TokenBucket,
+)
 
 
 class TestTokenBucket:
@@ -59,6 +64,22 @@ class TestTokenBucket:
         assert elapsed > 0.08
 
 
+class TestSharedTokenBucket:
+    def test_reservations_queue_behind_each_other(self) -> None:
+        """Reservations beyond the burst return increasing waits instead of blocking."""
+        bucket = SharedTokenBucket(tokens_per_second=10, burst_size=2)
+
+        waits = [bucket.reserve() for _ in range(4)]
+
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == pytest.approx(0.1, abs=0.02)
+        assert waits[3] == pytest.approx(0.2, abs=0.02)
+
+    def test_for_tier_applies_safety_margin(self) -> None:
+        bucket = SharedTokenBucket.for_tier(RateTier.BASIC)
+        assert bucket._rate == 18
+
+
 class TestRateLimiter:
     def test_tier_limits_applied(self) -> None:
         """Verify tier limits are correctly applied."""
@@ -70,6 +91,13 @@ class TestRateLimiter:
         assert limiter._read_bucket._rate == 18
         assert limiter._write_bucket._rate == 9
 
+    def test_external_read_bucket_is_used(self) -> None:
+        """A shared read budget replaces the private read bucket; writes stay private."""
+        shared = SharedTokenBucket(tokens_per_second=5)
+        limiter = RateLimiter(tier=RateTier.BASIC, read_bucket=shared)
+        assert limiter._read_bucket is shared
+        assert limiter._write_bucket._rate == 9
+
     def test_advanced_tier_limits(self) -> None:
         """Verify advanced tier limits."""
         limiter = RateLimiter(tier=RateTier.ADVANCED)
@@ -1,12 +1,23 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pytest
 
 from kalshi_research.api.config import Environment, set_environment
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 @pytest.fixture(autouse=True)
 def _reset_api_environment() -> None:
     set_environment(Environment.PRODUCTION)
     yield
     set_environment(Environment.PRODUCTION)
+
+
+@pytest.fixture(autouse=True)
+def _isolate_exa_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # `ExaCache()` opens its database on construction; keep it out of the checkout's data/.
+    monkeypatch.setattr("kalshi_research.exa.cache.DEFAULT_EXA_CACHE_DIR", tmp_path / "exa_cache")
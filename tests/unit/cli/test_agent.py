@@ -279,3 +279,47 @@ async def test_execute_analysis_adds_warning_for_mock_synthesizer_when_not_quiet
     assert "warning" in result
     printed = "\n".join(str(call.args[0]) for call in mock_print.call_args_list if call.args)
     assert "MockSynthesizer" in printed
+
+
+def test_agent_batch_reads_tickers_from_scan_json_and_renders_summary(tmp_path: Path) -> None:
+    scan_file = tmp_path / "scan.json"
+    scan_file.write_text(
+        json.dumps({"count": 2, "markets": [{"ticker": "A-1"}, {"ticker": "B-1"}]})
+    )
+    batch_result = {
+        "markets": [
+            {"ticker": "A-1", "status": "skipped", "result": None, "reason": "not_found"},
+            {"ticker": "C-1", "status": "failed", "result": None, "reason": "synthesis: boom"},
+        ],
+        "events_researched": 1,
+        "exa_cost_usd": 0.1,
+        "llm_cost_usd": 0.02,
+        "max_exa_usd": 20.0,
+        "max_llm_usd": 20.0,
+    }
+    mock_execute = AsyncMock(return_value=batch_result)
+    output_file = tmp_path / "estimates.json"
+
+    with (
+        patch("kalshi_research.cli._agent_batch._execute_batch", mock_execute),
+        patch(
+            "kalshi_research.cli._agent_batch.run_async",
+            side_effect=lambda coro: asyncio.run(coro),
+        ),
+    ):
+        result = runner.invoke(
+            root_app,
+            ["agent", "batch", "C-1", "--file", str(scan_file), "--output", str(output_file)],
+        )
+
+    assert result.exit_code == 0, result.output
+    assert mock_execute.call_args.args[0] == ["C-1", "A-1", "B-1"]
+    assert "Completed 0, failed 1, skipped 1" in result.output
+    assert json.loads(output_file.read_text()) == batch_result
+
+
+def test_agent_batch_requires_tickers() -> None:
+    result = runner.invoke(root_app, ["agent", "batch"])
+
+    assert result.exit_code == 2
+    assert "Provide tickers" in result.output
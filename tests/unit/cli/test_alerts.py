@@ -275,14 +275,55 @@ def test_alerts_monitor_once_exits(
         yield mock_market
 
     mock_client.get_all_markets = MagicMock(side_effect=market_gen)
+    mock_client.get_markets_by_tickers = AsyncMock(return_value=[mock_market])
 
     result = runner.invoke(app, ["alerts", "monitor", "--once"])
 
     assert result.exit_code == 0
     assert "Press Ctrl+C" not in result.stdout
     assert "Running single check" in result.stdout
-    assert "Fetching markets" in result.stdout
+    assert "Fetching 1 watched markets" in result.stdout
     assert "Single check complete" in result.stdout
+    mock_client.get_markets_by_tickers.assert_awaited_once_with(["TEST-TICKER"], status="open")
+    mock_client.get_all_markets.assert_not_called()
+
+
+@patch("kalshi_research.cli.alerts.monitor.load_alerts")
+@patch("kalshi_research.cli.client_factory.public_client")
+def test_alerts_monitor_full_sweep_above_threshold(
+    mock_public_client_fn: MagicMock,
+    mock_load_alerts: MagicMock,
+) -> None:
+    mock_load_alerts.return_value = {
+        "conditions": [
+            {
+                "id": f"alert-{i}",
+                "condition_type": "price_above",
+                "ticker": f"TEST-TICKER-{i}",
+                "threshold": 0.9,
+            }
+            for i in range(3)
+        ]
+    }
+
+    mock_client = AsyncMock()
+    mock_client.__aenter__.return_value = mock_client
+    mock_client.__aexit__.return_value = None
+    mock_public_client_fn.return_value = mock_client
+
+    async def market_gen(status=None, max_pages: int | None = None, mve_filter=None):
+        del status, max_pages, mve_filter
+        if False:  # pragma: no cover
+            yield None
+
+    mock_client.get_all_markets = MagicMock(side_effect=market_gen)
+
+    result = runner.invoke(app, ["alerts", "monitor", "--once", "--full-sweep-threshold", "2"])
+
+    assert result.exit_code == 0
+    assert "Fetching markets" in result.stdout
+    mock_client.get_all_markets.assert_called_once_with(status="open", max_pages=None)
+    mock_client.get_markets_by_tickers.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -310,14 +351,23 @@ async def test_alert_monitor_loop_prints_utc_timestamp_when_alerts_trigger(monke
         async def __aexit__(self, exc_type, exc, tb) -> None:
             del exc_type, exc, tb
 
-        async def get_all_markets(self, *args, **kwargs):
+        async def get_markets_by_tickers(self, *args, **kwargs) -> list[object]:
             del args, kwargs
-            if False:  # pragma: no cover
-                yield None
+            return []
 
     monkeypatch.setattr(client_factory, "public_client", lambda **_: DummyClient())
 
+    from kalshi_research.alerts.dispatcher import AlertDispatcher
+
     class DummyMonitor:
+        dispatcher = AlertDispatcher()
+
+        async def __aenter__(self) -> DummyMonitor:
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb) -> None:
+            del exc_type, exc, tb
+
         def list_conditions(self) -> list[object]:
             return []
 
@@ -371,6 +421,7 @@ def test_alerts_monitor_continuous_shows_ctrl_c(
         yield mock_market
 
     mock_client.get_all_markets = MagicMock(side_effect=market_gen)
+    mock_client.get_markets_by_tickers = AsyncMock(return_value=[mock_market])
 
     with patch(
         "kalshi_research.cli.alerts.monitor.asyncio.sleep",
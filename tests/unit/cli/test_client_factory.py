@@ -13,7 +13,7 @@ from cryptography.hazmat.primitives.asymmetric import rsa
 
 from kalshi_research.api import KalshiClient, KalshiPublicClient
 from kalshi_research.api.rate_limiter import RateTier
-from kalshi_research.cli.client_factory import authed_client, public_client
+from kalshi_research.cli.client_factory import authed_client, market_cache, public_client
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Generator
@@ -47,6 +47,14 @@ def test_key() -> Generator[tuple[Path, str], None, None]:
 class TestPublicClient:
     """Test public_client factory function."""
 
+    def test_public_client_market_cache_is_opt_in(self) -> None:
+        assert market_cache(None) is None
+        assert public_client()._market_cache is None
+
+        client = public_client(market_cache_max_age=30)
+        assert client._market_cache is not None
+        assert client._market_cache.max_age_seconds == 30
+
     def test_public_client_returns_kalshi_public_client(self) -> None:
         """Factory returns KalshiPublicClient instance."""
         client = public_client()
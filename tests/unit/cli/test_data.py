@@ -105,6 +105,25 @@ def test_data_export(mock_export: MagicMock) -> None:
     mock_export.assert_called_once()
 
 
+@patch("kalshi_research.data.export.export_to_parquet")
+def test_data_export_incremental_passes_compaction_threshold(mock_export: MagicMock) -> None:
+    with patch("pathlib.Path.exists", return_value=True):
+        result = runner.invoke(app, ["data", "export", "--incremental", "--compact-min-files", "6"])
+
+    assert result.exit_code == 0
+    kwargs = mock_export.call_args.kwargs
+    assert kwargs["incremental"] is True
+    assert kwargs["compact_min_files"] == 6
+
+
+def test_data_export_incremental_rejects_csv() -> None:
+    with patch("pathlib.Path.exists", return_value=True):
+        result = runner.invoke(app, ["data", "export", "--format", "csv", "--incremental"])
+
+    assert result.exit_code == 2
+    assert "only supported for parquet" in result.stdout
+
+
 @patch("kalshi_research.data.DatabaseManager")
 @patch("kalshi_research.data.repositories.EventRepository")
 @patch("kalshi_research.data.repositories.MarketRepository")
@@ -140,12 +159,14 @@ def test_data_stats(
 
         mock_price_repo = MagicMock()
         mock_price_repo.count_for_market = AsyncMock(return_value=10)
+        mock_price_repo.latest_quote_stats = AsyncMock(return_value=(1, None))
         mock_price_repo_cls.return_value = mock_price_repo
 
         result = runner.invoke(app, ["data", "stats"])
 
     assert result.exit_code == 0
     assert "Total Events" in result.stdout
+    assert "Markets With Quotes" in result.stdout
     assert "3" in result.stdout
 
 
@@ -343,7 +364,7 @@ def test_data_prune_dry_run_prints_summary_without_applying() -> None:
     assert "Prune dry-run" in result.stdout
 
 
-def test_data_prune_apply_prints_summary() -> None:
+def test_data_prune_hourly_rollups_alone_is_a_target() -> None:
     from kalshi_research.data.maintenance import PruneCounts
 
     with runner.isolated_filesystem():
@@ -351,19 +372,47 @@ def test_data_prune_apply_prints_summary() -> None:
 
         @asynccontextmanager
         async def fake_open_db_session(_path: Path):
-            session = AsyncMock()
-            begin_cm = AsyncMock()
-            begin_cm.__aenter__.return_value = None
-            begin_cm.__aexit__.return_value = None
-            session.begin = MagicMock(return_value=begin_cm)
-            yield session
+            yield AsyncMock()
 
+        compute = AsyncMock(return_value=PruneCounts(hourly_rollups=5))
         with (
             patch("kalshi_research.cli.db.open_db_session", fake_open_db_session),
-            patch(
-                "kalshi_research.data.maintenance.apply_prune",
-                AsyncMock(return_value=PruneCounts(price_snapshots=1)),
-            ),
+            patch("kalshi_research.data.maintenance.compute_prune_counts", compute),
+        ):
+            result = runner.invoke(
+                app,
+                ["data", "prune", "--db", "db.sqlite", "--hourly-rollups-older-than-days", "90"],
+            )
+
+    assert result.exit_code == 0, result.stdout
+    assert "price_rollups (1h)" in result.stdout
+    assert compute.await_args.kwargs["snapshots_before"] is None
+    assert compute.await_args.kwargs["hourly_rollups_before"] is not None
+
+
+def test_data_prune_apply_prints_summary() -> None:
+    from kalshi_research.data.chunked_prune import ChunkedPruneResult
+    from kalshi_research.data.maintenance import PruneCounts
+
+    with runner.isolated_filesystem():
+        Path("db.sqlite").touch()
+
+        @asynccontextmanager
+        async def fake_open_db(_path: Path):
+            yield MagicMock()
+
+        prune = AsyncMock(
+            return_value=ChunkedPruneResult(
+                counts=PruneCounts(price_snapshots=1),
+                elapsed_seconds=0.5,
+                chunks=1,
+                resumed=False,
+                incremental_vacuum=False,
+            )
+        )
+        with (
+            patch("kalshi_research.cli.db.open_db", fake_open_db),
+            patch("kalshi_research.data.chunked_prune.prune_in_chunks", prune),
         ):
             result = runner.invoke(
                 app,
@@ -375,12 +424,72 @@ def test_data_prune_apply_prints_summary() -> None:
                     "--snapshots-older-than-days",
                     "7",
                     "--apply",
+                    "--chunk-size",
+                    "100",
+                    "--incremental-vacuum",
                 ],
             )
 
-    assert result.exit_code == 0
+    assert result.exit_code == 0, result.stdout
     assert "Prune Summary" in result.stdout
+    assert "Deleted 1 rows" in result.stdout
+    assert "auto_vacuum is not INCREMENTAL" in result.stdout
     assert "Prune applied" in result.stdout
+    kwargs = prune.await_args.kwargs
+    assert kwargs["chunk_rows"] == 100
+    assert kwargs["state_path"].name == "db.sqlite.prune-state.json"
+    assert kwargs["resume"] is False
+
+
+def test_data_prune_resume_requires_apply_and_checkpoint() -> None:
+    with runner.isolated_filesystem():
+        Path("db.sqlite").touch()
+        dry = runner.invoke(app, ["data", "prune", "--db", "db.sqlite", "--resume"])
+        missing = runner.invoke(app, ["data", "prune", "--db", "db.sqlite", "--apply", "--resume"])
+
+    assert dry.exit_code == 2
+    assert "--resume requires --apply" in dry.stdout
+    assert missing.exit_code == 1
+    assert "No interrupted prune to resume" in missing.stdout
+
+
+def test_data_prune_resume_uses_checkpoint_cutoffs() -> None:
+    from kalshi_research.data.chunked_prune import ChunkedPruneResult, PruneCheckpoint
+    from kalshi_research.data.maintenance import PruneCounts
+
+    cutoff = datetime(2026, 1, 1, tzinfo=UTC)
+    with runner.isolated_filesystem():
+        Path("db.sqlite").touch()
+        PruneCheckpoint(snapshots_before=None, news_before=cutoff, hourly_rollups_before=None).save(
+            Path("db.sqlite.prune-state.json")
+        )
+
+        @asynccontextmanager
+        async def fake_open_db(_path: Path):
+            yield MagicMock()
+
+        prune = AsyncMock(
+            return_value=ChunkedPruneResult(
+                counts=PruneCounts(news_articles=2),
+                elapsed_seconds=1.0,
+                chunks=2,
+                resumed=True,
+                incremental_vacuum=False,
+            )
+        )
+        with (
+            patch("kalshi_research.cli.db.open_db", fake_open_db),
+            patch("kalshi_research.data.chunked_prune.prune_in_chunks", prune),
+        ):
+            result = runner.invoke(
+                app, ["data", "prune", "--db", "db.sqlite", "--apply", "--resume"]
+            )
+
+    assert result.exit_code == 0, result.stdout
+    assert "news_articles" in result.stdout
+    assert "price_snapshots" not in result.stdout
+    assert prune.await_args.kwargs["resume"] is True
+    assert prune.await_args.kwargs["news_before"] == cutoff
 
 
 def test_data_vacuum_smoke() -> None:
@@ -392,6 +501,22 @@ def test_data_vacuum_smoke() -> None:
     assert "Vacuum complete" in result.stdout
 
 
+def test_data_vacuum_incremental_enables_incremental_auto_vacuum() -> None:
+    import sqlite3
+
+    with runner.isolated_filesystem():
+        sqlite3.connect("db.sqlite").close()
+        result = runner.invoke(app, ["data", "vacuum", "--db", "db.sqlite", "--incremental"])
+        conn = sqlite3.connect("db.sqlite")
+        try:
+            mode = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+        finally:
+            conn.close()
+
+    assert result.exit_code == 0, result.stdout
+    assert mode == 2
+
+
 @patch("kalshi_research.cli.client_factory.public_client")
 def test_data_sync_trades_generic_error_exits_with_error(mock_public_client_fn: MagicMock) -> None:
     mock_client = AsyncMock()
@@ -504,3 +629,63 @@ def test_data_migrate_upgrade_failure_exits_with_error(
     assert result.exit_code == 1
     assert "Migration failed" in result.stdout
     assert "Boom" in result.stdout
+
+
+def test_data_collect_rejects_unknown_sqlite_profile() -> None:
+    result = runner.invoke(app, ["data", "collect", "--sqlite-profile", "turbo"])
+
+    assert result.exit_code == 2
+    assert "Unknown SQLite profile" in result.stdout
+
+
+def test_data_collect_rejects_jitter_longer_than_a_job_interval() -> None:
+    # The snapshot interval (15 minutes by default) and the hourly market sync share --jitter.
+    for args in (["--jitter", "900"], ["--interval", "120", "--jitter", "3600"]):
+        result = runner.invoke(app, ["data", "collect", *args])
+
+        assert result.exit_code == 2
+        assert "--jitter must be shorter" in result.stdout
+
+
+def test_data_collect_rejects_invalid_rate_tier() -> None:
+    result = runner.invoke(app, ["data", "collect", "--shards", "2", "--rate-tier", "gold"])
+
+    assert result.exit_code == 1
+    assert "Invalid rate tier" in result.stdout
+
+
+def test_data_collect_stats_reads_status_file(tmp_path: Path) -> None:
+    from kalshi_research.data import TaskStats
+
+    stats = TaskStats(name="price_snapshot", interval_seconds=60)
+    stats.record_run(
+        started_at=datetime.now(UTC),
+        duration_seconds=75.0,
+        lag_seconds=0.2,
+        outcome="ok",
+        missed_runs=1,
+    )
+    status_file = tmp_path / "status.json"
+    status_file.write_text(
+        json.dumps(
+            {
+                "updated_at": "2026-01-01T00:00:00+00:00",
+                "tasks": {"price_snapshot": stats.to_dict()},
+            }
+        )
+    )
+
+    result = runner.invoke(app, ["data", "collect", "--stats", "--status-file", str(status_file)])
+
+    assert result.exit_code == 0
+    assert "price_snapshot" in result.stdout
+    assert "took longer than the interval" in result.stdout
+
+
+def test_data_collect_stats_missing_status_file(tmp_path: Path) -> None:
+    result = runner.invoke(
+        app, ["data", "collect", "--stats", "--status-file", str(tmp_path / "none.json")]
+    )
+
+    assert result.exit_code == 1
+    assert "No collector status" in result.stdout
@@ -257,7 +257,7 @@ def test_news_collect_for_ticker_prints_count(tmp_path) -> None:
     with (
         patch("kalshi_research.exa.ExaConfig.from_env", return_value=ExaConfig(api_key="test")),
         patch("kalshi_research.exa.ExaClient", return_value=mock_exa),
-        patch("kalshi_research.news.NewsCollector", return_value=mock_collector),
+        patch("kalshi_research.news.NewsCollector", return_value=mock_collector) as collector_cls,
     ):
         result = runner.invoke(
             app,
@@ -270,6 +270,8 @@ def test_news_collect_for_ticker_prints_count(tmp_path) -> None:
                 "3",
                 "--max-per-query",
                 "5",
+                "--sentiment-method",
+                "keyword-v2",
                 "--db",
                 str(db_path),
             ],
@@ -277,6 +279,7 @@ def test_news_collect_for_ticker_prints_count(tmp_path) -> None:
 
     assert result.exit_code == 0
     assert "MKT1: 2 new article(s)" in result.stdout
+    assert collector_cls.call_args.kwargs["sentiment_analyzer"].method == "keyword-v2"
 
 
 def test_news_sentiment_prints_summary(tmp_path) -> None:
@@ -307,3 +310,63 @@ def test_news_sentiment_prints_summary(tmp_path) -> None:
     assert result.exit_code == 0
     assert "Sentiment:" in result.stdout
     assert "rates" in result.stdout
+
+
+def test_news_rescore_stores_method_version_and_resumes(tmp_path) -> None:
+    from kalshi_research.data.models import NewsArticle, NewsSentiment
+    from kalshi_research.news.rescore import RescoreCheckpoint
+
+    db_path = tmp_path / "news.db"
+
+    async def _setup_db() -> None:
+        async with DatabaseManager(db_path) as db, db.session_factory() as session:
+            await db.create_tables()
+            for i in range(3):
+                session.add(
+                    NewsArticle(
+                        url=f"https://example.com/{i}",
+                        url_hash=str(i),
+                        title="Rally",
+                        source_domain="example.com",
+                        full_text="Prices surge.",
+                    )
+                )
+            await session.commit()
+
+    async def _methods() -> list[str]:
+        async with DatabaseManager(db_path) as db, db.session_factory() as session:
+            return list((await session.execute(select(NewsSentiment.method))).scalars().all())
+
+    asyncio.run(_setup_db())
+
+    result = runner.invoke(
+        app,
+        ["news", "rescore", "--method", "keyword-v2", "--chunk-size", "2", "--db", str(db_path)],
+    )
+    assert result.exit_code == 0
+    assert "Re-scored 3 article(s) as 'keyword-v2'" in result.stdout
+    assert "--method keyword-v2" in result.stdout
+    assert asyncio.run(_methods()) == ["keyword-v2"] * 3
+    # A finished run leaves no checkpoint behind, so there is nothing to resume.
+    state_path = tmp_path / "news.db.rescore-keyword-v2.json"
+    assert not state_path.exists()
+    resume = ["news", "rescore", "--method", "keyword-v2", "--resume", "--db", str(db_path)]
+    result = runner.invoke(app, resume)
+    assert result.exit_code == 1
+    assert "No interrupted re-score to resume" in result.stdout
+
+    RescoreCheckpoint("keyword-v2", 2).save(state_path)
+    result = runner.invoke(app, resume)
+    assert result.exit_code == 0
+    assert "Resuming after article id 2" in result.stdout
+    assert "Re-scored 1 article(s)" in result.stdout
+    assert not state_path.exists()
+
+
+def test_news_rescore_rejects_invalid_workers(tmp_path) -> None:
+    result = runner.invoke(
+        app,
+        ["news", "rescore", "--method", "v2", "--workers", "0", "--db", str(tmp_path / "n.db")],
+    )
+    assert result.exit_code == 2
+    assert "--workers must be >= 1" in result.stdout
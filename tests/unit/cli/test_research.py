@@ -1494,3 +1494,21 @@ def test_research_thesis_list_full_flag_disables_truncation() -> None:
     assert result_full.exit_code == 0
     assert title_suffix in result_full.stdout
     assert id_suffix in result_full.stdout
+
+
+def test_research_cache_stats_and_clear(tmp_path: Path) -> None:
+    from kalshi_research.exa.cache import ExaCache
+
+    with ExaCache(tmp_path) as cache:
+        cache.set("search", {"query": "a"}, {"ok": True})
+        cache.set("search", {"query": "b"}, {"ok": True})
+
+    result = runner.invoke(app, ["research", "cache", "stats", "--cache-dir", str(tmp_path)])
+    assert result.exit_code == 0
+    assert "2 entries" in result.stdout
+
+    result = runner.invoke(
+        app, ["research", "cache", "clear", "--all", "--cache-dir", str(tmp_path)]
+    )
+    assert result.exit_code == 0
+    assert "Cleared 2 Exa cache entries (all)" in result.stdout
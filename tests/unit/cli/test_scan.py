@@ -37,7 +37,7 @@ def test_scan_profile_defaults_rejects_unknown_profile() -> None:
 
 
 @patch("kalshi_research.data.repositories.PriceRepository")
-@patch("kalshi_research.data.DatabaseManager")
+@patch("kalshi_research.cli.db.DatabaseManager")
 def test_scan_movers_uses_probability_units(
     mock_db_cls: MagicMock,
     mock_price_repo_cls: MagicMock,
@@ -74,7 +74,7 @@ def test_scan_movers_uses_probability_units(
     )
 
     mock_price_repo = MagicMock()
-    mock_price_repo.get_for_market = AsyncMock(return_value=[newest, oldest])
+    mock_price_repo.get_history = AsyncMock(return_value=[newest, oldest])
     mock_price_repo_cls.return_value = mock_price_repo
 
     mock_session_cm = AsyncMock()
@@ -103,7 +103,7 @@ def test_scan_movers_uses_probability_units(
 
 
 @patch("kalshi_research.data.repositories.PriceRepository")
-@patch("kalshi_research.data.DatabaseManager")
+@patch("kalshi_research.cli.db.DatabaseManager")
 def test_scan_movers_full_flag_disables_title_truncation(
     mock_db_cls: MagicMock,
     mock_price_repo_cls: MagicMock,
@@ -143,7 +143,7 @@ def test_scan_movers_full_flag_disables_title_truncation(
     )
 
     mock_price_repo = MagicMock()
-    mock_price_repo.get_for_market = AsyncMock(return_value=[newest, oldest])
+    mock_price_repo.get_history = AsyncMock(return_value=[newest, oldest])
     mock_price_repo_cls.return_value = mock_price_repo
 
     mock_session_cm = AsyncMock()
@@ -182,7 +182,7 @@ def test_scan_movers_full_flag_disables_title_truncation(
 
 
 @patch("kalshi_research.data.repositories.PriceRepository")
-@patch("kalshi_research.data.DatabaseManager")
+@patch("kalshi_research.cli.db.DatabaseManager")
 def test_scan_arbitrage_warns_when_tickers_truncated(
     mock_db_cls: MagicMock,
     mock_price_repo_cls: MagicMock,
@@ -1830,3 +1830,100 @@ def test_scan_new_markets_category_filter(
     assert result.exit_code == 0
     assert "ECON-NEW" in result.stdout
     assert "SPORTS-NEW" not in result.stdout
+
+
+def test_scan_opportunities_from_db_uses_stored_quotes_without_api(tmp_path) -> None:
+    from datetime import UTC, datetime, timedelta
+
+    from kalshi_research.data import DatabaseManager
+    from kalshi_research.data.models import Event, LatestQuote
+    from kalshi_research.data.models import Market as DBMarket
+
+    db_path = tmp_path / "kalshi.db"
+    now = datetime.now(UTC)
+
+    async def _seed() -> None:
+        async with DatabaseManager(db_path) as db:
+            await db.create_tables()
+            async with db.session_factory() as session, session.begin():
+                session.add(Event(ticker="EVT", series_ticker="S", title="Event"))
+                await session.flush()
+                for ticker, yes_bid in (("CLOSE-RACE", 49), ("LOPSIDED", 5)):
+                    session.add(
+                        DBMarket(
+                            ticker=ticker,
+                            event_ticker="EVT",
+                            title=f"{ticker} market",
+                            status="active",
+                            open_time=now - timedelta(days=1),
+                            close_time=now + timedelta(days=2),
+                            expiration_time=now + timedelta(days=3),
+                        )
+                    )
+                    await session.flush()
+                    session.add(
+                        LatestQuote(
+                            ticker=ticker,
+                            snapshot_time=now,
+                            yes_bid=yes_bid,
+                            yes_ask=yes_bid + 2,
+                            no_bid=98 - yes_bid,
+                            no_ask=100 - yes_bid,
+                            volume=100,
+                            volume_24h=100,
+                            open_interest=10,
+                        )
+                    )
+
+    asyncio.run(_seed())
+
+    with patch(
+        "kalshi_research.cli.client_factory.public_client",
+        side_effect=AssertionError("API must not be used"),
+    ):
+        result = runner.invoke(
+            app, ["scan", "opportunities", "--from-db", "--db", str(db_path), "--full"]
+        )
+
+    assert result.exit_code == 0, result.stdout
+    assert "CLOSE-RACE" in result.stdout
+    assert "LOPSIDED" not in result.stdout
+
+
+def test_scan_opportunities_from_db_refresh_does_not_create_missing_db(tmp_path) -> None:
+    db_path = tmp_path / "missing.db"
+
+    result = runner.invoke(
+        app,
+        [
+            "scan",
+            "opportunities",
+            "--from-db",
+            "--refresh-if-older",
+            "30",
+            "--db",
+            str(db_path),
+        ],
+    )
+
+    assert result.exit_code == 1
+    assert "Database not found" in result.stdout
+    assert not db_path.exists()
+
+
+def test_scan_opportunities_from_db_rejects_liquidity_options(tmp_path) -> None:
+    result = runner.invoke(
+        app,
+        [
+            "scan",
+            "opportunities",
+            "--from-db",
+            "--db",
+            str(tmp_path / "kalshi.db"),
+            "--profile",
+            "liquid",
+        ],
+    )
+
+    assert result.exit_code == 2
+    assert "--from-db" in result.stdout
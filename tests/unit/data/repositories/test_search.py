@@ -11,6 +11,7 @@ if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
 
 from kalshi_research.data.models import Event, Market, PriceSnapshot
+from kalshi_research.data.repositories.prices import PriceRepository
 from kalshi_research.data.repositories.search import SearchRepository
 from kalshi_research.data.search_utils import has_fts5_support
 
@@ -118,6 +119,7 @@ async def sample_data(session: AsyncSession) -> None:
         open_interest=1000,
     )
     session.add_all([snapshot1, snapshot2, snapshot3])
+    await PriceRepository(session).upsert_latest_quotes([snapshot1, snapshot2, snapshot3])
 
     await session.commit()
 
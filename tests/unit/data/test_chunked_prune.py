@@ -0,0 +1,275 @@
+"""Tests for chunked, resumable pruning."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import func, select
+
+from kalshi_research.data import DatabaseManager, PriceRollup
+from kalshi_research.data.chunked_prune import PruneCheckpoint, PruneProgress, prune_in_chunks
+from kalshi_research.data.maintenance import PruneCounts, compute_prune_counts
+from kalshi_research.data.models import (
+    Event,
+    Market,
+    NewsArticle,
+    NewsArticleMarket,
+    NewsSentiment,
+    PriceSnapshot,
+    SnapshotBatch,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+NOW = datetime.now(UTC)
+CUTOFF = NOW - timedelta(days=5)
+EXPECTED = PruneCounts(
+    price_snapshots=5,
+    snapshot_batches=5,
+    news_articles=3,
+    news_article_markets=3,
+    news_sentiments=3,
+)
+
+
+@pytest.fixture
+async def db(tmp_path: Path) -> AsyncIterator[DatabaseManager]:
+    async with DatabaseManager(tmp_path / "prune.db") as db:
+        await db.create_tables()
+        async with db.session_factory() as session, session.begin():
+            session.add(Event(ticker="EVT1", series_ticker="S1", title="Event 1"))
+            session.add(
+                Market(
+                    ticker="MKT1",
+                    event_ticker="EVT1",
+                    title="Market 1",
+                    status="active",
+                    open_time=NOW - timedelta(days=30),
+                    close_time=NOW + timedelta(days=30),
+                    expiration_time=NOW + timedelta(days=60),
+                )
+            )
+            # Five old batches spread over two days, plus one current batch.
+            times = [NOW - timedelta(days=10, hours=9 * i) for i in range(5)] + [NOW]
+            for snapshot_time in times:
+                batch = SnapshotBatch(snapshot_time=snapshot_time, status="complete")
+                session.add(batch)
+                await session.flush()
+                session.add(
+                    PriceSnapshot(
+                        ticker="MKT1",
+                        snapshot_time=snapshot_time,
+                        batch_id=batch.id,
+                        yes_bid=40,
+                        yes_ask=42,
+                        no_bid=58,
+                        no_ask=60,
+                        volume=100,
+                        volume_24h=50,
+                        open_interest=10,
+                    )
+                )
+            for i, collected_at in enumerate([NOW - timedelta(days=10)] * 3 + [NOW]):
+                article = NewsArticle(
+                    url=f"https://example.com/{i}",
+                    url_hash=str(i),
+                    title=f"Article {i}",
+                    source_domain="example.com",
+                    collected_at=collected_at,
+                )
+                session.add(article)
+                await session.flush()
+                session.add(NewsArticleMarket(article_id=article.id, ticker="MKT1"))
+                session.add(
+                    NewsSentiment(
+                        article_id=article.id,
+                        analyzed_at=collected_at,
+                        score=0.1,
+                        label="neutral",
+                        confidence=0.5,
+                        method="test",
+                        keywords_matched="[]",
+                    )
+                )
+        yield db
+
+
+async def _count(db: DatabaseManager, model: type[object]) -> int:
+    async with db.session_factory() as session:
+        return int((await session.execute(select(func.count()).select_from(model))).scalar_one())
+
+
+@pytest.mark.asyncio
+async def test_chunked_prune_matches_single_transaction_counts(db: DatabaseManager) -> None:
+    async with db.session_factory() as session:
+        expected = await compute_prune_counts(session, snapshots_before=CUTOFF, news_before=CUTOFF)
+    progress: list[PruneProgress] = []
+
+    result = await prune_in_chunks(
+        db,
+        snapshots_before=CUTOFF,
+        news_before=CUTOFF,
+        chunk_rows=2,
+        pause_seconds=0,
+        on_progress=progress.append,
+    )
+
+    assert expected == EXPECTED
+    assert result.counts == EXPECTED
+    assert result.chunks == len(progress)
+    assert not result.resumed
+    assert [p.deleted for p in progress if p.stage == "price_snapshots"] == [2, 4, 5]
+    assert [p.deleted for p in progress if p.stage == "news"] == [2, 3]
+    assert await _count(db, PriceSnapshot) == 1
+    assert await _count(db, SnapshotBatch) == 1
+    assert await _count(db, NewsArticle) == 1
+    assert await _count(db, NewsSentiment) == 1
+    # Pruned snapshots were downsampled first (backfill runs before the deletes).
+    async with db.session_factory() as session:
+        resolutions = (
+            await session.execute(
+                select(PriceRollup.resolution, func.sum(PriceRollup.sample_count)).group_by(
+                    PriceRollup.resolution
+                )
+            )
+        ).all()
+    assert sorted(resolutions) == [("1d", 5), ("1h", 5)]
+
+
+@pytest.mark.asyncio
+async def test_backfill_completes_buckets_straddling_the_cutoff(db: DatabaseManager) -> None:
+    hour = (NOW - timedelta(days=3)).replace(minute=0, second=0, microsecond=0)
+    async with db.session_factory() as session, session.begin():
+        for minute in (10, 50):
+            session.add(
+                PriceSnapshot(
+                    ticker="MKT1",
+                    snapshot_time=hour + timedelta(minutes=minute),
+                    yes_bid=40,
+                    yes_ask=42,
+                    no_bid=58,
+                    no_ask=60,
+                    volume=100,
+                    volume_24h=50,
+                    open_interest=10,
+                )
+            )
+
+    await prune_in_chunks(
+        db, snapshots_before=hour + timedelta(minutes=30), news_before=None, pause_seconds=0
+    )
+
+    # The kept snapshot at :50 is in the hourly and daily buckets, not only the pruned one.
+    async with db.session_factory() as session:
+        counts = dict(
+            (
+                await session.execute(
+                    select(PriceRollup.resolution, PriceRollup.sample_count).where(
+                        PriceRollup.bucket_start >= hour.replace(hour=0),
+                        PriceRollup.bucket_start <= hour,
+                    )
+                )
+            )
+            .tuples()
+            .all()
+        )
+    assert counts == {"1h": 2, "1d": 2}
+
+
+@pytest.mark.asyncio
+async def test_interrupted_prune_resumes_from_checkpoint(
+    db: DatabaseManager, tmp_path: Path
+) -> None:
+    state_path = tmp_path / "prune-state.json"
+
+    def interrupt(progress: PruneProgress) -> None:
+        if progress.stage == "price_snapshots":
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        await prune_in_chunks(
+            db,
+            snapshots_before=CUTOFF,
+            news_before=CUTOFF,
+            chunk_rows=2,
+            pause_seconds=0,
+            state_path=state_path,
+            on_progress=interrupt,
+        )
+
+    checkpoint = PruneCheckpoint.load(state_path)
+    assert checkpoint.snapshots_before == CUTOFF
+    assert checkpoint.completed_stages == ["rollup_backfill"]
+    assert checkpoint.counts == {"price_snapshots": 2}
+    assert await _count(db, PriceSnapshot) == 4
+
+    # The saved cutoffs win over the (absent) ones passed on resume.
+    result = await prune_in_chunks(
+        db,
+        snapshots_before=None,
+        news_before=None,
+        chunk_rows=2,
+        pause_seconds=0,
+        state_path=state_path,
+        resume=True,
+    )
+
+    assert result.resumed
+    assert result.counts == EXPECTED
+    assert not state_path.exists()
+    assert await _count(db, PriceSnapshot) == 1
+
+
+@pytest.mark.asyncio
+async def test_resume_without_checkpoint_raises(db: DatabaseManager, tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        await prune_in_chunks(
+            db,
+            snapshots_before=None,
+            news_before=None,
+            state_path=tmp_path / "missing.json",
+            resume=True,
+        )
+
+
+@pytest.mark.asyncio
+async def test_incremental_vacuum_requires_incremental_auto_vacuum(db: DatabaseManager) -> None:
+    skipped = await prune_in_chunks(
+        db, snapshots_before=CUTOFF, news_before=None, pause_seconds=0, incremental_vacuum=True
+    )
+    assert not skipped.incremental_vacuum
+
+    # Enough pruned text to leave many free pages behind, not just one.
+    async with db.session_factory() as session, session.begin():
+        session.add_all(
+            NewsArticle(
+                url=f"https://example.com/big/{i}",
+                url_hash=f"big-{i}",
+                title="Big",
+                source_domain="example.com",
+                collected_at=NOW - timedelta(days=10),
+                full_text="x" * 4000,
+            )
+            for i in range(200)
+        )
+    async with db.engine.connect() as conn:
+        await conn.exec_driver_sql("PRAGMA auto_vacuum=INCREMENTAL")
+        await conn.exec_driver_sql("VACUUM")
+
+    applied = await prune_in_chunks(
+        db,
+        snapshots_before=None,
+        news_before=CUTOFF,
+        chunk_rows=500,
+        pause_seconds=0,
+        incremental_vacuum=True,
+    )
+    assert applied.incremental_vacuum
+    assert applied.counts.news_articles == 203
+    async with db.engine.connect() as conn:
+        freelist = (await conn.exec_driver_sql("PRAGMA freelist_count")).scalar()
+    assert freelist == 0
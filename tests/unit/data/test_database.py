@@ -94,3 +94,227 @@ class TestDatabaseManager:
         assert manager._session_factory is factory
 
         await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_create_tables_backfills_latest_quotes(self, temp_db_path: Path) -> None:
+        """Existing snapshots populate empty latest_quotes and price_rollups tables."""
+        manager = DatabaseManager(str(temp_db_path))
+        await manager.create_tables()
+        async with manager.engine.begin() as conn:
+            await conn.execute(
+                text(
+                    "INSERT INTO events (ticker, series_ticker, title, mutually_exclusive, "
+                    "created_at, updated_at) VALUES ('EVT', 'S', 'Event', 0, "
+                    "'2026-01-01 00:00:00', '2026-01-01 00:00:00')"
+                )
+            )
+            await conn.execute(
+                text(
+                    "INSERT INTO markets (ticker, event_ticker, title, status, open_time, "
+                    "close_time, expiration_time, created_at, updated_at) VALUES ('MKT', 'EVT', "
+                    "'Market', 'active', '2026-01-01 00:00:00', '2026-02-01 00:00:00', "
+                    "'2026-02-02 00:00:00', '2026-01-01 00:00:00', '2026-01-01 00:00:00')"
+                )
+            )
+            for hour, yes_bid in ((1, 40), (2, 42)):
+                await conn.execute(
+                    text(
+                        "INSERT INTO price_snapshots (ticker, snapshot_time, yes_bid, yes_ask, "
+                        "no_bid, no_ask, volume, volume_24h, open_interest) VALUES ('MKT', "
+                        f"'2026-01-01 0{hour}:00:00', {yes_bid}, 50, 50, 60, 1, 1, 1)"
+                    )
+                )
+
+        await manager.create_tables()
+
+        async with manager.engine.connect() as conn:
+            rows = (await conn.execute(text("SELECT ticker, yes_bid FROM latest_quotes"))).all()
+            rollups = (
+                await conn.execute(
+                    text(
+                        "SELECT resolution, bucket_start, sample_count, open_mid, high_mid, "
+                        "low_mid, close_mid, yes_bid FROM price_rollups "
+                        "ORDER BY resolution, bucket_start"
+                    )
+                )
+            ).all()
+        assert [tuple(row) for row in rows] == [("MKT", 42)]
+        assert [tuple(row) for row in rollups] == [
+            ("1d", "2026-01-01 00:00:00.000000", 2, 45.0, 46.0, 45.0, 46.0, 42),
+            ("1h", "2026-01-01 01:00:00.000000", 1, 45.0, 45.0, 45.0, 45.0, 40),
+            ("1h", "2026-01-01 02:00:00.000000", 1, 46.0, 46.0, 46.0, 46.0, 42),
+        ]
+
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_create_tables_backfills_news_sentiment_daily(self, temp_db_path: Path) -> None:
+        """Existing market sentiment populates an empty news_sentiment_daily table."""
+        manager = DatabaseManager(str(temp_db_path))
+        await manager.create_tables()
+        async with manager.engine.begin() as conn:
+            await conn.execute(
+                text(
+                    "INSERT INTO events (ticker, series_ticker, title, mutually_exclusive, "
+                    "created_at, updated_at) VALUES ('EVT', 'S', 'Event', 0, "
+                    "'2026-01-01 00:00:00', '2026-01-01 00:00:00')"
+                )
+            )
+            await conn.execute(
+                text(
+                    "INSERT INTO markets (ticker, event_ticker, title, status, open_time, "
+                    "close_time, expiration_time, created_at, updated_at) VALUES ('MKT', 'EVT', "
+                    "'Market', 'active', '2026-01-01 00:00:00', '2026-02-01 00:00:00', "
+                    "'2026-02-02 00:00:00', '2026-01-01 00:00:00', '2026-01-01 00:00:00')"
+                )
+            )
+            for article_id, score, label in ((1, 0.5, "positive"), (2, -0.3, "negative")):
+                await conn.execute(
+                    text(
+                        "INSERT INTO news_articles (id, url, url_hash, title, source_domain, "
+                        f"collected_at) VALUES ({article_id}, 'https://e.com/{article_id}', "
+                        f"'{article_id}', 'T', 'e.com', '2026-01-01 0{article_id}:00:00')"
+                    )
+                )
+                await conn.execute(
+                    text(
+                        "INSERT INTO news_article_markets (article_id, ticker) "
+                        f"VALUES ({article_id}, 'MKT')"
+                    )
+                )
+                await conn.execute(
+                    text(
+                        "INSERT INTO news_sentiments (article_id, analyzed_at, score, label, "
+                        f"confidence, method) VALUES ({article_id}, '2026-01-01 03:00:00', "
+                        f"{score}, '{label}', 0.7, 'keyword')"
+                    )
+                )
+
+        await manager.create_tables()
+
+        async with manager.engine.connect() as conn:
+            rows = (
+                await conn.execute(
+                    text(
+                        "SELECT ticker, method, bucket_start, article_count, score_sum, "
+                        "positive_count, negative_count FROM news_sentiment_daily"
+                    )
+                )
+            ).all()
+        assert [tuple(row) for row in rows] == [
+            ("MKT", "keyword", "2026-01-01 00:00:00.000000", 2, pytest.approx(0.2), 1, 1)
+        ]
+
+        await manager.close()
+
+
+class TestReadOnlyDatabaseManager:
+    """Test read-only DatabaseManager engines."""
+
+    @pytest.fixture
+    async def populated_db_path(self, tmp_path: Path) -> Path:
+        """Create a database with tables and a marker row."""
+        db_path = tmp_path / "kalshi.db"
+        async with DatabaseManager(db_path) as manager:
+            await manager.create_tables()
+            async with manager.engine.begin() as conn:
+                await conn.execute(
+                    text(
+                        "INSERT INTO events (ticker, series_ticker, title, "
+                        "mutually_exclusive, created_at, updated_at) "
+                        "VALUES ('EVT', 'SER', 'Event', 0, '2026-01-01', '2026-01-01')"
+                    )
+                )
+        return db_path
+
+    @pytest.mark.asyncio
+    async def test_reader_reads_committed_rows(self, populated_db_path: Path) -> None:
+        """A reader sees rows committed by the writer."""
+        async with DatabaseManager(populated_db_path) as writer:
+            reader = writer.reader()
+            assert reader.read_only is True
+            assert reader.engine is not writer.engine
+
+            async with reader.session_factory() as session:
+                result = await session.execute(text("SELECT ticker FROM events"))
+                assert result.scalars().all() == ["EVT"]
+
+                query_only = await session.execute(text("PRAGMA query_only"))
+                assert query_only.scalar_one() == 1
+
+            await reader.close()
+
+    @pytest.mark.asyncio
+    async def test_read_only_rejects_writes(self, populated_db_path: Path) -> None:
+        """Writes through a read-only engine fail."""
+        from sqlalchemy.exc import OperationalError
+
+        async with (
+            DatabaseManager(populated_db_path, read_only=True) as manager,
+            manager.session_factory() as session,
+        ):
+            with pytest.raises(OperationalError):
+                await session.execute(text("DELETE FROM events"))
+
+    @pytest.mark.asyncio
+    async def test_read_only_rejects_schema_changes(self, populated_db_path: Path) -> None:
+        """Schema management is unavailable on read-only managers."""
+        async with DatabaseManager(populated_db_path, read_only=True) as manager:
+            with pytest.raises(RuntimeError, match="read-only"):
+                await manager.create_tables()
+            with pytest.raises(RuntimeError, match="read-only"):
+                await manager.drop_tables()
+
+    def test_read_only_requires_existing_file(self, tmp_path: Path) -> None:
+        """Read-only engines never create the database file."""
+        manager = DatabaseManager(tmp_path / "missing.db", read_only=True)
+
+        with pytest.raises(FileNotFoundError):
+            _ = manager.engine
+        assert not (tmp_path / "missing.db").exists()
+
+
+class TestSQLiteProfiles:
+    """Test per-engine SQLite performance profiles."""
+
+    @pytest.mark.asyncio
+    async def test_collector_profile_applies_pragmas(self, tmp_path: Path) -> None:
+        """Profile pragmas are applied to every pooled connection."""
+        async with DatabaseManager(tmp_path / "kalshi.db", profile="collector") as manager:
+            assert manager.profile.name == "collector"
+            async with manager.engine.connect() as conn:
+                synchronous = await conn.execute(text("PRAGMA synchronous"))
+                assert synchronous.scalar_one() == 1  # NORMAL
+                temp_store = await conn.execute(text("PRAGMA temp_store"))
+                assert temp_store.scalar_one() == 2  # MEMORY
+                busy_timeout = await conn.execute(text("PRAGMA busy_timeout"))
+                assert busy_timeout.scalar_one() == 30_000
+                journal_mode = await conn.execute(text("PRAGMA journal_mode"))
+                assert journal_mode.scalar_one() == "wal"
+
+            assert manager.engine.pool.size() == 2  # type: ignore[attr-defined]
+
+    @pytest.mark.asyncio
+    async def test_custom_profile(self, tmp_path: Path) -> None:
+        """A custom profile can be passed instead of a name."""
+        from kalshi_research.data import SQLiteProfile
+
+        profile = SQLiteProfile(name="custom", cache_size_kib=1024, wal_autocheckpoint_pages=50)
+        async with (
+            DatabaseManager(tmp_path / "kalshi.db", profile=profile) as manager,
+            manager.engine.connect() as conn,
+        ):
+            cache_size = await conn.execute(text("PRAGMA cache_size"))
+            assert cache_size.scalar_one() == -1024
+            checkpoint = await conn.execute(text("PRAGMA wal_autocheckpoint"))
+            assert checkpoint.scalar_one() == 50
+
+    def test_default_profiles(self, tmp_path: Path) -> None:
+        """Writers keep SQLite defaults; read-only managers use the analytics profile."""
+        assert DatabaseManager(tmp_path / "kalshi.db").profile.pragmas() == []
+        assert DatabaseManager(tmp_path / "kalshi.db", read_only=True).profile.name == "analytics"
+
+    def test_unknown_profile_rejected(self, tmp_path: Path) -> None:
+        """Unknown profile names fail at construction time."""
+        with pytest.raises(ValueError, match="Unknown SQLite profile"):
+            DatabaseManager(tmp_path / "kalshi.db", profile="turbo")
@@ -1,8 +1,14 @@
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from kalshi_research.data.export import export_to_csv, export_to_parquet, query_parquet
+from kalshi_research.data.export import (
+    compact_parquet_partitions,
+    export_to_csv,
+    export_to_parquet,
+    query_parquet,
+)
 
 
 @patch("duckdb.connect")
@@ -116,3 +122,125 @@ def test_query_parquet_creates_views_for_existing_exports(mock_connect, tmp_path
     assert any("CREATE VIEW markets" in q for q in executed)
     assert any("CREATE VIEW events" in q for q in executed)
     assert not any("CREATE VIEW settlements" in q for q in executed)
+
+
+def _executed_sql(mock_conn: MagicMock) -> list[str]:
+    return [call.args[0] for call in mock_conn.execute.call_args_list]
+
+
+@patch("duckdb.connect")
+def test_export_to_parquet_incremental_bootstraps_with_full_export(mock_connect, tmp_path):
+    mock_conn = MagicMock()
+    mock_connect.return_value = mock_conn
+    mock_conn.execute.return_value.fetchone.return_value = (42, "2026-01-02 00:00:00", 42)
+
+    db_path = tmp_path / "test.db"
+    db_path.touch()
+    output_dir = tmp_path / "exports"
+
+    export_to_parquet(db_path, output_dir, tables=["price_snapshots"], incremental=True)
+
+    copies = [q for q in _executed_sql(mock_conn) if "COPY" in q]
+    assert len(copies) == 1
+    assert "OVERWRITE true" in copies[0]
+    assert "id > 0 AND id <= 42" in copies[0]
+
+    state = json.loads((output_dir / ".export_state.json").read_text())
+    assert state["tables"]["price_snapshots"]["last_id"] == 42
+
+
+@patch("duckdb.connect")
+def test_export_to_parquet_incremental_appends_rows_after_watermark(mock_connect, tmp_path):
+    mock_conn = MagicMock()
+    mock_connect.return_value = mock_conn
+    mock_conn.execute.return_value.fetchone.return_value = (50, "2026-01-03 00:00:00", 8)
+
+    db_path = tmp_path / "test.db"
+    db_path.touch()
+    output_dir = tmp_path / "exports"
+    output_dir.mkdir()
+    (output_dir / ".export_state.json").write_text(
+        json.dumps({"version": 1, "tables": {"price_snapshots": {"last_id": 42}}})
+    )
+
+    export_to_parquet(db_path, output_dir, tables=["price_snapshots"], incremental=True)
+
+    copies = [q for q in _executed_sql(mock_conn) if "COPY" in q]
+    assert len(copies) == 1
+    assert "APPEND true" in copies[0]
+    assert "id > 42 AND id <= 50" in copies[0]
+
+    state = json.loads((output_dir / ".export_state.json").read_text())
+    assert state["tables"]["price_snapshots"]["last_id"] == 50
+
+
+@patch("duckdb.connect")
+def test_export_to_parquet_incremental_skips_copy_when_no_new_rows(mock_connect, tmp_path):
+    mock_conn = MagicMock()
+    mock_connect.return_value = mock_conn
+    mock_conn.execute.return_value.fetchone.return_value = (None, None, 0)
+
+    db_path = tmp_path / "test.db"
+    db_path.touch()
+    output_dir = tmp_path / "exports"
+    output_dir.mkdir()
+    (output_dir / ".export_state.json").write_text(
+        json.dumps({"version": 1, "tables": {"price_snapshots": {"last_id": 42}}})
+    )
+
+    export_to_parquet(db_path, output_dir, tables=["price_snapshots"], incremental=True)
+
+    assert not [q for q in _executed_sql(mock_conn) if "COPY" in q]
+    state = json.loads((output_dir / ".export_state.json").read_text())
+    assert state["tables"]["price_snapshots"]["last_id"] == 42
+
+
+def test_export_to_parquet_rejects_corrupt_state_file(tmp_path):
+    db_path = tmp_path / "test.db"
+    db_path.touch()
+    output_dir = tmp_path / "exports"
+    output_dir.mkdir()
+    (output_dir / ".export_state.json").write_text(json.dumps({"version": 99}))
+
+    with pytest.raises(ValueError, match="unexpected schema"):
+        export_to_parquet(db_path, output_dir, incremental=True)
+
+
+def test_compact_parquet_partitions_merges_small_files(tmp_path):
+    import duckdb
+
+    table_dir = tmp_path / "price_snapshots"
+    partition = table_dir / "month=2026-01"
+    partition.mkdir(parents=True)
+    conn = duckdb.connect()
+    try:
+        for i in range(3):
+            conn.execute(
+                f"COPY (SELECT {i} AS id, 'T' AS ticker) TO '{partition / f'part-{i}.parquet'}' "
+                "(FORMAT PARQUET)"
+            )
+    finally:
+        conn.close()
+    small = table_dir / "month=2026-02"
+    small.mkdir()
+    (small / "part-0.parquet").write_bytes((partition / "part-0.parquet").read_bytes())
+
+    compacted = compact_parquet_partitions(table_dir, min_files=3)
+
+    assert compacted == 1
+    files = list(partition.glob("*.parquet"))
+    assert len(files) == 1
+    assert files[0].name.startswith("part-compacted-")
+    assert len(list(small.glob("*.parquet"))) == 1
+
+    conn = duckdb.connect()
+    try:
+        rows = conn.execute(f"SELECT id FROM read_parquet('{files[0]}')").fetchall()
+    finally:
+        conn.close()
+    assert rows == [(0,), (1,), (2,)]
+
+
+def test_compact_parquet_partitions_rejects_min_files_below_two(tmp_path):
+    with pytest.raises(ValueError, match="min_files"):
+        compact_parquet_partitions(tmp_path, min_files=1)
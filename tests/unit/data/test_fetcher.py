@@ -1,7 +1,8 @@
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 
+from kalshi_research.api import MarketSweep
 from kalshi_research.api.models.event import Event
 from kalshi_research.api.models.market import Market, MarketFilterStatus, MarketStatus
 from kalshi_research.data._converters import api_market_to_settlement, api_market_to_snapshot
@@ -360,21 +361,36 @@ async def test_take_snapshot(data_fetcher, mock_client, mock_db):
         liquidity=10000,
     )
 
-    async def market_gen(status=None, max_pages: int | None = None, mve_filter=None):
+    async def market_gen(status=None, max_pages: int | None = None, mve_filter=None, sweep=None):
         del mve_filter
         yield mock_market
 
     mock_client.get_all_markets = MagicMock(side_effect=market_gen)
 
-    with patch("kalshi_research.data.fetcher.PriceRepository") as MockPriceRepo:
+    with (
+        patch("kalshi_research.data._snapshot_writer.PriceRepository") as MockPriceRepo,
+        patch("kalshi_research.data._snapshot_writer.SnapshotBatchRepository") as MockBatchRepo,
+    ):
         repo = AsyncMock()
         MockPriceRepo.return_value = repo
+        batch_repo = AsyncMock()
+        batch_repo.start.return_value = MagicMock(id=7)
+        MockBatchRepo.return_value = batch_repo
 
         count = await data_fetcher.take_snapshot(max_pages=5)
 
         assert count == 1
         repo.add.assert_called_once()
-        mock_client.get_all_markets.assert_called_once_with(status="open", max_pages=5)
+        batch_repo.finish.assert_awaited_once_with(
+            7, status="complete", market_count=1, skipped_count=0, truncated=False
+        )
+        repo.upsert_latest_quotes.assert_awaited_once()
+        (quoted,) = repo.upsert_latest_quotes.await_args.args
+        assert [snapshot.ticker for snapshot in quoted] == ["TEST-MARKET"]
+        mock_client.get_all_markets.assert_called_once_with(
+            status="open", max_pages=5, sweep=MarketSweep()
+        )
+        batch_repo.start.assert_awaited_once_with(ANY, status_filter="open")
         # With session.begin() pattern, commits are automatic on context exit
 
 
@@ -430,21 +446,30 @@ async def test_take_snapshot_skips_markets_missing_dollar_quotes(data_fetcher, m
         liquidity=10000,
     )
 
-    async def market_gen(status=None, max_pages: int | None = None, mve_filter=None):
+    async def market_gen(status=None, max_pages: int | None = None, mve_filter=None, sweep=None):
         del mve_filter
         yield good_market
         yield bad_market
 
     mock_client.get_all_markets = MagicMock(side_effect=market_gen)
 
-    with patch("kalshi_research.data.fetcher.PriceRepository") as MockPriceRepo:
+    with (
+        patch("kalshi_research.data._snapshot_writer.PriceRepository") as MockPriceRepo,
+        patch("kalshi_research.data._snapshot_writer.SnapshotBatchRepository") as MockBatchRepo,
+    ):
         repo = AsyncMock()
         MockPriceRepo.return_value = repo
+        batch_repo = AsyncMock()
+        batch_repo.start.return_value = MagicMock(id=7)
+        MockBatchRepo.return_value = batch_repo
 
         count = await data_fetcher.take_snapshot(max_pages=5)
 
         assert count == 1
         assert repo.add.call_count == 1
+        batch_repo.finish.assert_awaited_once_with(
+            7, status="complete", market_count=1, skipped_count=1, truncated=False
+        )
 
 
 @pytest.mark.asyncio
@@ -14,6 +14,7 @@ from kalshi_research.data.models import (
     NewsArticleMarket,
     NewsSentiment,
     PriceSnapshot,
+    SnapshotBatch,
 )
 
 
@@ -155,3 +156,60 @@ async def test_prune_deletes_old_snapshots_and_news(tmp_path) -> None:
         assert sentiment_total == 1
     finally:
         await db.close()
+
+
+@pytest.mark.asyncio
+async def test_prune_drops_whole_snapshot_batches(tmp_path) -> None:
+    now = datetime.now(UTC)
+    cutoff = now - timedelta(days=5)
+
+    async with DatabaseManager(tmp_path / "maintenance.db") as db:
+        await db.create_tables()
+        async with db.session_factory() as session, session.begin():
+            session.add(Event(ticker="EVT1", series_ticker="S1", title="Event 1"))
+            session.add(
+                Market(
+                    ticker="MKT1",
+                    event_ticker="EVT1",
+                    title="Market 1",
+                    status="active",
+                    open_time=now - timedelta(days=30),
+                    close_time=now + timedelta(days=30),
+                    expiration_time=now + timedelta(days=60),
+                )
+            )
+            old_batch = SnapshotBatch(snapshot_time=now - timedelta(days=10), status="complete")
+            new_batch = SnapshotBatch(snapshot_time=now, status="complete")
+            session.add_all([old_batch, new_batch])
+            await session.flush()
+            for batch_id, snapshot_time in (
+                (old_batch.id, old_batch.snapshot_time),
+                (new_batch.id, new_batch.snapshot_time),
+                # Legacy row written before snapshot batches existed.
+                (None, now - timedelta(days=20)),
+            ):
+                session.add(
+                    PriceSnapshot(
+                        ticker="MKT1",
+                        snapshot_time=snapshot_time,
+                        batch_id=batch_id,
+                        yes_bid=40,
+                        yes_ask=42,
+                        no_bid=58,
+                        no_ask=60,
+                        volume=100,
+                        volume_24h=50,
+                        open_interest=10,
+                    )
+                )
+
+        async with db.session_factory() as session, session.begin():
+            removed = await apply_prune(session, snapshots_before=cutoff, news_before=None)
+
+        assert removed == PruneCounts(price_snapshots=2, snapshot_batches=1)
+        assert removed.total_rows == 3
+        async with db.session_factory() as session:
+            remaining = (await session.execute(select(PriceSnapshot.batch_id))).scalars().all()
+            batch_ids = (await session.execute(select(SnapshotBatch.id))).scalars().all()
+        assert remaining == [new_batch.id]
+        assert batch_ids == [new_batch.id]
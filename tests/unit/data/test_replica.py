@@ -0,0 +1,90 @@
+"""Tests for backup-API database replicas."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from kalshi_research.data.replica import backup_database, default_replica_path, refresh_replica
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _make_wal_db(path: Path, rows: int) -> None:
+    with sqlite3.connect(path) as conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS t (id INTEGER PRIMARY KEY, v TEXT)")
+        conn.executemany("INSERT INTO t (v) VALUES (?)", [(str(i),) for i in range(rows)])
+
+
+def _count(path: Path) -> int:
+    with sqlite3.connect(path) as conn:
+        return int(conn.execute("SELECT count(*) FROM t").fetchone()[0])
+
+
+def test_default_replica_path() -> None:
+    from pathlib import Path
+
+    assert default_replica_path(Path("data/kalshi.db")) == Path("data/kalshi.replica.db")
+
+
+def test_backup_database_copies_committed_wal_rows(tmp_path: Path) -> None:
+    source = tmp_path / "kalshi.db"
+    _make_wal_db(source, rows=10)
+
+    # Keep a writer connection open so committed rows may still live only in the WAL.
+    writer = sqlite3.connect(source)
+    try:
+        writer.execute("INSERT INTO t (v) VALUES ('late')")
+        writer.commit()
+
+        replica = backup_database(source, tmp_path / "copy.db")
+    finally:
+        writer.close()
+
+    assert _count(replica) == 11
+    with sqlite3.connect(replica) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    assert not list(tmp_path.glob(".copy.db.tmp.*"))
+
+
+def test_backup_database_rejects_same_path(tmp_path: Path) -> None:
+    source = tmp_path / "kalshi.db"
+    _make_wal_db(source, rows=1)
+
+    with pytest.raises(ValueError, match="must differ"):
+        backup_database(source, source)
+
+
+def test_backup_database_missing_source(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        backup_database(tmp_path / "missing.db", tmp_path / "copy.db")
+
+
+def test_refresh_replica_reuses_fresh_copy(tmp_path: Path) -> None:
+    source = tmp_path / "kalshi.db"
+    _make_wal_db(source, rows=3)
+
+    replica = refresh_replica(source, max_age_seconds=60)
+    assert replica == default_replica_path(source)
+    assert _count(replica) == 3
+
+    _make_wal_db(source, rows=2)
+    assert _count(refresh_replica(source, max_age_seconds=60)) == 3
+
+
+def test_refresh_replica_replaces_stale_copy(tmp_path: Path) -> None:
+    source = tmp_path / "kalshi.db"
+    _make_wal_db(source, rows=3)
+    replica = refresh_replica(source, max_age_seconds=60)
+
+    stale = time.time() - 3600
+    os.utime(replica, (stale, stale))
+    _make_wal_db(source, rows=2)
+
+    assert _count(refresh_replica(source, max_age_seconds=60)) == 5
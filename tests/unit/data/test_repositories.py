@@ -244,6 +244,66 @@ class TestPriceRepository:
 
         assert count == 5
 
+    @pytest.mark.asyncio
+    async def test_rebuild_latest_quotes(self, seeded_session: AsyncSession) -> None:
+        """Rebuilding materializes the newest snapshot per ticker."""
+        repo = PriceRepository(seeded_session)
+
+        assert await repo.rebuild_latest_quotes() == 2
+        quotes = await repo.get_latest_quotes(["MKT1", "MKT2", "MKT3"])
+
+        assert set(quotes) == {"MKT1", "MKT2"}
+        assert quotes["MKT1"].yes_bid == 45
+        assert quotes["MKT1"].volume == 10000
+
+    @pytest.mark.asyncio
+    async def test_upsert_latest_quotes_keeps_newest(self, seeded_session: AsyncSession) -> None:
+        """Older snapshots never overwrite a newer latest quote."""
+        repo = PriceRepository(seeded_session)
+        now = datetime.now(UTC)
+
+        def _snapshot(snapshot_time: datetime, yes_bid: int) -> PriceSnapshot:
+            return PriceSnapshot(
+                ticker="MKT1",
+                snapshot_time=snapshot_time,
+                yes_bid=yes_bid,
+                yes_ask=yes_bid + 2,
+                no_bid=98 - yes_bid,
+                no_ask=100 - yes_bid,
+                volume=20000,
+                volume_24h=700,
+                open_interest=6000,
+            )
+
+        await repo.upsert_latest_quotes([_snapshot(now + timedelta(minutes=15), 60)])
+        await repo.upsert_latest_quotes([_snapshot(now - timedelta(hours=1), 10)])
+
+        quote = await repo.get_latest_quote("MKT1")
+        assert quote is not None
+        assert quote.yes_bid == 60
+        assert quote.spread == 2
+
+        count, latest_time = await repo.latest_quote_stats()
+        assert count == 1
+        assert latest_time is not None
+
+
+class TestMarketRepositoryLatestQuotes:
+    """Test MarketRepository.get_with_latest_quotes."""
+
+    @pytest.mark.asyncio
+    async def test_joins_latest_quotes_and_filters(self, seeded_session: AsyncSession) -> None:
+        await PriceRepository(seeded_session).rebuild_latest_quotes()
+        repo = MarketRepository(seeded_session)
+
+        rows = await repo.get_with_latest_quotes()
+        assert sorted(row.ticker for row in rows) == ["MKT1", "MKT2"]
+        assert {row.category for row in rows} == {"Crypto"}
+
+        assert await repo.get_with_latest_quotes(category="sports") == []
+        assert await repo.get_with_latest_quotes(exclude_category="crypto") == []
+        assert await repo.get_with_latest_quotes(event_prefix="evt2") == []
+
 
 class TestSettlementRepository:
     """Test SettlementRepository methods."""
@@ -0,0 +1,170 @@
+"""Tests for hourly/daily price rollups and resolution selection."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import delete, select
+
+from kalshi_research.data import DatabaseManager, PriceRollup
+from kalshi_research.data.maintenance import PruneCounts, apply_prune
+from kalshi_research.data.models import Event, Market, PriceSnapshot
+from kalshi_research.data.repositories import PriceRepository, PriceRollupRepository
+from kalshi_research.data.repositories.rollups import bucket_start
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+T0 = datetime(2026, 1, 5, 10, 0, tzinfo=UTC)
+
+
+def _snapshot(minutes: int, yes_bid: int, volume: int) -> PriceSnapshot:
+    return PriceSnapshot(
+        ticker="MKT",
+        snapshot_time=T0 + timedelta(minutes=minutes),
+        yes_bid=yes_bid,
+        yes_ask=yes_bid + 2,
+        no_bid=98 - yes_bid,
+        no_ask=100 - yes_bid,
+        last_price=yes_bid + 1,
+        volume=volume,
+        volume_24h=volume,
+        open_interest=10,
+    )
+
+
+# Two hourly buckets on one day; the 10:20 snapshot arrives out of order.
+SNAPSHOTS = [(0, 40, 100), (40, 46, 130), (20, 36, 120), (65, 50, 150)]
+
+
+@pytest.fixture
+async def db(tmp_path: Path) -> AsyncIterator[DatabaseManager]:
+    async with DatabaseManager(tmp_path / "rollups.db") as db:
+        await db.create_tables()
+        async with db.session_factory() as session, session.begin():
+            session.add(Event(ticker="EVT", series_ticker="S", title="Event"))
+            session.add(
+                Market(
+                    ticker="MKT",
+                    event_ticker="EVT",
+                    title="Market",
+                    status="active",
+                    open_time=T0 - timedelta(days=30),
+                    close_time=T0 + timedelta(days=30),
+                    expiration_time=T0 + timedelta(days=31),
+                )
+            )
+            snapshots = [_snapshot(*spec) for spec in SNAPSHOTS]
+            session.add_all(snapshots)
+            await session.flush()
+            rollups = PriceRollupRepository(session)
+            for snapshot in snapshots:
+                await rollups.upsert_snapshots([snapshot])
+        yield db
+
+
+async def _rollup_rows(db: DatabaseManager) -> list[tuple[object, ...]]:
+    async with db.session_factory() as session:
+        result = await session.execute(
+            select(PriceRollup).order_by(PriceRollup.resolution, PriceRollup.bucket_start)
+        )
+        return [
+            (
+                r.resolution,
+                r.bucket_start,
+                r.first_snapshot_time,
+                r.snapshot_time,
+                r.sample_count,
+                r.open_mid,
+                r.high_mid,
+                r.low_mid,
+                r.close_mid,
+                r.open_volume,
+                r.yes_bid,
+                r.volume,
+            )
+            for r in result.scalars().all()
+        ]
+
+
+def test_bucket_start_floors_in_utc() -> None:
+    ts = datetime(2026, 1, 5, 10, 59, 59, 999, tzinfo=UTC)
+    assert bucket_start(ts, "1h") == datetime(2026, 1, 5, 10, tzinfo=UTC)
+    assert bucket_start(ts, "1d") == datetime(2026, 1, 5, tzinfo=UTC)
+    with pytest.raises(ValueError, match="resolution"):
+        bucket_start(ts, "5m")
+
+
+@pytest.mark.asyncio
+async def test_incremental_rollups_track_ohlc_and_last_quote(db: DatabaseManager) -> None:
+    async with db.session_factory() as session:
+        daily = (await PriceRollupRepository(session).get_for_market("MKT", "1d"))[0]
+        hourly = await PriceRollupRepository(session).get_for_market("MKT", "1h")
+
+    assert daily.sample_count == 4
+    assert (daily.open_mid, daily.high_mid, daily.low_mid, daily.close_mid) == (41, 51, 37, 51)
+    assert daily.yes_bid == 50
+    assert daily.volume_traded == 50
+    assert daily.implied_probability == pytest.approx(0.51)
+    # Newest bucket first; the out-of-order snapshot did not become the 10:00 close.
+    assert [h.close_mid for h in hourly] == [51, 47]
+    assert hourly[1].open_mid == 41
+    assert hourly[1].low_mid == 37
+
+
+@pytest.mark.asyncio
+async def test_backfill_matches_incremental_rollups(db: DatabaseManager) -> None:
+    incremental = await _rollup_rows(db)
+
+    async with db.session_factory() as session, session.begin():
+        await session.execute(delete(PriceRollup))
+        await PriceRollupRepository(session).backfill()
+
+    assert await _rollup_rows(db) == incremental
+
+
+@pytest.mark.asyncio
+async def test_get_history_picks_coarsest_sufficient_resolution(db: DatabaseManager) -> None:
+    async with db.session_factory() as session:
+        repo = PriceRepository(session)
+        raw = await repo.get_history("MKT")
+        fine = await repo.get_history("MKT", granularity=timedelta(minutes=30))
+        hourly = await repo.get_history("MKT", granularity=timedelta(hours=6))
+        daily = await repo.get_history("MKT", granularity=timedelta(days=7))
+        recent = await repo.get_history(
+            "MKT", start_time=T0 + timedelta(minutes=30), granularity=timedelta(hours=1)
+        )
+
+    assert len(raw) == len(fine) == 4
+    assert all(isinstance(row, PriceSnapshot) for row in raw)
+    assert [(r.resolution, r.sample_count) for r in hourly] == [("1h", 1), ("1h", 3)]
+    assert [(r.resolution, r.sample_count) for r in daily] == [("1d", 4)]
+    # Filters apply to each bucket's last quote time (SQLite returns naive UTC).
+    assert [r.snapshot_time.replace(tzinfo=UTC) for r in recent] == [
+        T0 + timedelta(minutes=65),
+        T0 + timedelta(minutes=40),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_pruned_snapshots_are_served_from_rollups(db: DatabaseManager) -> None:
+    cutoff = T0 + timedelta(days=1)
+    async with db.session_factory() as session, session.begin():
+        await session.execute(delete(PriceRollup))  # force the prune-time backfill
+        removed = await apply_prune(session, snapshots_before=cutoff, news_before=None)
+
+    assert removed == PruneCounts(price_snapshots=4)
+    async with db.session_factory() as session:
+        history = await PriceRepository(session).get_history("MKT")
+    assert [(r.resolution, r.close_mid) for r in history] == [("1h", 51), ("1h", 47)]
+
+    async with db.session_factory() as session, session.begin():
+        removed = await apply_prune(
+            session, snapshots_before=None, news_before=None, hourly_rollups_before=cutoff
+        )
+
+    assert removed == PruneCounts(hourly_rollups=2)
+    assert [row[0] for row in await _rollup_rows(db)] == ["1d"]
@@ -7,10 +7,16 @@ These tests verify the scheduler runs tasks at correct intervals.
 from __future__ import annotations
 
 import asyncio
+import json
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 
 import pytest
 
-from kalshi_research.data.scheduler import DataScheduler
+from kalshi_research.data.scheduler import DataScheduler, TaskStats
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 class TestDataScheduler:
@@ -170,3 +176,124 @@ class TestDataScheduler:
 
         assert results["task1"] >= 1
         assert results["task2"] >= 1
+
+
+class TestSchedulerStats:
+    """Run statistics, overruns, deadlines and the status file."""
+
+    @pytest.mark.asyncio
+    async def test_overrun_skips_slots_and_is_counted(self) -> None:
+        """A run longer than the interval is an overrun; the slots it covered are missed."""
+
+        async def slow() -> None:
+            await asyncio.sleep(0.25)
+
+        scheduler = DataScheduler()
+        await scheduler.schedule_interval("slow", slow, interval_seconds=0.1)
+        async with scheduler:
+            await asyncio.sleep(0.4)
+
+        stats = scheduler.stats["slow"]
+        assert stats.runs >= 1
+        assert stats.overruns == stats.runs
+        assert stats.missed_runs >= 2
+        assert stats.max_duration_seconds >= 0.25
+        assert stats.last_outcome == "ok"
+
+    @pytest.mark.asyncio
+    async def test_deadline_cancels_run(self) -> None:
+        """Runs exceeding the deadline are cancelled and counted as timeouts."""
+        cancelled = asyncio.Event()
+
+        async def hang() -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        scheduler = DataScheduler()
+        await scheduler.schedule_interval("hang", hang, interval_seconds=1, deadline_seconds=0.05)
+        async with scheduler:
+            await asyncio.wait_for(cancelled.wait(), timeout=2)
+            await asyncio.sleep(0.01)
+
+        stats = scheduler.stats["hang"]
+        assert stats.timeouts == 1
+        assert stats.last_outcome == "timeout"
+
+    @pytest.mark.asyncio
+    async def test_timeout_raised_by_task_is_a_failure(self) -> None:
+        """A TimeoutError from the task itself is not mistaken for the deadline."""
+        ran = asyncio.Event()
+
+        async def task() -> None:
+            ran.set()
+            raise TimeoutError("upstream timed out")
+
+        scheduler = DataScheduler()
+        await scheduler.schedule_interval("t", task, interval_seconds=1, deadline_seconds=5)
+        async with scheduler:
+            await asyncio.wait_for(ran.wait(), timeout=2)
+            await asyncio.sleep(0.01)
+
+        assert scheduler.stats["t"].failures == 1
+        assert scheduler.stats["t"].timeouts == 0
+
+    @pytest.mark.asyncio
+    async def test_status_file_written_after_run(self, tmp_path: Path) -> None:
+        """The status file reflects every task's stats after a run."""
+        status_path = tmp_path / "status" / "collector.json"
+
+        async def task() -> None:
+            pass
+
+        scheduler = DataScheduler(status_path=status_path)
+        await scheduler.schedule_interval("quick", task, interval_seconds=1, jitter_seconds=0.01)
+        async with scheduler:
+            for _ in range(100):
+                if status_path.exists():
+                    break
+                await asyncio.sleep(0.01)
+
+        payload = json.loads(status_path.read_text())
+        quick = payload["tasks"]["quick"]
+        assert quick["runs"] == 1
+        assert quick["jitter_seconds"] == 0.01
+        assert quick["duration_histogram"]["le_1"] == 1
+        assert quick["next_run_at"] is not None
+
+    @pytest.mark.asyncio
+    async def test_rejects_jitter_not_shorter_than_interval(self) -> None:
+        async def task() -> None:
+            pass
+
+        scheduler = DataScheduler()
+        with pytest.raises(ValueError, match="jitter_seconds"):
+            await scheduler.schedule_interval("t", task, interval_seconds=1, jitter_seconds=1)
+
+
+class TestTaskStats:
+    def _record(self, stats: TaskStats, duration: float) -> None:
+        stats.record_run(
+            started_at=datetime.now(UTC),
+            duration_seconds=duration,
+            lag_seconds=0.0,
+            outcome="ok",
+            missed_runs=0,
+        )
+
+    def test_histogram_and_quantiles(self) -> None:
+        stats = TaskStats(name="snap", interval_seconds=900)
+        for duration in [0.5] * 18 + [40.0, 2000.0]:
+            self._record(stats, duration)
+
+        assert stats.duration_buckets[0] == 18
+        assert stats.duration_buckets[-1] == 1
+        assert stats.duration_quantile(0.5) == 1.0
+        assert stats.duration_quantile(0.95) == 60.0
+        assert stats.duration_quantile(1.0) == 2000.0
+        assert stats.overruns == 1
+
+    def test_quantile_without_runs(self) -> None:
+        assert TaskStats(name="snap", interval_seconds=60).duration_quantile(0.95) is None
@@ -0,0 +1,230 @@
+"""Tests for the sharded snapshot collector (planning, worker sweeps, single writer)."""
+
+from __future__ import annotations
+
+import queue
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+import pytest
+import respx
+from httpx import Response
+
+from kalshi_research.api import KalshiPublicClient, Market, MarketSweep
+from kalshi_research.api.rate_limiter import RateTier, SharedTokenBucket
+from kalshi_research.data import DatabaseManager, DataFetcher, ShardedSnapshotCollector
+from kalshi_research.data.repositories import PriceRepository
+from kalshi_research.data.sharded_collector import (
+    MarketShard,
+    ShardMessage,
+    plan_shards,
+    run_shard_worker,
+    sweep_shard,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+MARKETS_URL = "https://api.elections.kalshi.com/trade-api/v2/markets"
+
+
+class _FakeWorker:
+    def __init__(self, *, alive: bool = True) -> None:
+        self.alive = alive
+        self.terminated = False
+
+    def is_alive(self) -> bool:
+        return self.alive
+
+    def terminate(self) -> None:
+        self.terminated = True
+        self.alive = False
+
+    def join(self, timeout: float | None = None) -> None:
+        del timeout
+
+
+def _market(make_market: Callable[..., dict[str, Any]], ticker: str, created: str) -> Market:
+    return Market.model_validate(
+        make_market(
+            ticker=ticker,
+            created_time=created,
+            yes_bid_dollars="0.4500",
+            yes_ask_dollars="0.4700",
+            no_bid_dollars="0.5300",
+            no_ask_dollars="0.5500",
+        )
+    )
+
+
+class TestPlanShards:
+    def test_single_shard_without_history(self) -> None:
+        assert plan_shards([], 4) == [MarketShard(0)]
+        assert plan_shards([1, 2, 3], 1) == [MarketShard(0)]
+
+    def test_quantile_windows_overlap_at_boundaries(self) -> None:
+        plan = plan_shards(list(range(100, 200)), 4)
+
+        assert [(s.min_created_ts, s.max_created_ts) for s in plan] == [
+            (None, 126),
+            (124, 151),
+            (149, 176),
+            (174, None),
+        ]
+
+    def test_identical_timestamps_collapse_shards(self) -> None:
+        plan = plan_shards([50] * 10, 3)
+
+        assert [(s.min_created_ts, s.max_created_ts) for s in plan] == [(None, 51), (49, None)]
+
+
+class TestShardWorker:
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_sweep_shard_sends_pages_with_window_filters(self, make_market) -> None:
+        route = respx.get(MARKETS_URL).mock(
+            side_effect=[
+                Response(200, json={"markets": [make_market(ticker="A")], "cursor": "c1"}),
+                Response(200, json={"markets": [make_market(ticker="B")], "cursor": None}),
+            ]
+        )
+        out: queue.Queue[ShardMessage] = queue.Queue()
+
+        async with KalshiPublicClient() as client:
+            sent = await sweep_shard(client, MarketShard(2, 100, 200), out)
+
+        assert sent == 2
+        params = route.calls[0].request.url.params
+        assert params["min_created_ts"] == "100"
+        assert params["max_created_ts"] == "200"
+        assert params["status"] == "open"
+        assert params["limit"] == "1000"
+        messages = [out.get_nowait(), out.get_nowait()]
+        assert [m.shard for m in messages] == [2, 2]
+        assert [m.markets[0].ticker for m in messages] == ["A", "B"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_sweep_shard_records_truncation(self, make_market) -> None:
+        respx.get(MARKETS_URL).mock(
+            return_value=Response(200, json={"markets": [make_market(ticker="A")], "cursor": "c"})
+        )
+        out: queue.Queue[ShardMessage] = queue.Queue()
+        sweep = MarketSweep()
+
+        async with KalshiPublicClient() as client:
+            await sweep_shard(client, MarketShard(0), out, max_pages=1, sweep=sweep)
+
+        assert sweep == MarketSweep(pages=1, truncated=True)
+
+    @respx.mock
+    def test_worker_reports_done_and_errors(self, make_market) -> None:
+        respx.get(MARKETS_URL).mock(
+            side_effect=[
+                Response(200, json={"markets": [make_market(ticker="A")], "cursor": None}),
+                Response(500, text="boom"),
+            ]
+        )
+        out: queue.Queue[ShardMessage] = queue.Queue()
+        bucket = SharedTokenBucket.for_tier(RateTier.BASIC)
+        kwargs: dict[str, Any] = {
+            "environment": "prod",
+            "rate_tier": "basic",
+            "status": "open",
+            "max_pages": None,
+        }
+
+        run_shard_worker(MarketShard(0), out, bucket, **kwargs)
+        run_shard_worker(MarketShard(1), out, bucket, **kwargs)
+
+        page, done, failed = out.get_nowait(), out.get_nowait(), out.get_nowait()
+        assert page.markets[0].ticker == "A"
+        assert done == ShardMessage(0, done=True)
+        assert failed.shard == 1
+        assert failed.error is not None
+        assert "500" in failed.error
+
+
+class TestShardedSnapshotCollector:
+    def test_rejects_statuses_without_created_ts_support(self) -> None:
+        with pytest.raises(ValueError, match="status"):
+            ShardedSnapshotCollector(DataFetcher(db=None), shards=2, status="closed")  # type: ignore[arg-type]
+
+    @pytest.mark.asyncio
+    async def test_writer_dedupes_and_learns_partition(
+        self, tmp_path: Path, make_market, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        pages = [
+            ShardMessage(0, [_market(make_market, "A", "2025-01-01T00:00:00Z")]),
+            ShardMessage(1, [_market(make_market, "B", "2025-02-01T00:00:00Z")]),
+            # Boundary overlap: the same market reported by the neighbouring shard.
+            ShardMessage(0, [_market(make_market, "B", "2025-02-01T00:00:00Z")]),
+            ShardMessage(0, done=True),
+            ShardMessage(1, done=True),
+        ]
+        started: list[list[MarketShard]] = []
+
+        def fake_start(self, plan, out, bucket):  # type: ignore[no-untyped-def]
+            del self, bucket
+            started.append(list(plan))
+            for message in pages:
+                out.put(message)
+            return [_FakeWorker(alive=False) for _ in plan]
+
+        monkeypatch.setattr(ShardedSnapshotCollector, "_start_workers", fake_start)
+
+        async with DatabaseManager(tmp_path / "sharded.db") as db:
+            await db.create_tables()
+            async with DataFetcher(db, client=object()) as fetcher:  # type: ignore[arg-type]
+                collector = ShardedSnapshotCollector(fetcher, shards=2)
+                collector._created_ts = [1, 2]  # history from a previous cycle
+                assert await collector.take_snapshot() == 2
+
+            async with db.session_factory() as session:
+                quotes = await PriceRepository(session).get_latest_quotes(["A", "B"])
+            assert set(quotes) == {"A", "B"}
+
+        assert len(started[0]) == 2
+        # The next cycle is split at the creation-time median learned from this one.
+        plan = collector.plan()
+        assert len(plan) == 2
+        boundary = int(datetime(2025, 2, 1, tzinfo=UTC).timestamp())
+        assert plan[0].max_created_ts == boundary + 1
+
+    @pytest.mark.asyncio
+    async def test_truncated_shard_marks_sweep_truncated(self, make_market) -> None:
+        collector = ShardedSnapshotCollector(DataFetcher(db=None), shards=2)  # type: ignore[arg-type]
+        out: queue.Queue[ShardMessage] = queue.Queue()
+        out.put(ShardMessage(0, [_market(make_market, "A", "2025-01-01T00:00:00Z")]))
+        out.put(ShardMessage(0, done=True))
+        out.put(ShardMessage(1, done=True, truncated=True))
+        sweep = MarketSweep()
+
+        workers = [_FakeWorker(), _FakeWorker()]
+        markets = [m async for m in collector._markets_from_workers(out, workers, [], sweep)]
+
+        assert [m.ticker for m in markets] == ["A"]
+        assert sweep == MarketSweep(pages=1, truncated=True)
+
+    @pytest.mark.asyncio
+    async def test_worker_failure_aborts_snapshot(self) -> None:
+        collector = ShardedSnapshotCollector(DataFetcher(db=None), shards=1)  # type: ignore[arg-type]
+        out: queue.Queue[ShardMessage] = queue.Queue()
+        out.put(ShardMessage(0, error="KalshiAPIError: 500"))
+
+        with pytest.raises(RuntimeError, match="shard 0 failed"):
+            [m async for m in collector._markets_from_workers(out, [_FakeWorker()], [])]
+
+    @pytest.mark.asyncio
+    async def test_dead_worker_without_report_aborts_snapshot(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from kalshi_research.data import sharded_collector
+
+        monkeypatch.setattr(sharded_collector, "_QUEUE_POLL_SECONDS", 0.01)
+        collector = ShardedSnapshotCollector(DataFetcher(db=None), shards=1)  # type: ignore[arg-type]
+        out: queue.Queue[ShardMessage] = queue.Queue()
+
+        with pytest.raises(RuntimeError, match="exited unexpectedly"):
+            [m async for m in collector._markets_from_workers(out, [_FakeWorker(alive=False)], [])]
@@ -0,0 +1,175 @@
+"""Tests for the pipelined snapshot writer (page transactions, batch markers, backpressure)."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from sqlalchemy import func, select
+
+from kalshi_research.api import Market, MarketSweep
+from kalshi_research.data import DatabaseManager, PriceSnapshot, _snapshot_writer
+from kalshi_research.data._snapshot_writer import write_snapshot
+from kalshi_research.data.repositories import PriceRepository, SnapshotBatchRepository
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+    from pathlib import Path
+
+
+def _markets(make_market: Callable[..., dict[str, Any]], count: int) -> list[Market]:
+    return [
+        Market.model_validate(
+            make_market(
+                ticker=f"MKT-{i}",
+                yes_bid_dollars="0.4500",
+                yes_ask_dollars="0.4700",
+                no_bid_dollars="0.5300",
+                no_ask_dollars="0.5500",
+            )
+        )
+        for i in range(count)
+    ]
+
+
+async def _iterate(
+    markets: list[Market], *, fail_after: int | None = None
+) -> AsyncIterator[Market]:
+    for i, market in enumerate(markets):
+        if fail_after is not None and i == fail_after:
+            raise RuntimeError("sweep failed")
+        yield market
+
+
+async def _snapshot_count(db: DatabaseManager) -> int:
+    async with db.session_factory() as session:
+        result = await session.execute(select(func.count()).select_from(PriceSnapshot))
+        return int(result.scalar_one())
+
+
+@pytest.mark.asyncio
+async def test_pages_are_written_and_batch_completed(tmp_path: Path, make_market) -> None:
+    async with DatabaseManager(tmp_path / "snap.db") as db:
+        await db.create_tables()
+
+        count = await write_snapshot(db, _iterate(_markets(make_market, 5)), batch_size=2)
+
+        assert count == 5
+        assert await _snapshot_count(db) == 5
+        async with db.session_factory() as session:
+            batch = await SnapshotBatchRepository(session).get_latest_complete()
+        assert batch is not None
+        assert batch.market_count == 5
+        assert batch.finished_at is not None
+
+
+@pytest.mark.asyncio
+async def test_source_failure_marks_batch_failed(tmp_path: Path, make_market) -> None:
+    async with DatabaseManager(tmp_path / "snap.db") as db:
+        await db.create_tables()
+
+        with pytest.raises(RuntimeError, match="sweep failed"):
+            await write_snapshot(db, _iterate(_markets(make_market, 5), fail_after=3), batch_size=2)
+
+        # The first full page was committed, but the batch is not complete.
+        assert await _snapshot_count(db) == 2
+        async with db.session_factory() as session:
+            repo = SnapshotBatchRepository(session)
+            assert await repo.get_latest_complete() is None
+            (batch,) = await repo.get_all()
+        assert batch.status == "failed"
+        assert batch.market_count == 2
+
+
+@pytest.mark.asyncio
+async def test_producer_is_bounded_by_queue(
+    tmp_path: Path, make_market, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A stalled writer stops the producer after `queue_pages` buffered pages."""
+    yielded = 0
+    release = asyncio.Event()
+    original_write_page = _snapshot_writer._write_page
+
+    async def counting(markets: list[Market]) -> AsyncIterator[Market]:
+        nonlocal yielded
+        for market in markets:
+            yielded += 1
+            yield market
+
+    async def stalled_write_page(db: DatabaseManager, page: Any) -> None:
+        await release.wait()
+        await original_write_page(db, page)
+
+    monkeypatch.setattr(_snapshot_writer, "_write_page", stalled_write_page)
+
+    async with DatabaseManager(tmp_path / "snap.db") as db:
+        await db.create_tables()
+        task = asyncio.create_task(
+            write_snapshot(db, counting(_markets(make_market, 20)), batch_size=1, queue_pages=2)
+        )
+        await asyncio.sleep(0.1)
+        # One page held by the writer, two queued, one waiting to be enqueued.
+        assert yielded <= 4
+        release.set()
+        assert await task == 20
+
+
+@pytest.mark.asyncio
+async def test_rows_reference_batch_and_as_of_query_uses_latest_complete(
+    tmp_path: Path, make_market
+) -> None:
+    async with DatabaseManager(tmp_path / "snap.db") as db:
+        await db.create_tables()
+
+        await write_snapshot(db, _iterate(_markets(make_market, 3)), status_filter="open")
+        # A later, truncated sweep is not a consistent point-in-time view by default.
+        await write_snapshot(
+            db, _iterate(_markets(make_market, 2)), sweep=MarketSweep(pages=1, truncated=True)
+        )
+        with pytest.raises(RuntimeError):
+            await write_snapshot(db, _iterate(_markets(make_market, 3), fail_after=1))
+
+        async with db.session_factory() as session:
+            batches = {b.id: b for b in await SnapshotBatchRepository(session).get_all()}
+            latest = await PriceRepository(session).get_latest_batch_snapshots()
+            subset = await PriceRepository(session).get_latest_batch_snapshots(["MKT-2"])
+            with_truncated = await PriceRepository(session).get_latest_batch_snapshots(
+                include_truncated=True
+            )
+
+        complete, truncated, _failed = sorted(batches)
+        assert batches[complete].status_filter == "open"
+        assert batches[truncated].truncated is True
+        assert [s.ticker for s in latest] == ["MKT-0", "MKT-1", "MKT-2"]
+        assert {s.batch_id for s in latest} == {complete}
+        assert [s.ticker for s in subset] == ["MKT-2"]
+        assert {s.batch_id for s in with_truncated} == {truncated}
+
+
+@pytest.mark.asyncio
+async def test_cached_sweep_keeps_its_time_and_is_written_once(tmp_path: Path, make_market) -> None:
+    swept_at = datetime.now(UTC) - timedelta(minutes=5)
+
+    async def cached(markets: list[Market], sweep: MarketSweep) -> AsyncIterator[Market]:
+        # Like get_all_markets(): sweep metadata is filled in once iteration starts.
+        sweep.from_cache = True
+        sweep.swept_at = swept_at
+        for market in markets:
+            yield market
+
+    async with DatabaseManager(tmp_path / "snap.db") as db:
+        await db.create_tables()
+
+        first, second = MarketSweep(), MarketSweep()
+        assert await write_snapshot(db, cached(_markets(make_market, 3), first), sweep=first) == 3
+        # Another process serving the same cached sweep does not record it again.
+        assert await write_snapshot(db, cached(_markets(make_market, 3), second), sweep=second) == 0
+
+        async with db.session_factory() as session:
+            (batch,) = await SnapshotBatchRepository(session).get_all()
+            times = (await session.execute(select(PriceSnapshot.snapshot_time))).scalars().all()
+        assert batch.snapshot_time.replace(tzinfo=UTC) == swept_at
+        assert {t.replace(tzinfo=UTC) for t in times} == {swept_at}
+        assert await _snapshot_count(db) == 3
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import sqlite3
+import time
+from contextlib import closing
 from datetime import timedelta
 from typing import TYPE_CHECKING
 from unittest.mock import patch
 
+import pytest
+
 from kalshi_research.exa.cache import ExaCache
 
 if TYPE_CHECKING:
@@ -20,6 +25,18 @@ def test_cache_round_trip(tmp_path: Path) -> None:
     cached = cache.get("search", {"num_results": 3, "query": "hello"})
 
     assert cached == payload
+    # One database file instead of a file per entry.
+    assert [p.name for p in tmp_path.iterdir() if p.suffix in {".db", ".json"}] == ["exa_cache.db"]
+
+
+def test_cache_persists_across_instances_with_full_length_keys(tmp_path: Path) -> None:
+    with ExaCache(tmp_path) as cache:
+        cache.set("search", {"query": "hello"}, {"ok": True})
+        assert len(cache._make_key("search", {"query": "hello"})) == 64
+
+    with ExaCache(tmp_path) as reopened:
+        assert reopened.get("search", {"query": "hello"}) == {"ok": True}
+        assert reopened.get("answer", {"query": "hello"}) is None
 
 
 def test_cache_expired_entry_is_evicted(tmp_path: Path) -> None:
@@ -37,17 +54,15 @@ def test_cache_corrupt_entry_is_evicted(tmp_path: Path) -> None:
     params = {"query": "hello"}
     cache.set("search", params, {"ok": True})
 
-    # Corrupt the first cache file.
-    files = list(tmp_path.glob("*.json"))
-    assert len(files) == 1
-    files[0].write_text("{broken json", encoding="utf-8")
+    with closing(sqlite3.connect(cache.path)) as conn, conn:
+        conn.execute("UPDATE exa_cache SET payload = ?", (b"{broken json",))
 
     with patch("kalshi_research.exa.cache.logger") as mock_logger:
         assert cache.get("search", params) is None
 
     mock_logger.warning.assert_called_once()
     assert mock_logger.warning.call_args.kwargs["exc_info"] is True
-    assert not files[0].exists()
+    assert cache.stats().entries == 0
 
 
 def test_clear_expired_only_removes_expired(tmp_path: Path) -> None:
@@ -58,9 +73,71 @@ def test_clear_expired_only_removes_expired(tmp_path: Path) -> None:
 
     removed = cache.clear_expired()
     assert removed == 1
+    assert cache.stats().entries == 1
+    assert cache.get("search", {"query": "active"}) == {"ok": True}
+
+
+def test_clear_removes_legacy_json_files(tmp_path: Path) -> None:
+    (tmp_path / "0123456789abcdef.json").write_text("{}", encoding="utf-8")
+    cache = ExaCache(tmp_path)
+    cache.set("search", {"query": "hello"}, {"ok": True})
+
+    assert cache.clear_expired() == 1
+    assert not list(tmp_path.glob("*.json"))
+    assert cache.clear() == 1
+
+
+def test_payloads_are_compressed_and_lru_evicted_over_size_cap(tmp_path: Path) -> None:
+    text = "prediction markets " * 500
+    cache = ExaCache(tmp_path)
+    cache.set("search", {"query": "probe"}, {"text": text})
+    entry_size = cache.stats().size_bytes
+    assert entry_size < len(text) // 10
+    cache.close()
+
+    cache = ExaCache(tmp_path, max_bytes=entry_size * 2)
+    cache.clear()
+    now = time.time()
+    with patch("kalshi_research.exa.cache.time.time", side_effect=[now + i for i in range(5)]):
+        cache.set("search", {"query": "a"}, {"text": text})
+        cache.set("search", {"query": "b"}, {"text": text})
+        # Reading "a" makes "b" the least recently used entry.
+        assert cache.get("search", {"query": "a"}) is not None
+        cache.set("search", {"query": "c"}, {"text": text})
+        assert cache.get("search", {"query": "b"}) is None
+
+    stats = cache.stats()
+    assert stats.entries == 2
+    assert stats.size_bytes <= entry_size * 2
+    assert (stats.hits, stats.misses, stats.evictions) == (1, 1, 1)
+    assert stats.hit_rate == 0.5
+    assert cache.get("search", {"query": "c"}) == {"text": text}
+
+
+def test_set_checks_the_cap_without_summing_the_table(tmp_path: Path) -> None:
+    cache = ExaCache(tmp_path, max_bytes=10_000_000)
+    statements: list[str] = []
+    cache._conn.set_trace_callback(statements.append)
+
+    for i in range(3):
+        cache.set("search", {"query": f"q{i}"}, {"i": i})
+    cache.set("search", {"query": "q0"}, {"i": "replaced"})
+
+    assert not [sql for sql in statements if "SUM(size)" in sql]
+    assert cache._size_bytes == cache.stats().size_bytes
+
+
+@pytest.mark.asyncio
+async def test_async_interface_is_safe_for_concurrent_tasks(tmp_path: Path) -> None:
+    cache = ExaCache(tmp_path)
+
+    await asyncio.gather(*(cache.aset("search", {"query": f"q{i}"}, {"i": i}) for i in range(20)))
+    results = await asyncio.gather(*(cache.aget("search", {"query": f"q{i}"}) for i in range(20)))
+
+    assert results == [{"i": i} for i in range(20)]
+    assert cache.stats().hits == 20
 
-    active_files = list(tmp_path.glob("*.json"))
-    assert len(active_files) == 1
 
-    entry = json.loads(active_files[0].read_text(encoding="utf-8"))
-    assert entry["params"]["query"] == "active"
+def test_max_bytes_must_be_positive(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="max_bytes must be positive"):
+        ExaCache(tmp_path, max_bytes=0)
@@ -7,6 +7,7 @@ These tests use respx to mock HTTP requests. Everything else
 
 from __future__ import annotations
 
+import asyncio
 import json
 from datetime import UTC, datetime
 from pathlib import Path
@@ -499,3 +500,53 @@ async def test_request_rejects_invalid_json() -> None:
     async with _client() as exa:
         with pytest.raises(ExaAPIError):
             await exa.search("hello")
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_concurrent_identical_searches_share_one_request() -> None:
+    response_json = _load_golden_exa_fixture("search_response.json")
+    released = asyncio.Event()
+
+    async def respond(_request: Any) -> Response:
+        await released.wait()
+        return Response(200, json=response_json)
+
+    route = respx.post("https://api.exa.ai/search").mock(side_effect=respond)
+
+    async with _client() as exa:
+        calls = [
+            asyncio.create_task(exa.search("hello", num_results=1)),
+            asyncio.create_task(exa.search("hello", num_results=1)),
+            asyncio.create_task(exa.search("other", num_results=1)),
+        ]
+        await asyncio.sleep(0.01)
+        released.set()
+        first, second, other = await asyncio.gather(*calls)
+        # Finished requests are not reused: a later identical search is sent again.
+        await exa.search("hello", num_results=1)
+
+    assert route.call_count == 3
+    assert first.request_id == second.request_id == other.request_id
+    assert exa._single_flight.coalesced == 1
+    # The shared response is paid for once: the waiter records no cost.
+    assert first.cost_dollars is not None
+    assert second.cost_dollars is None
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_research_task_creation_is_never_coalesced() -> None:
+    route = respx.post("https://api.exa.ai/research/v1").mock(
+        return_value=Response(
+            200,
+            json={"researchId": "r1", "status": "pending", "createdAt": 1, "instructions": "x"},
+        )
+    )
+
+    async with _client() as exa:
+        await asyncio.gather(
+            exa.create_research_task(instructions="x"), exa.create_research_task(instructions="x")
+        )
+
+    assert route.call_count == 2
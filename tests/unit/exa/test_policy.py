@@ -41,6 +41,30 @@ def test_budget_enforces_limit_before_spending() -> None:
     assert budget.can_spend(0.07) is True
 
 
+def test_budget_reservations_count_until_settled() -> None:
+    budget = ExaBudget(limit_usd=0.10)
+
+    assert budget.reserve(0.06) is True
+    assert budget.reserve(0.06) is False
+    assert budget.remaining_usd == pytest.approx(0.04)
+    assert budget.can_spend(0.05) is False
+
+    budget.settle(0.06, actual_usd=0.02)
+    assert budget.reserved_usd == 0.0
+    assert budget.spent_usd == pytest.approx(0.02)
+    assert budget.reserve(0.06) is True
+
+
+def test_contents_cost_is_per_page_only() -> None:
+    policy = ExaPolicy.from_mode()
+    assert policy.estimate_contents_cost_usd(
+        num_urls=10, include_text=True, include_highlights=True
+    ) == pytest.approx(10 * 0.002 * 1.2)
+    assert policy.estimate_contents_cost_usd(
+        num_urls=0, include_text=True, include_highlights=True
+    ) == pytest.approx(0.0)
+
+
 def test_budget_rejects_invalid_values() -> None:
     with pytest.raises(ValueError, match="limit_usd must be positive"):
         ExaBudget(limit_usd=0.0)
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from kalshi_research.exa._singleflight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_waiters_share_result_and_exception() -> None:
+    flight = SingleFlight()
+    calls = 0
+    released = asyncio.Event()
+
+    async def call() -> dict[str, int]:
+        nonlocal calls
+        calls += 1
+        await released.wait()
+        return {"calls": calls}
+
+    tasks = [asyncio.create_task(flight.run("k", call)) for _ in range(3)]
+    await asyncio.sleep(0)
+    assert flight.in_flight == 1
+    released.set()
+    results = await asyncio.gather(*tasks)
+
+    assert calls == 1
+    assert results == [({"calls": 1}, False), ({"calls": 1}, True), ({"calls": 1}, True)]
+    assert flight.coalesced == 2
+    assert flight.in_flight == 0
+
+    async def fail() -> None:
+        await asyncio.sleep(0)
+        raise ValueError("boom")
+
+    outcomes = await asyncio.gather(
+        flight.run("k", fail), flight.run("k", fail), return_exceptions=True
+    )
+    assert [type(outcome) for outcome in outcomes] == [ValueError, ValueError]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_hands_the_call_to_a_waiter() -> None:
+    flight = SingleFlight()
+    started: list[str] = []
+    released = asyncio.Event()
+
+    def call(name: str):
+        async def run() -> str:
+            started.append(name)
+            await released.wait()
+            return name
+
+        return run
+
+    leader = asyncio.create_task(flight.run("k", call("leader")))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(flight.run("k", call("waiter")))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    await asyncio.sleep(0)
+    released.set()
+
+    assert await waiter == ("waiter", False)
+    assert leader.cancelled()
+    assert started == ["leader", "waiter"]
@@ -1,5 +1,6 @@
 """Test Exa Websets client with respx mocking using golden fixtures."""
 
+import asyncio
 import json
 from datetime import UTC, datetime
 from pathlib import Path
@@ -374,3 +375,28 @@ async def test_client_auth_error_handling(websets_client: ExaWebsetsClient):
             await websets_client.create_webset(params)
 
     assert "401" in str(exc_info.value) or "Invalid API key" in str(exc_info.value)
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_concurrent_identical_gets_share_one_request(
+    websets_client: ExaWebsetsClient,
+) -> None:
+    """Concurrent polls of the same Webset are coalesced into one HTTP request."""
+    fixture_data = load_golden_fixture("get_webset")
+    released = asyncio.Event()
+
+    async def respond(_request: httpx.Request) -> httpx.Response:
+        await released.wait()
+        return httpx.Response(200, json=fixture_data)
+
+    route = respx.get("https://api.exa.ai/v0/websets/webset_test123").mock(side_effect=respond)
+
+    async with websets_client:
+        polls = [asyncio.create_task(websets_client.get_webset("webset_test123")) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        released.set()
+        responses = await asyncio.gather(*polls)
+
+    assert route.call_count == 1
+    assert {response.id for response in responses} == {"webset_test123"}
@@ -5,6 +5,7 @@ from dataclasses import replace
 from datetime import UTC, datetime, timedelta
 
 import pytest
+from sqlalchemy import event
 
 from kalshi_research.data import DatabaseManager
 from kalshi_research.data.models import (
@@ -15,6 +16,7 @@ from kalshi_research.data.models import (
     NewsArticleMarket,
     NewsSentiment,
 )
+from kalshi_research.data.repositories import SentimentRollupRepository
 from kalshi_research.news import SentimentAggregator
 from kalshi_research.news.aggregator import SentimentSummary
 
@@ -275,3 +277,84 @@ async def test_aggregator_event_summary(tmp_path) -> None:
         assert summary.avg_score == 0.4
         assert summary.score_change is not None
         assert summary.score_change == pytest.approx(0.6)
+
+
+@pytest.mark.asyncio
+async def test_market_summaries_batch_tickers_in_one_query(tmp_path) -> None:
+    now = datetime.now(UTC)
+
+    async with DatabaseManager(tmp_path / "agg-batch.db") as db:
+        await db.create_tables()
+
+        async with db.session_factory() as session, session.begin():
+            session.add(Event(ticker="EVT1", series_ticker="S1", title="Event 1"))
+            for ticker in ("MKT1", "MKT2", "MKT3"):
+                session.add(
+                    Market(
+                        ticker=ticker,
+                        event_ticker="EVT1",
+                        title=ticker,
+                        status="active",
+                        open_time=now - timedelta(days=30),
+                        close_time=now + timedelta(days=1),
+                        expiration_time=now + timedelta(days=2),
+                    )
+                )
+            rows = [
+                ("MKT1", 1, 0.5, "positive", "keyword"),
+                ("MKT1", 1, -0.1, "neutral", "keyword"),
+                ("MKT1", 1, 0.9, "positive", "keyword-v2"),  # Other method: ignored.
+                ("MKT1", 9, -0.5, "negative", "keyword"),
+                ("MKT2", 2, 0.2, "positive", "keyword"),
+                ("MKT3", 9, 0.3, "positive", "keyword"),  # Previous period only: left out.
+            ]
+            article_ids = []
+            for i, (ticker, days_ago, score, label, method) in enumerate(rows):
+                article = NewsArticle(
+                    url=f"https://example.com/{i}",
+                    url_hash=f"batch-{i}",
+                    title=f"Article {i}",
+                    source_domain="example.com",
+                    collected_at=now - timedelta(days=days_ago),
+                )
+                session.add(article)
+                await session.flush()
+                article_ids.append(article.id)
+                session.add(NewsArticleMarket(article_id=article.id, ticker=ticker))
+                session.add(
+                    NewsSentiment(
+                        article_id=article.id,
+                        score=score,
+                        label=label,
+                        confidence=0.8,
+                        method=method,
+                        keywords_matched=None,
+                    )
+                )
+            await session.flush()
+            await SentimentRollupRepository(session).add_articles(article_ids)
+
+        statements: list[str] = []
+
+        def _record(_conn, _cursor, statement, *_args) -> None:
+            statements.append(statement)
+
+        aggregator = SentimentAggregator(db)
+        event.listen(db.engine.sync_engine, "before_cursor_execute", _record)
+        try:
+            summaries = await aggregator.get_market_summaries(["MKT1", "MKT2", "MKT3", "NONE"])
+        finally:
+            event.remove(db.engine.sync_engine, "before_cursor_execute", _record)
+        single = await aggregator.get_market_summary("MKT1", days=7)
+
+    assert len(statements) == 1
+    assert set(summaries) == {"MKT1", "MKT2"}
+    mkt1 = summaries["MKT1"]
+    assert single is not None
+    assert mkt1.avg_score == pytest.approx(single.avg_score) == pytest.approx(0.2)
+    assert mkt1.score_std == pytest.approx(single.score_std)
+    assert (mkt1.total_articles, mkt1.positive_count, mkt1.neutral_count) == (2, 1, 1)
+    assert mkt1.median_score is None
+    assert mkt1.previous_avg_score == pytest.approx(-0.5)
+    assert mkt1.score_change == pytest.approx(0.7)
+    assert summaries["MKT2"].score_change is None
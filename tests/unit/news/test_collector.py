@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from datetime import UTC, datetime, timedelta
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import event, func, select
 
 from kalshi_research.data import DatabaseManager
 from kalshi_research.data.models import (
@@ -14,9 +15,15 @@ from kalshi_research.data.models import (
     NewsArticleEvent,
     NewsArticleMarket,
     NewsSentiment,
+    NewsSentimentDaily,
+    TrackedItem,
 )
+from kalshi_research.exa.models.common import CostDollars
+from kalshi_research.exa.models.contents import ContentsResponse, ContentsStatus
 from kalshi_research.exa.models.search import SearchResponse, SearchResult
+from kalshi_research.exa.policy import ExaMode, ExaPolicy
 from kalshi_research.news import NewsCollector, NewsTracker, SentimentAnalyzer
+from kalshi_research.news._article_store import match_contents, url_hash
 
 pytestmark = [pytest.mark.unit]
 
@@ -102,6 +109,10 @@ async def test_collector_dedupes_by_url_hash_and_writes_sentiment(tmp_path) -> N
             assert sentiments[0].label in {"positive", "neutral", "negative"}
             assert sentiments[0].keywords_matched is not None
             json.loads(sentiments[0].keywords_matched)
+            # The market's daily sentiment rollup is maintained in the same transaction.
+            daily = (await session.execute(select(NewsSentimentDaily))).scalars().one()
+            assert (daily.ticker, daily.method, daily.article_count) == ("MKT1", "keyword", 1)
+            assert daily.score_sum == sentiments[0].score
 
 
 @pytest.mark.asyncio
@@ -150,3 +161,264 @@ async def test_collector_links_event_articles(tmp_path) -> None:
 
         async with db.session_factory() as session:
             assert len((await session.execute(select(NewsArticleEvent))).scalars().all()) == 1
+
+
+class ConcurrentStubExaClient:
+    """Returns one unique article per query and records scheduling order and concurrency."""
+
+    def __init__(self, *, cost_usd: float | None = None) -> None:
+        self.queries: list[str] = []
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._cost_usd = cost_usd
+
+    async def search_and_contents(self, query: str, **_kwargs) -> SearchResponse:
+        self.queries.append(query)
+        self._in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        await asyncio.sleep(0.01)
+        self._in_flight -= 1
+        return SearchResponse(
+            request_id=f"req-{query}",
+            results=[
+                SearchResult(
+                    id=query,
+                    url=f"https://example.com/{query}",
+                    title=query,
+                    published_date=datetime.now(UTC),
+                    text=None,
+                    highlights=None,
+                )
+            ],
+            cost_dollars=(
+                CostDollars(total=self._cost_usd) if self._cost_usd is not None else None
+            ),
+        )
+
+
+async def _track_events(db: DatabaseManager, queries: dict[str, list[str]]) -> None:
+    async with db.session_factory() as session:
+        for ticker in queries:
+            session.add(Event(ticker=ticker, series_ticker="S", title=ticker))
+        await session.commit()
+    tracker = NewsTracker(db)
+    for ticker, item_queries in queries.items():
+        await tracker.track(ticker=ticker, item_type="event", search_queries=item_queries)
+
+
+@pytest.mark.asyncio
+async def test_collect_all_runs_queries_concurrently_round_robin(tmp_path) -> None:
+    async with DatabaseManager(tmp_path / "concurrent.db") as db:
+        await db.create_tables()
+        await _track_events(db, {"EVT-A": ["a1", "a2", "a3", "a4"], "EVT-B": ["b1"]})
+        exa = ConcurrentStubExaClient()
+
+        policy = ExaPolicy.from_mode(budget_usd=1.0)
+        collector = NewsCollector(exa=exa, db=db, policy=policy)
+
+        results = await collector.collect_all(concurrency=2)
+
+        assert results == {"EVT-A": 4, "EVT-B": 1}
+        # Every item's first query is scheduled before any item's second.
+        assert exa.queries[:2] == ["a1", "b1"]
+        assert exa.max_in_flight == 2
+        async with db.session_factory() as session:
+            collected = (await session.execute(select(TrackedItem.last_collected_at))).all()
+        assert all(row.last_collected_at is not None for row in collected)
+
+
+@pytest.mark.asyncio
+async def test_collect_all_shares_budget_fairly_across_items(tmp_path) -> None:
+    # FAST mode estimates (0.005 + 5 * 0.001) * 1.2 = 0.012 per query; room for three.
+    policy = ExaPolicy.from_mode(mode=ExaMode.FAST, budget_usd=0.037)
+    async with DatabaseManager(tmp_path / "budget.db") as db:
+        await db.create_tables()
+        await _track_events(
+            db, {"EVT-A": ["a1", "a2", "a3"], "EVT-B": ["b1", "b2"], "EVT-C": ["c1"]}
+        )
+        exa = ConcurrentStubExaClient(cost_usd=0.012)
+        collector = NewsCollector(exa=exa, db=db, max_articles_per_query=5, policy=policy)
+
+        results = await collector.collect_all(concurrency=4)
+
+    assert sorted(exa.queries) == ["a1", "b1", "c1"]
+    assert results == {"EVT-A": 1, "EVT-B": 1, "EVT-C": 1}
+    assert collector.budget_exhausted
+    assert collector.budget.reserved_usd == 0.0
+    assert collector.budget.spent_usd == pytest.approx(0.036)
+
+
+@pytest.mark.asyncio
+async def test_collector_batches_inserts_and_links_known_articles(tmp_path) -> None:
+    now = datetime.now(UTC)
+    response = SearchResponse(
+        request_id="req-3",
+        results=[
+            SearchResult(
+                id=str(i),
+                url=url,
+                title=f"Story {i}",
+                published_date=now,
+                text="Markets rally with strong momentum.",
+                highlights=None,
+            )
+            # The repeated URL is stored once.
+            for i, url in enumerate(
+                ["https://example.com/x", "https://example.com/y", "https://example.com/x"]
+            )
+        ],
+    )
+
+    async with DatabaseManager(tmp_path / "batched.db") as db:
+        await db.create_tables()
+        await _track_events(db, {"EVT-X": ["x"], "EVT-Y": ["y"]})
+        async with db.session_factory() as session:
+            tracked = {
+                item.ticker: item for item in (await session.execute(select(TrackedItem))).scalars()
+            }
+        collector = NewsCollector(
+            exa=StubExaClient(response), db=db, sentiment_analyzer=SentimentAnalyzer()
+        )
+
+        statements: list[str] = []
+
+        def record(_conn, _cursor, statement, *_args) -> None:
+            statements.append(statement.split()[0])
+
+        event.listen(db.engine.sync_engine, "before_cursor_execute", record)
+        try:
+            inserted = await collector.collect_for_tracked_item(tracked["EVT-X"])
+        finally:
+            event.remove(db.engine.sync_engine, "before_cursor_execute", record)
+        inserted_again = await collector.collect_for_tracked_item(tracked["EVT-Y"])
+
+        async with db.session_factory() as session:
+            links = (
+                await session.execute(
+                    select(NewsArticleEvent.event_ticker, func.count()).group_by(
+                        NewsArticleEvent.event_ticker
+                    )
+                )
+            ).all()
+            sentiment_count = (
+                await session.execute(select(func.count()).select_from(NewsSentiment))
+            ).scalar_one()
+
+    assert inserted == 2
+    assert inserted_again == 0
+    # Lookup, article insert, link insert, sentiment insert, then the last_collected_at update.
+    assert statements == ["SELECT", "INSERT", "INSERT", "INSERT", "UPDATE"]
+    # Already-stored articles are linked to the second event too; sentiment is not repeated.
+    assert sorted(links) == [("EVT-X", 2), ("EVT-Y", 2)]
+    assert sentiment_count == 2
+
+
+class TwoPhaseStubExaClient:
+    """Search returns bare results per query; contents are served per URL."""
+
+    def __init__(self, results_by_query: dict[str, list[str]]) -> None:
+        self._results_by_query = results_by_query
+        self.content_requests: list[list[str]] = []
+
+    async def search(self, query: str, **_kwargs) -> SearchResponse:
+        await asyncio.sleep(0.01)
+        return SearchResponse(
+            request_id=f"search-{query}",
+            results=[
+                SearchResult(id=url, url=url, title=url, published_date=datetime.now(UTC))
+                for url in self._results_by_query[query]
+            ],
+        )
+
+    async def get_contents(self, urls: list[str], **_kwargs) -> ContentsResponse:
+        self.content_requests.append(urls)
+        await asyncio.sleep(0.01)
+        fetched = [url for url in urls if not url.endswith("/gone")]
+        return ContentsResponse(
+            request_id="contents",
+            results=[
+                SearchResult(id=url, url=url, title="", text=f"Text of {url}", highlights=["hi"])
+                for url in fetched
+            ],
+            statuses=[
+                ContentsStatus(id=url, status="success" if url in fetched else "error")
+                for url in urls
+            ],
+        )
+
+
+@pytest.mark.asyncio
+async def test_two_phase_fetches_contents_only_for_unseen_urls(tmp_path) -> None:
+    stored = "https://example.com/stored"
+    shared = "https://example.com/shared"
+    exa = TwoPhaseStubExaClient(
+        {
+            "a": [stored, shared, "https://example.com/a"],
+            "b": [shared, "https://example.com/gone"],
+        }
+    )
+
+    async with DatabaseManager(tmp_path / "two_phase.db") as db:
+        await db.create_tables()
+        await _track_events(db, {"EVT-A": ["a"], "EVT-B": ["b"]})
+        async with db.session_factory() as session, session.begin():
+            session.add(
+                NewsArticle(
+                    url=stored, url_hash=url_hash(stored), title="Old", source_domain="example.com"
+                )
+            )
+        collector = NewsCollector(
+            exa=exa, db=db, policy=ExaPolicy.from_mode(budget_usd=1.0), two_phase=True
+        )
+
+        results = await collector.collect_all(concurrency=2)
+
+        async with db.session_factory() as session:
+            articles = {
+                a.url: a for a in (await session.execute(select(NewsArticle))).scalars().all()
+            }
+            links = set(
+                (
+                    await session.execute(
+                        select(NewsArticleEvent.event_ticker, NewsArticle.url).join(NewsArticle)
+                    )
+                ).all()
+            )
+
+    # The stored URL is never fetched and the shared one is fetched once.
+    assert sorted(url for batch in exa.content_requests for url in batch) == [
+        "https://example.com/a",
+        "https://example.com/gone",
+        shared,
+    ]
+    assert results == {"EVT-A": 2, "EVT-B": 0}
+    assert articles[shared].full_text == f"Text of {shared}"
+    assert articles[shared].title == shared
+    assert "https://example.com/gone" not in articles
+    assert links == {
+        ("EVT-A", stored),
+        ("EVT-A", shared),
+        ("EVT-A", "https://example.com/a"),
+        ("EVT-B", shared),
+    }
+
+
+def test_match_contents_falls_back_to_id_then_position() -> None:
+    requested = [
+        SearchResult(id=f"doc-{i}", url=f"https://example.com/{i}", title=str(i)) for i in range(3)
+    ]
+    fetched = [
+        # Redirected, but echoes the requested URL as its id.
+        SearchResult(id="https://example.com/0", url="https://example.com/0?amp", title=""),
+        SearchResult(id="doc-1", url="https://m.example.com/1", title=""),
+        SearchResult(id="other", url="https://example.org/two", title=""),
+    ]
+
+    matched = match_contents(requested, fetched)
+    assert {key: r.url for key, r in matched.items()} == {
+        url_hash("https://example.com/0"): "https://example.com/0?amp",
+        url_hash("https://example.com/1"): "https://m.example.com/1",
+        url_hash("https://example.com/2"): "https://example.org/two",
+    }
+    # Without one result per requested URL, unidentifiable results are not paired by position.
+    assert url_hash("https://example.com/2") not in match_contents(requested, fetched[1:])
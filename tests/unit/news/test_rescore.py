@@ -0,0 +1,193 @@
+"""Tests for re-scoring stored articles under a sentiment method version."""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import delete, select
+
+from kalshi_research.data import DatabaseManager
+from kalshi_research.data.models import (
+    Event,
+    Market,
+    NewsArticle,
+    NewsArticleMarket,
+    NewsSentiment,
+    NewsSentimentDaily,
+)
+from kalshi_research.news import SentimentAggregator, SentimentAnalyzer
+from kalshi_research.news.rescore import (
+    RescoreCheckpoint,
+    RescoreProgress,
+    rescore_sentiment,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+pytestmark = [pytest.mark.unit]
+
+NOW = datetime.now(UTC)
+TEXTS = [
+    "Prices rally on strong growth.",
+    "Fear of a crash grows as risk mounts.",
+    None,  # Never fetched: skipped.
+    "Markets surge to a record.",
+    "Analysts worry about a slowdown.",
+]
+
+
+@pytest.fixture
+async def db(tmp_path: Path) -> AsyncIterator[DatabaseManager]:
+    async with DatabaseManager(tmp_path / "rescore.db") as db:
+        await db.create_tables()
+        async with db.session_factory() as session, session.begin():
+            session.add(Event(ticker="EVT1", series_ticker="S1", title="Event 1"))
+            session.add(
+                Market(
+                    ticker="MKT1",
+                    event_ticker="EVT1",
+                    title="Market 1",
+                    status="active",
+                    open_time=NOW - timedelta(days=30),
+                    close_time=NOW + timedelta(days=30),
+                    expiration_time=NOW + timedelta(days=60),
+                )
+            )
+            for i, text in enumerate(TEXTS):
+                article = NewsArticle(
+                    url=f"https://example.com/{i}",
+                    url_hash=str(i),
+                    title=f"Article {i}",
+                    source_domain="example.com",
+                    collected_at=NOW - timedelta(days=1),
+                    full_text=text,
+                )
+                session.add(article)
+                await session.flush()
+                session.add(NewsArticleMarket(article_id=article.id, ticker="MKT1"))
+                session.add(
+                    NewsSentiment(
+                        article_id=article.id,
+                        analyzed_at=NOW - timedelta(days=1),
+                        score=0.0,
+                        label="neutral",
+                        confidence=0.3,
+                        method="keyword",
+                        keywords_matched="[]",
+                    )
+                )
+        yield db
+
+
+async def _scores(db: DatabaseManager, method: str) -> dict[int, float]:
+    async with db.session_factory() as session:
+        rows = await session.execute(
+            select(NewsSentiment.article_id, NewsSentiment.score).where(
+                NewsSentiment.method == method
+            )
+        )
+    return dict(rows.tuples().all())
+
+
+@pytest.mark.asyncio
+async def test_rescore_writes_new_method_version_in_chunks(db: DatabaseManager) -> None:
+    analyzer = SentimentAnalyzer(method="keyword-v2")
+    progress: list[RescoreProgress] = []
+
+    result = await rescore_sentiment(db, analyzer, chunk_rows=2, on_progress=progress.append)
+
+    assert result.scored == 4
+    assert result.chunks == 2
+    assert [p.scored for p in progress] == [2, 4]
+    assert result.last_article_id == 5
+    scores = await _scores(db, "keyword-v2")
+    expected = {
+        i + 1: analyzer.analyze(text, f"Article {i}").score
+        for i, text in enumerate(TEXTS)
+        if text is not None
+    }
+    assert scores == expected
+    # The previous version is kept alongside the new one.
+    assert await _scores(db, "keyword") == dict.fromkeys(range(1, 6), 0.0)
+
+
+@pytest.mark.asyncio
+async def test_rescore_upserts_and_resumes_from_checkpoint(
+    db: DatabaseManager, tmp_path: Path
+) -> None:
+    await rescore_sentiment(db, SentimentAnalyzer(method="keyword"), workers=2, chunk_rows=3)
+    # Re-scoring an existing version replaces its rows instead of duplicating them.
+    async with db.session_factory() as session:
+        rows = (
+            await session.execute(
+                select(NewsSentiment.article_id, NewsSentiment.keywords_matched).where(
+                    NewsSentiment.method == "keyword"
+                )
+            )
+        ).all()
+    assert len(rows) == 5
+    assert json.loads(dict(rows)[1]) == ["growth", "rally", "strong"]
+
+    # A re-score of "keyword" was interrupted after article 1. Rows already stored under the
+    # method beyond that point (written by the collector) must not move the resume point.
+    state_path = tmp_path / "rescore-keyword.json"
+    RescoreCheckpoint("keyword", 1).save(state_path)
+    with pytest.raises(ValueError, match="'keyword'"):
+        await rescore_sentiment(
+            db, SentimentAnalyzer(method="keyword-v2"), state_path=state_path, resume=True
+        )
+
+    resumed = await rescore_sentiment(
+        db, SentimentAnalyzer(method="keyword"), chunk_rows=2, state_path=state_path, resume=True
+    )
+    assert resumed.after_article_id == 1
+    assert resumed.scored == 3
+    assert resumed.last_article_id == 5
+    assert not state_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_aggregator_selects_method_version(db: DatabaseManager) -> None:
+    await rescore_sentiment(db, SentimentAnalyzer(method="keyword-v2"))
+
+    default = await SentimentAggregator(db).get_market_summary("MKT1", compare_previous=False)
+    rescored = await SentimentAggregator(db, method="keyword-v2").get_market_summary(
+        "MKT1", compare_previous=False
+    )
+
+    assert default is not None
+    assert default.total_articles == 5
+    assert default.avg_score == 0.0
+    assert rescored is not None
+    assert rescored.total_articles == 4
+    assert rescored.positive_count == 2
+    assert rescored.negative_count == 2
+    # Re-scoring refreshes the daily rollups that batched summaries read.
+    batched = await SentimentAggregator(db, method="keyword-v2").get_market_summaries(["MKT1"])
+    assert batched["MKT1"].total_articles == 4
+    assert batched["MKT1"].avg_score == pytest.approx(rescored.avg_score)
+
+
+@pytest.mark.asyncio
+async def test_rescore_keeps_rollup_totals_of_pruned_articles(db: DatabaseManager) -> None:
+    await rescore_sentiment(db, SentimentAnalyzer(method="keyword-v2"))
+    # Prune article 1 from the middle of the day, as `data prune` would.
+    async with db.session_factory() as session, session.begin():
+        await session.execute(delete(NewsSentiment).where(NewsSentiment.article_id == 1))
+        await session.execute(delete(NewsArticleMarket).where(NewsArticleMarket.article_id == 1))
+        await session.execute(delete(NewsArticle).where(NewsArticle.id == 1))
+
+    await rescore_sentiment(db, SentimentAnalyzer(method="keyword-v2"))
+
+    async with db.session_factory() as session:
+        daily = (
+            await session.execute(
+                select(NewsSentimentDaily).where(NewsSentimentDaily.method == "keyword-v2")
+            )
+        ).scalar_one()
+    assert (daily.article_count, daily.positive_count, daily.negative_count) == (4, 2, 2)
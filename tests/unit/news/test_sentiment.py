@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from kalshi_research.news.sentiment import SentimentAnalyzer
 
 
@@ -38,3 +40,35 @@ def test_sentiment_negation_skips_keyword() -> None:
     result = analyzer.analyze("This is not bullish. Traders are not optimistic.")
     # Both "bullish" and "optimistic" are negated, so confidence should be low/neutral.
     assert result.label == "neutral"
+
+
+def test_sentiment_intensifier_and_punctuation_between_tokens() -> None:
+    analyzer = SentimentAnalyzer()
+    result = analyzer.analyze("Prices sharply... surge; never, crash!", title="Risk-off")
+    # "sharply surge" counts 1.5 and "never crash" is negated; the title's "risk" counts 2.
+    assert result.score == pytest.approx((1.5 - 2.0) / 3.5)
+    assert result.label == "negative"
+    assert result.confidence == pytest.approx(0.85)
+    assert result.keywords_matched == ["risk", "surge"]
+
+
+def test_analyze_many_matches_analyze_in_order() -> None:
+    analyzer = SentimentAnalyzer(negative_weight=1.5)
+    texts = [
+        "Markets rally on strong growth.",
+        "Fear of a crash grows.",
+        "Nothing notable today.",
+        "Not bullish, but no crisis either.",
+        "Sharply higher gains beat expectations.",
+    ]
+    titles = ["Rally", None, "Crisis averted", None, ""]
+    expected = [analyzer.analyze(text, title) for text, title in zip(texts, titles, strict=True)]
+
+    assert analyzer.analyze_many(texts, titles) == expected
+    assert analyzer.analyze_many(texts, titles, workers=2, chunk_size=2) == expected
+    assert analyzer.analyze_many(texts[:1]) == [analyzer.analyze(texts[0])]
+
+
+def test_analyze_many_rejects_mismatched_titles() -> None:
+    with pytest.raises(ValueError, match="same length"):
+        SentimentAnalyzer().analyze_many(["a", "b"], ["title"])